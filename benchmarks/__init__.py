@@ -0,0 +1,6 @@
+#!/usr/bin/env python
+'''
+Benchmarks of the Hyperwallet SDK against a local stand-in server.
+
+Run ``python -m benchmarks --help`` from the repository root.
+'''
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+import argparse
+import json
+import sys
+
+from benchmarks import suite
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmark the Hyperwallet SDK.')
+    parser.add_argument('--output', default='benchmark-results.json', help='file the results are written to')
+    parser.add_argument('--modes', default='plain,jose', help='comma separated server modes (plain, jose)')
+    parser.add_argument('--cases', default=None, help='comma separated case names, all by default')
+    parser.add_argument('--iterations', type=int, default=200, help='measured calls per case')
+    parser.add_argument('--warmup', type=int, default=20, help='calls made before measuring each case')
+    parser.add_argument('--items', type=int, default=1000, help='items of each list endpoint')
+    parser.add_argument('--compare', default=None, help='results of a previous run to compare with')
+    parser.add_argument('--threshold', type=float, default=0.1, help='throughput loss reported as a regression')
+    args = parser.parse_args(argv)
+
+    def report(mode, name, result):
+        if 'error' in result:
+            print('{:<6} {:<22} ERROR {}'.format(mode, name, result['error']))
+        else:
+            print('{:<6} {:<22} {:>10.1f} ops/s  p50 {:>9.3f} ms  p99 {:>9.3f} ms'.format(
+                mode,
+                name,
+                result['opsPerSecond'],
+                result['p50'] * 1000,
+                result['p99'] * 1000
+            ))
+
+    results = suite.run(
+        modes=[mode for mode in args.modes.split(',') if mode],
+        cases=args.cases.split(',') if args.cases else None,
+        iterations=args.iterations,
+        warmup=args.warmup,
+        items=args.items,
+        report=report
+    )
+
+    with open(args.output, 'w') as output:
+        json.dump(results, output, indent=2, sort_keys=True)
+
+    print('Results written to {}'.format(args.output))
+
+    if args.compare:
+        with open(args.compare) as baselineFile:
+            baseline = json.load(baselineFile)
+
+        regressions = 0
+        for (mode, name, ratio, regressed) in suite.compare(baseline, results, args.threshold):
+            regressions += regressed
+            print('{:<6} {:<22} {:>+7.1%}{}'.format(mode, name, ratio - 1, '  REGRESSION' if regressed else ''))
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+'''
+Throughput of many threads sharing one client, over HTTP/1.1 and HTTP/2.
+
+Each transport is measured against its own local stand-in server, which
+counts the connections the client opens. Run
+``python -m benchmarks.concurrency --help`` from the repository root.
+'''
+
+import argparse
+import json
+import platform
+import sys
+import threading
+import time
+
+from hyperwallet import Api, __version__
+from hyperwallet.utils.instrumentation import LatencyHistogram
+
+from hyperwallet.tests.standin import Http2StandInServer, StandInServer
+
+USER_TOKEN = 'usr-00000000-0000-0000-0000-000000000001'
+
+# The servers and client options of each transport.
+TRANSPORTS = [
+    ('http1', StandInServer, {}),
+    ('http2', Http2StandInServer, {'http2': True})
+]
+
+
+def measure(api, threads, requests):
+    '''
+    Measure the throughput and latency of concurrent getUser calls.
+
+    :param api:
+        The Api shared by the threads. **REQUIRED**
+    :param threads:
+        The number of threads calling the API. **REQUIRED**
+    :param requests:
+        The number of calls made by each thread. **REQUIRED**
+    :returns:
+        A dictionary with the requests per second and latencies in seconds.
+    '''
+
+    histogram = LatencyHistogram()
+    errors = []
+
+    def call():
+        for _ in range(requests):
+            start = time.perf_counter()
+            try:
+                api.getUser(USER_TOKEN)
+            except Exception as e:
+                errors.append(e)
+            histogram.record(time.perf_counter() - start)
+
+    workers = [threading.Thread(target=call) for _ in range(threads)]
+    start = time.perf_counter()
+
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    elapsed = time.perf_counter() - start
+
+    if errors:
+        raise errors[0]
+
+    result = histogram.asDict()
+    result['opsPerSecond'] = threads * requests / elapsed if elapsed else None
+    return result
+
+
+def run(transports=None, concurrency=(1, 16, 64), requests=100, latency=0.005, poolMaxSize=10, report=None):
+    '''
+    Run the benchmark.
+
+    :param transports:
+        The names of the transports to measure, None for every transport.
+    :param concurrency:
+        The numbers of threads to measure.
+    :param requests:
+        The number of calls made by each thread.
+    :param latency:
+        The seconds the stand-in servers spend processing each request.
+    :param poolMaxSize:
+        The poolMaxSize of the clients.
+    :param report:
+        Callable taking the transport name, number of threads and result as
+        each measure finishes.
+    :returns:
+        A dictionary with the environment and the results keyed by transport
+        and number of threads.
+    '''
+
+    results = {}
+
+    for (name, serverClass, options) in TRANSPORTS:
+        if transports is not None and name not in transports:
+            continue
+
+        for threads in concurrency:
+            with serverClass(latency=latency) as server:
+                api = Api('bench-user', 'bench-pass', 'prg-bench', server.url, poolMaxSize=poolMaxSize, **options)
+
+                try:
+                    result = measure(api, threads, requests)
+                    result['connections'] = server.connections
+                except Exception as e:
+                    # Keep going so one broken transport does not hide the others
+                    result = {'error': '{}: {}'.format(type(e).__name__, e)}
+
+            results.setdefault(name, {})[str(threads)] = result
+            if report:
+                report(name, threads, result)
+
+    return {
+        'version': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': int(time.time()),
+        'requests': requests,
+        'latency': latency,
+        'poolMaxSize': poolMaxSize,
+        'results': results
+    }
+
+
+def compare(baseline, current, threshold=0.1):
+    '''
+    Compare the throughput of two runs.
+
+    :param baseline:
+        The results of the reference run. **REQUIRED**
+    :param current:
+        The results of the new run. **REQUIRED**
+    :param threshold:
+        The relative throughput loss reported as a regression.
+    :returns:
+        A list of ``(transport, threads, ratio, regressed)`` tuples for the
+        measures made in both runs, where ratio is current over baseline
+        throughput.
+    '''
+
+    comparison = []
+
+    for (name, measures) in sorted(current['results'].items()):
+        for (threads, result) in sorted(measures.items(), key=lambda item: int(item[0])):
+            before = baseline['results'].get(name, {}).get(threads, {}).get('opsPerSecond')
+            after = result.get('opsPerSecond')
+
+            if before and after:
+                ratio = after / before
+                comparison.append((name, int(threads), ratio, ratio < 1 - threshold))
+
+    return comparison
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.concurrency', description='Measure concurrent requests over HTTP/1.1 and HTTP/2.')
+    parser.add_argument('--output', default='concurrency-results.json', help='file the results are written to')
+    parser.add_argument('--transports', default=None, help='comma separated transports (http1, http2), all by default')
+    parser.add_argument('--concurrency', default='1,16,64', help='comma separated numbers of threads')
+    parser.add_argument('--requests', type=int, default=100, help='calls made by each thread')
+    parser.add_argument('--latency', type=float, default=0.005, help='seconds the server spends on each request')
+    parser.add_argument('--pool-max-size', type=int, default=10, help='poolMaxSize of the clients')
+    parser.add_argument('--compare', default=None, help='results of a previous run to compare with')
+    parser.add_argument('--threshold', type=float, default=0.1, help='throughput loss reported as a regression')
+    args = parser.parse_args(argv)
+
+    def report(name, threads, result):
+        if 'error' in result:
+            print('{:<6} {:>4} threads ERROR {}'.format(name, threads, result['error']))
+        else:
+            print('{:<6} {:>4} threads {:>10.1f} req/s  p50 {:>8.3f} ms  p99 {:>8.3f} ms  {:>5} connections'.format(
+                name,
+                threads,
+                result['opsPerSecond'],
+                result['p50'] * 1000,
+                result['p99'] * 1000,
+                result['connections']
+            ))
+
+    results = run(
+        transports=args.transports.split(',') if args.transports else None,
+        concurrency=[int(threads) for threads in args.concurrency.split(',') if threads],
+        requests=args.requests,
+        latency=args.latency,
+        poolMaxSize=args.pool_max_size,
+        report=report
+    )
+
+    with open(args.output, 'w') as output:
+        json.dump(results, output, indent=2, sort_keys=True)
+
+    print('Results written to {}'.format(args.output))
+
+    if args.compare:
+        with open(args.compare) as baselineFile:
+            baseline = json.load(baselineFile)
+
+        regressions = 0
+        for (name, threads, ratio, regressed) in compare(baseline, results, args.threshold):
+            regressions += regressed
+            print('{:<6} {:>4} threads {:>+7.1%}{}'.format(name, threads, ratio - 1, '  REGRESSION' if regressed else ''))
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+'''
+Import time of the Hyperwallet SDK, measured with ``python -X importtime``.
+
+Each target is imported by a fresh interpreter, so that the cost of loading
+every module is measured. Run ``python -m benchmarks.importtime --help`` from
+the repository root.
+'''
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from hyperwallet import __version__
+
+# The statements measured, from importing the package to building a client.
+TARGETS = [
+    ('package', 'import hyperwallet'),
+    ('api', 'from hyperwallet import Api'),
+    ('client', 'from hyperwallet import Api; Api("user", "pass", "prg")'),
+    ('asyncClient', 'from hyperwallet import AsyncApi; AsyncApi("user", "pass", "prg")'),
+    ('encryption', 'from hyperwallet.utils.encryption import Encryption')
+]
+
+# The modules loaded by the interpreter itself, whatever the statement.
+BASELINE = 'pass'
+
+
+def parse(output):
+    '''
+    Parse the report written by ``python -X importtime``.
+
+    :param output:
+        The standard error of the interpreter. **REQUIRED**
+    :returns:
+        A dictionary of the cumulative import time of each top-level module,
+        in seconds, including the modules it imported.
+    '''
+
+    modules = {}
+
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        (selfTime, cumulative, name) = line[len('import time:'):].split('|')
+
+        # Nested imports are indented below the module importing them.
+        if not name[1:].startswith(' '):
+            modules[name.strip()] = int(cumulative) / 1000000.0
+
+    return modules
+
+
+def importTime(statement, python=sys.executable):
+    '''
+    Import time of one run of a statement.
+
+    :param statement:
+        The Python statement to run. **REQUIRED**
+    :param python:
+        The interpreter to run it with.
+    :returns:
+        A tuple of the total time and the time of each top-level module it
+        imported, in seconds.
+    '''
+
+    baseline = parse(_run(BASELINE, python))
+    modules = parse(_run(statement, python))
+    modules = dict((name, seconds) for (name, seconds) in modules.items() if name not in baseline)
+
+    return (sum(modules.values()), modules)
+
+
+def _run(statement, python):
+    process = subprocess.run(
+        [python, '-X', 'importtime', '-c', statement],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+
+    return process.stderr
+
+
+def run(targets=None, repeat=7, top=5, report=None):
+    '''
+    Measure the import time of the SDK.
+
+    :param targets:
+        The names of the targets to measure, None for every target.
+    :param repeat:
+        The number of interpreters started per target.
+    :param top:
+        The number of slowest modules kept per target.
+    :param report:
+        Callable taking the target name and result as each target finishes.
+    :returns:
+        A dictionary with the environment and the results keyed by target.
+    '''
+
+    results = {}
+
+    for (name, statement) in TARGETS:
+        if targets is not None and name not in targets:
+            continue
+
+        try:
+            runs = [importTime(statement) for _ in range(repeat)]
+        except Exception as e:
+            results[name] = {'error': '{}: {}'.format(type(e).__name__, e)}
+        else:
+            modules = {}
+            for (_, topLevel) in runs:
+                for (module, seconds) in topLevel.items():
+                    modules.setdefault(module, []).append(seconds)
+
+            slowest = sorted(modules.items(), key=lambda item: -statistics.median(item[1]))[:top]
+
+            results[name] = {
+                'statement': statement,
+                'median': statistics.median(total for (total, _) in runs),
+                'min': min(total for (total, _) in runs),
+                'modules': dict((module, statistics.median(times)) for (module, times) in slowest)
+            }
+
+        if report:
+            report(name, results[name])
+
+    return {
+        'version': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': int(time.time()),
+        'repeat': repeat,
+        'results': results
+    }
+
+
+def compare(baseline, current, threshold=0.1):
+    '''
+    Compare the import time of two runs.
+
+    :param baseline:
+        The results of the reference run. **REQUIRED**
+    :param current:
+        The results of the new run. **REQUIRED**
+    :param threshold:
+        The relative slowdown reported as a regression.
+    :returns:
+        A list of ``(target, ratio, regressed)`` tuples for the targets
+        measured in both runs, where ratio is current over baseline time.
+    '''
+
+    comparison = []
+
+    for (name, result) in sorted(current['results'].items()):
+        before = baseline['results'].get(name, {}).get('median')
+        after = result.get('median')
+
+        if before and after:
+            ratio = after / before
+            comparison.append((name, ratio, ratio > 1 + threshold))
+
+    return comparison
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.importtime', description='Measure the import time of the Hyperwallet SDK.')
+    parser.add_argument('--output', default='importtime-results.json', help='file the results are written to')
+    parser.add_argument('--targets', default=None, help='comma separated target names, all by default')
+    parser.add_argument('--repeat', type=int, default=7, help='interpreters started per target')
+    parser.add_argument('--top', type=int, default=5, help='slowest modules reported per target')
+    parser.add_argument('--compare', default=None, help='results of a previous run to compare with')
+    parser.add_argument('--threshold', type=float, default=0.1, help='slowdown reported as a regression')
+    args = parser.parse_args(argv)
+
+    def report(name, result):
+        if 'error' in result:
+            print('{:<12} ERROR {}'.format(name, result['error']))
+            return
+
+        print('{:<12} {:>9.1f} ms'.format(name, result['median'] * 1000))
+        for (module, seconds) in sorted(result['modules'].items(), key=lambda item: -item[1]):
+            print('  {:<40} {:>9.1f} ms'.format(module, seconds * 1000))
+
+    results = run(
+        targets=args.targets.split(',') if args.targets else None,
+        repeat=args.repeat,
+        top=args.top,
+        report=report
+    )
+
+    with open(args.output, 'w') as output:
+        json.dump(results, output, indent=2, sort_keys=True)
+
+    print('Results written to {}'.format(args.output))
+
+    if args.compare:
+        with open(args.compare) as baselineFile:
+            baseline = json.load(baselineFile)
+
+        regressions = 0
+        for (name, ratio, regressed) in compare(baseline, results, args.threshold):
+            regressions += regressed
+            print('{:<12} {:>+7.1%}{}'.format(name, ratio - 1, '  REGRESSION' if regressed else ''))
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+
+import json
+import os.path
+import platform
+import time
+
+from jwcrypto.common import json_encode
+from jwcrypto.jws import JWS
+
+from hyperwallet import Api, __version__
+from hyperwallet.models import Receipt
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.utils.codec import CODECS
+from hyperwallet.utils.columnar import ColumnarBatch, RECEIPT_COLUMNS
+from hyperwallet.utils.encryption import Encryption
+from hyperwallet.utils.instrumentation import LatencyHistogram
+from hyperwallet.utils.webhooks import WebhookReceiver
+
+from hyperwallet.tests.standin import StandInServer, payment, receipt
+
+try:
+    from jose import jws as joseJWS
+except ImportError:
+    joseJWS = None
+
+RESOURCES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'hyperwallet', 'tests', 'resources')
+
+USER_TOKEN = 'usr-00000000-0000-0000-0000-000000000001'
+
+
+def encryptionData():
+    '''
+    The encryption settings of the client, using the key sets of the tests.
+    '''
+
+    return {
+        'clientPrivateKeySetLocation': os.path.join(RESOURCES, 'private-jwkset1'),
+        'hyperwalletKeySetLocation': os.path.join(RESOURCES, 'public-jwkset1')
+    }
+
+
+def createPayment(api, index):
+    return api.createPayment({
+        'amount': '20.00',
+        'clientPaymentId': 'bench-{}'.format(index),
+        'currency': 'USD',
+        'destinationToken': USER_TOKEN,
+        'programToken': 'prg-00000000-0000-0000-0000-000000000001',
+        'purpose': 'OTHER'
+    })
+
+
+def listReceiptsForUser(api, index):
+    return api.listReceiptsForUser(USER_TOKEN, {'limit': 100})
+
+
+def paging(api, index):
+    return sum(1 for item in api.iterReceiptsForUser(USER_TOKEN, pageSize=100))
+
+
+# Cases sending requests to the stand-in server, run once per mode.
+REMOTE_CASES = [
+    ('createPayment', createPayment),
+    ('listReceiptsForUser', listReceiptsForUser),
+    ('paging', paging)
+]
+
+
+def signedMessage(encryption, payload):
+    '''
+    Sign a message like the API does before encrypting a response.
+    '''
+
+    signKey = encryption.keySetCache.findByAlgorithm(encryption.clientPrivateKeySetLocation, encryption.signAlgorithm)
+    jwsToken = JWS(payload.encode('utf-8'))
+    jwsToken.add_signature(signKey.key, None, json_encode({
+        'alg': encryption.signAlgorithm,
+        'kid': signKey.kid,
+        'exp': int(time.time()) + 3600
+    }))
+    return jwsToken.serialize(True)
+
+
+def twoPassVerify(encryption):
+    '''
+    Build the signature check used before the single-pass path, which parsed
+    the signed message with python-jose for its header, then again to verify
+    it with a key serialized back to JSON. Kept as a reference for the
+    ``verify`` case; requires python-jose.
+
+    :returns:
+        Callable taking a signed message.
+    '''
+
+    def verify(payload):
+        header = joseJWS.get_unverified_header(payload)
+        checkSignKey = encryption.keySetCache.findByKid(
+            encryption.hyperwalletKeySetLocation,
+            header.get('kid'),
+            encryption.signAlgorithm
+        )
+        return joseJWS.verify(payload, json.dumps(checkSignKey.data), algorithms=encryption.signAlgorithm)
+
+    return verify
+
+
+def localCases():
+    '''
+    Build the cases that do not send requests.
+
+    :returns:
+        A list of ``(name, operation)`` tuples.
+    '''
+
+    page = [receipt(index, USER_TOKEN) for index in range(100)]
+    payload = json.dumps({'data': page})
+
+    encryption = Encryption(**encryptionData())
+    encrypted = encryption.encrypt(payload)
+    signed = signedMessage(encryption, payload)
+
+    receiver = WebhookReceiver()
+    notifications = [
+        json.dumps({'token': 'wbh-{}'.format(index), 'type': 'PAYMENTS.CREATED', 'object': item}).encode('utf-8')
+        for (index, item) in enumerate(page)
+    ]
+
+    cases = [
+        ('modelConstruction', lambda index: [Receipt(item) for item in page]),
+        ('columnarDecode', lambda index: ColumnarBatch(RECEIPT_COLUMNS).extend(page)),
+        ('encrypt', lambda index: encryption.encrypt(payload)),
+        ('decrypt', lambda index: encryption.decrypt(encrypted)),
+        ('verify', lambda index: encryption.verify(signed)),
+        ('webhookParse', lambda index: [receiver.parse(body).object for body in notifications])
+    ]
+
+    # Decoding a page of Receipts as received, and encoding a batch of
+    # Payments as sent, with every codec available.
+    receiptPage = json.dumps({'hasNextPage': True, 'data': page}).encode('utf-8')
+    paymentBatch = [payment(index) for index in range(100)]
+
+    for (name, codecClass) in sorted(CODECS.items()):
+        try:
+            codec = codecClass()
+        except HyperwalletException:
+            continue
+        cases.append(('decodeReceipts.' + name, lambda index, codec=codec: codec.loads(receiptPage)))
+        cases.append(('encodePayments.' + name, lambda index, codec=codec: [codec.dumps(item) for item in paymentBatch]))
+
+    if joseJWS is not None:
+        reference = twoPassVerify(encryption)
+        cases.append(('verifyTwoPass', lambda index: reference(signed)))
+
+    return cases
+
+
+def measure(operation, iterations, warmup):
+    '''
+    Measure the throughput and latency of an operation.
+
+    :param operation:
+        Callable taking the index of the iteration. **REQUIRED**
+    :param iterations:
+        The number of measured calls. **REQUIRED**
+    :param warmup:
+        The number of calls made before measuring. **REQUIRED**
+    :returns:
+        A dictionary with the operations per second and latencies in seconds.
+    '''
+
+    for index in range(warmup):
+        operation(index)
+
+    histogram = LatencyHistogram()
+    start = time.perf_counter()
+
+    for index in range(warmup, warmup + iterations):
+        callStart = time.perf_counter()
+        operation(index)
+        histogram.record(time.perf_counter() - callStart)
+
+    elapsed = time.perf_counter() - start
+
+    result = histogram.asDict()
+    result['opsPerSecond'] = iterations / elapsed if elapsed else None
+    return result
+
+
+def run(modes=('plain', 'jose'), cases=None, iterations=200, warmup=20, items=1000, report=None):
+    '''
+    Run the benchmark suite.
+
+    :param modes:
+        The modes of the stand-in server, ``plain`` and/or ``jose``.
+    :param cases:
+        The names of the cases to run, None for every case.
+    :param iterations:
+        The number of measured calls per case.
+    :param warmup:
+        The number of calls made before measuring each case.
+    :param items:
+        The number of items of each list endpoint.
+    :param report:
+        Callable taking the mode, case name and result as each case finishes.
+    :returns:
+        A dictionary with the environment and the results keyed by mode and case.
+    '''
+
+    def selected(name):
+        return cases is None or name in cases
+
+    results = {}
+
+    for mode in modes:
+        encrypted = mode == 'jose'
+        server = StandInServer(Encryption(**encryptionData()) if encrypted else None, items=items)
+
+        with server:
+            api = Api('bench-user', 'bench-pass', 'prg-bench', server.url, encryptionData() if encrypted else None)
+
+            for (name, operation) in REMOTE_CASES:
+                if selected(name):
+                    results.setdefault(mode, {})[name] = _runCase(lambda index: operation(api, index), iterations, warmup)
+                    if report:
+                        report(mode, name, results[mode][name])
+
+    for (name, operation) in localCases():
+        if selected(name):
+            results.setdefault('local', {})[name] = _runCase(operation, iterations, warmup)
+            if report:
+                report('local', name, results['local'][name])
+
+    return {
+        'version': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': int(time.time()),
+        'iterations': iterations,
+        'results': results
+    }
+
+
+def _runCase(operation, iterations, warmup):
+    try:
+        return measure(operation, iterations, warmup)
+    except Exception as e:
+        # Keep going so one broken case does not hide the others
+        return {'error': '{}: {}'.format(type(e).__name__, e)}
+
+
+def compare(baseline, current, threshold=0.1):
+    '''
+    Compare the throughput of two benchmark runs.
+
+    :param baseline:
+        The results of the reference run. **REQUIRED**
+    :param current:
+        The results of the new run. **REQUIRED**
+    :param threshold:
+        The relative throughput loss reported as a regression.
+    :returns:
+        A list of ``(mode, case, ratio, regressed)`` tuples for the cases
+        measured in both runs, where ratio is current over baseline ops/sec.
+    '''
+
+    comparison = []
+
+    for (mode, cases) in sorted(current['results'].items()):
+        for (name, result) in sorted(cases.items()):
+            before = baseline['results'].get(mode, {}).get(name, {}).get('opsPerSecond')
+            after = result.get('opsPerSecond')
+
+            if before and after:
+                ratio = after / before
+                comparison.append((mode, name, ratio, ratio < 1 - threshold))
+
+    return comparison
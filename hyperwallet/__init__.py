@@ -38,4 +38,52 @@ from .models import (
     RejectReason,
 )
 
-from .api import Api                                                     # noqa
+# The clients are imported on first use, along with the HTTP libraries.
+_CLIENTS = {
+    'Api': 'api',
+    'AsyncApi': 'asyncapi',
+}
+
+__all__ = [
+    '__version__',
+    'Api',
+    'AsyncApi',
+    'HyperwalletModel',
+    'User',
+    'TransferMethod',
+    'BankAccount',
+    'BankCard',
+    'PrepaidCard',
+    'PaperCheck',
+    'Transfer',
+    'AuthenticationToken',
+    'PayPalAccount',
+    'VenmoAccount',
+    'Payment',
+    'Balance',
+    'Receipt',
+    'Program',
+    'Account',
+    'StatusTransition',
+    'TransferMethodConfiguration',
+    'Webhook',
+    'TransferRefunds',
+    'HyperwalletVerificationDocument',
+    'HyperwalletVerificationDocumentReason',
+    'RejectReason',
+]
+
+
+def __getattr__(name):
+    if name not in _CLIENTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    import importlib
+
+    value = getattr(importlib.import_module('.' + _CLIENTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CLIENTS))
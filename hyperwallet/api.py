@@ -1,8 +1,18 @@
 #!/usr/bin/env python
 
+import uuid
+
+from datetime import timedelta
+
+try:
+    from urllib.parse import urlencode
+except ImportError:
+    from urllib import urlencode  # Python 2
+
 from .config import SERVER
 from .exceptions import HyperwalletException
-from .utils import ApiClient
+from .utils import ApiClient, PageIterator
+from .utils.bulk import BulkSubmitter
 
 from hyperwallet import (
     User,
@@ -44,6 +54,58 @@ class Api(object):
         Your UAT or Production API URL if applicable.
     :param encryptionData:
         Dictionary with params for encrypted requests (keys: clientPrivateKeySetLocation, hyperwalletKeySetLocation, etc).
+    :param poolConnections:
+        The number of connection pools (one per host) to cache.
+    :param poolMaxSize:
+        The maximum number of connections kept open per host. Set it to the
+        number of threads sharing this instance.
+    :param poolBlock:
+        Wait for a free connection instead of opening one that is discarded
+        once the pool is full.
+    :param keepAlive:
+        Reuse connections between requests.
+    :param socketOptions:
+        A list of ``(level, option, value)`` tuples set on every new socket.
+    :param retryPolicy:
+        A RetryPolicy deciding if failed requests are sent again. Requests are
+        not retried by default.
+    :param rateLimiter:
+        A RateLimiter pacing requests, for example with separate budgets for
+        reads and writes. Requests are not limited by default.
+    :param hooks:
+        A list of RequestHook called before each request, after each response
+        and on errors, such as a MetricsCollector.
+    :param responseCache:
+        A ResponseCache keeping the GET responses of resources that rarely
+        change. Responses are not cached by default.
+    :param singleFlight:
+        A SingleFlight sharing one request between identical GETs made at the
+        same time. Requests are not shared by default.
+    :param encryptionProcesses:
+        The number of processes encrypting requests and decrypting responses
+        when encryptionData is set. Encryption runs in the calling thread by
+        default.
+    :param codec:
+        The codec encoding request bodies and decoding response bodies, such
+        as a JsonCodec, or its name: ``json`` or ``orjson``. Defaults to
+        orjson when it is installed, and to the json module otherwise.
+    :param timeout:
+        The seconds to wait for a connection and for the response, as a
+        number or a ``(connect, read)`` tuple. None waits indefinitely. Use
+        ``hyperwallet.utils.Timeout`` to override it for some calls, and
+        ``hyperwallet.utils.Deadline`` to bound a group of calls. Defaults to
+        10 seconds to connect and 60 seconds to read.
+    :param hedgePolicy:
+        A HedgePolicy sending a second copy of GET requests slower than
+        usual and using the first response. Requests are not hedged by
+        default.
+    :param circuitBreaker:
+        A CircuitBreaker failing requests fast, with a CIRCUIT_OPEN error,
+        on endpoints that keep failing. Requests are always sent by default.
+    :param http2:
+        Send requests over HTTP/2 with httpx, which multiplexes concurrent
+        requests over up to ``poolMaxSize`` connections. Requires the
+        ``http2`` extra.
 
     .. note::
         **server** defaults to the Hyperwallet Sandbox URL if not provided.
@@ -55,7 +117,23 @@ class Api(object):
                  password=None,
                  programToken=None,
                  server=SERVER,
-                 encryptionData=None):
+                 encryptionData=None,
+                 poolConnections=10,
+                 poolMaxSize=10,
+                 poolBlock=False,
+                 keepAlive=True,
+                 socketOptions=None,
+                 retryPolicy=None,
+                 rateLimiter=None,
+                 hooks=None,
+                 responseCache=None,
+                 singleFlight=None,
+                 encryptionProcesses=None,
+                 codec=None,
+                 timeout=(10, 60),
+                 hedgePolicy=None,
+                 circuitBreaker=None,
+                 http2=False):
         '''
         Create an instance of the API interface.
         This is the main interface the user will call to interact with the API.
@@ -75,7 +153,42 @@ class Api(object):
         self.programToken = programToken
         self.server = server
 
-        self.apiClient = ApiClient(self.username, self.password, self.server, encryptionData)
+        self.apiClient = ApiClient(
+            self.username,
+            self.password,
+            self.server,
+            encryptionData,
+            poolConnections=poolConnections,
+            poolMaxSize=poolMaxSize,
+            poolBlock=poolBlock,
+            keepAlive=keepAlive,
+            socketOptions=socketOptions,
+            retryPolicy=retryPolicy,
+            rateLimiter=rateLimiter,
+            hooks=hooks,
+            responseCache=responseCache,
+            singleFlight=singleFlight,
+            encryptionProcesses=encryptionProcesses,
+            codec=codec,
+            timeout=timeout,
+            hedgePolicy=hedgePolicy,
+            circuitBreaker=circuitBreaker,
+            http2=http2
+        )
+
+    def close(self):
+        '''
+        Close every connection of the pool, and stop the processes started
+        for ``encryptionProcesses`` and the event loop of HTTP/2.
+        '''
+
+        self.apiClient.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     '''
 
@@ -167,6 +280,34 @@ class Api(object):
 
         return [User(x) for x in response.get('data', [])]
 
+    def iterUsers(self,
+                  params=None,
+                  pageSize=None,
+                  prefetch=True):
+        '''
+        Iterate over Users, page by page.
+
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Users.
+        '''
+
+        if params and not set(list(params)).issubset(User.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            User,
+            'users',
+            params,
+            pageSize,
+            prefetch
+        )
+
     def getUserStatusTransition(self,
                                 userToken=None,
                                 statusTransitionToken=None):
@@ -229,6 +370,44 @@ class Api(object):
 
         return [StatusTransition(x) for x in response.get('data', [])]
 
+    def iterUserStatusTransitions(self,
+                                  userToken=None,
+                                  params=None,
+                                  pageSize=None,
+                                  prefetch=True):
+        '''
+        Iterate over User Status Transitions, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of User Status Transitions.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if params and not set(list(params)).issubset(StatusTransition.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            StatusTransition,
+            self.__buildUrl(
+                'users',
+                userToken,
+                'status-transitions'
+            ),
+            params,
+            pageSize,
+            prefetch
+        )
+
     '''
 
     Bank Accounts
@@ -341,6 +520,40 @@ class Api(object):
 
         return [BankAccount(x) for x in response.get('data', [])]
 
+    def iterBankAccounts(self,
+                         userToken=None,
+                         params=None,
+                         pageSize=None,
+                         prefetch=True):
+        '''
+        Iterate over Bank Accounts, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Bank Accounts.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if params and not set(list(params)).issubset(BankAccount.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            BankAccount,
+            self.__buildUrl('users', userToken, 'bank-accounts'),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def createBankAccountStatusTransition(self,
                                           userToken=None,
                                           bankAccountToken=None,
@@ -458,6 +671,52 @@ class Api(object):
 
         return [StatusTransition(x) for x in response.get('data', [])]
 
+    def iterBankAccountStatusTransitions(self,
+                                         userToken=None,
+                                         bankAccountToken=None,
+                                         params=None,
+                                         pageSize=None,
+                                         prefetch=True):
+        '''
+        Iterate over Bank Account Status Transitions, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param bankAccountToken:
+            A token identifying the Bank Account. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Bank Account Status Transitions.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if not bankAccountToken:
+            raise HyperwalletException('bankAccountToken is required')
+
+        if params and not set(list(params)).issubset(StatusTransition.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            StatusTransition,
+            self.__buildUrl(
+                'users',
+                userToken,
+                'bank-accounts',
+                bankAccountToken,
+                'status-transitions'
+            ),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def deactivateBankAccount(self,
                               userToken=None,
                               bankAccountToken=None,
@@ -600,6 +859,40 @@ class Api(object):
 
         return [BankCard(x) for x in response.get('data', [])]
 
+    def iterBankCards(self,
+                      userToken=None,
+                      params=None,
+                      pageSize=None,
+                      prefetch=True):
+        '''
+        Iterate over Bank Cards, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Bank Cards.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if params and not set(list(params)).issubset(BankCard.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            BankCard,
+            self.__buildUrl('users', userToken, 'bank-cards'),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def createBankCardStatusTransition(self,
                                        userToken=None,
                                        bankCardToken=None,
@@ -717,6 +1010,52 @@ class Api(object):
 
         return [StatusTransition(x) for x in response.get('data', [])]
 
+    def iterBankCardStatusTransitions(self,
+                                      userToken=None,
+                                      bankCardToken=None,
+                                      params=None,
+                                      pageSize=None,
+                                      prefetch=True):
+        '''
+        Iterate over Bank Card Status Transitions, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param bankCardToken:
+            A token identifying the Bank Card. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Bank Card Status Transitions.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if not bankCardToken:
+            raise HyperwalletException('bankCardToken is required')
+
+        if params and not set(list(params)).issubset(StatusTransition.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            StatusTransition,
+            self.__buildUrl(
+                'users',
+                userToken,
+                'bank-cards',
+                bankCardToken,
+                'status-transitions'
+            ),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def deactivateBankCard(self,
                            userToken=None,
                            bankCardToken=None,
@@ -859,6 +1198,40 @@ class Api(object):
 
         return [PrepaidCard(x) for x in response.get('data', [])]
 
+    def iterPrepaidCards(self,
+                         userToken=None,
+                         params=None,
+                         pageSize=None,
+                         prefetch=True):
+        '''
+        Iterate over Prepaid Cards, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Prepaid Cards.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if params and not set(list(params)).issubset(PrepaidCard.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            PrepaidCard,
+            self.__buildUrl('users', userToken, 'prepaid-cards'),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def createPrepaidCardStatusTransition(self,
                                           userToken=None,
                                           prepaidCardToken=None,
@@ -976,6 +1349,52 @@ class Api(object):
 
         return [StatusTransition(x) for x in response.get('data', [])]
 
+    def iterPrepaidCardStatusTransitions(self,
+                                         userToken=None,
+                                         prepaidCardToken=None,
+                                         params=None,
+                                         pageSize=None,
+                                         prefetch=True):
+        '''
+        Iterate over Prepaid Card Status Transitions, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param prepaidCardToken:
+            A token identifying the Prepaid Card. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Prepaid Card Status Transitions.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if not prepaidCardToken:
+            raise HyperwalletException('prepaidCardToken is required')
+
+        if params and not set(list(params)).issubset(StatusTransition.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            StatusTransition,
+            self.__buildUrl(
+                'users',
+                userToken,
+                'prepaid-cards',
+                prepaidCardToken,
+                'status-transitions'
+            ),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def deactivatePrepaidCard(self,
                               userToken=None,
                               prepaidCardToken=None,
@@ -1268,6 +1687,40 @@ class Api(object):
 
         return [PaperCheck(x) for x in response.get('data', [])]
 
+    def iterPaperChecks(self,
+                        userToken=None,
+                        params=None,
+                        pageSize=None,
+                        prefetch=True):
+        '''
+        Iterate over Paper Checks, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Paper Checks.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if params and not set(list(params)).issubset(PaperCheck.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            PaperCheck,
+            self.__buildUrl('users', userToken, 'paper-checks'),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def createPaperCheckStatusTransition(self,
                                          userToken=None,
                                          paperCheckToken=None,
@@ -1385,6 +1838,52 @@ class Api(object):
 
         return [StatusTransition(x) for x in response.get('data', [])]
 
+    def iterPaperCheckStatusTransitions(self,
+                                        userToken=None,
+                                        paperCheckToken=None,
+                                        params=None,
+                                        pageSize=None,
+                                        prefetch=True):
+        '''
+        Iterate over Paper Check Status Transitions, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param paperCheckToken:
+            A token identifying the Paper Check. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Paper Check Status Transitions.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if not paperCheckToken:
+            raise HyperwalletException('paperCheckToken is required')
+
+        if params and not set(list(params)).issubset(StatusTransition.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            StatusTransition,
+            self.__buildUrl(
+                'users',
+                userToken,
+                'paper-checks',
+                paperCheckToken,
+                'status-transitions'
+            ),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def deactivatePaperCheck(self,
                              userToken=None,
                              paperCheckToken=None,
@@ -1493,17 +1992,100 @@ class Api(object):
 
         return [Transfer(x) for x in response.get('data', [])]
 
-    def createTransferStatusTransition(self,
-                                       transferToken=None,
-                                       data=None):
-        '''
-        Create a Transfer Status Transition.
-        :param transferToken:
-            A token identifying the Transfer. **REQUIRED**
-        :param data:
-            A dictionary containing Transfer Status Transition information. **REQUIRED**
-        :returns:
-            A Transfer Status Transition.
+    def iterTransfers(self,
+                      params=None,
+                      pageSize=None,
+                      prefetch=True):
+        '''
+        Iterate over Transfers, page by page.
+
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Transfers.
+        '''
+
+        if params and not set(list(params)).issubset(Transfer.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            Transfer,
+            self.__buildUrl('transfers'),
+            params,
+            pageSize,
+            prefetch
+        )
+
+    def exportTransfers(self,
+                        directory=None,
+                        start=None,
+                        end=None,
+                        params=None,
+                        format='csv',
+                        windowSize=timedelta(days=1),
+                        maxWorkers=4,
+                        rowsPerFile=50000,
+                        pageSize=100):
+        '''
+        Export Transfers created within a period to files, page by page.
+
+        :param directory:
+            The directory the files are written to. **REQUIRED**
+        :param start:
+            The beginning of the period, included, as a datetime or timestamp string. **REQUIRED**
+        :param end:
+            The end of the period, excluded, as a datetime or timestamp string. **REQUIRED**
+        :param params:
+            A dictionary containing additional query parameters.
+        :param format:
+            The file format, ``csv`` or ``parquet`` (requires pyarrow).
+        :param windowSize:
+            The duration of each date window, as a timedelta.
+        :param maxWorkers:
+            The number of date windows fetched concurrently.
+        :param rowsPerFile:
+            The number of rows after which a new file is started.
+        :param pageSize:
+            The number of items requested per page.
+        :returns:
+            An Exporter. Its run method writes the files, resuming an
+            interrupted export, and returns an ExportResult.
+        '''
+
+        if params and not set(list(params)).issubset(Transfer.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__export(
+            Transfer,
+            self.__buildUrl('transfers'),
+            directory,
+            'transfers',
+            start,
+            end,
+            params,
+            format,
+            windowSize,
+            maxWorkers,
+            rowsPerFile,
+            pageSize,
+            False
+        )
+
+    def createTransferStatusTransition(self,
+                                       transferToken=None,
+                                       data=None):
+        '''
+        Create a Transfer Status Transition.
+        :param transferToken:
+            A token identifying the Transfer. **REQUIRED**
+        :param data:
+            A dictionary containing Transfer Status Transition information. **REQUIRED**
+        :returns:
+            A Transfer Status Transition.
         '''
 
         if not transferToken:
@@ -1640,6 +2222,40 @@ class Api(object):
 
         return [PayPalAccount(x) for x in response.get('data', [])]
 
+    def iterPayPalAccounts(self,
+                           userToken=None,
+                           params=None,
+                           pageSize=None,
+                           prefetch=True):
+        '''
+        Iterate over PayPal Accounts, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of PayPal Accounts.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if params and not set(list(params)).issubset(PayPalAccount.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            PayPalAccount,
+            self.__buildUrl('users', userToken, 'paypal-accounts'),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def createPayPalAccountStatusTransition(self,
                                             userToken=None,
                                             payPalAccountToken=None,
@@ -1757,6 +2373,52 @@ class Api(object):
 
         return [StatusTransition(x) for x in response.get('data', [])]
 
+    def iterPayPalAccountStatusTransitions(self,
+                                           userToken=None,
+                                           payPalAccountToken=None,
+                                           params=None,
+                                           pageSize=None,
+                                           prefetch=True):
+        '''
+        Iterate over PayPal Account Status Transitions, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param payPalAccountToken:
+            A token identifying the PayPal Account. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of PayPal Account Status Transitions.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if not payPalAccountToken:
+            raise HyperwalletException('payPalAccountToken is required')
+
+        if params and not set(list(params)).issubset(StatusTransition.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            StatusTransition,
+            self.__buildUrl(
+                'users',
+                userToken,
+                'paypal-accounts',
+                payPalAccountToken,
+                'status-transitions'
+            ),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def deactivatePayPalAccount(self,
                                 userToken=None,
                                 payPalAccountToken=None,
@@ -1904,6 +2566,40 @@ class Api(object):
 
         return [VenmoAccount(x) for x in response.get('data', [])]
 
+    def iterVenmoAccounts(self,
+                          userToken=None,
+                          params=None,
+                          pageSize=None,
+                          prefetch=True):
+        '''
+        Iterate over Venmo Accounts, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Venmo Accounts.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if params and not set(list(params)).issubset(VenmoAccount.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            VenmoAccount,
+            self.__buildUrl('users', userToken, 'venmo-accounts'),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def createVenmoAccountStatusTransition(self,
                                            userToken=None,
                                            venmoAccountToken=None,
@@ -2021,6 +2717,52 @@ class Api(object):
 
         return [StatusTransition(x) for x in response.get('data', [])]
 
+    def iterVenmoAccountStatusTransitions(self,
+                                          userToken=None,
+                                          venmoAccountToken=None,
+                                          params=None,
+                                          pageSize=None,
+                                          prefetch=True):
+        '''
+        Iterate over Venmo Account Status Transitions, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param venmoAccountToken:
+            A token identifying the Venmo Account. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Venmo Account Status Transitions.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if not venmoAccountToken:
+            raise HyperwalletException('venmoAccountToken is required')
+
+        if params and not set(list(params)).issubset(StatusTransition.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            StatusTransition,
+            self.__buildUrl(
+                'users',
+                userToken,
+                'venmo-accounts',
+                venmoAccountToken,
+                'status-transitions'
+            ),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def deactivateVenmoAccount(self,
                                userToken=None,
                                venmoAccountToken=None,
@@ -2102,6 +2844,67 @@ class Api(object):
 
         return Payment(response)
 
+    def createPayments(self,
+                       payments=None,
+                       maxWorkers=8,
+                       rateLimit=None,
+                       maxAttempts=3):
+        '''
+        Create many Payments concurrently.
+
+        Payments without a clientPaymentId are given a generated one. Before a
+        Payment is sent again after a communication error, it is looked up by
+        its clientPaymentId so it is never created twice.
+
+        :param payments:
+            An iterable of dictionaries containing Payment information. **REQUIRED**
+        :param maxWorkers:
+            The number of Payments created concurrently.
+        :param rateLimit:
+            The maximum number of requests started per second.
+        :param maxAttempts:
+            The number of times a Payment is sent when the API cannot be reached.
+        :returns:
+            A BulkSubmitter yielding a BulkResult per Payment as it completes,
+            with a summary once exhausted.
+        '''
+
+        if payments is None:
+            raise HyperwalletException('payments is required')
+
+        return BulkSubmitter(
+            self.createPayment,
+            (self.__withClientPaymentId(data) for data in payments),
+            maxWorkers=maxWorkers,
+            rateLimit=rateLimit,
+            maxAttempts=maxAttempts,
+            recover=self.__findPaymentByClientPaymentId
+        )
+
+    def __withClientPaymentId(self, data):
+        '''
+        Copy Payment information, generating a clientPaymentId if missing.
+        '''
+
+        data = dict(data or {})
+
+        if not data.get('clientPaymentId'):
+            data['clientPaymentId'] = str(uuid.uuid4())
+
+        return data
+
+    def __findPaymentByClientPaymentId(self, data):
+        '''
+        Retrieve the Payment created with the clientPaymentId of Payment information.
+
+        :returns:
+            A Payment, or None if it was not created.
+        '''
+
+        payments = self.listPayments({'clientPaymentId': data['clientPaymentId']})
+
+        return payments[0] if payments else None
+
     def getPayment(self,
                    paymentToken=None):
         '''
@@ -2140,6 +2943,140 @@ class Api(object):
 
         return [Payment(x) for x in response.get('data', [])]
 
+    def iterPayments(self,
+                     params=None,
+                     pageSize=None,
+                     prefetch=True):
+        '''
+        Iterate over Payments, page by page.
+
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Payments.
+        '''
+
+        if params and not set(list(params)).issubset(Payment.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            Payment,
+            'payments',
+            params,
+            pageSize,
+            prefetch
+        )
+
+    def exportPayments(self,
+                       directory=None,
+                       start=None,
+                       end=None,
+                       params=None,
+                       format='csv',
+                       windowSize=timedelta(days=1),
+                       maxWorkers=4,
+                       rowsPerFile=50000,
+                       pageSize=100):
+        '''
+        Export Payments created within a period to files, page by page.
+
+        :param directory:
+            The directory the files are written to. **REQUIRED**
+        :param start:
+            The beginning of the period, included, as a datetime or timestamp string. **REQUIRED**
+        :param end:
+            The end of the period, excluded, as a datetime or timestamp string. **REQUIRED**
+        :param params:
+            A dictionary containing additional query parameters.
+        :param format:
+            The file format, ``csv`` or ``parquet`` (requires pyarrow).
+        :param windowSize:
+            The duration of each date window, as a timedelta.
+        :param maxWorkers:
+            The number of date windows fetched concurrently.
+        :param rowsPerFile:
+            The number of rows after which a new file is started.
+        :param pageSize:
+            The number of items requested per page.
+        :returns:
+            An Exporter. Its run method writes the files, resuming an
+            interrupted export, and returns an ExportResult.
+        '''
+
+        if params and not set(list(params)).issubset(Payment.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__export(
+            Payment,
+            'payments',
+            directory,
+            'payments',
+            start,
+            end,
+            params,
+            format,
+            windowSize,
+            maxWorkers,
+            rowsPerFile,
+            pageSize,
+            True
+        )
+
+    def syncPayments(self,
+                     store=None,
+                     handler=None,
+                     start=None,
+                     params=None,
+                     stream=None,
+                     windowSize=timedelta(days=1),
+                     maxWorkers=4,
+                     pageSize=100):
+        '''
+        Synchronize Payments created since the previous run.
+
+        :param store:
+            The WatermarkStore keeping the position of the stream. **REQUIRED**
+        :param handler:
+            Callable taking the list of new Payments of each date window. **REQUIRED**
+        :param start:
+            Where the first run starts, as a datetime or timestamp string.
+            Required until the stream has a watermark.
+        :param params:
+            A dictionary containing additional query parameters.
+        :param stream:
+            The name of the stream in the store. Defaults to the endpoint and
+            its query parameters.
+        :param windowSize:
+            The duration of each date window, as a timedelta.
+        :param maxWorkers:
+            The number of date windows requested concurrently.
+        :param pageSize:
+            The number of items requested per page.
+        :returns:
+            An IncrementalSync. Its run method hands the new Payments over and
+            returns a SyncResult.
+        '''
+
+        if params and not set(list(params)).issubset(Payment.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__sync(
+            Payment,
+            'payments',
+            store,
+            handler,
+            start,
+            params,
+            stream,
+            windowSize,
+            maxWorkers,
+            pageSize
+        )
+
     def getPaymentStatusTransition(self,
                                    paymentToken=None,
                                    statusTransitionToken=None):
@@ -2202,6 +3139,44 @@ class Api(object):
 
         return [StatusTransition(x) for x in response.get('data', [])]
 
+    def iterPaymentStatusTransitions(self,
+                                     paymentToken=None,
+                                     params=None,
+                                     pageSize=None,
+                                     prefetch=True):
+        '''
+        Iterate over Payment Status Transitions, page by page.
+
+        :param paymentToken:
+            A token identifying the Payment. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Payment Status Transitions.
+        '''
+
+        if not paymentToken:
+            raise HyperwalletException('paymentToken is required')
+
+        if params and not set(list(params)).issubset(StatusTransition.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            StatusTransition,
+            self.__buildUrl(
+                'payments',
+                paymentToken,
+                'status-transitions'
+            ),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def createPaymentStatusTransition(self,
                                       paymentToken=None,
                                       data=None):
@@ -2267,6 +3242,40 @@ class Api(object):
 
         return [Balance(x) for x in response.get('data', [])]
 
+    def iterBalancesForUser(self,
+                            userToken=None,
+                            params=None,
+                            pageSize=None,
+                            prefetch=True):
+        '''
+        Iterate over User Balances, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Balances.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if params and not set(list(params)).issubset(Balance.filters_array_user):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            Balance,
+            self.__buildUrl('users', userToken, 'balances'),
+            params,
+            pageSize,
+            prefetch
+        )
+
     def listBalancesForPrepaidCard(self,
                                    userToken=None,
                                    prepaidCardToken=None,
@@ -2293,25 +3302,309 @@ class Api(object):
         if params and not set(list(params)).issubset(Balance.filters_array_prepaid_card):
             raise HyperwalletException('Invalid filter')
 
-        response = self.apiClient.doGet(
+        response = self.apiClient.doGet(
+            self.__buildUrl(
+                'users',
+                userToken,
+                'prepaid-cards',
+                prepaidCardToken,
+                'balances'
+            ),
+            params
+        )
+
+        return [Balance(x) for x in response.get('data', [])]
+
+    def iterBalancesForPrepaidCard(self,
+                                   userToken=None,
+                                   prepaidCardToken=None,
+                                   params=None,
+                                   pageSize=None,
+                                   prefetch=True):
+        '''
+        Iterate over Prepaid Card Balances, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param prepaidCardToken:
+            A token identifying the Prepaid Card. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Balances.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if not prepaidCardToken:
+            raise HyperwalletException('prepaidCardToken is required')
+
+        if params and not set(list(params)).issubset(Balance.filters_array_prepaid_card):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            Balance,
+            self.__buildUrl(
+                'users',
+                userToken,
+                'prepaid-cards',
+                prepaidCardToken,
+                'balances'
+            ),
+            params,
+            pageSize,
+            prefetch
+        )
+
+    def listBalancesForAccount(self,
+                               programToken=None,
+                               accountToken=None,
+                               params=None):
+        '''
+        List Account Balances.
+
+        :param programToken:
+            A token identifying the Program. **REQUIRED**
+        :param accountToken:
+            A token identifying the Account. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :returns:
+            An array of Balances.
+        '''
+
+        if not programToken:
+            raise HyperwalletException('programToken is required')
+
+        if not accountToken:
+            raise HyperwalletException('accountToken is required')
+
+        if params and not set(list(params)).issubset(Balance.filters_array_account):
+            raise HyperwalletException('Invalid filter')
+
+        response = self.apiClient.doGet(
+            self.__buildUrl(
+                'programs',
+                programToken,
+                'accounts',
+                accountToken,
+                'balances'
+            ),
+            params
+        )
+
+        return [Balance(x) for x in response.get('data', [])]
+
+    def iterBalancesForAccount(self,
+                               programToken=None,
+                               accountToken=None,
+                               params=None,
+                               pageSize=None,
+                               prefetch=True):
+        '''
+        Iterate over Account Balances, page by page.
+
+        :param programToken:
+            A token identifying the Program. **REQUIRED**
+        :param accountToken:
+            A token identifying the Account. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Balances.
+        '''
+
+        if not programToken:
+            raise HyperwalletException('programToken is required')
+
+        if not accountToken:
+            raise HyperwalletException('accountToken is required')
+
+        if params and not set(list(params)).issubset(Balance.filters_array_account):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            Balance,
+            self.__buildUrl(
+                'programs',
+                programToken,
+                'accounts',
+                accountToken,
+                'balances'
+            ),
+            params,
+            pageSize,
+            prefetch
+        )
+
+    '''
+
+    Receipts
+    https://portal.hyperwallet.com/docs/api/v3/resources/receipts
+
+    '''
+
+    def listReceiptsForUser(self,
+                            userToken=None,
+                            params=None):
+        '''
+        List User Receipts.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :returns:
+            An array of Receipts.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if params and not set(list(params)).issubset(Receipt.filters_array_user):
+            raise HyperwalletException('Invalid filter')
+
+        response = self.apiClient.doGet(
+            self.__buildUrl('users', userToken, 'receipts'),
+            params
+        )
+
+        return [Receipt(x) for x in response.get('data', [])]
+
+    def iterReceiptsForUser(self,
+                            userToken=None,
+                            params=None,
+                            pageSize=None,
+                            prefetch=True):
+        '''
+        Iterate over User Receipts, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Receipts.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if params and not set(list(params)).issubset(Receipt.filters_array_user):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            Receipt,
+            self.__buildUrl('users', userToken, 'receipts'),
+            params,
+            pageSize,
+            prefetch
+        )
+
+    def listReceiptsForPrepaidCard(self,
+                                   userToken=None,
+                                   prepaidCardToken=None,
+                                   params=None):
+        '''
+        List Prepaid Card Receipts.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param prepaidCardToken:
+            A token identifying the Prepaid Card. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :returns:
+            An array of Receipts.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if not prepaidCardToken:
+            raise HyperwalletException('prepaidCardToken is required')
+
+        if params and not set(list(params)).issubset(Receipt.filters_array_prepaid_card):
+            raise HyperwalletException('Invalid filter')
+
+        response = self.apiClient.doGet(
+            self.__buildUrl(
+                'users',
+                userToken,
+                'prepaid-cards',
+                prepaidCardToken,
+                'receipts'
+            ),
+            params
+        )
+
+        return [Receipt(x) for x in response.get('data', [])]
+
+    def iterReceiptsForPrepaidCard(self,
+                                   userToken=None,
+                                   prepaidCardToken=None,
+                                   params=None,
+                                   pageSize=None,
+                                   prefetch=True):
+        '''
+        Iterate over Prepaid Card Receipts, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param prepaidCardToken:
+            A token identifying the Prepaid Card. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Receipts.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if not prepaidCardToken:
+            raise HyperwalletException('prepaidCardToken is required')
+
+        if params and not set(list(params)).issubset(Receipt.filters_array_prepaid_card):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            Receipt,
             self.__buildUrl(
                 'users',
                 userToken,
                 'prepaid-cards',
                 prepaidCardToken,
-                'balances'
+                'receipts'
             ),
-            params
+            params,
+            pageSize,
+            prefetch
         )
 
-        return [Balance(x) for x in response.get('data', [])]
-
-    def listBalancesForAccount(self,
+    def listReceiptsForAccount(self,
                                programToken=None,
                                accountToken=None,
                                params=None):
         '''
-        List Account Balances.
+        List Account Receipts.
 
         :param programToken:
             A token identifying the Program. **REQUIRED**
@@ -2320,7 +3613,7 @@ class Api(object):
         :param params:
             A dictionary containing query parameters.
         :returns:
-            An array of Balances.
+            An array of Receipts.
         '''
 
         if not programToken:
@@ -2329,7 +3622,7 @@ class Api(object):
         if not accountToken:
             raise HyperwalletException('accountToken is required')
 
-        if params and not set(list(params)).issubset(Balance.filters_array_account):
+        if params and not set(list(params)).issubset(Receipt.filters_array_account):
             raise HyperwalletException('Invalid filter')
 
         response = self.apiClient.doGet(
@@ -2338,101 +3631,171 @@ class Api(object):
                 programToken,
                 'accounts',
                 accountToken,
-                'balances'
+                'receipts'
             ),
             params
         )
 
-        return [Balance(x) for x in response.get('data', [])]
-
-    '''
-
-    Receipts
-    https://portal.hyperwallet.com/docs/api/v3/resources/receipts
-
-    '''
+        return [Receipt(x) for x in response.get('data', [])]
 
-    def listReceiptsForUser(self,
-                            userToken=None,
-                            params=None):
+    def iterReceiptsForAccount(self,
+                               programToken=None,
+                               accountToken=None,
+                               params=None,
+                               pageSize=None,
+                               prefetch=True):
         '''
-        List User Receipts.
+        Iterate over Account Receipts, page by page.
 
-        :param userToken:
-            A token identifying the User. **REQUIRED**
+        :param programToken:
+            A token identifying the Program. **REQUIRED**
+        :param accountToken:
+            A token identifying the Account. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
         :returns:
-            An array of Receipts.
+            A PageIterator of Receipts.
         '''
 
-        if not userToken:
-            raise HyperwalletException('userToken is required')
+        if not programToken:
+            raise HyperwalletException('programToken is required')
 
-        if params and not set(list(params)).issubset(Receipt.filters_array_user):
+        if not accountToken:
+            raise HyperwalletException('accountToken is required')
+
+        if params and not set(list(params)).issubset(Receipt.filters_array_account):
             raise HyperwalletException('Invalid filter')
 
-        response = self.apiClient.doGet(
-            self.__buildUrl('users', userToken, 'receipts'),
-            params
+        return self.__iterate(
+            Receipt,
+            self.__buildUrl(
+                'programs',
+                programToken,
+                'accounts',
+                accountToken,
+                'receipts'
+            ),
+            params,
+            pageSize,
+            prefetch
         )
 
-        return [Receipt(x) for x in response.get('data', [])]
-
-    def listReceiptsForPrepaidCard(self,
-                                   userToken=None,
-                                   prepaidCardToken=None,
-                                   params=None):
-        '''
-        List Prepaid Card Receipts.
+    def exportReceiptsForAccount(self,
+                                 programToken=None,
+                                 accountToken=None,
+                                 directory=None,
+                                 start=None,
+                                 end=None,
+                                 params=None,
+                                 format='csv',
+                                 windowSize=timedelta(days=1),
+                                 maxWorkers=4,
+                                 rowsPerFile=50000,
+                                 pageSize=100):
+        '''
+        Export Account Receipts created within a period to files, page by page.
 
-        :param userToken:
-            A token identifying the User. **REQUIRED**
-        :param prepaidCardToken:
-            A token identifying the Prepaid Card. **REQUIRED**
+        :param programToken:
+            A token identifying the Program. **REQUIRED**
+        :param accountToken:
+            A token identifying the Account. **REQUIRED**
+        :param directory:
+            The directory the files are written to. **REQUIRED**
+        :param start:
+            The beginning of the period, included, as a datetime or timestamp string. **REQUIRED**
+        :param end:
+            The end of the period, excluded, as a datetime or timestamp string. **REQUIRED**
         :param params:
-            A dictionary containing query parameters.
+            A dictionary containing additional query parameters.
+        :param format:
+            The file format, ``csv`` or ``parquet`` (requires pyarrow).
+        :param windowSize:
+            The duration of each date window, as a timedelta.
+        :param maxWorkers:
+            The number of date windows fetched concurrently.
+        :param rowsPerFile:
+            The number of rows after which a new file is started.
+        :param pageSize:
+            The number of items requested per page.
         :returns:
-            An array of Receipts.
+            An Exporter. Its run method writes the files, resuming an
+            interrupted export, and returns an ExportResult.
         '''
 
-        if not userToken:
-            raise HyperwalletException('userToken is required')
+        if not programToken:
+            raise HyperwalletException('programToken is required')
 
-        if not prepaidCardToken:
-            raise HyperwalletException('prepaidCardToken is required')
+        if not accountToken:
+            raise HyperwalletException('accountToken is required')
 
-        if params and not set(list(params)).issubset(Receipt.filters_array_prepaid_card):
+        if params and not set(list(params)).issubset(Receipt.filters_array_account):
             raise HyperwalletException('Invalid filter')
 
-        response = self.apiClient.doGet(
+        return self.__export(
+            Receipt,
             self.__buildUrl(
-                'users',
-                userToken,
-                'prepaid-cards',
-                prepaidCardToken,
+                'programs',
+                programToken,
+                'accounts',
+                accountToken,
                 'receipts'
             ),
-            params
+            directory,
+            'receipts-' + accountToken,
+            start,
+            end,
+            params,
+            format,
+            windowSize,
+            maxWorkers,
+            rowsPerFile,
+            pageSize,
+            True
         )
 
-        return [Receipt(x) for x in response.get('data', [])]
-
-    def listReceiptsForAccount(self,
+    def syncReceiptsForAccount(self,
                                programToken=None,
                                accountToken=None,
-                               params=None):
+                               store=None,
+                               handler=None,
+                               start=None,
+                               params=None,
+                               stream=None,
+                               windowSize=timedelta(days=1),
+                               maxWorkers=4,
+                               pageSize=100):
         '''
-        List Account Receipts.
+        Synchronize Account Receipts created since the previous run.
 
         :param programToken:
             A token identifying the Program. **REQUIRED**
         :param accountToken:
             A token identifying the Account. **REQUIRED**
+        :param store:
+            The WatermarkStore keeping the position of the stream. **REQUIRED**
+        :param handler:
+            Callable taking the list of new Account Receipts of each date window. **REQUIRED**
+        :param start:
+            Where the first run starts, as a datetime or timestamp string.
+            Required until the stream has a watermark.
         :param params:
-            A dictionary containing query parameters.
+            A dictionary containing additional query parameters.
+        :param stream:
+            The name of the stream in the store. Defaults to the endpoint and
+            its query parameters.
+        :param windowSize:
+            The duration of each date window, as a timedelta.
+        :param maxWorkers:
+            The number of date windows requested concurrently.
+        :param pageSize:
+            The number of items requested per page.
         :returns:
-            An array of Receipts.
+            An IncrementalSync. Its run method hands the new Account Receipts over and
+            returns a SyncResult.
         '''
 
         if not programToken:
@@ -2444,7 +3807,8 @@ class Api(object):
         if params and not set(list(params)).issubset(Receipt.filters_array_account):
             raise HyperwalletException('Invalid filter')
 
-        response = self.apiClient.doGet(
+        return self.__sync(
+            Receipt,
             self.__buildUrl(
                 'programs',
                 programToken,
@@ -2452,11 +3816,16 @@ class Api(object):
                 accountToken,
                 'receipts'
             ),
-            params
+            store,
+            handler,
+            start,
+            params,
+            stream,
+            windowSize,
+            maxWorkers,
+            pageSize
         )
 
-        return [Receipt(x) for x in response.get('data', [])]
-
     '''
 
     Programs
@@ -2656,13 +4025,63 @@ class Api(object):
             params
         )
 
-        configurations = []
-
         data = response.get('data')
 
         if not data:
             return []
 
+        return self.__parseTransferMethodConfigurations(data)
+
+    def iterTransferMethodConfigurations(self,
+                                         userToken=None,
+                                         params=None,
+                                         pageSize=None,
+                                         prefetch=True):
+        '''
+        Iterate over Transfer Method Configurations, page by page.
+
+        :param userToken:
+            A token identifying the User. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Transfer Method Configurations.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if params and not set(list(params)).issubset(TransferMethodConfiguration.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        params = dict(params or {})
+        params.update({'userToken': userToken})
+
+        return PageIterator(
+            self.apiClient.doGet,
+            'transfer-method-configurations',
+            self.__parseTransferMethodConfigurations,
+            params,
+            pageSize,
+            prefetch
+        )
+
+    def __parseTransferMethodConfigurations(self, data):
+        '''
+        Expand Transfer Method Configurations to one per country and currency.
+
+        :param data:
+            The data array of a Transfer Method Configurations response. **REQUIRED**
+        :returns:
+            An array of Transfer Method Configurations.
+        '''
+
+        configurations = []
+
         for collection in data:
             countries = collection.pop('countries', [])
             currencies = collection.pop('currencies', [])
@@ -2761,9 +4180,251 @@ class Api(object):
 
         return [Webhook(x) for x in response.get('data', [])]
 
+    def iterWebhookNotifications(self,
+                                 params=None,
+                                 pageSize=None,
+                                 prefetch=True):
+        '''
+        Iterate over Webhook Notifications, page by page.
+
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Webhooks.
+        '''
+
+        if params and not set(list(params)).issubset(Webhook.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            Webhook,
+            'webhook-notifications',
+            params,
+            pageSize,
+            prefetch
+        )
+
+    def syncWebhookNotifications(self,
+                                 store=None,
+                                 handler=None,
+                                 start=None,
+                                 params=None,
+                                 stream=None,
+                                 windowSize=timedelta(days=1),
+                                 maxWorkers=4,
+                                 pageSize=100):
+        '''
+        Synchronize Webhook Notifications created since the previous run.
+
+        :param store:
+            The WatermarkStore keeping the position of the stream. **REQUIRED**
+        :param handler:
+            Callable taking the list of new Webhook Notifications of each date window. **REQUIRED**
+        :param start:
+            Where the first run starts, as a datetime or timestamp string.
+            Required until the stream has a watermark.
+        :param params:
+            A dictionary containing additional query parameters.
+        :param stream:
+            The name of the stream in the store. Defaults to the endpoint and
+            its query parameters.
+        :param windowSize:
+            The duration of each date window, as a timedelta.
+        :param maxWorkers:
+            The number of date windows requested concurrently.
+        :param pageSize:
+            The number of items requested per page.
+        :returns:
+            An IncrementalSync. Its run method hands the new Webhook Notifications over and
+            returns a SyncResult.
+        '''
+
+        if params and not set(list(params)).issubset(Webhook.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__sync(
+            Webhook,
+            'webhook-notifications',
+            store,
+            handler,
+            start,
+            params,
+            stream,
+            windowSize,
+            maxWorkers,
+            pageSize
+        )
+
+    def replayWebhookNotifications(self,
+                                   receiver=None,
+                                   start=None,
+                                   end=None,
+                                   params=None,
+                                   windowSize=timedelta(hours=1),
+                                   maxWorkers=4,
+                                   pageSize=100):
+        '''
+        Hand over the Webhook Notifications of a period to the handlers of a
+        receiver, skipping those it already handled.
+
+        :param receiver:
+            The WebhookReceiver whose handlers and token store are used. **REQUIRED**
+        :param start:
+            The start of the period, as a datetime or timestamp string. **REQUIRED**
+        :param end:
+            The end of the period, as a datetime or timestamp string. Defaults to now.
+        :param params:
+            A dictionary containing additional query parameters.
+        :param windowSize:
+            The duration of each date window, as a timedelta.
+        :param maxWorkers:
+            The number of date windows requested concurrently.
+        :param pageSize:
+            The number of items requested per page.
+        :returns:
+            A WebhookReplay. Its run method hands the Webhook Notifications over
+            in the order they were created and returns a ReplayResult.
+        '''
+
+        if not receiver:
+            raise HyperwalletException('receiver is required')
+
+        if not start:
+            raise HyperwalletException('start is required')
+
+        if params and not set(list(params)).issubset(Webhook.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        from .utils.webhooks import WebhookReplay
+
+        return WebhookReplay(
+            self.apiClient.doGet,
+            receiver,
+            start,
+            end,
+            params,
+            windowSize=windowSize,
+            maxWorkers=maxWorkers,
+            pageSize=pageSize
+        )
+
     def __buildUrl(self, *paths):
         return '/'.join(s.strip('/') for s in paths)
 
+    def __iterate(self, model, partialUrl, params, pageSize, prefetch):
+        '''
+        Create a PageIterator yielding one model per item of a list endpoint.
+
+        :param model:
+            The Model class to build from each item. **REQUIRED**
+        :param partialUrl:
+            A partial URL to specify the API endpoint. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator.
+        '''
+
+        return PageIterator(
+            self.apiClient.doGet,
+            partialUrl,
+            lambda data: [model(x) for x in data],
+            params,
+            pageSize,
+            prefetch
+        )
+
+    def __export(self, model, partialUrl, directory, name, start, end, params, format,
+                 windowSize, maxWorkers, rowsPerFile, pageSize, sortable):
+        '''
+        Create an Exporter writing the fields of a model for a list endpoint.
+
+        :param model:
+            The Model class whose fields are exported. **REQUIRED**
+        :param partialUrl:
+            A partial URL to specify the API endpoint. **REQUIRED**
+        :param sortable:
+            True if the endpoint accepts ``sortBy=createdOn``. **REQUIRED**
+        :returns:
+            An Exporter.
+        '''
+
+        if not directory:
+            raise HyperwalletException('directory is required')
+
+        if not start:
+            raise HyperwalletException('start is required')
+
+        if not end:
+            raise HyperwalletException('end is required')
+
+        from .utils.export import Exporter
+
+        return Exporter(
+            self.apiClient.doGet,
+            partialUrl,
+            model.defaults,
+            directory,
+            name,
+            start,
+            end,
+            params,
+            format=format,
+            windowSize=windowSize,
+            maxWorkers=maxWorkers,
+            rowsPerFile=rowsPerFile,
+            pageSize=pageSize,
+            sortable=sortable
+        )
+
+    def __sync(self, model, partialUrl, store, handler, start, params, stream,
+               windowSize, maxWorkers, pageSize):
+        '''
+        Create an IncrementalSync handing over the new models of a list endpoint.
+
+        :param model:
+            The Model class to build from each item. **REQUIRED**
+        :param partialUrl:
+            A partial URL to specify the API endpoint. **REQUIRED**
+        :returns:
+            An IncrementalSync.
+        '''
+
+        if not store:
+            raise HyperwalletException('store is required')
+
+        if not handler:
+            raise HyperwalletException('handler is required')
+
+        if not stream:
+            stream = partialUrl
+            if params:
+                stream += '?' + urlencode(sorted(params.items()))
+
+        from .utils.sync import IncrementalSync
+
+        return IncrementalSync(
+            self.apiClient.doGet,
+            partialUrl,
+            store,
+            stream,
+            handler,
+            lambda data: [model(x) for x in data],
+            start=start,
+            params=params,
+            windowSize=windowSize,
+            maxWorkers=maxWorkers,
+            pageSize=pageSize
+        )
+
     def setDocumentAndReasonFromResponseHelper(self,
                                                data=None):
         '''
@@ -3113,6 +4774,41 @@ class Api(object):
 
         return TransferRefunds(response)
 
+    def iterTransferRefunds(self,
+                            transferToken=None,
+                            params=None,
+                            pageSize=None,
+                            prefetch=True):
+        '''
+        Iterate over Transfer Refunds, page by page.
+
+        :param transferToken:
+            A token identifying the Transfer. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Transfer Refunds.
+        '''
+
+        if not transferToken:
+            raise HyperwalletException('transferToken is required')
+
+        return self.__iterate(
+            TransferRefunds,
+            self.__buildUrl(
+                'transfers',
+                transferToken,
+                'refunds'
+            ),
+            params,
+            pageSize,
+            prefetch
+        )
+
     '''
         List Transfer Methods
     '''
@@ -3146,6 +4842,44 @@ class Api(object):
 
         return TransferMethod(response)
 
+    def iterTransferMethods(self,
+                            userToken=None,
+                            params=None,
+                            pageSize=None,
+                            prefetch=True):
+        '''
+        Iterate over Transfer Methods, page by page.
+
+        :param userToken:
+            A token identifying the Transfer. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Transfer Methods.
+        '''
+
+        if not userToken:
+            raise HyperwalletException('userToken is required')
+
+        if params and not set(list(params)).issubset(TransferMethod.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            TransferMethod,
+            self.__buildUrl(
+                'users',
+                userToken,
+                'transfer-methods'
+            ),
+            params,
+            pageSize,
+            prefetch
+        )
+
     '''
 
         Get Transfer Status Transition
@@ -3217,3 +4951,41 @@ class Api(object):
         )
 
         return StatusTransition(response)
+
+    def iterTransferStatusTransitions(self,
+                                      transferToken=None,
+                                      params=None,
+                                      pageSize=None,
+                                      prefetch=True):
+        '''
+        Iterate over Transfer Status Transitions, page by page.
+
+        :param transferToken:
+            A token identifying the Transfer. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :param pageSize:
+            The number of items requested per page.
+        :param prefetch:
+            Request the next page while the current one is being processed.
+        :returns:
+            A PageIterator of Transfer Status Transitions.
+        '''
+
+        if not transferToken:
+            raise HyperwalletException('transferToken is required')
+
+        if params and not set(list(params)).issubset(StatusTransition.filters_array):
+            raise HyperwalletException('Invalid filter')
+
+        return self.__iterate(
+            StatusTransition,
+            self.__buildUrl(
+                'transfers',
+                transferToken,
+                'status-transitions'
+            ),
+            params,
+            pageSize,
+            prefetch
+        )
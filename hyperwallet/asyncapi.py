@@ -0,0 +1,420 @@
+#!/usr/bin/env python
+
+import asyncio
+import contextvars
+import functools
+
+from .api import Api
+from .config import SERVER
+from .exceptions import HyperwalletException
+from .utils import AsyncApiClient, AsyncPageIterator
+
+# The Api methods returning an object that sends many requests, which
+# AsyncApi runs in worker threads.
+_THREADED = (
+    'createPayments',
+    'exportPayments',
+    'exportReceiptsForAccount',
+    'exportTransfers',
+    'replayWebhookNotifications',
+    'syncPayments',
+    'syncReceiptsForAccount',
+    'syncWebhookNotifications'
+)
+
+# The public methods of Api sending no request, shared as they are.
+_LOCAL = (
+    'setDocumentAndReasonFromResponseHelper',
+)
+
+
+class _RequestCaptured(Exception):
+    '''
+    Raised by _ReplayClient to stop an Api method at its API request.
+    '''
+
+    def __init__(self, name, args, kwargs):
+        super(_RequestCaptured, self).__init__(name)
+
+        self.name = name
+        self.requestArgs = args
+        self.requestKwargs = kwargs
+
+
+class _ReplayClient(object):
+    '''
+    Stands in for the ApiClient while an Api method runs synchronously.
+
+    Without a response, the first request of the method is captured and the
+    method is interrupted. With a response, the request returns it, so the
+    method can build its models. A method sending a second request cannot
+    be replayed, and fails.
+
+    :param response:
+        The API response to return to the Api method.
+    '''
+
+    _missing = object()
+
+    def __init__(self, response=_missing):
+        self.response = response
+        self.requests = 0
+
+    def __getattr__(self, name):
+        if not name.startswith('do') and name != 'putDocument':
+            raise AttributeError(name)
+
+        def request(*args, **kwargs):
+            if self.response is self._missing:
+                raise _RequestCaptured(name, args, kwargs)
+
+            self.requests += 1
+            if self.requests > 1:
+                raise HyperwalletException('AsyncApi cannot run methods sending more than one request')
+
+            return self.response
+
+        return request
+
+
+class _LoopClient(object):
+    '''
+    Stands in for the ApiClient in worker threads, sending their requests
+    through the asyncio client on its event loop.
+
+    :param apiClient:
+        The AsyncApiClient sending the requests. **REQUIRED**
+    '''
+
+    def __init__(self, apiClient):
+        self.apiClient = apiClient
+        self.loop = None
+
+    def __getattr__(self, name):
+        if not name.startswith('do') and name != 'putDocument':
+            raise AttributeError(name)
+
+        send = getattr(self.apiClient, name)
+
+        def request(*args, **kwargs):
+            if self.loop is None or _runningLoop() is self.loop:
+                # Waiting on the loop from its own thread would never return.
+                raise HyperwalletException('AsyncApi requests must be run with await')
+
+            return asyncio.run_coroutine_threadsafe(send(*args, **kwargs), self.loop).result()
+
+        return request
+
+
+def _runningLoop():
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class AsyncRunner(object):
+    '''
+    Runs an object returned by an Api method, such as an Exporter, in worker
+    threads, while its requests are sent by the asyncio client.
+
+    Its ``run`` method is a coroutine, and iterating it with ``async for``
+    iterates the object. Other attributes, such as the ``summary`` of a
+    BulkSubmitter, are those of the object.
+
+    :param target:
+        The object returned by the Api method. **REQUIRED**
+    :param client:
+        The stand-in client the object sends its requests to. **REQUIRED**
+    '''
+
+    def __init__(self, target, client):
+        self.target = target
+        self.client = client
+
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+
+    async def run(self):
+        '''
+        Run the object to completion.
+
+        :returns:
+            The result of its run method.
+        '''
+
+        return await self.__inThread(self.target.run)
+
+    async def __aiter__(self):
+        '''
+        Iterate over the object, such as the BulkResults of a BulkSubmitter.
+        '''
+
+        iterator = iter(self.target)
+        end = object()
+
+        try:
+            while True:
+                item = await self.__inThread(next, iterator, end)
+                if item is end:
+                    return
+                yield item
+        finally:
+            if hasattr(iterator, 'close'):
+                await self.__inThread(iterator.close)
+
+    async def __inThread(self, function, *args):
+        loop = asyncio.get_running_loop()
+        self.client.loop = loop
+
+        # Keep the Deadline and Timeout of the caller.
+        return await loop.run_in_executor(None, contextvars.copy_context().run, function, *args)
+
+
+class AsyncApi(object):
+    '''
+    An asyncio Python interface for the Hyperwallet API.
+
+    Every public method of Api sending a request is available as a coroutine
+    with the same parameters and returning the same models, the ``iter*``
+    methods returning an AsyncPageIterator to use with ``async for``.
+
+    The methods returning an object that sends many requests, such as
+    ``createPayments`` and the ``export*``, ``sync*`` and
+    ``replayWebhookNotifications`` methods, return an AsyncRunner: await its
+    ``run`` method, or iterate it with ``async for``. The object runs in
+    worker threads, which also call its handlers.
+
+    :param username:
+        The username of this API user. **REQUIRED**
+    :param password:
+        The password of this API user. **REQUIRED**
+    :param programToken:
+        The token for the program this user is accessing. **REQUIRED**
+    :param server:
+        Your UAT or Production API URL if applicable.
+    :param encryptionData:
+        Dictionary with params for encrypted requests (keys: clientPrivateKeySetLocation, hyperwalletKeySetLocation, etc).
+    :param maxConnections:
+        The maximum number of connections kept open to the API.
+    :param retryPolicy:
+        A RetryPolicy deciding if failed requests are sent again. Requests are
+        not retried by default.
+    :param rateLimiter:
+        A RateLimiter pacing requests, for example with separate budgets for
+        reads and writes. Requests are not limited by default.
+    :param hooks:
+        A list of RequestHook called before each request, after each response
+        and on errors, such as a MetricsCollector.
+    :param responseCache:
+        A ResponseCache keeping the GET responses of resources that rarely
+        change. Responses are not cached by default.
+    :param singleFlight:
+        A SingleFlight sharing one request between identical GETs made at the
+        same time. Requests are not shared by default.
+    :param encryptionProcesses:
+        The number of processes encrypting requests and decrypting responses
+        when encryptionData is set. Encryption runs in the calling thread by
+        default.
+    :param codec:
+        The codec encoding request bodies and decoding response bodies, such
+        as a JsonCodec, or its name: ``json`` or ``orjson``. Defaults to
+        orjson when it is installed, and to the json module otherwise.
+    :param timeout:
+        The seconds to wait for a connection and for the response, as a
+        number or a ``(connect, read)`` tuple. None waits indefinitely. Use
+        ``hyperwallet.utils.Timeout`` to override it for some calls, and
+        ``hyperwallet.utils.Deadline`` to bound a group of calls. Defaults to
+        10 seconds to connect and 60 seconds to read.
+    :param hedgePolicy:
+        A HedgePolicy sending a second copy of GET requests slower than
+        usual and using the first response. Requests are not hedged by
+        default.
+    :param circuitBreaker:
+        A CircuitBreaker failing requests fast, with a CIRCUIT_OPEN error,
+        on endpoints that keep failing. Requests are always sent by default.
+    :param http2:
+        Send requests over HTTP/2, which multiplexes concurrent requests
+        over up to ``maxConnections`` connections. Requires the ``http2``
+        extra.
+
+    .. note::
+        **server** defaults to the Hyperwallet Sandbox URL if not provided.
+    '''
+
+    def __init__(self,
+                 username=None,
+                 password=None,
+                 programToken=None,
+                 server=SERVER,
+                 encryptionData=None,
+                 maxConnections=100,
+                 retryPolicy=None,
+                 rateLimiter=None,
+                 hooks=None,
+                 responseCache=None,
+                 singleFlight=None,
+                 encryptionProcesses=None,
+                 codec=None,
+                 timeout=(10, 60),
+                 hedgePolicy=None,
+                 circuitBreaker=None,
+                 http2=False):
+        '''
+        Create an instance of the asyncio API interface.
+        '''
+
+        if not username:
+            raise HyperwalletException('username is required')
+
+        if not password:
+            raise HyperwalletException('password is required')
+
+        if not programToken:
+            raise HyperwalletException('programToken is required')
+
+        self.username = username
+        self.password = password
+        self.programToken = programToken
+        self.server = server
+
+        self.apiClient = AsyncApiClient(
+            self.username,
+            self.password,
+            self.server,
+            encryptionData,
+            maxConnections=maxConnections,
+            retryPolicy=retryPolicy,
+            rateLimiter=rateLimiter,
+            hooks=hooks,
+            responseCache=responseCache,
+            singleFlight=singleFlight,
+            encryptionProcesses=encryptionProcesses,
+            codec=codec,
+            timeout=timeout,
+            hedgePolicy=hedgePolicy,
+            circuitBreaker=circuitBreaker,
+            http2=http2
+        )
+
+    async def close(self):
+        '''
+        Close every connection of the pool, and stop the processes started
+        for ``encryptionProcesses``.
+        '''
+
+        await self.apiClient.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _runSync(self, name, client, args, kwargs):
+        '''
+        Run an Api method against a stand-in client.
+
+        :param name:
+            The name of the Api method. **REQUIRED**
+        :param client:
+            The client the Api method sends its requests to. **REQUIRED**
+        :returns:
+            The result of the Api method.
+        '''
+
+        api = Api.__new__(Api)
+        api.__dict__.update(self.__dict__)
+        api.apiClient = client
+
+        return getattr(Api, name)(api, *args, **kwargs)
+
+    async def _call(self, name, args, kwargs):
+        '''
+        Run an Api method, sending its request through the asyncio client.
+
+        The method runs a first time to validate its parameters and capture its
+        request, then a second time with the response to build its models.
+
+        :param name:
+            The name of the Api method. **REQUIRED**
+        :returns:
+            The result of the Api method.
+        '''
+
+        try:
+            return self._runSync(name, _ReplayClient(), args, kwargs)
+        except _RequestCaptured as captured:
+            request = captured
+
+        send = getattr(self.apiClient, request.name)
+        response = await send(*request.requestArgs, **request.requestKwargs)
+
+        return self._runSync(name, _ReplayClient(response), args, kwargs)
+
+    def _iterate(self, name, args, kwargs):
+        '''
+        Run an Api ``iter*`` method, returning an AsyncPageIterator.
+
+        :param name:
+            The name of the Api method. **REQUIRED**
+        :returns:
+            An AsyncPageIterator.
+        '''
+
+        iterator = self._runSync(name, _ReplayClient(), args, kwargs)
+
+        return AsyncPageIterator(
+            self.apiClient.doGet,
+            iterator.partialUrl,
+            iterator.parse,
+            iterator.params,
+            iterator.pageSize,
+            iterator.prefetch
+        )
+
+    def _thread(self, name, args, kwargs):
+        '''
+        Run an Api method returning an object that sends many requests.
+
+        :param name:
+            The name of the Api method. **REQUIRED**
+        :returns:
+            An AsyncRunner.
+        '''
+
+        client = _LoopClient(self.apiClient)
+
+        return AsyncRunner(self._runSync(name, client, args, kwargs), client)
+
+
+def _asyncMethod(name):
+    method = getattr(Api, name)
+
+    if name in _THREADED:
+        @functools.wraps(method)
+        def thread(self, *args, **kwargs):
+            return self._thread(name, args, kwargs)
+
+        return thread
+
+    if name.startswith('iter'):
+        @functools.wraps(method)
+        def iterate(self, *args, **kwargs):
+            return self._iterate(name, args, kwargs)
+
+        return iterate
+
+    @functools.wraps(method)
+    async def call(self, *args, **kwargs):
+        return await self._call(name, args, kwargs)
+
+    return call
+
+
+# Mirror every public method of Api.
+for _name in dir(Api):
+    if _name.startswith('_') or not callable(getattr(Api, _name)) or hasattr(AsyncApi, _name):
+        continue
+
+    setattr(AsyncApi, _name, getattr(Api, _name) if _name in _LOCAL else _asyncMethod(_name))
@@ -4,24 +4,98 @@ import json
 from enum import Enum
 
 
-class HyperwalletModel(object):
+class _Field(object):
+    '''
+    A Model attribute read from the raw JSON of the Model when first accessed.
+
+    Values are only stored on the Model once they are assigned or converted,
+    so building a Model costs no more than keeping a reference to its data.
+
+    :param key:
+        The key of the value in the raw JSON. **REQUIRED**
+    :param convert:
+        Callable taking the Model and the raw value and returning the value of
+        the attribute, which is then kept on the Model.
+    '''
+
+    __slots__ = ('key', 'name', 'convert')
+
+    def __init__(self, key, convert=None):
+        self.key = key
+        self.name = key
+        self.convert = convert
+
+    def __get__(self, model, owner):
+        if model is None:
+            return self
+
+        values = model._values
+        if values is not None and self.name in values:
+            return values[self.name]
+
+        value = model._raw_json.get(self.key)
+
+        if self.convert is not None:
+            value = self.convert(model, value)
+            self.__set__(model, value)
+
+        return value
+
+    def __set__(self, model, value):
+        if model._values is None:
+            model._values = {}
+        model._values[self.name] = value
+
+
+class _ModelSchema(type):
+    '''
+    Create the attributes of a Model from the ``_fields`` of its class, and
+    merge the fields of every base class into ``defaults``.
+    '''
+
+    def __new__(mcs, name, bases, namespace):
+        for field in namespace.get('_fields', ()):
+            if field not in namespace:
+                namespace[field] = _Field(field)
+
+        for (attribute, value) in namespace.items():
+            if isinstance(value, _Field):
+                value.name = attribute
+
+        cls = super(_ModelSchema, mcs).__new__(mcs, name, bases, namespace)
+
+        cls.defaults = dict(
+            (field, None)
+            for klass in reversed(cls.__mro__)
+            for (field, value) in vars(klass).items()
+            if isinstance(value, _Field)
+        )
+
+        return cls
+
+
+class HyperwalletModel(object, metaclass=_ModelSchema):
     '''
     The base Hyperwallet Model from which all other models will inherit.
 
+    Models only keep a reference to the raw JSON: the attributes listed in the
+    ``_fields`` of each class are read from it when accessed.
+
     :param data:
         A dictionary containing the attributes for the Model.
     '''
 
+    __slots__ = ('_raw_json', '_values')
+
+    _fields = ()
+
     def __init__(self, data):
         '''
         Create an instance of the base HyperwalletModel.
         '''
 
-        self.defaults = {
-            '_raw_json': None
-        }
-
-        setattr(self, '_raw_json', data)
+        self._raw_json = data
+        self._values = None
 
     def __str__(self):
         '''
@@ -71,59 +145,51 @@ class User(HyperwalletModel):
         A dictionary containing the attributes for the User.
     '''
 
-    filters_array = {'clientUserId', 'email', 'programToken', 'status', 'verificationStatus', 'taxVerificationStatus', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
+    __slots__ = ()
 
-    def __init__(self, data):
-        '''
-        Create a new User with the provided attributes.
-        '''
+    filters_array = {'clientUserId', 'email', 'programToken', 'status', 'verificationStatus', 'taxVerificationStatus', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
 
-        super(User, self).__init__(data)
-
-        self.defaults = {
-            'addressLine1': None,
-            'addressLine2': None,
-            'businessContactRole': None,
-            'businessName': None,
-            'businessOperatingName': None,
-            'businessRegistrationCountry': None,
-            'businessRegistrationId': None,
-            'businessRegistrationStateProvince': None,
-            'businessType': None,
-            'city': None,
-            'clientUserId': None,
-            'country': None,
-            'countryOfBirth': None,
-            'countryOfNationality': None,
-            'createdOn': None,
-            'dateOfBirth': None,
-            'driversLicenseId': None,
-            'email': None,
-            'employerId': None,
-            'firstName': None,
-            'gender': None,
-            'governmentId': None,
-            'governmentIdType': None,
-            'language': None,
-            'lastName': None,
-            'middleName': None,
-            'mobileNumber': None,
-            'passportId': None,
-            'phoneNumber': None,
-            'postalCode': None,
-            'profileType': None,
-            'programToken': None,
-            'stateProvince': None,
-            'status': None,
-            'token': None,
-            'verificationStatus': None,
-            'taxVerificationStatus': None,
-            'timeZone': None,
-            'documents': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'addressLine1',
+        'addressLine2',
+        'businessContactRole',
+        'businessName',
+        'businessOperatingName',
+        'businessRegistrationCountry',
+        'businessRegistrationId',
+        'businessRegistrationStateProvince',
+        'businessType',
+        'city',
+        'clientUserId',
+        'country',
+        'countryOfBirth',
+        'countryOfNationality',
+        'createdOn',
+        'dateOfBirth',
+        'driversLicenseId',
+        'email',
+        'employerId',
+        'firstName',
+        'gender',
+        'governmentId',
+        'governmentIdType',
+        'language',
+        'lastName',
+        'middleName',
+        'mobileNumber',
+        'passportId',
+        'phoneNumber',
+        'postalCode',
+        'profileType',
+        'programToken',
+        'stateProvince',
+        'status',
+        'token',
+        'verificationStatus',
+        'taxVerificationStatus',
+        'timeZone',
+        'documents'
+    )
 
     def __repr__(self):
         return "User({date}, {token})".format(
@@ -140,25 +206,17 @@ class HyperwalletVerificationDocument(HyperwalletModel):
         A dictionary containing the attributes for the HyperwalletVerificationDocument.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new HyperwalletVerificationDocument with the provided attributes.
-        '''
-
-        super(HyperwalletVerificationDocument, self).__init__(data)
-
-        self.defaults = {
-            'category': None,
-            'type': None,
-            'status': None,
-            'country': None,
-            'reasons': None,
-            'createdOn': None,
-            'uploadFiles': None,
-        }
+    __slots__ = ()
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'category',
+        'type',
+        'status',
+        'country',
+        'reasons',
+        'createdOn',
+        'uploadFiles'
+    )
 
     def __repr__(self):
         return "HyperwalletVerificationDocument({category}, {createdOn})".format(
@@ -174,20 +232,12 @@ class HyperwalletVerificationDocumentReason(HyperwalletModel):
         A dictionary containing the attributes for the HyperwalletVerificationDocumentReason.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new HyperwalletVerificationDocumentReason with the provided attributes.
-        '''
-
-        super(HyperwalletVerificationDocumentReason, self).__init__(data)
-
-        self.defaults = {
-            'name': None,
-            'description': None,
-        }
+    __slots__ = ()
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'name',
+        'description'
+    )
 
     def __repr__(self):
         return "HyperwalletVerificationDocumentReason({name}, {description})".format(
@@ -214,19 +264,11 @@ class AuthenticationToken(HyperwalletModel):
         A dictionary containing the attributes for the Authentication Token.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Authentication Token with the provided attributes.
-        '''
-
-        super(AuthenticationToken, self).__init__(data)
-
-        self.defaults = {
-            'value': None,
-        }
+    __slots__ = ()
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'value',
+    )
 
     def __repr__(self):
         return "AuthenticationToken({value})".format(
@@ -242,27 +284,19 @@ class TransferMethod(HyperwalletModel):
         A dictionary containing the attributes for the Transfer Method.
     '''
 
-    filters_array = {'status', 'type', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
-
-    def __init__(self, data):
-        '''
-        Create a new Transfer Method with the provided attributes.
-        '''
+    __slots__ = ()
 
-        super(TransferMethod, self).__init__(data)
-
-        self.defaults = {
-            'createdOn': None,
-            'isDefaultTransferMethod': None,
-            'status': None,
-            'token': None,
-            'transferMethodCountry': None,
-            'transferMethodCurrency': None,
-            'type': None
-        }
+    filters_array = {'status', 'type', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'createdOn',
+        'isDefaultTransferMethod',
+        'status',
+        'token',
+        'transferMethodCountry',
+        'transferMethodCurrency',
+        'type'
+    )
 
     def __repr__(self):
         return "TransferMethod({date}, {token})".format(
@@ -279,73 +313,65 @@ class BankAccount(TransferMethod):
         A dictionary containing the attributes for the Bank Account.
     '''
 
-    filters_array = {'type', 'status', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
+    __slots__ = ()
 
-    def __init__(self, data):
-        '''
-        Create a new Bank Account with the provided attributes.
-        '''
+    filters_array = {'type', 'status', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
 
-        super(BankAccount, self).__init__(data)
-
-        self.defaults = {
-            'addressLine1': None,
-            'addressLine2': None,
-            'bankAccountId': None,
-            'bankAccountPurpose': None,
-            'bankId': None,
-            'bankName': None,
-            'branchAddressLine1': None,
-            'branchAddressLine2': None,
-            'branchCity': None,
-            'branchCountry': None,
-            'branchId': None,
-            'branchName': None,
-            'branchPostalCode': None,
-            'branchStateProvince': None,
-            'buildingSocietyAccount': None,
-            'businessContactRole': None,
-            'businessName': None,
-            'businessOperatingName': None,
-            'businessRegistrationCountry': None,
-            'businessRegistrationId': None,
-            'businessRegistrationStateProvince': None,
-            'businessType': None,
-            'city': None,
-            'country': None,
-            'countryOfBirth': None,
-            'countryOfNationality': None,
-            'dateOfBirth': None,
-            'driversLicenseId': None,
-            'employerId': None,
-            'firstName': None,
-            'gender': None,
-            'governmentId': None,
-            'governmentIdType': None,
-            'intermediaryBankAccountId': None,
-            'intermediaryBankAddressLine1': None,
-            'intermediaryBankAddressLine2': None,
-            'intermediaryBankCity': None,
-            'intermediaryBankCountry': None,
-            'intermediaryBankId': None,
-            'intermediaryBankName': None,
-            'intermediaryBankPostalCode': None,
-            'intermediaryBankStateProvince': None,
-            'kpp': None,
-            'lastName': None,
-            'middleName': None,
-            'mobileNumber': None,
-            'passportId': None,
-            'phoneNumber': None,
-            'postalCode': None,
-            'profileType': None,
-            'stateProvince': None,
-            'taxId': None,
-            'wireInstructions': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'addressLine1',
+        'addressLine2',
+        'bankAccountId',
+        'bankAccountPurpose',
+        'bankId',
+        'bankName',
+        'branchAddressLine1',
+        'branchAddressLine2',
+        'branchCity',
+        'branchCountry',
+        'branchId',
+        'branchName',
+        'branchPostalCode',
+        'branchStateProvince',
+        'buildingSocietyAccount',
+        'businessContactRole',
+        'businessName',
+        'businessOperatingName',
+        'businessRegistrationCountry',
+        'businessRegistrationId',
+        'businessRegistrationStateProvince',
+        'businessType',
+        'city',
+        'country',
+        'countryOfBirth',
+        'countryOfNationality',
+        'dateOfBirth',
+        'driversLicenseId',
+        'employerId',
+        'firstName',
+        'gender',
+        'governmentId',
+        'governmentIdType',
+        'intermediaryBankAccountId',
+        'intermediaryBankAddressLine1',
+        'intermediaryBankAddressLine2',
+        'intermediaryBankCity',
+        'intermediaryBankCountry',
+        'intermediaryBankId',
+        'intermediaryBankName',
+        'intermediaryBankPostalCode',
+        'intermediaryBankStateProvince',
+        'kpp',
+        'lastName',
+        'middleName',
+        'mobileNumber',
+        'passportId',
+        'phoneNumber',
+        'postalCode',
+        'profileType',
+        'stateProvince',
+        'taxId',
+        'wireInstructions'
+    )
 
     def __repr__(self):
         return "BankAccount({date}, {token})".format(
@@ -362,26 +388,18 @@ class BankCard(TransferMethod):
         A dictionary containing the attributes for the Bank Card.
     '''
 
-    filters_array = {'status', 'type', 'createdOn', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
-
-    def __init__(self, data):
-        '''
-        Create a new Bank Card with the provided attributes.
-        '''
+    __slots__ = ()
 
-        super(BankCard, self).__init__(data)
-
-        self.defaults = {
-            'cardBrand': None,
-            'cardNumber': None,
-            'cardType': None,
-            'cvv': None,
-            'processingTime': None,
-            'dateOfExpiry': None,
-        }
+    filters_array = {'status', 'type', 'createdOn', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'cardBrand',
+        'cardNumber',
+        'cardType',
+        'cvv',
+        'processingTime',
+        'dateOfExpiry'
+    )
 
     def __repr__(self):
         return "BankCard({date}, {token})".format(
@@ -398,25 +416,17 @@ class PrepaidCard(TransferMethod):
         A dictionary containing the attributes for the Prepaid Card.
     '''
 
-    filters_array = {'status', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
-
-    def __init__(self, data):
-        '''
-        Create a new Prepaid Card with the provided attributes.
-        '''
-
-        super(PrepaidCard, self).__init__(data)
+    __slots__ = ()
 
-        self.defaults = {
-            'cardBrand': None,
-            'cardNumber': None,
-            'cardPackage': None,
-            'cardType': None,
-            'dateOfExpiry': None
-        }
+    filters_array = {'status', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'cardBrand',
+        'cardNumber',
+        'cardPackage',
+        'cardType',
+        'dateOfExpiry'
+    )
 
     def __repr__(self):
         return "PrepaidCard({date}, {token})".format(
@@ -433,49 +443,41 @@ class PaperCheck(TransferMethod):
         A dictionary containing the attributes for the Paper Check.
     '''
 
-    filters_array = {'status', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
+    __slots__ = ()
 
-    def __init__(self, data):
-        '''
-        Create a new Paper Check with the provided attributes.
-        '''
+    filters_array = {'status', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
 
-        super(PaperCheck, self).__init__(data)
-
-        self.defaults = {
-            'addressLine1': None,
-            'addressLine2': None,
-            'businessContactRole': None,
-            'businessName': None,
-            'businessOperatingName': None,
-            'businessRegistrationCountry': None,
-            'businessRegistrationId': None,
-            'businessRegistrationStateProvince': None,
-            'businessType': None,
-            'city': None,
-            'country': None,
-            'countryOfBirth': None,
-            'countryOfNationality': None,
-            'dateOfBirth': None,
-            'driversLicenseId': None,
-            'employerId': None,
-            'firstName': None,
-            'gender': None,
-            'governmentId': None,
-            'governmentIdType': None,
-            'lastName': None,
-            'middleName': None,
-            'mobileNumber': None,
-            'passportId': None,
-            'phoneNumber': None,
-            'postalCode': None,
-            'profileType': None,
-            'shippingMethod': None,
-            'stateProvince': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'addressLine1',
+        'addressLine2',
+        'businessContactRole',
+        'businessName',
+        'businessOperatingName',
+        'businessRegistrationCountry',
+        'businessRegistrationId',
+        'businessRegistrationStateProvince',
+        'businessType',
+        'city',
+        'country',
+        'countryOfBirth',
+        'countryOfNationality',
+        'dateOfBirth',
+        'driversLicenseId',
+        'employerId',
+        'firstName',
+        'gender',
+        'governmentId',
+        'governmentIdType',
+        'lastName',
+        'middleName',
+        'mobileNumber',
+        'passportId',
+        'phoneNumber',
+        'postalCode',
+        'profileType',
+        'shippingMethod',
+        'stateProvince'
+    )
 
     def __repr__(self):
         return "PaperCheck({date}, {token})".format(
@@ -492,36 +494,28 @@ class Transfer(HyperwalletModel):
         A dictionary containing the attributes for the Transfer.
     '''
 
-    filters_array = {'clientTransferId', 'sourceToken', 'destinationToken', 'createdBefore', 'createdAfter', 'offset', 'limit'}
+    __slots__ = ()
 
-    def __init__(self, data):
-        '''
-        Create a new Transfer with the provided attributes.
-        '''
+    filters_array = {'clientTransferId', 'sourceToken', 'destinationToken', 'createdBefore', 'createdAfter', 'offset', 'limit'}
 
-        super(Transfer, self).__init__(data)
-
-        self.defaults = {
-            'token': None,
-            'status': None,
-            'createdOn': None,
-            'clientTransferId': None,
-            'sourceToken': None,
-            'sourceAmount': None,
-            'sourceFeeAmount': None,
-            'sourceCurrency': None,
-            'destinationToken': None,
-            'destinationAmount': None,
-            'destinationFeeAmount': None,
-            'destinationCurrency': None,
-            'foreignExchanges': None,
-            'notes': None,
-            'memo': None,
-            'expiresOn': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'token',
+        'status',
+        'createdOn',
+        'clientTransferId',
+        'sourceToken',
+        'sourceAmount',
+        'sourceFeeAmount',
+        'sourceCurrency',
+        'destinationToken',
+        'destinationAmount',
+        'destinationFeeAmount',
+        'destinationCurrency',
+        'foreignExchanges',
+        'notes',
+        'memo',
+        'expiresOn'
+    )
 
     def __repr__(self):
         return "Transfer({date}, {token})".format(
@@ -538,21 +532,13 @@ class PayPalAccount(TransferMethod):
         A dictionary containing the attributes for the PayPal Account.
     '''
 
-    filters_array = {'status', 'type', 'createdOn', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
-
-    def __init__(self, data):
-        '''
-        Create a new PayPal Account with the provided attributes.
-        '''
-
-        super(PayPalAccount, self).__init__(data)
+    __slots__ = ()
 
-        self.defaults = {
-            'email': None
-        }
+    filters_array = {'status', 'type', 'createdOn', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'email',
+    )
 
     def __repr__(self):
         return "PayPalAccount({date}, {token})".format(
@@ -569,21 +555,13 @@ class VenmoAccount(TransferMethod):
         A dictionary containing the attributes for the Venmo Account.
     '''
 
-    filters_array = {'status', 'type', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
-
-    def __init__(self, data):
-        '''
-        Create a new Venmo Account with the provided attributes.
-        '''
-
-        super(VenmoAccount, self).__init__(data)
+    __slots__ = ()
 
-        self.defaults = {
-            'accountId': None
-        }
+    filters_array = {'status', 'type', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'accountId',
+    )
 
     def __repr__(self):
         return "VenmoAccount({date}, {token})".format(
@@ -600,34 +578,25 @@ class Payment(HyperwalletModel):
         A dictionary containing the attributes for the Payment.
     '''
 
-    filters_array = {'clientPaymentId', 'currency', 'memo', 'releaseDate', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
+    __slots__ = ()
 
-    def __init__(self, data):
-        '''
-        Create a new Payment with the provided attributes.
-        '''
+    filters_array = {'clientPaymentId', 'currency', 'memo', 'releaseDate', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
 
-        super(Payment, self).__init__(data)
-
-        self.defaults = {
-            'amount': None,
-            'clientPaymentId': None,
-            'createdOn': None,
-            'currency': None,
-            'destinationToken': None,
-            'expiresOn': None,
-            'memo': None,
-            'notes': None,
-            'programToken': None,
-            'purpose': None,
-            'releaseOn': None,
-            'expiresOn': None,
-            'status': None,
-            'token': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'amount',
+        'clientPaymentId',
+        'createdOn',
+        'currency',
+        'destinationToken',
+        'expiresOn',
+        'memo',
+        'notes',
+        'programToken',
+        'purpose',
+        'releaseOn',
+        'status',
+        'token'
+    )
 
     def __repr__(self):
         return "Payment({date}, {token})".format(
@@ -644,24 +613,16 @@ class Balance(HyperwalletModel):
         A dictionary containing the attributes for the Balance.
     '''
 
+    __slots__ = ()
+
     filters_array_user = {'currency', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
     filters_array_account = {'currency', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
     filters_array_prepaid_card = {'createdBefore', 'createdAfter'}
 
-    def __init__(self, data):
-        '''
-        Create a new Balance with the provided attributes.
-        '''
-
-        super(Balance, self).__init__(data)
-
-        self.defaults = {
-            'amount': None,
-            'currency': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'amount',
+        'currency'
+    )
 
     def __repr__(self):
         return "Balance({currency}, {amount})".format(
@@ -678,34 +639,26 @@ class Receipt(HyperwalletModel):
         A dictionary containing the attributes for the Receipt.
     '''
 
+    __slots__ = ()
+
     filters_array_user = {'currency', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
     filters_array_account = {'currency', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
     filters_array_prepaid_card = {'createdBefore', 'createdAfter'}
 
-    def __init__(self, data):
-        '''
-        Create a new Receipt with the provided attributes.
-        '''
-
-        super(Receipt, self).__init__(data)
-
-        self.defaults = {
-            'amount': None,
-            'createdOn': None,
-            'currency': None,
-            'destinationToken': None,
-            'details': None,
-            'entry': None,
-            'fee': None,
-            'foreignExchangeCurrency': None,
-            'foreignExchangeRate': None,
-            'journalId': None,
-            'sourceToken': None,
-            'type': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'amount',
+        'createdOn',
+        'currency',
+        'destinationToken',
+        'details',
+        'entry',
+        'fee',
+        'foreignExchangeCurrency',
+        'foreignExchangeRate',
+        'journalId',
+        'sourceToken',
+        'type'
+    )
 
     def __repr__(self):
         return "Receipt({entry}, {amount})".format(
@@ -722,22 +675,14 @@ class Program(HyperwalletModel):
         A dictionary containing the attributes for the Program.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Program with the provided attributes.
-        '''
-
-        super(Program, self).__init__(data)
-
-        self.defaults = {
-            'createdOn': None,
-            'name': None,
-            'parentToken': None,
-            'token': None
-        }
+    __slots__ = ()
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'createdOn',
+        'name',
+        'parentToken',
+        'token'
+    )
 
     def __repr__(self):
         return "Program({date}, {token})".format(
@@ -754,22 +699,14 @@ class Account(HyperwalletModel):
         A dictionary containing the attributes for the Account.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Account with the provided attributes.
-        '''
-
-        super(Account, self).__init__(data)
-
-        self.defaults = {
-            'createdOn': None,
-            'email': None,
-            'token': None,
-            'type': None
-        }
+    __slots__ = ()
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'createdOn',
+        'email',
+        'token',
+        'type'
+    )
 
     def __repr__(self):
         return "Account({date}, {token})".format(
@@ -786,27 +723,19 @@ class StatusTransition(HyperwalletModel):
         A dictionary containing the attributes for the Status Transition.
     '''
 
-    filters_array = {'transition', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
-
-    def __init__(self, data):
-        '''
-        Create a new Status Transition with the provided attributes.
-        '''
-
-        super(StatusTransition, self).__init__(data)
+    __slots__ = ()
 
-        self.defaults = {
-            'createdOn': None,
-            'fromStatus': None,
-            'notes': None,
-            'statusCode': None,
-            'token': None,
-            'toStatus': None,
-            'transition': None
-        }
+    filters_array = {'transition', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    _fields = (
+        'createdOn',
+        'fromStatus',
+        'notes',
+        'statusCode',
+        'token',
+        'toStatus',
+        'transition'
+    )
 
     def __repr__(self):
         return "StatusTransition({date}, {token})".format(
@@ -823,33 +752,21 @@ class TransferMethodConfiguration(HyperwalletModel):
         A dictionary containing the attributes for the Transfer Method Configuration.
     '''
 
-    filters_array = {'userToken', 'offset', 'limit'}
-
-    def __init__(self, data):
-        '''
-        Create a new Transfer Method Configuration with the provided attributes.
-        '''
-
-        super(TransferMethodConfiguration, self).__init__(data)
+    __slots__ = ()
 
-        self.defaults = {
-            'country': None,
-            'currency': None,
-            'fields': None,
-            'profileType': None,
-            'type': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    filters_array = {'userToken', 'offset', 'limit'}
 
-        # Rename the countries array to a single country
-        countries = data.get('countries', ['NONE'])
-        setattr(self, 'country', countries[0])
+    _fields = (
+        'country',
+        'currency',
+        'fields',
+        'profileType',
+        'type'
+    )
 
-        # Rename the currencies array to a single currency
-        currencies = data.get('currencies', ['NONE'])
-        setattr(self, 'currency', currencies[0])
+    # Rename the countries and currencies arrays to a single country and currency
+    country = _Field('countries', lambda configuration, countries: (countries or ['NONE'])[0])
+    currency = _Field('currencies', lambda configuration, currencies: (currencies or ['NONE'])[0])
 
     def __repr__(self):
         return "TransferMethodConfiguration({country}, {type})".format(
@@ -866,50 +783,70 @@ class Webhook(HyperwalletModel):
         A dictionary containing the attributes for the Webhook.
     '''
 
+    __slots__ = ()
+
     filters_array = {'programToken', 'type', 'createdBefore', 'createdAfter', 'sortBy', 'offset', 'limit'}
 
-    def __init__(self, data):
+    _fields = (
+        'createdOn',
+        'object',
+        'token',
+        'type'
+    )
+
+    # The Models of the objects, by segment of the type. Filled in once the
+    # Models are defined, at the end of this module.
+    objectTypes = {}
+
+    # The Model resolved for each type of Webhook, None if there is none. The
+    # types come from the notifications, so only the first ones are kept.
+    _objectModels = {}
+    _cachedTypes = 1024
+
+    @classmethod
+    def objectModel(cls, webhookType):
         '''
-        Create a new Webhook with the provided attributes.
+        Find the Model of the object of a Webhook type.
+
+        :param webhookType:
+            The type of the Webhook, such as ``USERS.BANK_ACCOUNTS.CREATED``. **REQUIRED**
+        :returns:
+            The Model class, or None if the object is kept as a dictionary.
         '''
 
-        super(Webhook, self).__init__(data)
+        try:
+            return cls._objectModels[webhookType]
+        except KeyError:
+            pass
+
+        segments = webhookType.split('.')
+        model = None
+
+        if len(segments) > 1 and segments[1] in cls.objectTypes:
+            model = cls.objectTypes[segments[1]]
+        elif segments[0] in cls.objectTypes:
+            model = cls.objectTypes[segments[0]]
 
-        self.defaults = {
-            'createdOn': None,
-            'object': None,
-            'token': None,
-            'type': None
-        }
+        if len(cls._objectModels) < cls._cachedTypes:
+            cls._objectModels[webhookType] = model
+        return model
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    def _hydrateObject(self, value):
+        '''
+        Turn the object of the Webhook into the Model matching its type.
+        '''
 
         if self.type is None:
-            return
-
-        if type(self.object) is not dict:
-            return
-
-        types = {
-            'PAYMENTS': Payment,
-            'BANK_ACCOUNTS': BankAccount,
-            'PREPAID_CARDS': PrepaidCard,
-            'USERS': User,
-            "BANK_CARDS": BankCard,
-            "PAYPAL_ACCOUNTS": PayPalAccount,
-            "PAPER_CHECKS": PaperCheck,
-            "VENMO_ACCOUNTS": VenmoAccount,
-            "TRANSFERS": Transfer,
-            "REFUND": TransferRefunds
-        }
-
-        base, sub = self.type.split('.')[:2]
-
-        if sub in types:
-            self.object = types[sub](self.object)
-        elif base in types:
-            self.object = types[base](self.object)
+            return value
+
+        if type(value) is not dict:
+            return value
+
+        model = self.objectModel(self.type)
+
+        return value if model is None else model(value)
+
+    object = _Field('object', _hydrateObject)
 
     def __repr__(self):
         return "Webhook({date}, {token})".format(
@@ -933,37 +870,43 @@ class TransferRefunds(HyperwalletModel):
         A dictionary containing the attributes for the Transfer Refunds.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Transfer Refunds with the provided attributes.
-        '''
-
-        super(TransferRefunds, self).__init__(data)
-
-        self.defaults = {
-            'token': None,
-            'status': None,
-            'createdOn': None,
-            'clientRefundId': None,
-            'sourceToken': None,
-            'sourceAmount': None,
-            'sourceFeeAmount': None,
-            'sourceCurrency': None,
-            'destinationToken': None,
-            'destinationAmount': None,
-            'destinationFeeAmount': None,
-            'destinationCurrency': None,
-            'foreignExchanges': None,
-            'notes': None,
-            'memo': None,
-            'expiresOn': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    __slots__ = ()
+
+    _fields = (
+        'token',
+        'status',
+        'createdOn',
+        'clientRefundId',
+        'sourceToken',
+        'sourceAmount',
+        'sourceFeeAmount',
+        'sourceCurrency',
+        'destinationToken',
+        'destinationAmount',
+        'destinationFeeAmount',
+        'destinationCurrency',
+        'foreignExchanges',
+        'notes',
+        'memo',
+        'expiresOn'
+    )
 
     def __repr__(self):
         return "TransferRefunds({date}, {token})".format(
             date=self.createdOn,
             token=self.token
         )
+
+
+Webhook.objectTypes = {
+    'PAYMENTS': Payment,
+    'BANK_ACCOUNTS': BankAccount,
+    'PREPAID_CARDS': PrepaidCard,
+    'USERS': User,
+    'BANK_CARDS': BankCard,
+    'PAYPAL_ACCOUNTS': PayPalAccount,
+    'PAPER_CHECKS': PaperCheck,
+    'VENMO_ACCOUNTS': VenmoAccount,
+    'TRANSFERS': Transfer,
+    'REFUND': TransferRefunds
+}
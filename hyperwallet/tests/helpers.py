@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+
+import json
+import mock
+
+
+def response(statusCode, content, headers=None):
+    '''
+    A mock HTTP response, of JSON content unless headers say otherwise.
+    '''
+
+    allHeaders = {'Content-Type': 'application/json'}
+    allHeaders.update(headers or {})
+
+    return mock.MagicMock(
+        status_code=statusCode,
+        content=content,
+        headers=allHeaders
+    )
+
+
+def jsonResponse(statusCode, data, headers=None):
+    '''
+    A mock HTTP response with data encoded as JSON.
+    '''
+
+    return response(statusCode, json.dumps(data).encode('utf-8'), headers)
+
+
+def errorCode(exception):
+    '''
+    The code of the first error of a HyperwalletAPIException.
+    '''
+
+    return exception.message['errors'][0]['code']
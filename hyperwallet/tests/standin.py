@@ -0,0 +1,449 @@
+#!/usr/bin/env python
+
+import json
+import re
+import socket
+import socketserver
+import threading
+import time
+import uuid
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+def receipt(index, userToken):
+    '''
+    Build a realistic user Receipt.
+    '''
+
+    return {
+        'journalId': str(51660000 + index),
+        'type': 'PAYMENT',
+        'createdOn': '2019-10-{:02d}T22:{:02d}:{:02d}'.format(1 + index % 28, index % 60, (index * 7) % 60),
+        'entry': 'CREDIT',
+        'sourceToken': 'act-{}'.format(uuid.UUID(int=index)),
+        'destinationToken': userToken,
+        'amount': '{}.{:02d}'.format(10 + index % 990, index % 100),
+        'fee': '0.00',
+        'currency': ('USD', 'CAD', 'EUR')[index % 3],
+        'details': {
+            'clientPaymentId': 'cp-{}'.format(index),
+            'payeeName': 'Jane Doe'
+        }
+    }
+
+
+def payment(index):
+    '''
+    Build a realistic Payment.
+    '''
+
+    return {
+        'token': 'pmt-{}'.format(uuid.UUID(int=index)),
+        'status': 'COMPLETED',
+        'createdOn': '2019-10-{:02d}T22:10:48'.format(1 + index % 28),
+        'amount': '{}.00'.format(10 + index % 990),
+        'currency': 'USD',
+        'clientPaymentId': 'cp-{}'.format(index),
+        'purpose': 'OTHER',
+        'expiresOn': '2020-04-07T22:10:48',
+        'destinationToken': 'usr-{}'.format(uuid.UUID(int=index % 50)),
+        'programToken': 'prg-{}'.format(uuid.UUID(int=1)),
+        'links': [{
+            'params': {'rel': 'self'},
+            'href': 'https://api.sandbox.hyperwallet.com/rest/v3/payments/pmt-{}'.format(uuid.UUID(int=index))
+        }]
+    }
+
+
+def user(userToken):
+    '''
+    Build a realistic User.
+    '''
+
+    return {
+        'token': userToken,
+        'status': 'ACTIVATED',
+        'createdOn': '2019-10-01T22:10:48',
+        'clientUserId': 'cu-1',
+        'profileType': 'INDIVIDUAL',
+        'firstName': 'Jane',
+        'lastName': 'Doe',
+        'email': 'jane.doe@example.com',
+        'addressLine1': '950 Granville Street',
+        'city': 'Vancouver',
+        'stateProvince': 'BC',
+        'country': 'CA',
+        'postalCode': 'V6Z1L2',
+        'language': 'en',
+        'programToken': 'prg-{}'.format(uuid.UUID(int=1)),
+        'verificationStatus': 'NOT_REQUIRED'
+    }
+
+
+class _Endpoints(object):
+    '''
+    The endpoints answered by the stand-in servers, whatever their HTTP version.
+    '''
+
+    routes = [
+        ('POST', re.compile(r'^payments$'), 'createPayment'),
+        ('GET', re.compile(r'^payments$'), 'listPayments'),
+        ('GET', re.compile(r'^users/([^/]+)$'), 'getUser'),
+        ('GET', re.compile(r'^users/([^/]+)/receipts$'), 'listReceipts')
+    ]
+
+    def __init__(self, encryption, items, latency):
+        self.encryption = encryption
+        self.items = items
+        self.latency = latency
+
+        self.__index = 0
+        self.__lock = threading.Lock()
+
+    def handle(self, method, target, body):
+        '''
+        Answer a request.
+
+        :returns:
+            A tuple of the status, the content type and the body.
+        '''
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        url = urlparse(target)
+        path = url.path.split('/rest/v3/', 1)[-1].strip('/')
+        query = dict((key, values[0]) for (key, values) in parse_qs(url.query).items())
+
+        for (routeMethod, pattern, name) in self.routes:
+            match = pattern.match(path)
+            if routeMethod == method and match:
+                status, data = getattr(self, name)(query, body, *match.groups())
+                return self.__respond(status, data)
+
+        return self.__respond(404, {'errors': [{'code': 'NOT_FOUND', 'message': 'Unknown endpoint'}]})
+
+    def createPayment(self, query, body):
+        data = self.__readBody(body)
+
+        created = payment(self.__nextIndex())
+        created.update(data)
+
+        return 201, created
+
+    def listPayments(self, query, body):
+        return 200, self.__page(query, payment)
+
+    def getUser(self, query, body, userToken):
+        return 200, user(userToken)
+
+    def listReceipts(self, query, body, userToken):
+        return 200, self.__page(query, lambda index: receipt(index, userToken))
+
+    def __page(self, query, build):
+        offset = int(query.get('offset') or 0)
+        limit = int(query.get('limit') or 10)
+        count = max(0, min(limit, self.items - offset))
+
+        return {
+            'hasNextPage': offset + count < self.items,
+            'hasPreviousPage': offset > 0,
+            'limit': limit,
+            'data': [build(index) for index in range(offset, offset + count)]
+        }
+
+    def __readBody(self, body):
+        if not body:
+            return {}
+
+        if self.encryption is not None:
+            body = self.encryption.decrypt(body.decode('utf-8'))
+
+        return json.loads(body.decode('utf-8') if hasattr(body, 'decode') else body)
+
+    def __respond(self, status, data):
+        content = json.dumps(data)
+
+        if self.encryption is not None:
+            content = self.encryption.encrypt(content)
+            contentType = 'application/jose+json'
+        else:
+            contentType = 'application/json'
+
+        return status, contentType, content.encode('utf-8')
+
+    def __nextIndex(self):
+        with self.__lock:
+            self.__index += 1
+            return self.__index
+
+
+class _ThreadingServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    connections = 0
+
+    def get_request(self):
+        request = HTTPServer.get_request(self)
+        self.connections += 1
+        return request
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    # Send headers and body in one segment, without waiting for delayed ACKs
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.__dispatch('GET')
+
+    def do_POST(self):
+        self.__dispatch('POST')
+
+    def __dispatch(self, method):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+
+        status, contentType, content = self.server.endpoints.handle(method, self.path, body)
+
+        self.send_response(status)
+        self.send_header('Content-Type', contentType)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class StandInServer(object):
+    '''
+    A local HTTP server answering a subset of the ``/rest/v3/`` endpoints with
+    realistic payloads, plain or JOSE encrypted.
+
+    :param encryption:
+        The Encryption used to decrypt requests and encrypt responses, None to
+        serve plain JSON.
+    :param items:
+        The number of items of each list endpoint.
+    :param latency:
+        The seconds spent processing each request, as if the server was
+        waiting on a database.
+    '''
+
+    def __init__(self, encryption=None, items=1000, latency=0):
+        self.httpd = _ThreadingServer(('127.0.0.1', 0), _Handler)
+        self.httpd.endpoints = _Endpoints(encryption, items, latency)
+
+        self.__thread = None
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self.httpd.server_address[1])
+
+    @property
+    def connections(self):
+        '''
+        The number of connections accepted.
+        '''
+
+        return self.httpd.connections
+
+    def start(self):
+        self.__thread = threading.Thread(target=self.httpd.serve_forever)
+        self.__thread.daemon = True
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.__thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class _Http2Connection(object):
+    '''
+    One HTTP/2 connection of the Http2StandInServer, answering its streams
+    concurrently.
+    '''
+
+    def __init__(self, sock, endpoints, executor):
+        from h2.config import H2Configuration
+        from h2.connection import H2Connection
+
+        self.sock = sock
+        self.endpoints = endpoints
+        self.executor = executor
+
+        self.connection = H2Connection(H2Configuration(client_side=False, header_encoding='utf-8'))
+        self.requests = {}
+        self.closed = False
+
+        self.__writable = threading.Condition()
+
+    def serve(self):
+        from h2 import events
+
+        with self.__writable:
+            self.connection.initiate_connection()
+            self.__flush()
+
+        while not self.closed:
+            try:
+                data = self.sock.recv(65536)
+            except OSError:
+                break
+            if not data:
+                break
+
+            with self.__writable:
+                received = self.connection.receive_data(data)
+                self.__flush()
+
+            for event in received:
+                if isinstance(event, events.RequestReceived):
+                    self.requests[event.stream_id] = (dict(event.headers), bytearray())
+                elif isinstance(event, events.DataReceived):
+                    self.requests[event.stream_id][1].extend(event.data)
+                    with self.__writable:
+                        self.connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                        self.__flush()
+                elif isinstance(event, events.StreamEnded):
+                    (headers, body) = self.requests.pop(event.stream_id)
+                    self.executor.submit(self.__respond, event.stream_id, headers, bytes(body))
+                elif isinstance(event, (events.WindowUpdated, events.RemoteSettingsChanged)):
+                    with self.__writable:
+                        self.__writable.notify_all()
+                elif isinstance(event, events.ConnectionTerminated):
+                    self.closed = True
+
+        with self.__writable:
+            self.closed = True
+            self.__writable.notify_all()
+
+        self.sock.close()
+
+    def __respond(self, streamId, headers, body):
+        (status, contentType, content) = self.endpoints.handle(headers[':method'], headers[':path'], body or None)
+
+        with self.__writable:
+            self.connection.send_headers(streamId, [
+                (':status', str(status)),
+                ('content-type', contentType),
+                ('content-length', str(len(content)))
+            ])
+            self.__flush()
+
+        while True:
+            with self.__writable:
+                # Send as much as the flow control windows allow, then wait
+                # for the client to open them again.
+                window = self.connection.local_flow_control_window(streamId)
+                while window <= 0 and not self.closed:
+                    self.__writable.wait()
+                    window = self.connection.local_flow_control_window(streamId)
+
+                if self.closed:
+                    return
+
+                size = min(window, self.connection.max_outbound_frame_size, len(content))
+                self.connection.send_data(streamId, content[:size], end_stream=size == len(content))
+                self.__flush()
+
+            content = content[size:]
+            if not content:
+                return
+
+    def __flush(self):
+        data = self.connection.data_to_send()
+        if data:
+            self.sock.sendall(data)
+
+
+class Http2StandInServer(object):
+    '''
+    A local HTTP/2 server, without TLS, answering the same endpoints as the
+    StandInServer. Clients must speak HTTP/2 from the start of the connection.
+
+    :param encryption:
+        The Encryption used to decrypt requests and encrypt responses, None to
+        serve plain JSON.
+    :param items:
+        The number of items of each list endpoint.
+    :param latency:
+        The seconds spent processing each request, as if the server was
+        waiting on a database.
+    :param workers:
+        The number of requests processed concurrently.
+    '''
+
+    def __init__(self, encryption=None, items=1000, latency=0, workers=256):
+        self.endpoints = _Endpoints(encryption, items, latency)
+        self.workers = workers
+        self.connections = 0
+
+        self.__listener = None
+        self.__executor = None
+        self.__thread = None
+        self.__sockets = []
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self.__listener.getsockname()[1])
+
+    def start(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.__listener = socket.socket()
+        self.__listener.bind(('127.0.0.1', 0))
+        self.__listener.listen(128)
+        self.__executor = ThreadPoolExecutor(max_workers=self.workers)
+
+        self.__thread = threading.Thread(target=self.__accept)
+        self.__thread.daemon = True
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        # Closing a socket does not interrupt the threads blocked on it.
+        for sock in [self.__listener] + self.__sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+        self.__listener.close()
+        self.__thread.join()
+        self.__executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def __accept(self):
+        while True:
+            try:
+                (sock, _) = self.__listener.accept()
+            except OSError:
+                return
+
+            self.connections += 1
+            self.__sockets.append(sock)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            thread = threading.Thread(target=_Http2Connection(sock, self.endpoints, self.__executor).serve)
+            thread.daemon = True
+            thread.start()
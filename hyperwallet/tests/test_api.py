@@ -164,6 +164,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_users_with_params_invalid(self):
+        options = {'status': 'test', 'city': 'US'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterUsers(options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_users_with_params_valid(self, mock_get):
         options = {'status': 'test'}
@@ -173,6 +180,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_users_with_params_valid(self, mock_get):
+        options = {'status': 'test'}
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterUsers(options))
+
+        self.assertEqual(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_users_success(self, mock_get):
 
@@ -181,6 +197,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_users_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterUsers())
+
+        self.assertEqual(response[0].token, self.data.get('token'))
+
     def test_get_user_status_transition_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -210,6 +234,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_user_status_transitions_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterUserStatusTransitions()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_user_status_transitions_fail_need_params_invalid(self):
 
         options = {'transition': 'test', 'fromStatus': 'test'}
@@ -218,6 +249,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_user_status_transitions_fail_need_params_invalid(self):
+
+        options = {'transition': 'test', 'fromStatus': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterUserStatusTransitions('token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_user_status_transitions_params_valid(self, mock_get):
 
@@ -227,6 +266,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_user_status_transitions_params_valid(self, mock_get):
+
+        options = {'transition': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterUserStatusTransitions('token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_user_status_transitions_success(self, mock_get):
 
@@ -241,6 +289,20 @@ class ApiTest(unittest.TestCase):
 
     '''
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_user_status_transitions_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterUserStatusTransitions('token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
+    '''
+
+    Bank Accounts
+
+    '''
+
     def test_create_bank_account_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -321,6 +383,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_bank_accounts_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBankAccounts()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_bank_accounts_fail_need_params_invalid(self):
 
         options = {'status': 'test', 'bankName': 'test'}
@@ -329,6 +398,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_bank_accounts_fail_need_params_invalid(self):
+
+        options = {'status': 'test', 'bankName': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBankAccounts('token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_bank_accounts_params_valid(self, mock_get):
 
@@ -338,6 +415,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_bank_accounts_params_valid(self, mock_get):
+
+        options = {'status': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterBankAccounts('token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_bank_accounts_success(self, mock_get):
 
@@ -346,6 +432,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_bank_accounts_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterBankAccounts('token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_create_bank_account_status_transition_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -411,6 +505,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_bank_account_status_transitions_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBankAccountStatusTransitions()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_bank_account_status_transitions_fail_need_params_invalid(self):
 
         options = {'transition': 'test', 'fromStatus': 'test'}
@@ -419,6 +520,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_bank_account_status_transitions_fail_need_params_invalid(self):
+
+        options = {'transition': 'test', 'fromStatus': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBankAccountStatusTransitions('token', 'token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_bank_account_status_transitions_params_valid(self, mock_get):
 
@@ -428,6 +537,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_bank_account_status_transitions_params_valid(self, mock_get):
+
+        options = {'transition': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterBankAccountStatusTransitions('token', 'token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_list_bank_account_status_transitions_fail_need_bank_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -435,6 +553,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'bankAccountToken is required')
 
+    def test_iter_bank_account_status_transitions_fail_need_bank_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBankAccountStatusTransitions('token')
+
+        self.assertEqual(exc.exception.message, 'bankAccountToken is required')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_bank_account_status_transitions_success(self, mock_get):
 
@@ -443,6 +568,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_bank_account_status_transitions_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterBankAccountStatusTransitions('token', 'token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_deactivate_bank_account_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -562,6 +695,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_bank_cards_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBankCards()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_bank_cards_fail_need_params_invalid(self):
 
         options = {'type': 'test', 'cardNumber': 'test'}
@@ -570,6 +710,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_bank_cards_fail_need_params_invalid(self):
+
+        options = {'type': 'test', 'cardNumber': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBankCards('token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_bank_cards_params_valid(self, mock_get):
 
@@ -579,6 +727,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_bank_cards_params_valid(self, mock_get):
+
+        options = {'type': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterBankCards('token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_bank_cards_success(self, mock_get):
 
@@ -587,6 +744,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_bank_cards_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterBankCards('token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_create_bank_card_status_transition_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -652,6 +817,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_bank_card_status_transitions_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBankCardStatusTransitions()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_bank_card_status_transitions_fail_need_card_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -659,6 +831,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'bankCardToken is required')
 
+    def test_iter_bank_card_status_transitions_fail_need_card_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBankCardStatusTransitions('token')
+
+        self.assertEqual(exc.exception.message, 'bankCardToken is required')
+
     def test_list_bank_card_status_transitions_fail_need_params_invalid(self):
 
         options = {'transition': 'test', 'fromStatus': 'test'}
@@ -667,6 +846,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_bank_card_status_transitions_fail_need_params_invalid(self):
+
+        options = {'transition': 'test', 'fromStatus': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBankCardStatusTransitions('token', 'token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_bank_card_status_transitions_success(self, mock_get):
 
@@ -675,6 +862,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_bank_card_status_transitions_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterBankCardStatusTransitions('token', 'token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_bank_card_status_transitions_success(self, mock_get):
 
@@ -684,6 +879,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_bank_card_status_transitions_success(self, mock_get):
+
+        options = {'transition': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterBankCardStatusTransitions('token', 'token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_deactivate_bank_card_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -803,6 +1007,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_prepaid_cards_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPrepaidCards()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_prepaid_cards_fail_need_params_invalid(self):
 
         options = {'status': 'test', 'cardPackage': 'test'}
@@ -811,6 +1022,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_prepaid_cards_fail_need_params_invalid(self):
+
+        options = {'status': 'test', 'cardPackage': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPrepaidCards('token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_prepaid_cards_params_valid(self, mock_get):
 
@@ -820,6 +1039,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_prepaid_cards_params_valid(self, mock_get):
+
+        options = {'status': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPrepaidCards('token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_prepaid_cards_success(self, mock_get):
 
@@ -828,6 +1056,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_prepaid_cards_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPrepaidCards('token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_create_prepaid_card_status_transition_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -893,6 +1129,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_prepaid_card_status_transitions_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPrepaidCardStatusTransitions()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_prepaid_card_status_transitions_fail_need_card_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -900,6 +1143,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'prepaidCardToken is required')
 
+    def test_iter_prepaid_card_status_transitions_fail_need_card_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPrepaidCardStatusTransitions('token')
+
+        self.assertEqual(exc.exception.message, 'prepaidCardToken is required')
+
     def test_list_prepaid_card_status_transitions_fail_need_params_invalid(self):
 
         options = {'transition': 'test', 'status': 'test'}
@@ -908,6 +1158,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_prepaid_card_status_transitions_fail_need_params_invalid(self):
+
+        options = {'transition': 'test', 'status': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPrepaidCardStatusTransitions('token', 'token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_prepaid_card_status_transitions_success(self, mock_get):
 
@@ -917,6 +1175,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_prepaid_card_status_transitions_success(self, mock_get):
+
+        options = {'transition': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPrepaidCardStatusTransitions('token', 'token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_prepaid_card_status_transitions_success(self, mock_get):
 
@@ -925,6 +1192,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_prepaid_card_status_transitions_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPrepaidCardStatusTransitions('token', 'token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_deactivate_prepaid_card_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -1209,6 +1484,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_paper_checks_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPaperChecks()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_paper_checks_fail_need_params_invalid(self):
 
         options = {'status': 'test', 'city': 'test'}
@@ -1217,6 +1499,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_paper_checks_fail_need_params_invalid(self):
+
+        options = {'status': 'test', 'city': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPaperChecks('token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_paper_checks_params_valid(self, mock_get):
 
@@ -1226,6 +1516,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_paper_checks_params_valid(self, mock_get):
+
+        options = {'status': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPaperChecks('token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_paper_checks_success(self, mock_get):
 
@@ -1234,6 +1533,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_paper_checks_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPaperChecks('token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_create_paper_check_status_transition_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -1299,6 +1606,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_paper_check_status_transitions_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPaperCheckStatusTransitions()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_paper_check_status_transitions_fail_need_check_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -1306,6 +1620,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'paperCheckToken is required')
 
+    def test_iter_paper_check_status_transitions_fail_need_check_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPaperCheckStatusTransitions('token')
+
+        self.assertEqual(exc.exception.message, 'paperCheckToken is required')
+
     def test_list_paper_check_status_transitions_fail_need_params_invalid(self):
 
         options = {'transition': 'test', 'city': 'test'}
@@ -1314,6 +1635,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_paper_check_status_transitions_fail_need_params_invalid(self):
+
+        options = {'transition': 'test', 'city': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPaperCheckStatusTransitions('token', 'token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_paper_check_status_transitions_params_valid(self, mock_get):
 
@@ -1323,6 +1652,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_paper_check_status_transitions_params_valid(self, mock_get):
+
+        options = {'transition': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPaperCheckStatusTransitions('token', 'token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_paper_check_status_transitions_success(self, mock_get):
 
@@ -1331,7 +1669,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
-    def test_deactivate_paper_check_fail_need_user_token(self):
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_paper_check_status_transitions_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPaperCheckStatusTransitions('token', 'token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
+    def test_deactivate_paper_check_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
             self.api.deactivatePaperCheck()
@@ -1441,6 +1787,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_transfers_fail_need_params_invalid(self):
+
+        options = {'clientTransferId': 'test', 'status': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterTransfers(options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_transfers_params_valid(self, mock_get):
 
@@ -1450,6 +1804,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_transfers_params_valid(self, mock_get):
+
+        options = {'clientTransferId': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterTransfers(options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_transfers_success(self, mock_get):
 
@@ -1458,6 +1821,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_transfers_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterTransfers())
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_create_transfer_status_transition_fail_need_transfer_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -1605,6 +1976,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_paypal_accounts_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPayPalAccounts()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_transfers_fail_need_params_invalid(self):
 
         options = {'type': 'test', 'email': 'test'}
@@ -1613,6 +1991,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_transfers_fail_need_params_invalid(self):
+
+        options = {'type': 'test', 'email': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPayPalAccounts('token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_paypal_accounts_params_valid(self, mock_get):
 
@@ -1622,6 +2008,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_paypal_accounts_params_valid(self, mock_get):
+
+        options = {'type': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPayPalAccounts('token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_paypal_accounts_success(self, mock_get):
 
@@ -1630,6 +2025,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_paypal_accounts_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPayPalAccounts('token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_create_paypal_account_status_transition_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -1695,6 +2098,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_paypal_account_status_transitions_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPayPalAccountStatusTransitions()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_paypal_account_status_transitions_fail_need_paypal_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -1702,6 +2112,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'payPalAccountToken is required')
 
+    def test_iter_paypal_account_status_transitions_fail_need_paypal_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPayPalAccountStatusTransitions('token')
+
+        self.assertEqual(exc.exception.message, 'payPalAccountToken is required')
+
     def test_list_paypal_account_status_transitions_fail_need_params_invalid(self):
 
         options = {'transition': 'test', 'email': 'test'}
@@ -1710,6 +2127,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_paypal_account_status_transitions_fail_need_params_invalid(self):
+
+        options = {'transition': 'test', 'email': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPayPalAccountStatusTransitions('token', 'token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_paypal_account_status_transitions_params_valid(self, mock_get):
 
@@ -1719,6 +2144,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_paypal_account_status_transitions_params_valid(self, mock_get):
+
+        options = {'transition': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPayPalAccountStatusTransitions('token', 'token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_paypal_account_status_transitions_success(self, mock_get):
 
@@ -1727,6 +2161,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_paypal_account_status_transitions_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPayPalAccountStatusTransitions('token', 'token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_deactivate_paypal_account_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -1885,6 +2327,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_venmo_accounts_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterVenmoAccounts()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_venmo_accounts_fail_need_params_invalid(self):
 
         options = {'type': 'test', 'email': 'test'}
@@ -1893,6 +2342,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_venmo_accounts_fail_need_params_invalid(self):
+
+        options = {'type': 'test', 'email': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterVenmoAccounts('token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_venmo_accounts_params_valid(self, mock_get):
 
@@ -1902,6 +2359,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_venmo_accounts_params_valid(self, mock_get):
+
+        options = {'type': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterVenmoAccounts('token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_venmo_accounts_success(self, mock_get):
 
@@ -1910,6 +2376,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_venmo_accounts_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterVenmoAccounts('token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_create_venmo_account_status_transition_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -1975,6 +2449,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_venmo_account_status_transitions_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterVenmoAccountStatusTransitions()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_venmo_account_status_transitions_fail_need_venmo_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -1982,6 +2463,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'venmoAccountToken is required')
 
+    def test_iter_venmo_account_status_transitions_fail_need_venmo_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterVenmoAccountStatusTransitions('token')
+
+        self.assertEqual(exc.exception.message, 'venmoAccountToken is required')
+
     def test_list_venmo_account_status_transitions_fail_need_params_invalid(self):
 
         options = {'transition': 'test', 'email': 'test'}
@@ -1990,6 +2478,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_venmo_account_status_transitions_fail_need_params_invalid(self):
+
+        options = {'transition': 'test', 'email': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterVenmoAccountStatusTransitions('token', 'token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_venmo_account_status_transitions_params_valid(self, mock_get):
 
@@ -1999,6 +2495,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_venmo_account_status_transitions_params_valid(self, mock_get):
+
+        options = {'transition': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterVenmoAccountStatusTransitions('token', 'token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_venmo_account_status_transitions_success(self, mock_get):
 
@@ -2007,6 +2512,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_venmo_account_status_transitions_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterVenmoAccountStatusTransitions('token', 'token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_deactivate_venmo_account_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -2108,6 +2621,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_payments_fail_need_params_invalid(self):
+
+        options = {'currency': 'test', 'email': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPayments(options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_payments_params_valid(self, mock_get):
 
@@ -2117,6 +2638,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_payments_params_valid(self, mock_get):
+
+        options = {'currency': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPayments(options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_payments_success(self, mock_get):
 
@@ -2125,6 +2655,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_payments_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPayments())
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_get_payment_status_transition_fail_need_payment_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -2154,6 +2692,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'paymentToken is required')
 
+    def test_iter_payment_status_transitions_fail_need_payment_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPaymentStatusTransitions()
+
+        self.assertEqual(exc.exception.message, 'paymentToken is required')
+
     def test_list_payment_status_transitions_fail_need_params_invalid(self):
 
         options = {'transition': 'test', 'token': 'test'}
@@ -2162,6 +2707,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_payment_status_transitions_fail_need_params_invalid(self):
+
+        options = {'transition': 'test', 'token': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPaymentStatusTransitions('token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_payment_status_transitions_params_valid(self, mock_get):
 
@@ -2171,6 +2724,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_payment_status_transitions_params_valid(self, mock_get):
+
+        options = {'transition': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPaymentStatusTransitions('token', options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_payment_status_transitions_success(self, mock_get):
 
@@ -2179,6 +2741,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_payment_status_transitions_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterPaymentStatusTransitions('token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     def test_create_payment_status_transition_fail_need_payment_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -2214,6 +2784,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_user_balances_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBalancesForUser()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_user_balances_fail_need_params_invalid(self):
 
         options = {'currency': 'test', 'token': 'test'}
@@ -2222,6 +2799,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_user_balances_fail_need_params_invalid(self):
+
+        options = {'currency': 'test', 'token': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBalancesForUser('token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_user_balances_params_valid(self, mock_get):
 
@@ -2231,6 +2816,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].currency, self.balance.get('currency'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_user_balances_params_valid(self, mock_get):
+
+        options = {'currency': 'test'}
+        mock_get.return_value = {'data': [self.balance]}
+        response = list(self.api.iterBalancesForUser('token', options))
+
+        self.assertTrue(response[0].currency, self.balance.get('currency'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_user_balances_success(self, mock_get):
 
@@ -2239,6 +2833,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].currency, self.balance.get('currency'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_user_balances_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.balance]}
+        response = list(self.api.iterBalancesForUser('token'))
+
+        self.assertTrue(response[0].currency, self.balance.get('currency'))
+
     def test_list_prepaid_card_balances_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -2246,6 +2848,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_prepaid_card_balances_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBalancesForPrepaidCard()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_prepaid_card_balances_fail_need_card_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -2253,6 +2862,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'prepaidCardToken is required')
 
+    def test_iter_prepaid_card_balances_fail_need_card_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBalancesForPrepaidCard('token')
+
+        self.assertEqual(exc.exception.message, 'prepaidCardToken is required')
+
     def test_list_prepaid_card_balances_fail_need_params_invalid(self):
 
         options = {'limit': 'test', 'token': 'test'}
@@ -2261,6 +2877,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_prepaid_card_balances_fail_need_params_invalid(self):
+
+        options = {'limit': 'test', 'token': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBalancesForPrepaidCard('token', 'token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_prepaid_card_balances_params_valid(self, mock_get):
 
@@ -2270,6 +2894,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].currency, self.balance.get('currency'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_prepaid_card_balances_params_valid(self, mock_get):
+
+        options = {'createdBefore': 'test'}
+        mock_get.return_value = {'data': [self.balance]}
+        response = list(self.api.iterBalancesForPrepaidCard('token', 'token', options))
+
+        self.assertTrue(response[0].currency, self.balance.get('currency'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_prepaid_card_balances_success(self, mock_get):
 
@@ -2278,6 +2911,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].currency, self.balance.get('currency'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_prepaid_card_balances_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.balance]}
+        response = list(self.api.iterBalancesForPrepaidCard('token', 'token'))
+
+        self.assertTrue(response[0].currency, self.balance.get('currency'))
+
     def test_list_account_balances_fail_need_program_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -2285,6 +2926,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'programToken is required')
 
+    def test_iter_account_balances_fail_need_program_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBalancesForAccount()
+
+        self.assertEqual(exc.exception.message, 'programToken is required')
+
     def test_list_account_balances_fail_need_account_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -2292,6 +2940,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'accountToken is required')
 
+    def test_iter_account_balances_fail_need_account_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBalancesForAccount('token')
+
+        self.assertEqual(exc.exception.message, 'accountToken is required')
+
     def test_list_account_balances_fail_need_params_invalid(self):
 
         options = {'currency': 'test', 'token': 'test'}
@@ -2300,6 +2955,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_account_balances_fail_need_params_invalid(self):
+
+        options = {'currency': 'test', 'token': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterBalancesForAccount('token', 'token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_account_balances_params_valid(self, mock_get):
 
@@ -2309,6 +2972,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].currency, self.balance.get('currency'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_account_balances_params_valid(self, mock_get):
+
+        options = {'currency': 'test'}
+        mock_get.return_value = {'data': [self.balance]}
+        response = list(self.api.iterBalancesForAccount('token', 'token', options))
+
+        self.assertTrue(response[0].currency, self.balance.get('currency'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_account_balances_success(self, mock_get):
 
@@ -2323,6 +2995,20 @@ class ApiTest(unittest.TestCase):
 
     '''
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_account_balances_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.balance]}
+        response = list(self.api.iterBalancesForAccount('token', 'token'))
+
+        self.assertTrue(response[0].currency, self.balance.get('currency'))
+
+    '''
+
+    Receipts
+
+    '''
+
     def test_list_user_receipts_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -2330,6 +3016,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_user_receipts_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterReceiptsForUser()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_user_receipts_fail_need_params_invalid(self):
 
         options = {'currency': 'test', 'token': 'test'}
@@ -2338,6 +3031,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_user_receipts_fail_need_params_invalid(self):
+
+        options = {'currency': 'test', 'token': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterReceiptsForUser('token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_user_receipts_params_valid(self, mock_get):
 
@@ -2347,6 +3048,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].currency, self.balance.get('currency'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_user_receipts_params_valid(self, mock_get):
+
+        options = {'currency': 'test'}
+        mock_get.return_value = {'data': [self.balance]}
+        response = list(self.api.iterReceiptsForUser('token', options))
+
+        self.assertTrue(response[0].currency, self.balance.get('currency'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_user_receipts_success(self, mock_get):
 
@@ -2355,6 +3065,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].currency, self.balance.get('currency'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_user_receipts_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.balance]}
+        response = list(self.api.iterReceiptsForUser('token'))
+
+        self.assertTrue(response[0].currency, self.balance.get('currency'))
+
     def test_list_prepaid_card_receipts_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -2362,6 +3080,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_prepaid_card_receipts_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterReceiptsForPrepaidCard()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_prepaid_card_receipts_fail_need_card_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -2369,6 +3094,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'prepaidCardToken is required')
 
+    def test_iter_prepaid_card_receipts_fail_need_card_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterReceiptsForPrepaidCard('token')
+
+        self.assertEqual(exc.exception.message, 'prepaidCardToken is required')
+
     def test_list_prepaid_card_receipts_fail_need_params_invalid(self):
 
         options = {'createdBefore': 'test', 'token': 'test'}
@@ -2377,6 +3109,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_prepaid_card_receipts_fail_need_params_invalid(self):
+
+        options = {'createdBefore': 'test', 'token': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterReceiptsForPrepaidCard('token', 'token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_prepaid_card_receipts_params_valid(self, mock_get):
 
@@ -2386,6 +3126,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].currency, self.balance.get('currency'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_prepaid_card_receipts_params_valid(self, mock_get):
+
+        options = {'createdBefore': 'test'}
+        mock_get.return_value = {'data': [self.balance]}
+        response = list(self.api.iterReceiptsForPrepaidCard('token', 'token', options))
+
+        self.assertTrue(response[0].currency, self.balance.get('currency'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_prepaid_card_receipts_success(self, mock_get):
 
@@ -2394,6 +3143,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].currency, self.balance.get('currency'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_prepaid_card_receipts_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.balance]}
+        response = list(self.api.iterReceiptsForPrepaidCard('token', 'token'))
+
+        self.assertTrue(response[0].currency, self.balance.get('currency'))
+
     def test_list_account_receipts_fail_need_program_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -2401,6 +3158,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'programToken is required')
 
+    def test_iter_account_receipts_fail_need_program_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterReceiptsForAccount()
+
+        self.assertEqual(exc.exception.message, 'programToken is required')
+
     def test_list_account_receipts_fail_need_account_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -2408,6 +3172,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'accountToken is required')
 
+    def test_iter_account_receipts_fail_need_account_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterReceiptsForAccount('token')
+
+        self.assertEqual(exc.exception.message, 'accountToken is required')
+
     def test_list_account_receipts_fail_need_params_invalid(self):
 
         options = {'currency': 'test', 'token': 'test'}
@@ -2416,6 +3187,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_account_receipts_fail_need_params_invalid(self):
+
+        options = {'currency': 'test', 'token': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterReceiptsForAccount('token', 'token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_account_receipts_params_valid(self, mock_get):
 
@@ -2425,6 +3204,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].currency, self.balance.get('currency'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_account_receipts_params_valid(self, mock_get):
+
+        options = {'currency': 'test'}
+        mock_get.return_value = {'data': [self.balance]}
+        response = list(self.api.iterReceiptsForAccount('token', 'token', options))
+
+        self.assertTrue(response[0].currency, self.balance.get('currency'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_account_receipts_success(self, mock_get):
 
@@ -2439,6 +3227,20 @@ class ApiTest(unittest.TestCase):
 
     '''
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_account_receipts_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.balance]}
+        response = list(self.api.iterReceiptsForAccount('token', 'token'))
+
+        self.assertTrue(response[0].currency, self.balance.get('currency'))
+
+    '''
+
+    Programs
+
+    '''
+
     def test_get_program_fail_need_program_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -2568,6 +3370,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_transfer_method_configurations_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterTransferMethodConfigurations()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_transfer_method_configurations_fail_need_params_invalid(self):
 
         options = {'userToken': 'test', 'token': 'test'}
@@ -2576,6 +3385,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_transfer_method_configurations_fail_need_params_invalid(self):
+
+        options = {'userToken': 'test', 'token': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterTransferMethodConfigurations('token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_transfer_method_configurations_params_valid(self, mock_get):
 
@@ -2585,6 +3402,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].type, self.configuration.get('type'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_transfer_method_configurations_params_valid(self, mock_get):
+
+        options = {'offset': 10}
+        mock_get.return_value = {'data': [self.configuration]}
+        response = list(self.api.iterTransferMethodConfigurations('token', options))
+
+        self.assertTrue(response[0].type, self.configuration.get('type'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_transfer_method_configurations_success(self, mock_get):
 
@@ -2593,6 +3419,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].type, self.configuration.get('type'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_transfer_method_configurations_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.configuration]}
+        response = list(self.api.iterTransferMethodConfigurations('token'))
+
+        self.assertTrue(response[0].type, self.configuration.get('type'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_transfer_method_configurations_success_empty(self, mock_get):
 
@@ -2630,6 +3464,14 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_webhooks_fail_need_params_invalid(self):
+
+        options = {'type': 'test', 'token': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterWebhookNotifications(options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_webhooks_params_valid(self, mock_get):
 
@@ -2639,6 +3481,15 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].token, self.data.get('token'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_webhooks_params_valid(self, mock_get):
+
+        options = {'type': 'test'}
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterWebhookNotifications(options))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_webhooks_success(self, mock_get):
 
@@ -2651,6 +3502,19 @@ class ApiTest(unittest.TestCase):
 
     Upload Documents
 
+    '''
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_webhooks_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterWebhookNotifications())
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
+    '''
+
+    Upload Documents
+
     '''
     def test_uploadDocumentsForUser_fail_need_user_token(self):
 
@@ -2863,6 +3727,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'transferToken is required')
 
+    def test_iter_transfer_status_transitions_fail_need_transfer_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterTransferStatusTransitions()
+
+        self.assertEqual(exc.exception.message, 'transferToken is required')
+
     def test_list_transfer_status_transitions_fail_need_params_invalid(self):
 
         options = {'transition': 'test', 'token': 'test'}
@@ -2871,6 +3742,22 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_transfer_status_transitions_fail_need_params_invalid(self):
+
+        options = {'transition': 'test', 'token': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterTransferStatusTransitions('token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_transfer_status_transitions_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterTransferStatusTransitions('token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_transfer_status_transitions_params_valid(self, mock_get):
 
@@ -2930,6 +3817,21 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'transferToken is required')
 
+    def test_iter_transfer_refunds_fail_need_transfer_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterTransferRefunds()
+
+        self.assertEqual(exc.exception.message, 'transferToken is required')
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_transfer_refunds_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterTransferRefunds('token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_transfer_refunds_success(self, mock_get):
 
@@ -2951,6 +3853,13 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'userToken is required')
 
+    def test_iter_transfer_methods_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterTransferMethods()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
     def test_list_transfer_methods_fail_need_params_invalid(self):
 
         options = {'type': 'test', 'token': 'test'}
@@ -2959,6 +3868,22 @@ class ApiTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'Invalid filter')
 
+    def test_iter_transfer_methods_fail_need_params_invalid(self):
+
+        options = {'type': 'test', 'token': 'test'}
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterTransferMethods('token', options)
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_iter_transfer_methods_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = list(self.api.iterTransferMethods('token'))
+
+        self.assertTrue(response[0].token, self.data.get('token'))
+
     @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
     def test_list_transfer_methods_params_valid(self, mock_get):
 
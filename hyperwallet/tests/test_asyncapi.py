@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+
+import mock
+import json
+import unittest
+import os.path
+import hyperwallet
+
+from hyperwallet.asyncapi import AsyncRunner
+from hyperwallet.config import SERVER
+from hyperwallet.exceptions import HyperwalletException, HyperwalletAPIException
+from hyperwallet.utils import AsyncApiClient
+from hyperwallet.utils.encryption import Encryption
+
+
+class AsyncApiTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+
+        self.api = hyperwallet.AsyncApi(
+            'test-user',
+            'test-pass',
+            'prg-12345'
+        )
+
+        self.data = {
+            'token': 'tkn-12345'
+        }
+
+    def test_initialize_fail_need_program_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            hyperwallet.AsyncApi('username', 'password')
+
+        self.assertEqual(exc.exception.message, 'programToken is required')
+
+    def test_mirrors_api_methods(self):
+
+        for name in dir(hyperwallet.Api):
+            if not name.startswith('_'):
+                self.assertTrue(hasattr(self.api, name), name)
+
+    def test_helpers_stay_synchronous(self):
+
+        data = {'documents': [{'type': 'DRIVERS_LICENSE', 'reasons': [{'name': 'DOCUMENT_EXPIRED', 'description': 'Expired'}]}]}
+
+        response = self.api.setDocumentAndReasonFromResponseHelper(data)
+
+        self.assertEqual(response['documents'][0].reasons[0].description, 'Expired')
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_replay_fails_on_second_request(self, mock_get):
+
+        mock_get.return_value = self.data
+
+        def getUsers(api, first, second):
+            return [api.getUser(first), api.getUser(second)]
+
+        with mock.patch.object(hyperwallet.Api, 'getUsers', getUsers, create=True):
+            with self.assertRaises(HyperwalletException) as exc:
+                await self.api._call('getUsers', ('usr-1', 'usr-2'), {})
+
+        self.assertEqual(exc.exception.message, 'AsyncApi cannot run methods sending more than one request')
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_threaded_methods_fail_need_parameters(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.exportPayments()
+
+        self.assertEqual(exc.exception.message, 'directory is required')
+
+    async def test_threaded_methods_need_await(self):
+
+        runner = self.api.createPayments([{'amount': '10.00'}])
+        self.assertIsInstance(runner, AsyncRunner)
+
+        (result,) = runner.target.run()
+
+        self.assertIsInstance(result.error, HyperwalletException)
+        self.assertEqual(result.error.message, 'AsyncApi requests must be run with await')
+
+    async def test_get_user_fail_need_user_token(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            await self.api.getUser()
+
+        self.assertEqual(exc.exception.message, 'userToken is required')
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_get_user_success(self, mock_get):
+
+        mock_get.return_value = self.data
+        response = await self.api.getUser('token')
+
+        self.assertIsInstance(response, hyperwallet.User)
+        self.assertEqual(response.token, self.data.get('token'))
+        mock_get.assert_called_once_with(method='GET', url='users/token', params={})
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_create_payment_success(self, mock_post):
+
+        mock_post.return_value = self.data
+        response = await self.api.createPayment({'amount': '10.00'})
+
+        self.assertEqual(response.token, self.data.get('token'))
+        self.assertEqual(mock_post.call_args[1]['method'], 'POST')
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_list_payments_success(self, mock_get):
+
+        mock_get.return_value = {'data': [self.data]}
+        response = await self.api.listPayments({'currency': 'USD'})
+
+        self.assertEqual(response[0].token, self.data.get('token'))
+
+    def test_iter_payments_fail_need_params_invalid(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.iterPayments({'token': 'test'})
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_iter_payments_success(self, mock_get):
+
+        mock_get.side_effect = [
+            {'hasNextPage': True, 'data': [{'token': 'pmt-1'}]},
+            {'hasNextPage': False, 'data': [{'token': 'pmt-2'}]}
+        ]
+
+        response = [x.token async for x in self.api.iterPayments(pageSize=1)]
+
+        self.assertEqual(response, ['pmt-1', 'pmt-2'])
+        self.assertEqual(mock_get.call_args[1]['params'], {'limit': 1, 'offset': 1})
+
+
+class AsyncApiClientTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        self.clientPath = os.path.join(localDir, 'resources', 'private-jwkset1')
+        self.hyperwalletPath = os.path.join(localDir, 'resources', 'public-jwkset1')
+
+        self.client = AsyncApiClient('test-user', 'test-pass', SERVER)
+        self.clientWithEncryption = AsyncApiClient(
+            'test-user',
+            'test-pass',
+            SERVER,
+            {'clientPrivateKeySetLocation': self.clientPath, 'hyperwalletKeySetLocation': self.hyperwalletPath}
+        )
+
+    async def test_close(self):
+
+        with self.assertRaises(TypeError):
+            with self.client:
+                pass
+
+        async with self.client as client:
+            self.assertIs(client, self.client)
+
+        self.assertTrue(self.client.session.is_closed)
+
+    @mock.patch('httpx.AsyncClient.request', new_callable=mock.AsyncMock)
+    async def test_failed_connection(self, session_mock):
+
+        session_mock.side_effect = Exception('Connection refused')
+
+        with self.assertRaises(HyperwalletAPIException) as exc:
+            await self.client.doGet('users')
+
+        self.assertEqual(
+            exc.exception.message.get('errors')[0].get('code'),
+            'COMMUNICATION_ERROR'
+        )
+
+    @mock.patch('httpx.AsyncClient.request', new_callable=mock.AsyncMock)
+    async def test_receive_valid_json_response(self, session_mock):
+
+        session_mock.return_value = mock.MagicMock(
+            status_code=200,
+            content=json.dumps({'key': 'value'}).encode('utf-8'),
+            headers={
+                "Content-Type": "application/json"
+            }
+        )
+
+        self.assertEqual(await self.client.doGet('users', {'limit': 10, 'offset': None}), {'key': 'value'})
+        self.assertEqual(session_mock.call_args[1]['params'], {'limit': 10})
+
+    @mock.patch('httpx.AsyncClient.request', new_callable=mock.AsyncMock)
+    async def test_receive_valid_json_error_response(self, session_mock):
+
+        session_mock.return_value = mock.MagicMock(
+            status_code=400,
+            content=json.dumps({'errors': [{'code': 'FORBIDDEN'}]}),
+            headers={
+                "Content-Type": "application/json"
+            }
+        )
+
+        with self.assertRaises(HyperwalletAPIException) as exc:
+            await self.client.doGet('users')
+
+        self.assertEqual(
+            exc.exception.message.get('errors')[0].get('code'),
+            'FORBIDDEN'
+        )
+
+    @mock.patch('httpx.AsyncClient.request', new_callable=mock.AsyncMock)
+    async def test_request_with_encryption_successful(self, session_mock):
+
+        encryption = Encryption(self.clientPath, self.hyperwalletPath)
+
+        session_mock.return_value = mock.MagicMock(
+            status_code=200,
+            content=encryption.encrypt(json.dumps({'key': 'value'})),
+            headers={
+                "Content-Type": "application/jose+json"
+            }
+        )
+
+        self.assertEqual(await self.clientWithEncryption.doGet('users'), {'key': 'value'})
+
+
+if __name__ == '__main__':
+    unittest.main()
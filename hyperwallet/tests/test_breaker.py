@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+
+import mock
+import unittest
+
+from hyperwallet import Api
+from hyperwallet.config import SERVER
+from hyperwallet.exceptions import HyperwalletAPIException
+from hyperwallet.utils import ApiClient, AsyncApiClient, CircuitBreaker, Deadline, MetricsCollector
+from hyperwallet.utils.instrumentation import RequestEvent
+from hyperwallet.tests.helpers import errorCode, jsonResponse
+
+
+def serverError():
+    return jsonResponse(503, {'errors': [{'code': 'SERVICE_UNAVAILABLE', 'message': 'Try again later'}]})
+
+
+def finished(url, status=200, error=None, networkTime=0.01, method='GET'):
+    event = RequestEvent(method, url)
+    event.status = status
+    event.networkTime = networkTime
+    event.finish(error)
+    return event
+
+
+class CircuitBreakerTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.breaker = CircuitBreaker(failureRate=0.5, minRequests=4, windowSize=10, openFor=30, probes=2)
+        self.now = 1000.0
+
+        patcher = mock.patch('time.monotonic', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def send(self, url, status=200, **kwargs):
+
+        event = finished(url, status, **kwargs)
+        event.circuit = None
+        self.breaker.acquire(event)
+        self.breaker.record(event)
+        return event
+
+    def open(self, url='users/usr-1/receipts'):
+
+        for _ in range(4):
+            self.send(url, 503)
+
+    def test_opens_on_failure_rate(self):
+
+        for status in [200, 503, 200, 503]:
+            self.send('users/usr-1/receipts', status)
+
+        self.assertEqual(self.breaker.state('GET users/{token}/receipts'), 'open')
+
+        with self.assertRaises(HyperwalletAPIException) as exc:
+            self.send('users/usr-2/receipts')
+
+        self.assertEqual(errorCode(exc.exception), 'CIRCUIT_OPEN')
+        self.assertIn('GET users/{token}/receipts', exc.exception.message['errors'][0]['message'])
+
+    def test_needs_min_requests(self):
+
+        for _ in range(3):
+            self.send('users/usr-1/receipts', 503)
+
+        self.assertEqual(self.breaker.state('GET users/{token}/receipts'), 'closed')
+
+    def test_endpoints_are_independent(self):
+
+        self.open()
+
+        self.assertEqual(self.send('payments', method='POST').circuit, 'closed')
+        self.assertEqual(self.breaker.state('POST payments'), 'closed')
+
+    def test_failures(self):
+
+        self.assertTrue(self.breaker.failed(finished('users', None, error=ValueError('Connection refused'))))
+        self.assertTrue(self.breaker.failed(finished('users', 500)))
+        self.assertFalse(self.breaker.failed(finished('users', 400, error=ValueError('Invalid field'))))
+        self.assertFalse(self.breaker.failed(finished('users', 200, networkTime=5)))
+        self.assertIsNone(self.breaker.failed(finished('users', None, error=ValueError('Deadline'), networkTime=0)))
+
+        self.breaker.slowCallDuration = 2
+        self.assertTrue(self.breaker.failed(finished('users', 200, networkTime=5)))
+
+    def test_half_open_probes_close(self):
+
+        self.open()
+        self.now += 30
+
+        self.assertEqual(self.breaker.state('GET users/{token}/receipts'), 'half-open')
+
+        probes = [finished('users/usr-1/receipts'), finished('users/usr-2/receipts')]
+        for probe in probes:
+            self.breaker.acquire(probe)
+            self.assertEqual(probe.circuit, 'half-open')
+
+        with self.assertRaises(HyperwalletAPIException):
+            self.send('users/usr-3/receipts')
+
+        for probe in probes:
+            self.breaker.record(probe)
+
+        self.assertEqual(probes[1].circuit, 'closed')
+        self.assertEqual(self.send('users/usr-3/receipts').circuit, 'closed')
+
+    def test_failed_probe_reopens(self):
+
+        self.open()
+        self.now += 30
+
+        self.assertEqual(self.send('users/usr-1/receipts', 503).circuit, 'open')
+
+        with self.assertRaises(HyperwalletAPIException):
+            self.send('users/usr-1/receipts')
+
+        stats = self.breaker.stats()['GET users/{token}/receipts']
+        self.assertEqual((stats['state'], stats['opened'], stats['rejected']), ('open', 2, 1))
+
+    def test_unsent_probe_frees_its_slot(self):
+
+        self.open()
+        self.now += 30
+
+        for _ in range(3):
+            self.assertEqual(self.send('users/usr-1/receipts', None, networkTime=0).circuit, 'half-open')
+
+
+class ApiClientCircuitBreakerTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.metrics = MetricsCollector()
+        self.breaker = CircuitBreaker(minRequests=3, openFor=60)
+        self.client = ApiClient('test-user', 'test-pass', SERVER, hooks=[self.metrics], circuitBreaker=self.breaker)
+
+    @mock.patch('requests.Session.request')
+    def test_fails_fast_once_open(self, session_mock):
+
+        session_mock.return_value = serverError()
+
+        for _ in range(3):
+            with self.assertRaises(HyperwalletAPIException) as exc:
+                self.client.doGet('users/usr-1/receipts')
+            self.assertEqual(errorCode(exc.exception), 'SERVICE_UNAVAILABLE')
+
+        with self.assertRaises(HyperwalletAPIException) as exc:
+            self.client.doGet('users/usr-1/receipts')
+
+        self.assertEqual(errorCode(exc.exception), 'CIRCUIT_OPEN')
+        self.assertEqual(session_mock.call_count, 3)
+
+        session_mock.return_value = jsonResponse(201, {'token': 'pmt-1'})
+        self.assertEqual(self.client.doPost('payments', {'amount': '1.00'}), {'token': 'pmt-1'})
+
+        metrics = self.metrics.endpoint('GET users/{token}/receipts').asDict()
+        self.assertEqual(metrics['circuit'], 'open')
+        self.assertEqual(metrics['errors'], {'SERVICE_UNAVAILABLE': 3, 'CIRCUIT_OPEN': 1})
+        self.assertEqual(self.metrics.endpoint('POST payments').asDict()['circuit'], 'closed')
+
+    @mock.patch('requests.Session.request')
+    def test_connection_errors_open_the_circuit(self, session_mock):
+
+        session_mock.side_effect = Exception('Connection refused')
+
+        for _ in range(3):
+            with self.assertRaises(HyperwalletAPIException):
+                self.client.doGet('users')
+
+        self.assertEqual(self.breaker.state('GET users'), 'open')
+
+    @mock.patch('requests.Session.request')
+    def test_client_errors_keep_it_closed(self, session_mock):
+
+        session_mock.return_value = jsonResponse(400, {'errors': [{'code': 'CONSTRAINT_VIOLATIONS', 'message': 'Invalid'}]})
+
+        for _ in range(5):
+            with self.assertRaises(HyperwalletAPIException):
+                self.client.doPost('users', {})
+
+        self.assertEqual(self.breaker.state('POST users'), 'closed')
+
+    @mock.patch('requests.Session.request')
+    def test_unsent_requests_are_not_recorded(self, session_mock):
+
+        for _ in range(5):
+            with Deadline(0):
+                with self.assertRaises(HyperwalletAPIException):
+                    self.client.doGet('users')
+
+        session_mock.assert_not_called()
+        self.assertEqual(self.breaker.stats()['GET users']['requests'], 0)
+
+
+class ApiCircuitBreakerTest(unittest.TestCase):
+
+    @mock.patch('requests.Session.request')
+    def test_next_links_keep_their_endpoint(self, session_mock):
+
+        def page(endpoint, token):
+            return jsonResponse(200, {
+                'data': [{'token': token}],
+                'links': [{'params': {'rel': 'next'}, 'href': '{}/rest/v3/{}?after={}&limit=1'.format(SERVER, endpoint, token)}]
+            })
+
+        def request(method, url, **kwargs):
+            if '?after=' not in url:
+                return page(url.rsplit('/', 1)[1], 'tkn-1')
+            if '/users?' in url:
+                return serverError()
+            return jsonResponse(200, {'data': []})
+
+        session_mock.side_effect = request
+        breaker = CircuitBreaker(minRequests=3, openFor=60)
+        api = Api('test-user', 'test-pass', 'test-program', circuitBreaker=breaker)
+
+        for _ in range(2):
+            with self.assertRaises(HyperwalletAPIException):
+                list(api.iterUsers())
+
+        self.assertEqual(breaker.state('GET users'), 'open')
+        self.assertEqual([payment.token for payment in api.iterPayments()], ['tkn-1'])
+        self.assertEqual(breaker.state('GET payments'), 'closed')
+        self.assertEqual(sorted(breaker.stats()), ['GET payments', 'GET users'])
+
+
+class AsyncApiClientCircuitBreakerTest(unittest.IsolatedAsyncioTestCase):
+
+    @mock.patch('httpx.AsyncClient.request', new_callable=mock.AsyncMock)
+    async def test_fails_fast_once_open(self, session_mock):
+
+        client = AsyncApiClient('test-user', 'test-pass', SERVER, circuitBreaker=CircuitBreaker(minRequests=2))
+        session_mock.return_value = serverError()
+
+        for code in ['SERVICE_UNAVAILABLE', 'SERVICE_UNAVAILABLE', 'CIRCUIT_OPEN']:
+            with self.assertRaises(HyperwalletAPIException) as exc:
+                await client.doGet('users/usr-1/receipts')
+            self.assertEqual(errorCode(exc.exception), code)
+
+        self.assertEqual(session_mock.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+
+import mock
+import unittest
+import hyperwallet
+
+from hyperwallet.exceptions import HyperwalletException, HyperwalletAPIException
+from hyperwallet.utils.bulk import BulkSubmitter, BulkSummary
+
+
+def communicationError():
+    return HyperwalletAPIException({
+        'errors': [{'code': 'COMMUNICATION_ERROR', 'message': 'Connection failed'}]
+    })
+
+
+class BulkSubmitterTest(unittest.TestCase):
+
+    def test_submit_every_item(self):
+
+        submitter = BulkSubmitter(lambda x: x * 2, range(50), maxWorkers=4)
+        results = submitter.run()
+
+        self.assertEqual([x.result for x in results], [x * 2 for x in range(50)])
+        self.assertEqual(submitter.summary.total, 50)
+        self.assertEqual(submitter.summary.succeeded, 50)
+        self.assertEqual(submitter.summary.failuresByCode, {})
+
+    def test_submit_counts_failures_by_error_code(self):
+
+        def submit(item):
+            if item % 2:
+                raise HyperwalletAPIException({'errors': [{'code': 'INSUFFICIENT_FUNDS'}]})
+            return item
+
+        submitter = BulkSubmitter(submit, range(10), maxWorkers=2)
+        results = submitter.run()
+
+        self.assertEqual(results[1].errorCode, 'INSUFFICIENT_FUNDS')
+        self.assertEqual(results[1].attempts, 1)
+        self.assertEqual(submitter.summary.failed, 5)
+        self.assertEqual(submitter.summary.failuresByCode, {'INSUFFICIENT_FUNDS': 5})
+
+    def test_retry_communication_errors(self):
+
+        submit = mock.Mock(side_effect=[communicationError(), communicationError(), 'created'])
+
+        results = BulkSubmitter(submit, ['item'], maxWorkers=1, maxAttempts=3).run()
+
+        self.assertEqual(results[0].result, 'created')
+        self.assertEqual(results[0].attempts, 3)
+
+    def test_retry_recovers_previous_attempt(self):
+
+        submit = mock.Mock(side_effect=communicationError())
+        recover = mock.Mock(return_value='created')
+
+        results = BulkSubmitter(submit, ['item'], maxWorkers=1, recover=recover).run()
+
+        self.assertTrue(results[0].succeeded)
+        self.assertTrue(results[0].recovered)
+        self.assertEqual(results[0].result, 'created')
+        self.assertEqual(submit.call_count, 1)
+
+    def test_rate_limit(self):
+
+        with mock.patch('time.sleep') as sleep_mock:
+            BulkSubmitter(lambda x: x, range(5), maxWorkers=1, rateLimit=10).run()
+
+        self.assertEqual(sleep_mock.call_count, 4)
+
+    def test_summary_percentiles(self):
+
+        summary = BulkSummary([float(x) for x in range(1, 101)], {}, 10.0)
+
+        self.assertEqual(summary.latencyP50, 50.0)
+        self.assertEqual(summary.latencyP99, 99.0)
+        self.assertEqual(summary.throughput, 10.0)
+
+
+class ApiCreatePaymentsTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.api = hyperwallet.Api(
+            'test-user',
+            'test-pass',
+            'prg-12345'
+        )
+
+    def test_create_payments_fail_need_payments(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.createPayments()
+
+        self.assertEqual(exc.exception.message, 'payments is required')
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_create_payments_success(self, mock_post):
+
+        mock_post.side_effect = lambda **kwargs: {'token': 'pmt-12345'}
+
+        results = self.api.createPayments([{'clientPaymentId': 'abc'}, {'amount': '10.00'}]).run()
+
+        self.assertEqual([x.result.token for x in results], ['pmt-12345', 'pmt-12345'])
+        self.assertEqual(results[0].data['clientPaymentId'], 'abc')
+        self.assertTrue(results[1].data['clientPaymentId'])
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_create_payments_recover_by_client_payment_id(self, mock_request):
+
+        mock_request.side_effect = [communicationError(), {'data': [{'token': 'pmt-12345'}]}]
+
+        results = self.api.createPayments([{'clientPaymentId': 'abc'}], maxWorkers=1).run()
+
+        self.assertEqual(results[0].result.token, 'pmt-12345')
+        self.assertEqual(mock_request.call_args[1]['params'], {'clientPaymentId': 'abc'})
+
+
+class AsyncApiCreatePaymentsTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+
+        self.api = hyperwallet.AsyncApi(
+            'test-user',
+            'test-pass',
+            'prg-12345'
+        )
+
+    def test_create_payments_fail_need_payments(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.createPayments()
+
+        self.assertEqual(exc.exception.message, 'payments is required')
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_create_payments_success(self, mock_post):
+
+        mock_post.return_value = {'token': 'pmt-12345'}
+
+        submitter = self.api.createPayments([{'clientPaymentId': 'abc'}, {'amount': '10.00'}])
+        results = sorted([x async for x in submitter], key=lambda result: result.index)
+
+        self.assertEqual([x.result.token for x in results], ['pmt-12345', 'pmt-12345'])
+        self.assertEqual(results[0].data['clientPaymentId'], 'abc')
+        self.assertEqual(submitter.summary.succeeded, 2)
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_create_payments_recover_by_client_payment_id(self, mock_request):
+
+        mock_request.side_effect = [communicationError(), {'data': [{'token': 'pmt-12345'}]}]
+
+        results = await self.api.createPayments([{'clientPaymentId': 'abc'}], maxWorkers=1).run()
+
+        self.assertEqual(results[0].result.token, 'pmt-12345')
+        self.assertTrue(results[0].recovered)
+        self.assertEqual(mock_request.call_args[1]['params'], {'clientPaymentId': 'abc'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+
+import mock
+import unittest
+
+from datetime import date
+
+from hyperwallet.utils import ApiClient, AsyncApiClient, ResponseCache
+from hyperwallet.config import SERVER
+from hyperwallet.tests.helpers import jsonResponse
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.cache = ResponseCache(maxEntries=2)
+
+    def test_ttl_by_resource(self):
+
+        self.assertEqual(self.cache.ttl('programs/prg-1'), 3600)
+        self.assertEqual(self.cache.ttl('programs/prg-1/accounts/act-1'), 300)
+        self.assertEqual(self.cache.ttl('transfer-method-configurations'), 3600)
+        self.assertEqual(self.cache.ttl('users/usr-1'), 0)
+
+        self.assertIsNone(self.cache.key('user', 'users/usr-1', None))
+        self.assertNotEqual(
+            self.cache.key('user', 'programs/prg-1', None),
+            self.cache.key('other-user', 'programs/prg-1', None)
+        )
+        self.assertEqual(
+            self.cache.key('user', 'transfer-method-configurations', {'userToken': 'usr-1', 'limit': 10}),
+            self.cache.key('user', '/transfer-method-configurations/', {'limit': 10, 'userToken': 'usr-1'})
+        )
+        self.assertEqual(
+            self.cache.key('user', 'programs/prg-1', {'createdAfter': date(2024, 1, 1)}),
+            self.cache.key('user', 'programs/prg-1', {'createdAfter': '2024-01-01'})
+        )
+
+    def test_hits_return_copies(self):
+
+        key = self.cache.key('user', 'programs/prg-1', None)
+
+        self.assertIsNone(self.cache.lookup(key))
+
+        self.cache.store(key, 'programs/prg-1', {'token': 'prg-1'}, {})
+        entry = self.cache.lookup(key)
+
+        self.assertTrue(entry.fresh)
+        self.cache.content(entry)['token'] = 'changed'
+        self.assertEqual(self.cache.content(entry), {'token': 'prg-1'})
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+        self.assertEqual(self.cache.stats()['hitRatio'], 0.5)
+
+    def test_expired_entries(self):
+
+        cache = ResponseCache(ttls={'programs/{token}': 0.05})
+        unvalidated = cache.key('user', 'programs/prg-1', None)
+        validated = cache.key('user', 'programs/prg-2', None)
+
+        cache.store(unvalidated, 'programs/prg-1', {}, {})
+        cache.store(validated, 'programs/prg-2', {}, {'ETag': '"v1"'})
+
+        with mock.patch('time.monotonic', return_value=10 ** 9):
+            self.assertIsNone(cache.lookup(unvalidated))
+
+            entry = cache.lookup(validated)
+            self.assertFalse(entry.fresh)
+            self.assertEqual(entry.conditionalHeaders(), {'If-None-Match': '"v1"'})
+
+        self.assertEqual(cache.stats()['stale'], 1)
+        self.assertEqual(cache.stats()['entries'], 1)
+
+    def test_lru_eviction(self):
+
+        keys = [self.cache.key('user', 'programs/prg-{}'.format(index), None) for index in range(3)]
+
+        self.cache.store(keys[0], 'programs/prg-0', {}, {})
+        self.cache.store(keys[1], 'programs/prg-1', {}, {})
+        self.cache.lookup(keys[0])
+        self.cache.store(keys[2], 'programs/prg-2', {}, {})
+
+        self.assertIsNotNone(self.cache.lookup(keys[0]))
+        self.assertIsNone(self.cache.lookup(keys[1]))
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    def test_no_store(self):
+
+        key = self.cache.key('user', 'programs/prg-1', None)
+        self.cache.store(key, 'programs/prg-1', {}, {'Cache-Control': 'no-store'})
+
+        self.assertIsNone(self.cache.lookup(key))
+
+    def test_invalidate(self):
+
+        cache = ResponseCache()
+        for url in ('programs/prg-1', 'programs/prg-1/accounts/act-1', 'programs/prg-10'):
+            cache.store(cache.key('user', url, None), url, {}, {})
+
+        self.assertEqual(cache.invalidate('programs/prg-1'), 2)
+        self.assertEqual(cache.stats()['entries'], 1)
+        self.assertEqual(cache.clear(), 1)
+        self.assertEqual(cache.stats()['invalidations'], 3)
+
+
+class ApiClientCacheTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.cache = ResponseCache()
+        self.client = ApiClient('test-user', 'test-pass', SERVER, responseCache=self.cache)
+
+    @mock.patch('requests.Session.request')
+    def test_cached_get(self, session_mock):
+
+        session_mock.return_value = jsonResponse(200, {'token': 'prg-1'})
+
+        self.assertEqual(self.client.doGet('programs/prg-1'), {'token': 'prg-1'})
+        self.assertEqual(self.client.doGet('programs/prg-1'), {'token': 'prg-1'})
+        self.assertEqual(session_mock.call_count, 1)
+
+        self.client.doGet('users/usr-1')
+        self.client.doGet('users/usr-1')
+        self.assertEqual(session_mock.call_count, 3)
+
+    @mock.patch('requests.Session.request')
+    def test_conditional_revalidation(self, session_mock):
+
+        session_mock.return_value = jsonResponse(200, {'token': 'prg-1'}, {'ETag': '"v1"'})
+        self.client.doGet('programs/prg-1')
+
+        session_mock.return_value = mock.MagicMock(status_code=304, content=b'', headers={})
+
+        with mock.patch('time.monotonic', return_value=10 ** 9):
+            self.assertEqual(self.client.doGet('programs/prg-1'), {'token': 'prg-1'})
+
+        self.assertEqual(session_mock.call_args[1]['headers'], {'If-None-Match': '"v1"'})
+        self.assertEqual(self.cache.stats()['revalidated'], 1)
+
+    @mock.patch('requests.Session.request')
+    def test_writes_invalidate(self, session_mock):
+
+        session_mock.return_value = jsonResponse(200, {'token': 'prg-1'})
+        self.client.doGet('programs/prg-1/accounts/act-1')
+
+        self.client.doPut('programs/prg-1/accounts/act-1', {})
+        self.client.doGet('programs/prg-1/accounts/act-1')
+
+        self.assertEqual(session_mock.call_count, 3)
+
+
+class AsyncApiClientCacheTest(unittest.IsolatedAsyncioTestCase):
+
+    @mock.patch('httpx.AsyncClient.request', new_callable=mock.AsyncMock)
+    async def test_cached_get(self, session_mock):
+
+        client = AsyncApiClient('test-user', 'test-pass', SERVER, responseCache=ResponseCache())
+        session_mock.return_value = jsonResponse(200, {'token': 'prg-1'})
+
+        self.assertEqual(await client.doGet('transfer-method-configurations', {'userToken': 'usr-1'}), {'token': 'prg-1'})
+        self.assertEqual(await client.doGet('transfer-method-configurations', {'userToken': 'usr-1'}), {'token': 'prg-1'})
+        await client.doGet('transfer-method-configurations', {'userToken': 'usr-2'})
+
+        self.assertEqual(session_mock.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
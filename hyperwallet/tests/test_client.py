@@ -2,9 +2,13 @@
 
 import mock
 import json
+import socket
 import unittest
+import threading
 import os.path
 
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
 from hyperwallet.utils import ApiClient
 from hyperwallet.config import SERVER
 from hyperwallet.exceptions import HyperwalletAPIException
@@ -370,5 +374,81 @@ class ApiClientTest(unittest.TestCase):
         )
 
 
+class JsonHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = json.dumps({'token': 'tkn-12345'}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ApiClientConnectionPoolTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.httpd = HTTPServer(('127.0.0.1', 0), JsonHandler)
+        self.server = 'http://127.0.0.1:{}'.format(self.httpd.server_port)
+        thread = threading.Thread(target=self.httpd.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def tearDown(self):
+
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def test_reuse_connections(self):
+
+        client = ApiClient('test-user', 'test-pass', self.server, poolMaxSize=4)
+
+        for _ in range(5):
+            self.assertEqual(client.doGet('users/tkn-12345'), {'token': 'tkn-12345'})
+
+        stats = client.poolStats
+        self.assertEqual(stats['created'], 1)
+        self.assertEqual(stats['reused'], 4)
+        self.assertEqual(stats['discarded'], 0)
+        self.assertEqual(stats['inUse'], 0)
+        self.assertEqual(stats['open'], 1)
+
+    def test_pool_options(self):
+
+        socketOptions = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        client = ApiClient(
+            'test-user',
+            'test-pass',
+            self.server,
+            poolConnections=2,
+            poolMaxSize=100,
+            poolBlock=True,
+            keepAlive=False,
+            socketOptions=socketOptions
+        )
+
+        client.doGet('users/tkn-12345')
+
+        pool = client.adapter.poolmanager.connection_from_url(self.server)
+        self.assertEqual(pool.pool.maxsize, 100)
+        self.assertTrue(pool.block)
+        self.assertIn(socketOptions[0], pool.conn_kw['socket_options'])
+        self.assertEqual(client.session.headers['Connection'], 'close')
+
+    def test_close(self):
+
+        with ApiClient('test-user', 'test-pass', self.server) as client:
+            client.doGet('users/tkn-12345')
+            self.assertEqual(client.poolStats['open'], 1)
+
+        self.assertEqual(client.poolStats['open'], 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+
+import json
+import mock
+import os.path
+import unittest
+
+from hyperwallet.config import SERVER
+from hyperwallet.exceptions import HyperwalletAPIException, HyperwalletException
+from hyperwallet.utils import ApiClient
+from hyperwallet.utils.codec import JsonCodec, OrjsonCodec, defaultCodec
+from hyperwallet.utils.encryption import Encryption
+from hyperwallet.tests.helpers import response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+RESOURCES = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'resources')
+
+PAGE = {
+    'hasNextPage': False,
+    'data': [
+        {
+            'journalId': str(51660000 + index),
+            'type': 'PAYMENT',
+            'createdOn': '2019-10-01T22:10:48',
+            'amount': '{}.00'.format(index),
+            'currency': 'USD',
+            'details': {'clientPaymentId': 'cp-{}'.format(index), 'payeeName': 'José Muñoz'}
+        }
+        for index in range(20)
+    ]
+}
+
+
+class CodecTest(object):
+
+    def test_round_trip(self):
+
+        encoded = self.codec.dumps(PAGE)
+
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(self.codec.loads(encoded), PAGE)
+        self.assertEqual(self.codec.loads(encoded.decode('utf-8')), PAGE)
+        self.assertEqual(json.loads(encoded), PAGE)
+
+    def test_invalid_json(self):
+
+        with self.assertRaises(ValueError):
+            self.codec.loads(b'{"token": ')
+
+    def test_non_string_keys(self):
+
+        self.assertEqual(self.codec.loads(self.codec.dumps({1: 'one'})), {'1': 'one'})
+
+
+class JsonCodecTest(CodecTest, unittest.TestCase):
+
+    def setUp(self):
+
+        self.codec = JsonCodec()
+
+
+@unittest.skipIf(orjson is None, 'orjson is not installed')
+class OrjsonCodecTest(CodecTest, unittest.TestCase):
+
+    def setUp(self):
+
+        self.codec = OrjsonCodec()
+
+    def test_default(self):
+
+        self.assertIsInstance(defaultCodec(), OrjsonCodec)
+
+
+class ApiClientCodecTest(unittest.TestCase):
+
+    def test_codec_selection(self):
+
+        self.assertIsInstance(ApiClient('test-user', 'test-pass', SERVER, codec='json').codec, JsonCodec)
+        self.assertIsInstance(ApiClient('test-user', 'test-pass', SERVER).codec, type(defaultCodec()))
+
+        codec = JsonCodec()
+        self.assertIs(ApiClient('test-user', 'test-pass', SERVER, codec=codec).codec, codec)
+
+        with self.assertRaises(HyperwalletException):
+            ApiClient('test-user', 'test-pass', SERVER, codec='yaml')
+
+    @mock.patch('requests.Session.request')
+    def test_bytes_end_to_end(self, session_mock):
+
+        codec = mock.MagicMock(wraps=JsonCodec())
+        client = ApiClient('test-user', 'test-pass', SERVER, codec=codec)
+        session_mock.return_value = response(200, JsonCodec().dumps(PAGE))
+
+        self.assertEqual(client.doPost('payments', {'amount': '1.00'}), PAGE)
+
+        self.assertEqual(session_mock.call_args[1]['data'], b'{"amount": "1.00"}')
+        codec.loads.assert_called_once_with(session_mock.return_value.content)
+
+    @mock.patch('requests.Session.request')
+    def test_garbage_response(self, session_mock):
+
+        session_mock.return_value = response(200, b'<html>')
+
+        with self.assertRaises(HyperwalletAPIException) as exc:
+            ApiClient('test-user', 'test-pass', SERVER).doGet('users')
+
+        self.assertEqual(exc.exception.message['errors'][0]['code'], 'GARBAGE_RESPONSE')
+
+    @mock.patch('requests.Session.request')
+    def test_encrypted_post(self, session_mock):
+
+        encryptionData = {
+            'clientPrivateKeySetLocation': os.path.join(RESOURCES, 'private-jwkset1'),
+            'hyperwalletKeySetLocation': os.path.join(RESOURCES, 'public-jwkset1')
+        }
+        encryption = Encryption(**encryptionData)
+        client = ApiClient('test-user', 'test-pass', SERVER, encryptionData)
+        session_mock.return_value = response(
+            200,
+            encryption.encrypt(json.dumps({'token': 'pmt-1'})).encode('ascii'),
+            {'Content-Type': 'application/jose+json'}
+        )
+
+        self.assertEqual(client.doPost('payments', {'amount': '1.00'}), {'token': 'pmt-1'})
+
+        sent = session_mock.call_args[1]['data']
+        self.assertEqual(json.loads(encryption.decrypt(sent)), {'amount': '1.00'})
+
+
+if __name__ == '__main__':
+    unittest.main()
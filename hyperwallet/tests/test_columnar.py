@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+import mock
+import unittest
+
+from decimal import Decimal
+
+from hyperwallet import Api
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.utils import ColumnarBatch, RECEIPT_COLUMNS
+from hyperwallet.utils.columnar import MISSING, ScaledDecimalColumn, TimestampColumn
+
+
+class ColumnarBatchTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.receipts = [
+            {'journalId': '1', 'type': 'PAYMENT', 'entry': 'CREDIT', 'createdOn': '2019-10-01T22:10:48', 'amount': '10.50', 'currency': 'USD'},
+            {'journalId': '2', 'type': 'TRANSFER_TO_BANK_ACCOUNT', 'entry': 'DEBIT', 'createdOn': '2019-10-02T00:00:00', 'amount': '-5', 'fee': '1.25', 'currency': 'USD'},
+            {'journalId': '3', 'type': 'PAYMENT', 'entry': 'CREDIT', 'createdOn': '2019-10-03T12:00:00', 'amount': '7.1', 'currency': 'CAD'},
+            {'journalId': '4', 'type': 'PAYMENT', 'entry': 'CREDIT', 'amount': '100.00', 'currency': 'EUR'}
+        ]
+
+        self.batch = ColumnarBatch(RECEIPT_COLUMNS)
+        self.batch.extend(self.receipts[:2])
+        self.batch.extend(self.receipts[2:])
+
+    def test_typed_columns(self):
+
+        self.assertEqual(len(self.batch), 4)
+        self.assertEqual(list(self.batch['amount'].data), [1050, -500, 710, 10000])
+        self.assertEqual(list(self.batch['fee'].data), [MISSING, 125, MISSING, MISSING])
+        self.assertEqual(list(self.batch['createdOn'].data)[:3], [1569967848, 1569974400, 1570104000])
+        self.assertEqual(self.batch['createdOn'].data[3], MISSING)
+        self.assertEqual(list(self.batch['currency'].data), [0, 0, 1, 2])
+        self.assertEqual(self.batch['currency'].categories, ['USD', 'CAD', 'EUR'])
+
+    def test_decoded_values(self):
+
+        values = self.batch.asDict()
+
+        self.assertEqual(values['amount'], [Decimal('10.50'), Decimal('-5.00'), Decimal('7.10'), Decimal('100.00')])
+        self.assertEqual(values['fee'], [None, Decimal('1.25'), None, None])
+        self.assertEqual(values['type'], ['PAYMENT', 'TRANSFER_TO_BANK_ACCOUNT', 'PAYMENT', 'PAYMENT'])
+        self.assertEqual(values['journalId'], ['1', '2', '3', '4'])
+
+    def test_filter(self):
+
+        filtered = self.batch.filter(
+            self.batch['type'].isin('PAYMENT'),
+            self.batch['createdOn'].between('2019-10-01', '2019-10-03T23:59:59')
+        )
+
+        self.assertEqual(len(filtered), 2)
+        self.assertEqual(filtered.asDict()['journalId'], ['1', '3'])
+
+        filtered = self.batch.filter(self.batch['amount'].between(low='0', high='50'))
+
+        self.assertEqual(filtered.asDict()['journalId'], ['1', '3'])
+        self.assertEqual(len(self.batch.filter()), 4)
+
+    def test_sum_by_currency(self):
+
+        self.assertEqual(self.batch.sumBy('amount', 'currency'), {
+            'USD': Decimal('5.50'),
+            'CAD': Decimal('7.10'),
+            'EUR': Decimal('100.00')
+        })
+        self.assertEqual(self.batch['fee'].sum(), Decimal('1.25'))
+
+        credits = self.batch.filter(self.batch['entry'].isin(['CREDIT']))
+
+        self.assertEqual(credits.sumBy('amount', 'currency'), {
+            'USD': Decimal('10.50'),
+            'CAD': Decimal('7.10'),
+            'EUR': Decimal('100.00')
+        })
+
+    def test_invalid_values(self):
+
+        with self.assertRaises(HyperwalletException):
+            ScaledDecimalColumn('amount').parse('1.234')
+
+        with self.assertRaises(HyperwalletException):
+            TimestampColumn('createdOn').parse('yesterday')
+
+        self.assertEqual(ScaledDecimalColumn('amount', scale=3).parse('1.234'), 1234)
+        self.assertEqual(ScaledDecimalColumn('amount').parse('1.2300'), 123)
+
+    def test_amounts_not_decimal(self):
+
+        column = ScaledDecimalColumn('amount')
+
+        for value in ['1e3', 'abc', '1.-5', '1_000', ' 12', '.', '-']:
+            with self.assertRaises(HyperwalletException) as exc:
+                column.parse(value)
+            self.assertEqual(exc.exception.message, 'Amount {} is not a decimal'.format(value))
+
+        self.assertEqual([column.parse(value) for value in ['.5', '5.', '+5', '-0.05']], [50, 500, 500, -5])
+
+
+class PageIteratorColumnsTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.api = Api('test-user', 'test-pass', 'test-program')
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_receipts_to_columns(self, mock_get):
+
+        mock_get.side_effect = [
+            {'hasNextPage': True, 'data': [{'amount': '1.00', 'currency': 'USD'}, {'amount': '2.00', 'currency': 'USD'}]},
+            {'hasNextPage': False, 'data': [{'amount': '3.00', 'currency': 'CAD'}]}
+        ]
+
+        batch = self.api.iterReceiptsForUser('token', pageSize=2).toColumns(RECEIPT_COLUMNS)
+
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.sumBy('amount', 'currency'), {'USD': Decimal('3.00'), 'CAD': Decimal('3.00')})
+        self.assertEqual(mock_get.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+
+import mock
+import socket
+import threading
+import time
+import unittest
+
+from hyperwallet.config import SERVER
+from hyperwallet.exceptions import HyperwalletAPIException
+from hyperwallet.utils import ApiClient, AsyncApiClient, Deadline, PageIterator, RetryPolicy, Timeout
+from hyperwallet.utils.bulk import BulkSubmitter
+from hyperwallet.utils.deadline import checkDelay, currentDeadline, requestTimeout
+from hyperwallet.tests.helpers import errorCode, jsonResponse
+
+
+class DeadlineTest(unittest.TestCase):
+
+    def test_remaining_and_check(self):
+
+        with Deadline(10) as deadline:
+            self.assertIs(currentDeadline(), deadline)
+            self.assertGreater(deadline.check(), 9)
+            self.assertFalse(deadline.expired)
+
+        self.assertIsNone(currentDeadline())
+
+        with Deadline(0) as deadline:
+            self.assertTrue(deadline.expired)
+
+            with self.assertRaises(HyperwalletAPIException) as exc:
+                deadline.check()
+
+        self.assertEqual(errorCode(exc.exception), 'DEADLINE_EXCEEDED')
+
+    def test_nested_deadline_cannot_extend(self):
+
+        with Deadline(1) as outer:
+            with Deadline(60) as inner:
+                self.assertLessEqual(inner.remaining(), 1)
+                self.assertIs(currentDeadline(), inner)
+            with Deadline(0.5) as inner:
+                self.assertLessEqual(inner.remaining(), 0.5)
+            self.assertIs(currentDeadline(), outer)
+
+    def test_check_delay(self):
+
+        checkDelay(100)
+
+        with Deadline(5):
+            checkDelay(1)
+
+            with self.assertRaises(HyperwalletAPIException) as exc:
+                checkDelay(10)
+
+        self.assertEqual(errorCode(exc.exception), 'DEADLINE_EXCEEDED')
+
+    def test_request_timeout(self):
+
+        self.assertEqual(requestTimeout(5), (5, 5))
+        self.assertEqual(requestTimeout((3, 30)), (3, 30))
+
+        with Timeout(120):
+            self.assertEqual(requestTimeout((3, 30)), (120, 120))
+
+        with Timeout(None):
+            self.assertEqual(requestTimeout((3, 30)), (None, None))
+
+            with Deadline(2):
+                (connect, read) = requestTimeout((3, 30))
+
+        self.assertLessEqual(connect, 2)
+        self.assertLessEqual(read, 2)
+
+        with Deadline(10):
+            (connect, read) = requestTimeout((3, 30))
+
+        self.assertEqual(connect, 3)
+        self.assertLessEqual(read, 10)
+
+
+class ApiClientTimeoutTest(unittest.TestCase):
+
+    @mock.patch('requests.Session.request')
+    def test_timeouts(self, session_mock):
+
+        session_mock.return_value = jsonResponse(200, {'token': 'usr-1'})
+
+        client = ApiClient('test-user', 'test-pass', SERVER)
+        client.doGet('users/usr-1')
+        self.assertEqual(session_mock.call_args[1]['timeout'], (10, 60))
+
+        ApiClient('test-user', 'test-pass', SERVER, timeout=5).doGet('users/usr-1')
+        self.assertEqual(session_mock.call_args[1]['timeout'], (5, 5))
+
+        with Timeout((1, 300)):
+            client.doGet('users/usr-1')
+        self.assertEqual(session_mock.call_args[1]['timeout'], (1, 300))
+
+        with Deadline(20):
+            client.doGet('users/usr-1')
+        (connect, read) = session_mock.call_args[1]['timeout']
+        self.assertEqual(connect, 10)
+        self.assertLessEqual(read, 20)
+
+    @mock.patch('requests.Session.request')
+    def test_expired_deadline_sends_nothing(self, session_mock):
+
+        with Deadline(0):
+            with self.assertRaises(HyperwalletAPIException) as exc:
+                ApiClient('test-user', 'test-pass', SERVER).doGet('users')
+
+        self.assertEqual(errorCode(exc.exception), 'DEADLINE_EXCEEDED')
+        session_mock.assert_not_called()
+
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.request')
+    def test_retry_beyond_deadline(self, session_mock, sleep_mock):
+
+        session_mock.return_value = mock.MagicMock(status_code=503, content=b'', headers={'Retry-After': '30'})
+        client = ApiClient(
+            'test-user',
+            'test-pass',
+            SERVER,
+            retryPolicy=RetryPolicy(maxAttempts=5, budget=False)
+        )
+
+        with Deadline(10):
+            with self.assertRaises(HyperwalletAPIException) as exc:
+                client.doGet('users')
+
+        self.assertEqual(errorCode(exc.exception), 'DEADLINE_EXCEEDED')
+        self.assertEqual(session_mock.call_count, 1)
+        sleep_mock.assert_not_called()
+
+
+class StalledServerTest(unittest.TestCase):
+    '''
+    A server accepting connections and never responding.
+    '''
+
+    def setUp(self):
+
+        self.server = socket.socket()
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(8)
+        self.url = 'http://127.0.0.1:{}'.format(self.server.getsockname()[1])
+
+    def tearDown(self):
+
+        self.server.close()
+
+    def test_read_timeout(self):
+
+        started = time.monotonic()
+
+        with self.assertRaises(HyperwalletAPIException) as exc:
+            ApiClient('test-user', 'test-pass', self.url, timeout=0.2).doGet('users')
+
+        self.assertEqual(errorCode(exc.exception), 'COMMUNICATION_ERROR')
+        self.assertLess(time.monotonic() - started, 5)
+
+    def test_deadline(self):
+
+        started = time.monotonic()
+
+        with Deadline(0.2):
+            with self.assertRaises(HyperwalletAPIException) as exc:
+                ApiClient('test-user', 'test-pass', self.url).doGet('users')
+
+        self.assertEqual(errorCode(exc.exception), 'DEADLINE_EXCEEDED')
+        self.assertLess(time.monotonic() - started, 5)
+
+
+class PropagationTest(unittest.TestCase):
+
+    def test_pagination_prefetch(self):
+
+        deadlines = []
+
+        def fetchPage(partialUrl, params):
+            deadlines.append((currentDeadline(), threading.current_thread()))
+            return {'hasNextPage': params['offset'] < 2, 'data': [params['offset']]}
+
+        with Deadline(10) as deadline:
+            items = list(PageIterator(fetchPage, 'receipts', lambda data: data, pageSize=1))
+
+        self.assertEqual(items, [0, 1, 2])
+        self.assertTrue(all(found is deadline for (found, thread) in deadlines))
+        self.assertNotEqual(deadlines[0][1], deadlines[1][1])
+
+    def test_bulk_stops_at_deadline(self):
+
+        submit = mock.MagicMock(side_effect=lambda item: time.sleep(0.05) or item)
+
+        with Deadline(0.12):
+            results = BulkSubmitter(submit, range(20), maxWorkers=1).run()
+
+        sent = [result for result in results if result.succeeded]
+        skipped = [result for result in results if not result.succeeded]
+
+        self.assertEqual(submit.call_count, len(sent))
+        self.assertGreater(len(sent), 0)
+        self.assertGreater(len(skipped), 0)
+        self.assertTrue(all(result.errorCode == 'DEADLINE_EXCEEDED' for result in skipped))
+        self.assertTrue(all(result.attempts == 1 for result in skipped))
+
+
+class AsyncApiClientTimeoutTest(unittest.IsolatedAsyncioTestCase):
+
+    @mock.patch('httpx.AsyncClient.request', new_callable=mock.AsyncMock)
+    async def test_timeouts(self, session_mock):
+
+        session_mock.return_value = jsonResponse(200, {'token': 'usr-1'})
+
+        client = AsyncApiClient('test-user', 'test-pass', SERVER, timeout=(2, 30))
+        await client.doGet('users/usr-1')
+
+        timeout = session_mock.call_args[1]['timeout']
+        self.assertEqual((timeout.connect, timeout.read), (2, 30))
+
+        with Deadline(0):
+            with self.assertRaises(HyperwalletAPIException) as exc:
+                await client.doGet('users/usr-1')
+
+        self.assertEqual(errorCode(exc.exception), 'DEADLINE_EXCEEDED')
+        self.assertEqual(session_mock.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
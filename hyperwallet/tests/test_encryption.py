@@ -5,12 +5,14 @@ import time
 import json
 import os.path
 import mock
+import hyperwallet
 
 from jwcrypto import jwk, jws as cryptoJWS
 from jwcrypto.common import json_encode
 from hyperwallet.exceptions import HyperwalletException
-from hyperwallet.utils.encryption import Encryption
-from six.moves.urllib.parse import urlparse
+from hyperwallet.utils.apiclient import ApiClient
+from hyperwallet.utils.encryption import Encryption, EncryptionPool, JwkKeySetCache
+from urllib.parse import urlparse
 
 
 class EncryptionTest(unittest.TestCase):
@@ -157,6 +159,92 @@ class EncryptionTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'JWS signature has expired, checked by [exp] JWS header')
 
+    def test_should_verify_signed_message_once_parsed(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        clientPath = os.path.join(localDir, 'resources', 'private-jwkset1')
+        hyperwalletPath = os.path.join(localDir, 'resources', 'public-jwkset1')
+        encryption = Encryption(clientPath, hyperwalletPath)
+
+        jwsKeySet = self.__getJwkKeySet(location=clientPath)
+        jwkSignKey = self.__findJwkKeyByAlgorithm(jwkKeySet=jwsKeySet, algorithm='RS256')
+        privateKeyToSign = jwk.JWK(**jwkSignKey)
+
+        def sign(header):
+            jwsToken = cryptoJWS.JWS('{"token": "usr-1"}'.encode('utf-8'))
+            jwsToken.add_signature(privateKeyToSign, None, json_encode(header))
+            return jwsToken.serialize(True)
+
+        signedBody = sign({"alg": "RS256", "kid": jwkSignKey['kid'], "exp": int(time.time()) + 60})
+        self.assertEqual(encryption.verify(signedBody), b'{"token": "usr-1"}')
+        self.assertEqual(encryption.verify(signedBody.encode('utf-8')), b'{"token": "usr-1"}')
+
+        (protected, payload, signature) = signedBody.split('.')
+        with self.assertRaises(HyperwalletException) as exc:
+            encryption.verify('.'.join([protected, payload[:-4] + 'AAAA', signature]))
+        self.assertEqual(exc.exception.message, 'Signature verification failed.')
+
+        signedBody = sign({"alg": "RS384", "kid": jwkSignKey['kid'], "exp": int(time.time()) + 60})
+        with self.assertRaises(HyperwalletException) as exc:
+            encryption.verify(signedBody)
+        self.assertEqual(exc.exception.message, 'Signature verification failed.')
+
+        with self.assertRaises(HyperwalletException) as exc:
+            encryption.verify('not-a-jws')
+        self.assertEqual(exc.exception.message, 'Invalid JWS signature, expected 3 segments')
+
+    def test_should_load_each_jwk_key_set_once_when_encrypting_and_decrypting(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        clientPath = os.path.join(localDir, 'resources', 'private-jwkset1')
+        hyperwalletPath = os.path.join(localDir, 'resources', 'public-jwkset1')
+        encryption = Encryption(clientPath, hyperwalletPath)
+        testMessage = 'Message for test'
+
+        for _ in range(3):
+            encryption.decrypt(encryption.encrypt(testMessage))
+
+        self.assertEqual(encryption.keySetCache.misses, 2)
+        self.assertEqual(encryption.keySetCache.refreshes, 0)
+        self.assertEqual(encryption.keySetCache.hits, 10)
+
+    def test_should_refresh_jwk_key_set_when_ttl_has_expired(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        clientPath = os.path.join(localDir, 'resources', 'private-jwkset1')
+        with open(clientPath) as f:
+            keySet = f.read()
+        loader = mock.Mock(return_value=keySet)
+        cache = JwkKeySetCache(loader, ttl=60)
+
+        with mock.patch('time.time', return_value=1000):
+            cache.findByAlgorithm(clientPath, 'RS256')
+            cache.findByAlgorithm(clientPath, 'RS256')
+        with mock.patch('time.time', return_value=1060):
+            key = cache.findByAlgorithm(clientPath, 'RS256')
+
+        self.assertEqual(key.kid, '2018_sig_rsa_RS256_2048')
+        self.assertEqual(loader.call_count, 2)
+        self.assertEqual(cache.stats, {'hits': 1, 'misses': 1, 'refreshes': 1})
+
+    def test_should_refresh_jwk_key_set_when_kid_is_unknown(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        clientPath = os.path.join(localDir, 'resources', 'private-jwkset1')
+        with open(clientPath) as f:
+            keySet = f.read()
+        loader = mock.Mock(return_value=keySet)
+        cache = JwkKeySetCache(loader, kidMissRefreshInterval=0)
+
+        key = cache.findByKid(clientPath, '2018_sig_rsa_RS256_2048', 'RSA-OAEP-256')
+        self.assertEqual(key.algorithm, 'RS256')
+        self.assertEqual(loader.call_count, 1)
+
+        key = cache.findByKid(clientPath, 'unknown-kid', 'RSA-OAEP-256')
+        self.assertEqual(key.kid, '2018_enc_rsa_RSA-OAEP-256')
+        self.assertEqual(loader.call_count, 2)
+        self.assertEqual(cache.refreshes, 1)
+
     def __getJwkKeySet(self, location):
         '''
         Retrieves JWK key data from given location.
@@ -240,5 +328,92 @@ class EncryptionTest(unittest.TestCase):
         raise HyperwalletException('JWK set doesn\'t contain key with algorithm = ' + algorithm)
 
 
+class EncryptionPoolTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        cls.clientPath = os.path.join(localDir, 'resources', 'private-jwkset1')
+        cls.hyperwalletPath = os.path.join(localDir, 'resources', 'public-jwkset1')
+        cls.pool = EncryptionPool(cls.clientPath, cls.hyperwalletPath, processes=2, batchSize=3)
+
+    @classmethod
+    def tearDownClass(cls):
+
+        cls.pool.close()
+
+    def test_should_encrypt_and_decrypt_in_worker_processes(self):
+
+        encryption = Encryption(self.clientPath, self.hyperwalletPath)
+
+        self.assertEqual(encryption.decrypt(self.pool.encrypt('Message for test')).decode(), 'Message for test')
+        self.assertEqual(self.pool.decrypt(encryption.encrypt('Message for test')).decode(), 'Message for test')
+
+    def test_should_encrypt_and_decrypt_batches_in_order(self):
+
+        messages = ['Message {}'.format(index) for index in range(7)]
+
+        decrypted = self.pool.decryptMany(self.pool.encryptMany(messages))
+
+        self.assertEqual([message.decode() for message in decrypted], messages)
+        self.assertEqual(self.pool.encryptMany([]), [])
+
+    def test_should_spawn_workers_without_loading_keys(self):
+
+        with mock.patch('hyperwallet.utils.encryption.ProcessPoolExecutor') as executor_mock:
+            pool = EncryptionPool(self.clientPath, self.hyperwalletPath, processes=1)
+
+        self.assertEqual(executor_mock.call_args[1]['mp_context'].get_start_method(), 'spawn')
+        self.assertIsNone(pool.keySetCache)
+
+        with self.assertRaises(TypeError):
+            EncryptionPool(self.clientPath, self.hyperwalletPath, unknown=1)
+
+    def test_should_raise_worker_errors(self):
+
+        with self.assertRaises(HyperwalletException):
+            self.pool.decrypt('not a JWE token')
+
+    def test_should_be_used_by_api_client_with_encryption_processes(self):
+
+        encryptionData = {'clientPrivateKeySetLocation': self.clientPath, 'hyperwalletKeySetLocation': self.hyperwalletPath}
+
+        client = ApiClient('test-user', 'test-pass', 'https://localhost', encryptionData, encryptionProcesses=1)
+        self.assertIsInstance(client.encryption, EncryptionPool)
+        client.encryption.close()
+
+        client = ApiClient('test-user', 'test-pass', 'https://localhost', encryptionData)
+        self.assertNotIsInstance(client.encryption, EncryptionPool)
+
+    def test_should_be_stopped_by_api_close(self):
+
+        encryptionData = {'clientPrivateKeySetLocation': self.clientPath, 'hyperwalletKeySetLocation': self.hyperwalletPath}
+
+        with hyperwallet.Api('test-user', 'test-pass', 'prg-12345', encryptionData=encryptionData, encryptionProcesses=1) as api:
+            pool = api.apiClient.encryption
+            pool.encrypt('Message for test')
+
+        with self.assertRaises(RuntimeError):
+            pool.encrypt('Message for test')
+
+
+class AsyncEncryptionPoolTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_should_be_stopped_by_async_api_close(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        encryptionData = {
+            'clientPrivateKeySetLocation': os.path.join(localDir, 'resources', 'private-jwkset1'),
+            'hyperwalletKeySetLocation': os.path.join(localDir, 'resources', 'public-jwkset1')
+        }
+
+        async with hyperwallet.AsyncApi('test-user', 'test-pass', 'prg-12345', encryptionData=encryptionData, encryptionProcesses=1) as api:
+            pool = api.apiClient.encryption
+
+        with self.assertRaises(RuntimeError):
+            pool.encrypt('Message for test')
+
+
 if __name__ == '__main__':
     unittest.main()
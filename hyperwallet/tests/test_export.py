@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+
+import csv
+import json
+import mock
+import os
+import shutil
+import tempfile
+import unittest
+
+from datetime import datetime, timedelta, timezone
+
+from hyperwallet import Api, AsyncApi, Receipt
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.utils import Exporter
+from hyperwallet.utils.export import TIMESTAMP_FORMAT, nowTimestamp
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+def receipts(count):
+    return [
+        {
+            'journalId': str(index),
+            'type': 'PAYMENT',
+            'createdOn': '2019-10-{:02d}T{:02d}:00:00'.format(1 + index // 10, index % 10),
+            'amount': '{}.00'.format(index),
+            'currency': 'USD',
+            'details': {'payeeName': 'Jane Doe'}
+        }
+        for index in range(count)
+    ]
+
+
+class FakeEndpoint(object):
+    '''
+    Answer list requests from a fixed list of items, filtering by creation
+    date with inclusive bounds.
+    '''
+
+    def __init__(self, items, failAfter=None, sort=True):
+        self.items = items
+        self.failAfter = failAfter
+        self.sort = sort
+        self.requests = []
+
+    def __call__(self, partialUrl, params):
+        self.requests.append(dict(params))
+
+        if self.failAfter is not None and len(self.requests) > self.failAfter:
+            raise HyperwalletException('Connection reset')
+
+        items = [
+            item for item in self.items
+            if params['createdAfter'] <= item['createdOn'] <= params['createdBefore']
+        ]
+        if self.sort and params.get('sortBy') == 'createdOn':
+            items.sort(key=lambda item: item['createdOn'])
+
+        offset = params['offset']
+        page = items[offset:offset + params['limit']]
+
+        return {'hasNextPage': offset + len(page) < len(items), 'data': page}
+
+
+class ExporterTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.items = receipts(30)
+        self.fields = list(Receipt.defaults)
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def exporter(self, endpoint, **options):
+
+        options.setdefault('pageSize', 4)
+        options.setdefault('maxWorkers', 2)
+
+        return Exporter(
+            endpoint,
+            'receipts',
+            self.fields,
+            self.directory,
+            'receipts',
+            '2019-10-01',
+            '2019-10-03T05:00:00',
+            **options
+        )
+
+    def readRows(self, files):
+
+        rows = []
+        for path in files:
+            with open(path, newline='') as exportFile:
+                reader = csv.reader(exportFile)
+                self.assertEqual(next(reader), self.fields)
+                rows.extend(dict(zip(self.fields, row)) for row in reader)
+        return rows
+
+    def test_windows(self):
+
+        exporter = self.exporter(FakeEndpoint(self.items), windowSize=timedelta(days=1))
+
+        self.assertEqual(exporter.windows(), [
+            ('2019-10-01T00:00:00', '2019-10-02T00:00:00'),
+            ('2019-10-02T00:00:00', '2019-10-03T00:00:00'),
+            ('2019-10-03T00:00:00', '2019-10-03T05:00:00')
+        ])
+
+    def test_now_timestamp(self):
+
+        before = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
+        now = datetime.strptime(nowTimestamp(), TIMESTAMP_FORMAT)
+
+        self.assertLessEqual(before, now)
+        self.assertLess(now - before, timedelta(seconds=5))
+
+    def test_export_csv(self):
+
+        endpoint = FakeEndpoint(self.items)
+
+        result = self.exporter(endpoint).run()
+
+        self.assertEqual(result.rows, 25)
+        self.assertEqual(result.windows, 3)
+        self.assertEqual(result.resumed, 0)
+
+        rows = self.readRows(result.files)
+
+        self.assertEqual([row['journalId'] for row in rows], [str(index) for index in range(25)])
+        self.assertEqual(rows[0]['amount'], '0.00')
+        self.assertEqual(rows[0]['fee'], '')
+        self.assertEqual(json.loads(rows[0]['details']), {'payeeName': 'Jane Doe'})
+
+        self.assertTrue(all(request['sortBy'] == 'createdOn' for request in endpoint.requests))
+        self.assertIn({'createdAfter': '2019-09-30T23:59:59', 'createdBefore': '2019-10-02T00:00:01'},
+                      [dict((key, request[key]) for key in ('createdAfter', 'createdBefore')) for request in endpoint.requests])
+
+    def test_export_is_not_repeated(self):
+
+        self.exporter(FakeEndpoint(self.items)).run()
+
+        endpoint = FakeEndpoint(self.items)
+        result = self.exporter(endpoint).run()
+
+        self.assertEqual(result.rows, 0)
+        self.assertEqual(endpoint.requests, [])
+        self.assertEqual(len(self.readRows(result.files)), 25)
+
+    def test_rotate_files(self):
+
+        result = self.exporter(FakeEndpoint(self.items), rowsPerFile=4).run()
+
+        self.assertEqual(len(result.files), 8)
+        self.assertEqual(os.path.basename(result.files[0]), 'receipts-20191001T000000-00000.csv')
+        self.assertEqual(len(self.readRows(result.files)), 25)
+
+    def test_resume_from_watermark(self):
+
+        with self.assertRaises(HyperwalletException):
+            self.exporter(FakeEndpoint(self.items, failAfter=2), rowsPerFile=4, maxWorkers=1).run()
+
+        with open(os.path.join(self.directory, 'receipts.state.json')) as stateFile:
+            state = json.load(stateFile)['windows']['2019-10-01T00:00:00']
+
+        self.assertEqual(state['watermark'], '2019-10-01T07:00:00')
+        self.assertFalse(state['done'])
+
+        endpoint = FakeEndpoint(self.items)
+        result = self.exporter(endpoint, rowsPerFile=4, maxWorkers=1).run()
+
+        self.assertEqual(result.resumed, 1)
+        self.assertEqual(result.rows, 17)
+        self.assertEqual(endpoint.requests[0]['createdAfter'], '2019-10-01T06:59:59')
+
+        rows = self.readRows(result.files)
+        self.assertEqual([row['journalId'] for row in rows], [str(index) for index in range(25)])
+        self.assertEqual(
+            sorted(os.listdir(self.directory)),
+            sorted([os.path.basename(path) for path in result.files] + ['receipts.state.json'])
+        )
+
+    def test_resume_unsorted_restarts_window(self):
+
+        items = list(reversed(self.items))
+
+        with self.assertRaises(HyperwalletException):
+            self.exporter(FakeEndpoint(items, failAfter=1, sort=False), rowsPerFile=2, maxWorkers=1, sortable=False).run()
+
+        result = self.exporter(FakeEndpoint(items, sort=False), rowsPerFile=2, maxWorkers=1, sortable=False).run()
+
+        rows = self.readRows(result.files)
+        self.assertEqual(sorted(int(row['journalId']) for row in rows), list(range(25)))
+
+    def test_different_export_in_directory(self):
+
+        self.exporter(FakeEndpoint(self.items)).run()
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.exporter(FakeEndpoint(self.items), windowSize=timedelta(hours=6)).run()
+
+        self.assertIn('belongs to a different export', exc.exception.message)
+
+    def test_invalid_arguments(self):
+
+        with self.assertRaises(HyperwalletException):
+            self.exporter(FakeEndpoint(self.items), format='xlsx')
+
+        with self.assertRaises(HyperwalletException):
+            Exporter(FakeEndpoint(self.items), 'receipts', self.fields, self.directory, 'receipts', '2019-10-02', '2019-10-01')
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_export_parquet(self):
+
+        result = self.exporter(FakeEndpoint(self.items), format='parquet').run()
+
+        table = pyarrow.parquet.read_table(result.files[0])
+
+        self.assertEqual(table.column_names, self.fields)
+        self.assertEqual(table.column('journalId').to_pylist(), [str(index) for index in range(10)])
+        self.assertEqual(table.column('fee').to_pylist()[0], None)
+
+
+class ApiExportTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.api = Api('test-user', 'test-pass', 'test-program')
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def test_export_requires_directory(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.exportPayments(start='2019-10-01', end='2019-10-02')
+
+        self.assertEqual(exc.exception.message, 'directory is required')
+
+    def test_export_invalid_filter(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.exportTransfers(self.directory, '2019-10-01', '2019-10-02', {'sortBy': 'createdOn'})
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_export_receipts_for_account(self, mock_request):
+
+        mock_request.return_value = {'hasNextPage': False, 'data': receipts(3)}
+
+        result = self.api.exportReceiptsForAccount('prg-1', 'act-1', self.directory, '2019-10-01', '2019-10-02').run()
+
+        self.assertEqual(result.rows, 3)
+        self.assertEqual(os.path.basename(result.files[0]), 'receipts-act-1-20191001T000000-00000.csv')
+        self.assertEqual(mock_request.call_args[1]['url'], 'programs/prg-1/accounts/act-1/receipts')
+        self.assertEqual(mock_request.call_args[1]['params']['sortBy'], 'createdOn')
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_export_transfers_unsorted(self, mock_request):
+
+        mock_request.return_value = {'hasNextPage': False, 'data': []}
+
+        self.api.exportTransfers(self.directory, '2019-10-01', '2019-10-02').run()
+
+        self.assertNotIn('sortBy', mock_request.call_args[1]['params'])
+
+
+class AsyncApiExportTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+
+        self.api = AsyncApi('test-user', 'test-pass', 'test-program')
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def test_export_requires_directory(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.exportPayments(start='2019-10-01', end='2019-10-02')
+
+        self.assertEqual(exc.exception.message, 'directory is required')
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_export_payments(self, mock_request):
+
+        mock_request.return_value = {'hasNextPage': False, 'data': receipts(2)}
+
+        result = await self.api.exportPayments(self.directory, '2019-10-01', '2019-10-02').run()
+
+        self.assertEqual(result.rows, 2)
+        self.assertEqual(mock_request.call_args[1]['url'], 'payments')
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_export_receipts_for_account(self, mock_request):
+
+        mock_request.return_value = {'hasNextPage': False, 'data': receipts(3)}
+
+        result = await self.api.exportReceiptsForAccount('prg-1', 'act-1', self.directory, '2019-10-01', '2019-10-02').run()
+
+        self.assertEqual(result.rows, 3)
+        self.assertEqual(mock_request.call_args[1]['url'], 'programs/prg-1/accounts/act-1/receipts')
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_export_transfers(self, mock_request):
+
+        mock_request.return_value = {'hasNextPage': False, 'data': []}
+
+        result = await self.api.exportTransfers(self.directory, '2019-10-01', '2019-10-02').run()
+
+        self.assertEqual(result.rows, 0)
+        self.assertNotIn('sortBy', mock_request.call_args[1]['params'])
+
+
+if __name__ == '__main__':
+    unittest.main()
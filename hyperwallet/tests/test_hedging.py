@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+
+import asyncio
+import itertools
+import mock
+import threading
+import time
+import unittest
+
+from hyperwallet.config import SERVER
+from hyperwallet.utils import ApiClient, AsyncApiClient, HedgePolicy, MetricsCollector, RetryBudget, Timeout
+from hyperwallet.utils.instrumentation import RequestEvent
+from hyperwallet.tests.helpers import jsonResponse
+
+
+def slowFirstCall(delay, results=None):
+    '''
+    A request whose first call takes ``delay`` seconds and the others answer at once.
+    '''
+
+    calls = itertools.count()
+    results = results or ['primary', 'hedge']
+
+    def request(*args, **kwargs):
+        call = next(calls)
+        if call == 0:
+            time.sleep(delay)
+        result = results[min(call, len(results) - 1)]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return request
+
+
+class HedgePolicyTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.policy = HedgePolicy(minDelay=0.01, maxDelay=0.05, minSamples=5)
+
+    def tearDown(self):
+
+        self.policy.close()
+
+    def warmUp(self, url='users/usr-1'):
+
+        for _ in range(5):
+            self.policy.do(RequestEvent('GET', url), lambda: None)
+
+    def test_delay_needs_samples(self):
+
+        self.assertIsNone(self.policy.delay('GET users/{token}'))
+
+        self.warmUp()
+
+        self.assertEqual(self.policy.delay('GET users/{token}'), 0.01)
+        self.assertIsNone(self.policy.delay('GET payments/{token}'))
+        self.assertEqual(self.policy.stats(), {'requests': 5, 'fired': 0, 'won': 0, 'denied': 0})
+
+    @mock.patch('time.monotonic')
+    def test_delay_follows_recent_latencies(self, monotonic_mock):
+
+        monotonic_mock.return_value = 0
+        policy = HedgePolicy(minDelay=0.01, maxDelay=1, minSamples=5, window=60)
+        for _ in range(5):
+            policy.do(RequestEvent('GET', 'users/usr-1'), lambda: time.sleep(0.05))
+
+        self.assertGreaterEqual(policy.delay('GET users/{token}'), 0.05)
+
+        monotonic_mock.return_value = 60
+        self.assertGreaterEqual(policy.delay('GET users/{token}'), 0.05)
+
+        for _ in range(5):
+            policy.do(RequestEvent('GET', 'users/usr-1'), lambda: None)
+
+        self.assertEqual(policy.delay('GET users/{token}'), 0.01)
+
+        monotonic_mock.return_value = 180
+        self.assertIsNone(policy.delay('GET users/{token}'))
+
+    def test_requests_are_not_queued(self):
+
+        self.policy = HedgePolicy(minDelay=0.5, maxDelay=1, minSamples=5, maxWorkers=1)
+        self.warmUp()
+
+        def request():
+            time.sleep(0.2)
+            return 'primary'
+
+        threads = [threading.Thread(target=self.policy.do, args=(RequestEvent('GET', 'users/usr-2'), request)) for _ in range(4)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(self.policy.stats()['fired'], 0)
+
+    def test_requests_reuse_threads(self):
+
+        self.policy = HedgePolicy(minDelay=0.5, maxDelay=1, minSamples=5, maxWorkers=2)
+        self.warmUp()
+        threads = set()
+
+        for _ in range(10):
+            self.policy.do(RequestEvent('GET', 'users/usr-2'), lambda: threads.add(threading.current_thread()))
+
+        self.assertLessEqual(len(threads), 2)
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def test_hedge_wins(self):
+
+        self.warmUp()
+        event = RequestEvent('GET', 'users/usr-2')
+
+        started = time.perf_counter()
+        self.assertEqual(self.policy.do(event, slowFirstCall(1)), 'hedge')
+
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual((event.hedges, event.hedgesWon), (1, 1))
+        self.assertEqual(self.policy.stats(), {'requests': 6, 'fired': 1, 'won': 1, 'denied': 0})
+
+    def test_fast_request_is_not_hedged(self):
+
+        self.warmUp()
+        request = mock.MagicMock(return_value='primary')
+        event = RequestEvent('GET', 'users/usr-2')
+
+        self.assertEqual(self.policy.do(event, request), 'primary')
+
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual(event.hedges, 0)
+
+    def test_budget_exhausted(self):
+
+        self.policy.budget = RetryBudget(ratio=0, minRetriesPerSecond=0, maxBalance=1)
+        self.warmUp()
+
+        self.assertEqual(self.policy.do(RequestEvent('GET', 'users/usr-2'), slowFirstCall(0.1)), 'hedge')
+        self.assertEqual(self.policy.do(RequestEvent('GET', 'users/usr-3'), slowFirstCall(0.1)), 'primary')
+
+        self.assertEqual(self.policy.stats()['fired'], 1)
+        self.assertEqual(self.policy.stats()['denied'], 1)
+
+    def test_failed_copy_waits_for_the_other(self):
+
+        self.warmUp()
+
+        request = slowFirstCall(0.1, ['primary', ValueError('Connection reset')])
+        self.assertEqual(self.policy.do(RequestEvent('GET', 'users/usr-2'), request), 'primary')
+
+        request = slowFirstCall(0.1, [ValueError('Timed out'), ValueError('Connection reset')])
+        with self.assertRaises(ValueError):
+            self.policy.do(RequestEvent('GET', 'users/usr-3'), request)
+
+
+class ApiClientHedgingTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.metrics = MetricsCollector()
+        self.policy = HedgePolicy(minDelay=0.01, maxDelay=0.05, minSamples=5)
+        self.client = ApiClient('test-user', 'test-pass', SERVER, hooks=[self.metrics], hedgePolicy=self.policy)
+
+    def tearDown(self):
+
+        self.policy.close()
+
+    @mock.patch('requests.Session.request')
+    def test_slow_get_is_hedged(self, session_mock):
+
+        session_mock.return_value = jsonResponse(200, {'token': 'usr-1'})
+        for _ in range(5):
+            self.client.doGet('users/usr-1')
+
+        session_mock.side_effect = slowFirstCall(1, [jsonResponse(200, {'token': 'usr-2'})])
+        self.assertEqual(self.client.doGet('users/usr-2'), {'token': 'usr-2'})
+
+        metrics = self.metrics.endpoint('GET users/{token}').asDict()
+        self.assertEqual((metrics['requests'], metrics['hedges'], metrics['hedgesWon']), (6, 1, 1))
+
+    @mock.patch('requests.Session.request')
+    def test_post_is_not_hedged(self, session_mock):
+
+        session_mock.return_value = jsonResponse(200, {'token': 'usr-1'})
+
+        self.client.doPost('users', {'clientUserId': 'c-1'})
+
+        self.assertEqual(self.policy.stats()['requests'], 0)
+
+    @mock.patch('requests.Session.request')
+    def test_hedge_runs_with_the_caller_context(self, session_mock):
+
+        session_mock.return_value = jsonResponse(200, {'token': 'usr-1'})
+        for _ in range(5):
+            self.client.doGet('users/usr-1')
+
+        threads = []
+
+        def request(**kwargs):
+            threads.append(threading.current_thread())
+            if len(threads) == 1:
+                time.sleep(0.5)
+            return jsonResponse(200, {'token': 'usr-2'})
+
+        session_mock.side_effect = request
+        with Timeout(3):
+            self.client.doGet('users/usr-2')
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertEqual(session_mock.call_args[1]['timeout'], (3, 3))
+
+
+class AsyncApiClientHedgingTest(unittest.IsolatedAsyncioTestCase):
+
+    @mock.patch('httpx.AsyncClient.request', new_callable=mock.AsyncMock)
+    async def test_slow_get_is_hedged_and_cancelled(self, session_mock):
+
+        policy = HedgePolicy(minDelay=0.01, maxDelay=0.05, minSamples=5)
+        client = AsyncApiClient('test-user', 'test-pass', SERVER, hedgePolicy=policy)
+
+        session_mock.return_value = jsonResponse(200, {'token': 'usr-1'})
+        for _ in range(5):
+            await client.doGet('users/usr-1')
+
+        cancelled = asyncio.Event()
+
+        async def request(**kwargs):
+            if session_mock.call_count == 6:
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return jsonResponse(200, {'token': 'usr-2'})
+
+        session_mock.side_effect = request
+
+        self.assertEqual(await client.doGet('users/usr-2'), {'token': 'usr-2'})
+        await asyncio.wait_for(cancelled.wait(), 1)
+        self.assertEqual(policy.stats(), {'requests': 6, 'fired': 1, 'won': 1, 'denied': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
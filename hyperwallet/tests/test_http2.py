@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+
+import asyncio
+import mock
+import threading
+import unittest
+
+import hyperwallet
+
+from hyperwallet.exceptions import HyperwalletAPIException
+from hyperwallet.utils import ApiClient, AsyncApiClient
+from hyperwallet.utils.http2 import Http2Session, http2Options
+from hyperwallet.tests.standin import Http2StandInServer
+
+USER_TOKEN = 'usr-00000000-0000-0000-0000-000000000001'
+
+
+class Http2OptionsTest(unittest.TestCase):
+
+    def test_negotiation(self):
+
+        self.assertEqual(http2Options('https://api.sandbox.hyperwallet.com'), {'http1': True, 'http2': True})
+        self.assertEqual(http2Options('http://127.0.0.1:8080'), {'http1': False, 'http2': True})
+
+
+class ApiClientHttp2Test(unittest.TestCase):
+
+    def setUp(self):
+
+        self.server = Http2StandInServer(items=250).start()
+        self.addCleanup(self.server.stop)
+
+        self.api = hyperwallet.Api('test-user', 'test-pass', 'prg-12345', self.server.url, http2=True)
+        self.addCleanup(self.api.close)
+
+    def test_requests(self):
+
+        self.assertIsInstance(self.api.apiClient.session, Http2Session)
+
+        self.assertEqual(self.api.getUser(USER_TOKEN).token, USER_TOKEN)
+        self.assertEqual(sum(1 for receipt in self.api.iterReceiptsForUser(USER_TOKEN, pageSize=100)), 250)
+
+        payment = self.api.createPayment({
+            'amount': '20.00',
+            'clientPaymentId': 'cp-1',
+            'currency': 'USD',
+            'destinationToken': USER_TOKEN,
+            'programToken': 'prg-12345',
+            'purpose': 'OTHER'
+        })
+        self.assertEqual(payment.clientPaymentId, 'cp-1')
+
+    def test_concurrent_requests_share_a_connection(self):
+
+        errors = []
+
+        def call():
+            try:
+                for _ in range(10):
+                    self.api.getUser(USER_TOKEN)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.api.apiClient.poolStats, {'inUse': 0, 'idle': 1, 'open': 1})
+
+    def test_without_keep_alive(self):
+
+        client = ApiClient('test-user', 'test-pass', self.server.url, keepAlive=False, http2=True)
+        self.addCleanup(client.session.close)
+
+        for _ in range(2):
+            self.assertEqual(client.doGet('users/{}'.format(USER_TOKEN))['token'], USER_TOKEN)
+
+        self.assertEqual(client.poolStats['open'], 0)
+
+    def test_pool_stats_without_pool(self):
+
+        with mock.patch.object(self.api.apiClient.session, 'transport', object()):
+            self.assertEqual(self.api.apiClient.poolStats, {'inUse': None, 'idle': None, 'open': None})
+
+    def test_close(self):
+
+        session = self.api.apiClient.session
+        session.close()
+        session.close()
+
+        self.assertFalse(session.thread.is_alive())
+
+    def test_api_close(self):
+
+        with hyperwallet.Api('test-user', 'test-pass', 'prg-12345', self.server.url, http2=True) as api:
+            self.assertEqual(api.getUser(USER_TOKEN).token, USER_TOKEN)
+
+        self.assertFalse(api.apiClient.session.thread.is_alive())
+
+
+class Http2TimeoutTest(unittest.TestCase):
+
+    def test_read_timeout(self):
+
+        with Http2StandInServer(latency=1) as server:
+            client = ApiClient('test-user', 'test-pass', server.url, timeout=0.1, http2=True)
+
+            with self.assertRaises(HyperwalletAPIException) as exc:
+                client.doGet('users/{}'.format(USER_TOKEN))
+
+            client.close()
+
+        self.assertEqual(exc.exception.message['errors'][0]['code'], 'COMMUNICATION_ERROR')
+
+
+class AsyncApiClientHttp2Test(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrent_requests_share_a_connection(self):
+
+        server = Http2StandInServer().start()
+        self.addCleanup(server.stop)
+
+        client = AsyncApiClient('test-user', 'test-pass', server.url, http2=True)
+
+        responses = await asyncio.gather(*[client.doGet('users/{}'.format(USER_TOKEN)) for _ in range(50)])
+        await client.close()
+
+        self.assertEqual(set(response['token'] for response in responses), set([USER_TOKEN]))
+        self.assertEqual(server.connections, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
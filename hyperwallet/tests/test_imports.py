@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+import json
+import os.path
+import subprocess
+import sys
+import unittest
+
+import hyperwallet
+import hyperwallet.utils
+
+try:
+    from benchmarks.importtime import parse
+except ImportError:
+    # The benchmarks are left out of the source distribution.
+    parse = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(hyperwallet.__file__)))
+
+
+def loadedModules(statement):
+    '''
+    The top-level packages loaded by a fresh interpreter running a statement.
+    '''
+
+    output = subprocess.check_output([
+        sys.executable,
+        '-c',
+        '{}\nimport json, sys\nprint(json.dumps(sorted(set(name.split(".")[0] for name in sys.modules))))'.format(statement)
+    ], cwd=ROOT)
+    return set(json.loads(output.decode('utf-8')))
+
+
+class LazyImportTest(unittest.TestCase):
+
+    def test_package_does_not_load_dependencies(self):
+
+        modules = loadedModules('import hyperwallet')
+
+        for name in ('requests', 'requests_toolbelt', 'urllib3', 'jwcrypto', 'jose', 'httpx', 'asyncio', 'sqlite3'):
+            self.assertNotIn(name, modules)
+
+    def test_client_without_encryption_does_not_load_jose(self):
+
+        modules = loadedModules('from hyperwallet import Api\nApi("test-user", "test-pass", "test-program")')
+
+        self.assertIn('requests', modules)
+        for name in ('jwcrypto', 'jose', 'httpx', 'asyncio'):
+            self.assertNotIn(name, modules)
+
+    def test_encryption_does_not_need_six(self):
+
+        # six is not a dependency of the SDK.
+        modules = loadedModules('import hyperwallet.utils.encryption')
+
+        self.assertIn('jwcrypto', modules)
+        self.assertNotIn('six', modules)
+
+    def test_lazy_attributes(self):
+
+        from hyperwallet.api import Api
+        from hyperwallet.utils.apiclient import ApiClient
+
+        self.assertIs(hyperwallet.Api, Api)
+        self.assertIs(hyperwallet.utils.ApiClient, ApiClient)
+        self.assertIn('SingleFlight', dir(hyperwallet.utils))
+
+        with self.assertRaises(AttributeError):
+            hyperwallet.Unknown
+
+        with self.assertRaises(AttributeError):
+            hyperwallet.utils.Unknown
+
+    def test_star_import(self):
+
+        namespace = {}
+        exec('from hyperwallet import *', namespace)
+
+        from hyperwallet.api import Api
+
+        self.assertIs(namespace['Api'], Api)
+        for name in ('AsyncApi', 'User', 'Payment', '__version__'):
+            self.assertIn(name, namespace)
+
+        self.assertIn('Api', dir(hyperwallet))
+        self.assertIn('AsyncApi', dir(hyperwallet))
+
+    @unittest.skipIf(parse is None, 'benchmarks are not available')
+    def test_parse_importtime(self):
+
+        output = '\n'.join([
+            'import time: self [us] | cumulative | imported package',
+            'import time:       120 |        120 |   _json',
+            'import time:       350 |        470 | json',
+            'import time:      1500 |       1500 |     jwcrypto.common',
+            'import time:       500 |       2000 |   jwcrypto',
+            'import time:       400 |       2400 | hyperwallet.utils.encryption'
+        ])
+
+        self.assertEqual(parse(output), {'json': 0.00047, 'hyperwallet.utils.encryption': 0.0024})
+
+
+if __name__ == '__main__':
+    unittest.main()
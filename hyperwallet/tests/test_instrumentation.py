@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+
+import mock
+import unittest
+
+from hyperwallet.utils import ApiClient, RequestHook, MetricsCollector, LatencyHistogram, PageIterator
+from hyperwallet.utils.instrumentation import urlTemplate
+from hyperwallet.config import SERVER
+from hyperwallet.exceptions import HyperwalletAPIException
+from hyperwallet.tests.helpers import jsonResponse
+
+
+class RecordingHook(RequestHook):
+
+    def __init__(self):
+        self.calls = []
+
+    def beforeRequest(self, event):
+        self.calls.append(('beforeRequest', event.endpoint, event.bytesSent))
+
+    def afterResponse(self, event):
+        self.calls.append(('afterResponse', event.endpoint, event.status, event.bytesReceived))
+
+    def onError(self, event):
+        self.calls.append(('onError', event.endpoint, event.status, event.errorCode))
+
+
+class UrlTemplateTest(unittest.TestCase):
+
+    def test_url_template(self):
+
+        self.assertEqual(urlTemplate('users'), 'users')
+        self.assertEqual(urlTemplate('users/usr-1'), 'users/{token}')
+        self.assertEqual(urlTemplate('users/usr-1/bank-accounts'), 'users/{token}/bank-accounts')
+        self.assertEqual(
+            urlTemplate('/users/usr-1/bank-accounts/trm-2/status-transitions/sts-3/'),
+            'users/{token}/bank-accounts/{token}/status-transitions/{token}'
+        )
+
+    def test_url_template_of_links(self):
+
+        self.assertEqual(
+            urlTemplate('https://api.sandbox.hyperwallet.com/rest/v3/users/usr-1/receipts?offset=100&limit=100'),
+            'users/{token}/receipts'
+        )
+        self.assertEqual(urlTemplate('payments?clientPaymentId=cp-1'), 'payments')
+
+
+class LatencyHistogramTest(unittest.TestCase):
+
+    def test_empty_histogram(self):
+
+        histogram = LatencyHistogram()
+
+        self.assertIsNone(histogram.percentile(50))
+        self.assertIsNone(histogram.mean)
+
+    def test_percentiles_within_precision(self):
+
+        histogram = LatencyHistogram()
+
+        for value in range(1, 1001):
+            histogram.record(value / 1000.0)
+
+        self.assertEqual(histogram.count, 1000)
+        self.assertEqual(histogram.min, 0.001)
+        self.assertEqual(histogram.max, 1.0)
+        self.assertAlmostEqual(histogram.mean, 0.5005)
+
+        for (percentile, expected) in [(50, 0.5), (90, 0.9), (99, 0.99), (100, 1.0)]:
+            value = histogram.percentile(percentile)
+            self.assertTrue(expected <= value <= expected * (1 + 1 / 64.0), (percentile, value))
+
+    def test_small_values_are_exact(self):
+
+        histogram = LatencyHistogram(unit=1)
+
+        for value in [3, 3, 7, 100]:
+            histogram.record(value)
+
+        self.assertEqual(histogram.percentile(50), 3)
+        self.assertEqual(histogram.percentile(75), 7)
+        self.assertEqual(histogram.percentile(100), 100)
+
+
+class ApiClientHooksTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.hook = RecordingHook()
+        self.collector = MetricsCollector()
+        self.client = ApiClient('test-user', 'test-pass', SERVER, hooks=[self.hook, self.collector])
+
+    @mock.patch('requests.Session.request')
+    def test_hooks_after_response(self, session_mock):
+
+        session_mock.return_value = jsonResponse(200, {'token': 'usr-2'})
+
+        self.client.doPut('users/usr-1', {'firstName': 'Jane'})
+        self.client.doGet('users/usr-2')
+
+        self.assertEqual(self.hook.calls, [
+            ('beforeRequest', 'PUT users/{token}', len(self.client.codec.dumps({'firstName': 'Jane'}))),
+            ('afterResponse', 'PUT users/{token}', 200, 18),
+            ('beforeRequest', 'GET users/{token}', 0),
+            ('afterResponse', 'GET users/{token}', 200, 18)
+        ])
+
+        metrics = self.collector.asDict()
+        self.assertEqual(sorted(metrics.keys()), ['GET users/{token}', 'PUT users/{token}'])
+        self.assertEqual(metrics['GET users/{token}']['requests'], 1)
+        self.assertEqual(metrics['GET users/{token}']['statuses'], {200: 1})
+        self.assertEqual(metrics['GET users/{token}']['latency']['count'], 1)
+        self.assertEqual(len(self.collector.slowest(limit=1)), 1)
+
+    @mock.patch('requests.Session.request')
+    def test_next_links_keep_their_endpoint(self, session_mock):
+
+        session_mock.side_effect = [
+            jsonResponse(200, {
+                'data': [{'token': 'rct-1'}],
+                'links': [{'params': {'rel': 'next'}, 'href': SERVER + '/rest/v3/users/usr-1/receipts?offset=1&limit=1'}]
+            }),
+            jsonResponse(200, {'data': [{'token': 'rct-2'}], 'hasNextPage': False})
+        ]
+
+        items = list(PageIterator(self.client.doGet, 'users/usr-1/receipts', lambda data: data, pageSize=1, prefetch=False))
+
+        self.assertEqual(len(items), 2)
+        self.assertEqual(list(self.collector.asDict()), ['GET users/{token}/receipts'])
+        self.assertEqual(self.collector.endpoint('GET users/{token}/receipts').requests, 2)
+
+    @mock.patch('requests.Session.request')
+    def test_hooks_on_api_error(self, session_mock):
+
+        session_mock.return_value = jsonResponse(400, {'errors': [{'code': 'DUPLICATE'}]})
+
+        with self.assertRaises(HyperwalletAPIException):
+            self.client.doPost('users', {})
+
+        self.assertEqual(self.hook.calls[-1], ('onError', 'POST users', 400, 'DUPLICATE'))
+        self.assertEqual(self.collector.endpoint('POST users').errors, {'DUPLICATE': 1})
+
+    @mock.patch('requests.Session.request')
+    def test_hooks_on_communication_error(self, session_mock):
+
+        session_mock.side_effect = Exception('Connection reset')
+
+        with self.assertRaises(HyperwalletAPIException):
+            self.client.doGet('users')
+
+        self.assertEqual(self.hook.calls[-1], ('onError', 'GET users', None, 'COMMUNICATION_ERROR'))
+
+
+if __name__ == '__main__':
+    unittest.main()
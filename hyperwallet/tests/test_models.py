@@ -668,6 +668,52 @@ class ModelTest(unittest.TestCase):
             )
         )
 
+    '''
+
+    Lazy attributes
+
+    '''
+
+    def test_models_keep_no_instance_dict(self):
+
+        test_receipt = Receipt(self.receipt_data)
+
+        self.assertFalse(hasattr(test_receipt, '__dict__'))
+        self.assertEqual(test_receipt.amount, self.receipt_data.get('amount'))
+        self.assertIsNone(test_receipt.fee)
+
+        with self.assertRaises(AttributeError):
+            test_receipt.unknown = 'value'
+
+    def test_models_inherit_fields(self):
+
+        test_bank_account = BankAccount(self.transfer_method_data)
+
+        self.assertEqual(test_bank_account.token, self.transfer_method_data.get('token'))
+        self.assertIn('token', BankAccount.defaults)
+        self.assertIn('bankAccountId', BankAccount.defaults)
+        self.assertNotIn('bankAccountId', TransferMethod.defaults)
+
+    def test_models_attributes_can_be_assigned(self):
+
+        test_user = User(self.user_data)
+        test_user.token = 'usr-54321'
+
+        self.assertEqual(test_user.token, 'usr-54321')
+        self.assertEqual(User(self.user_data).token, self.user_data.get('token'))
+        self.assertEqual(test_user.asDict(), self.user_data)
+
+    def test_webhook_object_is_built_once(self):
+
+        test_webhook = Webhook({
+            'token': 'wbh-12345',
+            'type': 'USERS.CREATED',
+            'object': self.user_data
+        })
+
+        self.assertIsInstance(test_webhook.object, User)
+        self.assertIs(test_webhook.object, test_webhook.object)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+import mock
+import unittest
+
+from hyperwallet import Payment
+from hyperwallet.utils import PageIterator
+
+
+class PageIteratorTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.parse = lambda data: [Payment(x) for x in data]
+
+    def test_iterate_with_has_next_page(self):
+
+        fetchPage = mock.Mock(side_effect=[
+            {'hasNextPage': True, 'data': [{'token': 'pmt-1'}, {'token': 'pmt-2'}]},
+            {'hasNextPage': False, 'data': [{'token': 'pmt-3'}]}
+        ])
+
+        iterator = PageIterator(fetchPage, 'payments', self.parse, {'currency': 'USD'}, pageSize=2)
+
+        self.assertEqual([x.token for x in iterator], ['pmt-1', 'pmt-2', 'pmt-3'])
+        self.assertEqual(fetchPage.call_args_list, [
+            mock.call('payments', {'currency': 'USD', 'limit': 2, 'offset': 0}),
+            mock.call('payments', {'currency': 'USD', 'limit': 2, 'offset': 2})
+        ])
+
+    def test_iterate_following_next_links(self):
+
+        fetchPage = mock.Mock(side_effect=[
+            {
+                'data': [{'token': 'pmt-1'}],
+                'links': [
+                    {'params': {'rel': 'self'}, 'href': 'https://api.sandbox.hyperwallet.com/rest/v3/payments?offset=0&limit=1'},
+                    {'params': {'rel': 'next'}, 'href': 'https://api.sandbox.hyperwallet.com/rest/v3/payments?offset=1&limit=1'}
+                ]
+            },
+            {'data': [{'token': 'pmt-2'}], 'links': []}
+        ])
+
+        iterator = PageIterator(fetchPage, 'payments', self.parse, pageSize=1, prefetch=False)
+
+        self.assertEqual([x.token for x in iterator], ['pmt-1', 'pmt-2'])
+        self.assertEqual(
+            fetchPage.call_args_list[1],
+            mock.call('https://api.sandbox.hyperwallet.com/rest/v3/payments?offset=1&limit=1', None)
+        )
+
+    def test_iterate_stops_on_short_page_without_metadata(self):
+
+        fetchPage = mock.Mock(side_effect=[
+            {'data': [{'token': 'pmt-1'}, {'token': 'pmt-2'}]},
+            {'data': [{'token': 'pmt-3'}]}
+        ])
+
+        iterator = PageIterator(fetchPage, 'payments', self.parse, {'limit': 2, 'offset': 4})
+
+        self.assertEqual([x.token for x in iterator], ['pmt-1', 'pmt-2', 'pmt-3'])
+        self.assertEqual(fetchPage.call_count, 2)
+        self.assertEqual(fetchPage.call_args_list[1], mock.call('payments', {'limit': 2, 'offset': 6}))
+
+    def test_iterate_empty_response(self):
+
+        fetchPage = mock.Mock(return_value={})
+
+        self.assertEqual(list(PageIterator(fetchPage, 'payments', self.parse)), [])
+        self.assertEqual(fetchPage.call_count, 1)
+
+    def test_iterate_pages_is_lazy(self):
+
+        fetchPage = mock.Mock(side_effect=[
+            {'hasNextPage': True, 'data': [{'token': 'pmt-1'}]},
+            {'hasNextPage': True, 'data': [{'token': 'pmt-2'}]}
+        ])
+
+        pages = PageIterator(fetchPage, 'payments', self.parse, pageSize=1, prefetch=False).pages()
+
+        self.assertEqual(fetchPage.call_count, 0)
+        self.assertEqual([x.token for x in next(pages)], ['pmt-1'])
+        self.assertEqual(fetchPage.call_count, 1)
+        pages.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
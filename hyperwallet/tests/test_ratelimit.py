@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+
+import mock
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from hyperwallet.utils import ApiClient, RateLimiter, TokenBucket, FileTokenBucket
+from hyperwallet.config import SERVER
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    @mock.patch('time.time')
+    def test_reserve_waits_once_empty(self, time_mock):
+
+        time_mock.return_value = 100.0
+        bucket = TokenBucket(rate=2, capacity=2)
+
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.5)
+        self.assertEqual(bucket.reserve(), 1.0)
+        self.assertEqual(bucket.level, -2.0)
+
+        time_mock.return_value = 102.0
+
+        self.assertEqual(bucket.level, 2.0)
+        self.assertEqual(bucket.stats(), {
+            'level': 2.0,
+            'capacity': 2.0,
+            'reservations': 4,
+            'throttled': 2,
+            'totalWait': 1.5,
+            'lastWait': 1.0
+        })
+
+    @mock.patch('time.sleep')
+    def test_acquire_sleeps(self, sleep_mock):
+
+        bucket = TokenBucket(rate=1, capacity=1)
+
+        bucket.acquire()
+        wait = bucket.acquire()
+
+        self.assertTrue(0 < wait <= 1)
+        sleep_mock.assert_called_once_with(wait)
+
+    @mock.patch('time.time')
+    def test_reserve_from_many_threads(self, time_mock):
+
+        time_mock.return_value = 100.0
+        bucket = TokenBucket(rate=10, capacity=10)
+
+        threads = [threading.Thread(target=bucket.reserve) for x in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(bucket.reservations, 50)
+        self.assertEqual(bucket.throttled, 40)
+        self.assertAlmostEqual(bucket.level, -40.0)
+
+
+class FileTokenBucketTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'bucket.json')
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    @mock.patch('time.time')
+    def test_buckets_share_state_file(self, time_mock):
+
+        time_mock.return_value = 100.0
+        first = FileTokenBucket(self.path, rate=1, capacity=2)
+        second = FileTokenBucket(self.path, rate=1, capacity=2)
+
+        self.assertEqual(first.reserve(), 0.0)
+        self.assertEqual(second.reserve(), 0.0)
+        self.assertEqual(first.reserve(), 1.0)
+        self.assertEqual(second.level, -1.0)
+
+        with open(self.path) as stateFile:
+            self.assertEqual(json.load(stateFile), {'tokens': -1.0, 'updatedOn': 100.0})
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def test_buckets_per_endpoint_class(self):
+
+        limiter = RateLimiter({'read': TokenBucket(100), 'write': TokenBucket(1)})
+
+        self.assertEqual(limiter.reserve('GET', 'users'), 0.0)
+        self.assertEqual(limiter.reserve('POST', 'users'), 0.0)
+        self.assertGreater(limiter.reserve('PUT', 'users/token'), 0.0)
+        self.assertEqual(limiter.reserve('GET', 'users'), 0.0)
+
+        stats = limiter.stats()
+        self.assertEqual(stats['read']['reservations'], 2)
+        self.assertEqual(stats['write']['throttled'], 1)
+
+    def test_unknown_endpoint_class_is_not_limited(self):
+
+        limiter = RateLimiter({'payments': TokenBucket(1)}, classify=lambda method, url: url.split('/')[0])
+
+        self.assertEqual(limiter.reserve('POST', 'users'), 0.0)
+        self.assertEqual(limiter.reserve('POST', 'users'), 0.0)
+        self.assertEqual(limiter.reserve('POST', 'payments'), 0.0)
+        self.assertGreater(limiter.reserve('POST', 'payments'), 0.0)
+
+
+class ApiClientRateLimitTest(unittest.TestCase):
+
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.request')
+    def test_requests_wait_for_tokens(self, session_mock, sleep_mock):
+
+        session_mock.return_value = mock.MagicMock(
+            status_code=200,
+            content=json.dumps({'key': 'value'}),
+            headers={'Content-Type': 'application/json'}
+        )
+
+        limiter = RateLimiter({'write': TokenBucket(rate=1, capacity=1)})
+        client = ApiClient('test-user', 'test-pass', SERVER, rateLimiter=limiter)
+
+        client.doGet('users')
+        client.doPost('users', {})
+        client.doPost('users', {})
+
+        self.assertEqual(session_mock.call_count, 3)
+        self.assertEqual(sleep_mock.call_count, 1)
+        self.assertEqual(limiter.stats()['write']['throttled'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
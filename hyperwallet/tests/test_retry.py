@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+import mock
+import unittest
+
+from hyperwallet.utils import ApiClient, RetryPolicy, RetryBudget
+from hyperwallet.config import SERVER
+from hyperwallet.exceptions import HyperwalletAPIException
+from hyperwallet.tests.helpers import jsonResponse
+
+
+class RetryPolicyTest(unittest.TestCase):
+
+    def test_backoff_is_exponential_and_capped(self):
+
+        policy = RetryPolicy(backoffFactor=1, maxBackoff=5, jitter=False)
+
+        self.assertEqual([policy.backoff(x) for x in range(1, 5)], [1, 2, 4, 5])
+
+    def test_backoff_with_jitter(self):
+
+        policy = RetryPolicy(backoffFactor=1)
+
+        for attempt in range(1, 5):
+            self.assertTrue(0 <= policy.backoff(attempt) <= 2 ** (attempt - 1))
+
+    def test_retry_delay_honours_retry_after(self):
+
+        policy = RetryPolicy(budget=False)
+
+        self.assertEqual(policy.retryDelay('GET', 1, response=jsonResponse(429, {}, {'Retry-After': '7'})), 7.0)
+        self.assertIsNone(policy.retryDelay('GET', 1, response=jsonResponse(429, {}, {'Retry-After': '120'})))
+        self.assertIsNone(policy.retryDelay('GET', 1, response=jsonResponse(400, {})))
+
+    def test_retry_delay_only_for_retryable_requests(self):
+
+        policy = RetryPolicy(maxAttempts=2, budget=False)
+
+        self.assertIsNotNone(policy.retryDelay('GET', 1))
+        self.assertIsNotNone(policy.retryDelay('POST', 1, idempotent=True))
+        self.assertIsNone(policy.retryDelay('POST', 1))
+        self.assertIsNone(policy.retryDelay('GET', 2))
+
+    def test_retry_budget(self):
+
+        budget = RetryBudget(ratio=0.5, minRetriesPerSecond=0, maxBalance=1)
+        policy = RetryPolicy(budget=budget)
+
+        self.assertIsNotNone(policy.retryDelay('GET', 1))
+        self.assertIsNone(policy.retryDelay('GET', 1))
+
+        policy.recordRequest()
+        policy.recordRequest()
+
+        self.assertIsNotNone(policy.retryDelay('GET', 1))
+        self.assertEqual(budget.exhausted, 1)
+        self.assertEqual(policy.retries, 2)
+
+
+class ApiClientRetryTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.client = ApiClient(
+            'test-user',
+            'test-pass',
+            SERVER,
+            retryPolicy=RetryPolicy(maxAttempts=3, budget=False)
+        )
+
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.request')
+    def test_retry_communication_error(self, session_mock, sleep_mock):
+
+        session_mock.side_effect = [Exception('Connection reset'), jsonResponse(200, {'key': 'value'})]
+
+        self.assertEqual(self.client.doGet('users'), {'key': 'value'})
+        self.assertEqual(session_mock.call_count, 2)
+        self.assertEqual(sleep_mock.call_count, 1)
+
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.request')
+    def test_retry_unavailable_with_retry_after(self, session_mock, sleep_mock):
+
+        session_mock.side_effect = [
+            jsonResponse(503, {'errors': [{'code': 'UNAVAILABLE'}]}, {'Retry-After': '2'}),
+            jsonResponse(200, {'key': 'value'})
+        ]
+
+        self.assertEqual(self.client.doGet('users'), {'key': 'value'})
+        sleep_mock.assert_called_once_with(2.0)
+
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.request')
+    def test_retry_gives_up_after_max_attempts(self, session_mock, sleep_mock):
+
+        session_mock.return_value = jsonResponse(503, {'errors': [{'code': 'UNAVAILABLE'}]})
+
+        with self.assertRaises(HyperwalletAPIException) as exc:
+            self.client.doGet('users')
+
+        self.assertEqual(exc.exception.message.get('errors')[0].get('code'), 'UNAVAILABLE')
+        self.assertEqual(session_mock.call_count, 3)
+
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.request')
+    def test_retry_post_with_client_id_only(self, session_mock, sleep_mock):
+
+        session_mock.side_effect = Exception('Connection reset')
+
+        with self.assertRaises(HyperwalletAPIException):
+            self.client.doPost('payments', {'amount': '10.00'})
+
+        self.assertEqual(session_mock.call_count, 1)
+
+        with self.assertRaises(HyperwalletAPIException):
+            self.client.doPost('payments', {'amount': '10.00', 'clientPaymentId': 'abc'})
+
+        self.assertEqual(session_mock.call_count, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+
+import asyncio
+import json
+import mock
+import threading
+import time
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from hyperwallet import Api, AsyncApi
+from hyperwallet.exceptions import HyperwalletAPIException
+from hyperwallet.utils import SingleFlight
+from hyperwallet.utils.singleflight import requestKey
+
+
+def slowResponse(data, delay=0.1):
+    def request(*args, **kwargs):
+        time.sleep(delay)
+        return mock.MagicMock(
+            status_code=200,
+            content=json.dumps(data),
+            headers={'Content-Type': 'application/json'}
+        )
+    return request
+
+
+class SingleFlightTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.singleFlight = SingleFlight()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def request(self):
+
+        self.calls += 1
+        self.release.wait(5)
+        return {'token': 'usr-1', 'links': []}
+
+    def concurrently(self, function, count=8):
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [executor.submit(function) for _ in range(count)]
+            while self.singleFlight.stats()['coalesced'] < count - 1:
+                time.sleep(0.001)
+            self.release.set()
+            return futures
+
+    def test_request_key(self):
+
+        user = 'test-user@https://api.sandbox.hyperwallet.com'
+
+        self.assertEqual(requestKey(user, '/users/usr-1/', {'b': 1, 'a': 2}), requestKey(user, 'users/usr-1', {'a': 2, 'b': 1}))
+        self.assertEqual(requestKey(user, 'users', None), requestKey(user, 'users', {}))
+        self.assertNotEqual(requestKey(user, 'users', {'limit': 1}), requestKey(user, 'users', {'limit': 2}))
+        self.assertNotEqual(requestKey(user, 'users', None), requestKey('other-user@https://api.sandbox.hyperwallet.com', 'users', None))
+        self.assertEqual(
+            requestKey(user, 'payments', {'createdAfter': datetime(2024, 1, 1)}),
+            requestKey(user, 'payments', {'createdAfter': '2024-01-01 00:00:00'})
+        )
+
+    def test_concurrent_calls_share_a_request(self):
+
+        futures = self.concurrently(lambda: self.singleFlight.do('users/usr-1', self.request))
+        results = [future.result() for future in futures]
+
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(result == {'token': 'usr-1', 'links': []} for result in results))
+        self.assertEqual(len(set(id(result) for result in results)), 8)
+        self.assertEqual(len(set(id(result['links']) for result in results)), 8)
+        self.assertEqual(self.singleFlight.stats(), {'requests': 1, 'coalesced': 7, 'inFlight': 0})
+
+    def test_every_caller_gets_a_copy(self):
+
+        response = {'token': 'usr-1', 'links': []}
+
+        def request():
+            self.request()
+            return response
+
+        futures = self.concurrently(lambda: self.singleFlight.do('users/usr-1', request), count=2)
+
+        self.assertTrue(all(future.result() is not response for future in futures))
+
+        self.assertIs(self.singleFlight.do('users/usr-1', lambda: response), response)
+
+    def test_errors_are_shared(self):
+
+        def failing():
+            self.request()
+            raise HyperwalletAPIException({'errors': [{'code': 'NOT_FOUND', 'message': 'Not found'}]})
+
+        futures = self.concurrently(lambda: self.singleFlight.do('users/usr-1', failing), count=3)
+
+        for future in futures:
+            self.assertIsInstance(future.exception(), HyperwalletAPIException)
+        self.assertEqual(self.calls, 1)
+
+    def test_sequential_calls_are_not_shared(self):
+
+        self.release.set()
+
+        self.singleFlight.do('users/usr-1', self.request)
+        self.singleFlight.do('users/usr-1', self.request)
+
+        self.assertEqual(self.calls, 2)
+
+
+class AsyncSingleFlightTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrent_calls_share_a_request(self):
+
+        singleFlight = SingleFlight()
+        calls = []
+
+        async def request():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {'token': 'usr-1'}
+
+        results = await asyncio.gather(*[singleFlight.doAsync('users/usr-1', request) for _ in range(5)])
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'token': 'usr-1'}] * 5)
+        self.assertEqual(len(set(id(result) for result in results)), 5)
+        self.assertEqual(singleFlight.stats(), {'requests': 1, 'coalesced': 4, 'inFlight': 0})
+
+    async def test_every_caller_gets_a_copy(self):
+
+        singleFlight = SingleFlight()
+        response = {'token': 'usr-1'}
+
+        async def request():
+            await asyncio.sleep(0.01)
+            return response
+
+        results = await asyncio.gather(*[singleFlight.doAsync('users/usr-1', request) for _ in range(2)])
+
+        self.assertTrue(all(result is not response for result in results))
+        self.assertIs(await singleFlight.doAsync('users/usr-1', request), response)
+
+    async def test_errors_are_shared(self):
+
+        singleFlight = SingleFlight()
+
+        async def request():
+            await asyncio.sleep(0.01)
+            raise ValueError('boom')
+
+        results = await asyncio.gather(*[singleFlight.doAsync('users', request) for _ in range(3)], return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+    async def test_cancelled_caller_leaves_the_request_to_others(self):
+
+        singleFlight = SingleFlight()
+
+        async def request():
+            await asyncio.sleep(0.1)
+            return {'token': 'usr-1'}
+
+        leader = asyncio.ensure_future(asyncio.wait_for(singleFlight.doAsync('users/usr-1', request), 0.02))
+        await asyncio.sleep(0.005)
+        self.assertEqual(singleFlight.stats()['requests'], 1)
+        follower = singleFlight.doAsync('users/usr-1', request)
+
+        results = await asyncio.gather(leader, follower, return_exceptions=True)
+
+        self.assertIsInstance(results[0], asyncio.TimeoutError)
+        self.assertEqual(results[1], {'token': 'usr-1'})
+        self.assertEqual(singleFlight.stats(), {'requests': 1, 'coalesced': 1, 'inFlight': 0})
+
+    async def test_request_cancelled_without_callers(self):
+
+        singleFlight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def request():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.ensure_future(singleFlight.doAsync('users/usr-1', request)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        callers[0].cancel()
+        await asyncio.sleep(0.01)
+        self.assertFalse(cancelled.is_set())
+
+        callers[1].cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        await asyncio.gather(*callers, return_exceptions=True)
+
+        self.assertEqual(singleFlight.stats()['inFlight'], 0)
+
+    @mock.patch('httpx.AsyncClient.request', new_callable=mock.AsyncMock)
+    async def test_async_api(self, session_mock):
+
+        api = AsyncApi('test-user', 'test-pass', 'test-program', singleFlight=SingleFlight())
+
+        async def request(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock.MagicMock(
+                status_code=200,
+                content=json.dumps({'token': 'usr-1'}).encode('utf-8'),
+                headers={'Content-Type': 'application/json'}
+            )
+
+        session_mock.side_effect = request
+
+        users = await asyncio.gather(*[api.getUser('usr-1') for _ in range(4)])
+
+        self.assertEqual(session_mock.call_count, 1)
+        self.assertEqual(len(set(id(user) for user in users)), 4)
+        self.assertTrue(all(user.token == 'usr-1' for user in users))
+
+
+class ApiSingleFlightTest(unittest.TestCase):
+
+    @mock.patch('requests.Session.request')
+    def test_concurrent_get_user(self, session_mock):
+
+        singleFlight = SingleFlight()
+        api = Api('test-user', 'test-pass', 'test-program', singleFlight=singleFlight)
+        session_mock.side_effect = slowResponse({'token': 'usr-1'})
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            users = list(executor.map(lambda _: api.getUser('usr-1'), range(6)))
+
+        self.assertLess(session_mock.call_count, 6)
+        self.assertEqual(singleFlight.stats()['requests'], session_mock.call_count)
+        self.assertTrue(all(user.token == 'usr-1' for user in users))
+
+        users[0].token = 'changed'
+        self.assertEqual(users[1].token, 'usr-1')
+
+    @mock.patch('requests.Session.request')
+    def test_users_are_not_shared(self, session_mock):
+
+        singleFlight = SingleFlight()
+        apis = [Api(username, 'test-pass', 'test-program', singleFlight=singleFlight) for username in ('user-1', 'user-2')]
+        session_mock.side_effect = slowResponse({'token': 'usr-1'})
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(lambda api: api.getUser('usr-1'), apis))
+
+        self.assertEqual(session_mock.call_count, 2)
+        self.assertEqual(singleFlight.stats()['coalesced'], 0)
+
+    @mock.patch('requests.Session.request')
+    def test_posts_are_not_shared(self, session_mock):
+
+        singleFlight = SingleFlight()
+        api = Api('test-user', 'test-pass', 'test-program', singleFlight=singleFlight)
+        session_mock.side_effect = slowResponse({'token': 'pmt-1'}, delay=0.01)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: api.createPayment({'amount': '1.00'}), range(3)))
+
+        self.assertEqual(session_mock.call_count, 3)
+        self.assertEqual(singleFlight.stats()['requests'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+
+import mock
+import os
+import shutil
+import tempfile
+import unittest
+
+from datetime import timedelta
+
+from hyperwallet import Api, AsyncApi, Payment
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.utils import IncrementalSync, FileWatermarkStore, SqliteWatermarkStore
+
+
+def payments(start, count):
+    return [
+        {
+            'token': 'pmt-{}'.format(index),
+            'createdOn': '2019-10-{:02d}T{:02d}:00:00'.format(1 + index // 10, index % 10),
+            'amount': '{}.00'.format(index),
+            'currency': 'USD'
+        }
+        for index in range(start, start + count)
+    ]
+
+
+class FakeEndpoint(object):
+    '''
+    Answer list requests from a list of items, filtering by creation date
+    with inclusive bounds.
+    '''
+
+    def __init__(self, items, failOn=None):
+        self.items = items
+        self.failOn = failOn
+        self.requests = []
+
+    def __call__(self, partialUrl, params):
+        self.requests.append(dict(params))
+
+        if self.failOn and params['createdAfter'] == self.failOn:
+            raise HyperwalletException('Connection reset')
+
+        items = sorted(
+            (item for item in self.items if params['createdAfter'] <= item['createdOn'] <= params['createdBefore']),
+            key=lambda item: item['createdOn']
+        )
+        offset = params['offset']
+        page = items[offset:offset + params['limit']]
+
+        return {'hasNextPage': offset + len(page) < len(items), 'data': page}
+
+
+class StoreTest(object):
+
+    def test_load_and_save(self):
+
+        self.assertIsNone(self.store.load('payments'))
+
+        self.store.save('payments', {'watermark': '2019-10-01T00:00:00', 'keys': {'pmt-1': '2019-10-01T00:00:00'}})
+        self.store.save('webhook-notifications', {'watermark': '2019-10-02T00:00:00', 'keys': {}})
+        self.store.save('payments', {'watermark': '2019-10-03T00:00:00', 'keys': {}})
+
+        self.assertEqual(self.store.load('payments'), {'watermark': '2019-10-03T00:00:00', 'keys': {}})
+        self.assertEqual(self.store.load('webhook-notifications')['watermark'], '2019-10-02T00:00:00')
+
+
+class FileWatermarkStoreTest(StoreTest, unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.store = FileWatermarkStore(os.path.join(self.directory, 'watermarks.json'))
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+
+class SqliteWatermarkStoreTest(StoreTest, unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.store = SqliteWatermarkStore(os.path.join(self.directory, 'watermarks.db'))
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+
+class IncrementalSyncTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.store = SqliteWatermarkStore(os.path.join(self.directory, 'watermarks.db'))
+        self.handled = []
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def sync(self, endpoint, end, **options):
+
+        options.setdefault('pageSize', 3)
+        options.setdefault('maxWorkers', 2)
+
+        return IncrementalSync(
+            endpoint,
+            'payments',
+            self.store,
+            'payments',
+            self.handled.append,
+            lambda data: [Payment(x) for x in data],
+            start='2019-10-01',
+            end=end,
+            **options
+        )
+
+    def tokens(self):
+
+        return [payment.token for window in self.handled for payment in window]
+
+    def test_first_run_requires_start(self):
+
+        sync = IncrementalSync(FakeEndpoint([]), 'payments', self.store, 'payments', self.handled.append, list)
+
+        with self.assertRaises(HyperwalletException) as exc:
+            sync.run()
+
+        self.assertEqual(exc.exception.message, 'start is required for the first synchronization of payments')
+
+    def test_windows_in_order(self):
+
+        result = self.sync(FakeEndpoint(payments(0, 25)), '2019-10-03T05:00:00', maxWorkers=3).run()
+
+        self.assertEqual(result.items, 25)
+        self.assertEqual(result.windows, 3)
+        self.assertEqual(result.watermark, '2019-10-03T05:00:00')
+        self.assertEqual(len(self.handled), 3)
+        self.assertEqual(self.tokens(), ['pmt-{}'.format(index) for index in range(25)])
+
+    def test_only_new_items(self):
+
+        items = payments(0, 15)
+        self.sync(FakeEndpoint(items), '2019-10-02T05:00:00').run()
+
+        items.extend(payments(15, 10))
+        self.handled = []
+        endpoint = FakeEndpoint(items)
+
+        result = self.sync(endpoint, '2019-10-03T05:00:00').run()
+
+        self.assertEqual(self.tokens(), ['pmt-{}'.format(index) for index in range(15, 25)])
+        self.assertEqual(result.items, 10)
+        self.assertEqual(endpoint.requests[0]['createdAfter'], '2019-10-02T04:54:59')
+
+    def test_late_items_within_lookback(self):
+
+        items = payments(10, 5)
+        self.sync(FakeEndpoint(items), '2019-10-02T05:00:00').run()
+
+        # Created just before the watermark, but visible only after the first run.
+        items.append({'token': 'pmt-late', 'createdOn': '2019-10-02T04:58:00'})
+        self.handled = []
+
+        self.sync(FakeEndpoint(items), '2019-10-02T06:00:00').run()
+
+        self.assertEqual(self.tokens(), ['pmt-late'])
+
+    def test_resume_after_failure(self):
+
+        items = payments(0, 25)
+
+        with self.assertRaises(HyperwalletException):
+            self.sync(FakeEndpoint(items, failOn='2019-10-01T23:59:59'), '2019-10-03T05:00:00', maxWorkers=1).run()
+
+        self.assertEqual(self.store.load('payments')['watermark'], '2019-10-02T00:00:00')
+        self.assertEqual(len(self.tokens()), 10)
+
+        self.sync(FakeEndpoint(items), '2019-10-03T05:00:00').run()
+
+        self.assertEqual(self.tokens(), ['pmt-{}'.format(index) for index in range(25)])
+
+    def test_duplicates_across_pages(self):
+
+        items = payments(0, 5)
+
+        class ShiftingEndpoint(FakeEndpoint):
+            # Returns the first item again on the second page, as when a new
+            # item is inserted while paging by offset.
+            def __call__(self, partialUrl, params):
+                return super(ShiftingEndpoint, self).__call__(partialUrl, dict(params, offset=max(0, params['offset'] - 1)))
+
+        self.sync(ShiftingEndpoint(items), '2019-10-02T00:00:00').run()
+
+        self.assertEqual(self.tokens(), ['pmt-{}'.format(index) for index in range(5)])
+
+
+class ApiSyncTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.api = Api('test-user', 'test-pass', 'test-program')
+        self.directory = tempfile.mkdtemp()
+        self.store = FileWatermarkStore(os.path.join(self.directory, 'watermarks.json'))
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def test_sync_requires_store(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.syncPayments(handler=list, start='2019-10-01')
+
+        self.assertEqual(exc.exception.message, 'store is required')
+
+    def test_sync_invalid_filter(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.syncWebhookNotifications(self.store, list, '2019-10-01', {'token': 'wbh-1'})
+
+        self.assertEqual(exc.exception.message, 'Invalid filter')
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_sync_receipts_for_account(self, mock_request):
+
+        mock_request.return_value = {'hasNextPage': False, 'data': [
+            {'journalId': '1', 'createdOn': '2019-10-01T10:00:00', 'amount': '1.00'}
+        ]}
+        handled = []
+
+        result = self.api.syncReceiptsForAccount(
+            'prg-1', 'act-1', self.store, handled.extend, '2019-10-01', {'currency': 'USD'}, windowSize=timedelta(days=7)
+        ).run()
+
+        self.assertEqual(result.stream, 'programs/prg-1/accounts/act-1/receipts?currency=USD')
+        self.assertEqual([receipt.journalId for receipt in handled], ['1'])
+        self.assertEqual(mock_request.call_args[1]['url'], 'programs/prg-1/accounts/act-1/receipts')
+        self.assertEqual(mock_request.call_args[1]['params']['currency'], 'USD')
+        self.assertEqual(self.store.load(result.stream)['watermark'], result.watermark)
+
+
+class AsyncApiSyncTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+
+        self.api = AsyncApi('test-user', 'test-pass', 'test-program')
+        self.directory = tempfile.mkdtemp()
+        self.store = FileWatermarkStore(os.path.join(self.directory, 'watermarks.json'))
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def test_sync_requires_store(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.syncPayments(handler=list, start='2019-10-01')
+
+        self.assertEqual(exc.exception.message, 'store is required')
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_sync_payments(self, mock_request):
+
+        mock_request.return_value = {'hasNextPage': False, 'data': [
+            {'token': 'pmt-1', 'createdOn': '2019-10-01T10:00:00', 'amount': '1.00'}
+        ]}
+        handled = []
+
+        result = await self.api.syncPayments(self.store, handled.extend, '2019-10-01', windowSize=timedelta(days=36500)).run()
+
+        self.assertEqual(result.stream, 'payments')
+        self.assertIsInstance(handled[0], Payment)
+        self.assertEqual(self.store.load('payments')['watermark'], result.watermark)
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_sync_receipts_for_account(self, mock_request):
+
+        mock_request.return_value = {'hasNextPage': False, 'data': [
+            {'journalId': '1', 'createdOn': '2019-10-01T10:00:00', 'amount': '1.00'}
+        ]}
+        handled = []
+
+        await self.api.syncReceiptsForAccount('prg-1', 'act-1', self.store, handled.extend, '2019-10-01', windowSize=timedelta(days=36500)).run()
+
+        self.assertEqual([receipt.journalId for receipt in handled], ['1'])
+        self.assertEqual(mock_request.call_args[1]['url'], 'programs/prg-1/accounts/act-1/receipts')
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_sync_webhook_notifications(self, mock_request):
+
+        mock_request.return_value = {'hasNextPage': False, 'data': [
+            {'token': 'wbh-1', 'type': 'PAYMENTS.CREATED', 'createdOn': '2019-10-01T10:00:00'}
+        ]}
+        handled = []
+
+        result = await self.api.syncWebhookNotifications(self.store, handled.extend, '2019-10-01', windowSize=timedelta(days=36500)).run()
+
+        self.assertEqual(result.items, 1)
+        self.assertEqual(handled[0].token, 'wbh-1')
+        self.assertEqual(mock_request.call_args[1]['url'], 'webhook-notifications')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,434 @@
+#!/usr/bin/env python
+
+import asyncio
+import io
+import json
+import mock
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from datetime import timedelta
+
+from hyperwallet import Api, AsyncApi
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.models import BankAccount, Payment, Webhook
+from hyperwallet.tests.test_sync import FakeEndpoint
+from hyperwallet.utils import WebhookReceiver, WebhookReplay, MemoryTokenStore, SqliteTokenStore
+from hyperwallet.utils.encryption import Encryption
+
+RESOURCES = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'resources')
+
+
+def notification(token, webhookType='PAYMENTS.CREATED', **obj):
+    return json.dumps({
+        'token': token,
+        'type': webhookType,
+        'createdOn': '2019-01-01T00:00:00',
+        'object': obj
+    }).encode('utf-8')
+
+
+class WebhookModelTest(unittest.TestCase):
+
+    def test_object_model(self):
+
+        self.assertIs(Webhook.objectModel('PAYMENTS.CREATED'), Payment)
+        self.assertIs(Webhook.objectModel('USERS.BANK_ACCOUNTS.UPDATED.STATUS.ACTIVATED'), BankAccount)
+        self.assertIsNone(Webhook.objectModel('UNKNOWN.CREATED'))
+        self.assertIsNone(Webhook.objectModel('UNKNOWN'))
+
+    def test_object_models_bounded(self):
+
+        with mock.patch.object(Webhook, '_objectModels', {}):
+            for index in range(Webhook._cachedTypes + 10):
+                Webhook.objectModel('PAYMENTS.{}'.format(index))
+
+            self.assertEqual(len(Webhook._objectModels), Webhook._cachedTypes)
+            self.assertIs(Webhook.objectModel('PAYMENTS.UNCACHED'), Payment)
+
+
+class WebhookReceiverTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.receiver = WebhookReceiver(workers=2)
+        self.received = []
+
+    def tearDown(self):
+
+        self.receiver.close()
+
+    def test_handlers_by_type(self):
+
+        def payments(webhook):
+            self.received.append(('payments', webhook.token))
+
+        self.receiver.on('PAYMENTS', payments)
+        self.receiver.on('USERS.BANK_ACCOUNTS.CREATED', lambda webhook: self.received.append(('created', webhook.token)))
+        self.receiver.on('*', lambda webhook: self.received.append(('all', webhook.token)))
+
+        self.assertEqual(self.receiver.handlers('PAYMENTS.UPDATED.STATUS.COMPLETED')[0], payments)
+        self.assertEqual(len(self.receiver.handlers('USERS.BANK_ACCOUNTS.CREATED')), 2)
+        self.assertEqual(len(self.receiver.handlers('PAYMENTSX.CREATED')), 1)
+
+        @self.receiver.on('USERS')
+        def users(webhook):
+            pass
+
+        self.assertEqual(len(self.receiver.handlers('USERS.BANK_ACCOUNTS.CREATED')), 3)
+
+        with self.assertRaises(HyperwalletException):
+            self.receiver.on('', users)
+
+    @mock.patch('hyperwallet.utils.webhooks.CACHED_TYPES', 2)
+    def test_handlers_bounded(self):
+
+        self.receiver.on('PAYMENTS', self.received.append)
+
+        for index in range(5):
+            self.assertEqual(self.receiver.handlers('PAYMENTS.{}'.format(index)), (self.received.append,))
+
+        self.assertEqual(len(self.receiver._WebhookReceiver__routes), 2)
+
+    def test_receive_and_dispatch(self):
+
+        self.receiver.on('PAYMENTS', lambda webhook: self.received.append(webhook))
+
+        self.assertEqual(self.receiver.receive(notification('wbh-1', amount='10.00')), 202)
+        self.assertEqual(self.receiver.receive(notification('wbh-2', 'USERS.CREATED')), 202)
+        self.receiver.join()
+
+        self.assertEqual(len(self.received), 1)
+        self.assertIsInstance(self.received[0].object, Payment)
+        self.assertEqual(self.received[0].object.amount, '10.00')
+        self.assertEqual(self.receiver.stats()['handled'], 1)
+        self.assertEqual(self.receiver.stats()['unhandled'], 1)
+
+    def test_duplicates_are_dropped(self):
+
+        self.receiver.on('*', self.received.append)
+
+        self.assertEqual(self.receiver.receive(notification('wbh-1')), 202)
+        self.assertEqual(self.receiver.receive(notification('wbh-1')), 200)
+        self.receiver.join()
+
+        self.assertEqual(len(self.received), 1)
+        self.assertEqual(self.receiver.stats()['duplicates'], 1)
+
+    def test_seen_tokens_are_bounded(self):
+
+        receiver = WebhookReceiver(workers=1, seenTokens=2)
+
+        with receiver:
+            for token in ('wbh-1', 'wbh-2', 'wbh-3', 'wbh-1'):
+                self.assertEqual(receiver.receive(notification(token)), 202)
+
+    def test_invalid_notifications(self):
+
+        for body in (b'not json', b'[]', b'{"token": "wbh-1"}'):
+            with self.assertRaises(HyperwalletException):
+                self.receiver.receive(body)
+
+        self.assertEqual(self.receiver.stats()['invalid'], 3)
+
+    def test_backpressure(self):
+
+        release = threading.Event()
+        receiver = WebhookReceiver(workers=1, queueSize=1, enqueueTimeout=0)
+        receiver.on('*', lambda webhook: release.wait(5))
+
+        try:
+            statuses = [receiver.receive(notification('wbh-{}'.format(index))) for index in range(4)]
+
+            self.assertIn(503, statuses)
+            self.assertEqual(receiver.stats()['rejected'], statuses.count(503))
+
+            # A refused notification is accepted once delivered again.
+            release.set()
+            receiver.join()
+            self.assertEqual(receiver.receive(notification('wbh-3')), 202)
+        finally:
+            release.set()
+            receiver.close()
+
+    def test_handler_errors(self):
+
+        errors = []
+        receiver = WebhookReceiver(workers=1, onError=lambda webhook, e: errors.append((webhook.token, str(e))))
+
+        def failing(webhook):
+            raise ValueError('boom')
+
+        receiver.on('*', failing)
+
+        with receiver:
+            receiver.receive(notification('wbh-1'))
+            receiver.join()
+
+        self.assertEqual(errors, [('wbh-1', 'boom')])
+        self.assertEqual(receiver.stats()['failed'], 1)
+
+    def test_wsgi(self):
+
+        self.receiver.on('*', self.received.append)
+        responses = []
+
+        def call(method, body):
+            environ = {
+                'REQUEST_METHOD': method,
+                'CONTENT_LENGTH': str(len(body)),
+                'wsgi.input': io.BytesIO(body)
+            }
+            self.receiver.wsgi(environ, lambda status, headers: responses.append(status))
+            return responses[-1]
+
+        self.assertEqual(call('POST', notification('wbh-1')), '202 Accepted')
+        self.assertEqual(call('POST', notification('wbh-1')), '200 OK')
+        self.assertEqual(call('POST', b'{'), '400 Bad Request')
+        self.assertEqual(call('GET', b''), '405 Method Not Allowed')
+
+    def test_encrypted_notifications(self):
+
+        encryptionData = {
+            'clientPrivateKeySetLocation': os.path.join(RESOURCES, 'private-jwkset1'),
+            'hyperwalletKeySetLocation': os.path.join(RESOURCES, 'public-jwkset1')
+        }
+        receiver = WebhookReceiver(encryptionData)
+        body = Encryption(**encryptionData).encrypt(notification('wbh-1').decode('utf-8'))
+
+        self.assertEqual(receiver.parse(body.encode('utf-8')).token, 'wbh-1')
+
+        with self.assertRaises(HyperwalletException):
+            receiver.parse(notification('wbh-2'))
+
+
+class TokenStoreTest(object):
+
+    def test_claim_and_release(self):
+
+        self.assertEqual(self.store.claim(['wbh-1', 'wbh-2']), ['wbh-1', 'wbh-2'])
+        self.assertEqual(self.store.claim(['wbh-2', 'wbh-3']), ['wbh-3'])
+
+        self.store.release(['wbh-2'])
+        self.assertEqual(self.store.claim(['wbh-1', 'wbh-2']), ['wbh-2'])
+
+
+class MemoryTokenStoreTest(TokenStoreTest, unittest.TestCase):
+
+    def setUp(self):
+
+        self.store = MemoryTokenStore()
+
+    def test_bounded(self):
+
+        store = MemoryTokenStore(maxTokens=2)
+        store.claim(['wbh-1', 'wbh-2', 'wbh-3'])
+
+        self.assertEqual(store.claim(['wbh-1', 'wbh-3']), ['wbh-1'])
+
+
+class SqliteTokenStoreTest(TokenStoreTest, unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'tokens.db')
+        self.store = SqliteTokenStore(self.path)
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def test_shared_and_pruned(self):
+
+        self.store.claim(['wbh-1'])
+
+        self.assertEqual(SqliteTokenStore(self.path).claim(['wbh-1', 'wbh-2']), ['wbh-2'])
+        self.assertEqual(self.store.prune(timedelta(days=1)), 0)
+        self.assertEqual(self.store.prune(timedelta(seconds=-1)), 2)
+        self.assertEqual(self.store.claim(['wbh-1']), ['wbh-1'])
+
+
+def webhooks(count):
+    return [
+        {
+            'token': 'wbh-{}'.format(index),
+            'type': 'PAYMENTS.CREATED',
+            'createdOn': '2019-10-01T{:02d}:{:02d}:00'.format(index // 60, index % 60),
+            'object': {'token': 'pmt-{}'.format(index)}
+        }
+        for index in range(count)
+    ]
+
+
+class WebhookReplayTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.receiver = WebhookReceiver()
+        self.received = []
+        self.receiver.on('PAYMENTS', self.received.append)
+
+    def replay(self, endpoint, **kwargs):
+
+        return WebhookReplay(
+            endpoint,
+            self.receiver,
+            '2019-10-01T00:00:00',
+            '2019-10-01T05:00:00',
+            windowSize=timedelta(minutes=30),
+            pageSize=7,
+            **kwargs
+        ).run()
+
+    def test_replay_in_order(self):
+
+        endpoint = FakeEndpoint(list(reversed(webhooks(300))))
+
+        result = self.replay(endpoint, maxWorkers=3)
+
+        self.assertEqual((result.items, result.duplicates, result.windows), (300, 0, 10))
+        self.assertEqual([webhook.token for webhook in self.received], ['wbh-{}'.format(index) for index in range(300)])
+        self.assertIsInstance(self.received[0].object, Payment)
+        self.assertTrue(all(request['sortBy'] == 'createdOn' for request in endpoint.requests))
+
+    def test_skips_handled_notifications(self):
+
+        self.receiver.receive(json.dumps(webhooks(10)[3]).encode('utf-8'))
+        self.receiver.join()
+
+        result = self.replay(FakeEndpoint(webhooks(10)))
+
+        self.assertEqual((result.items, result.duplicates), (9, 1))
+        self.assertEqual(len(self.received), 10)
+
+        self.assertEqual(self.replay(FakeEndpoint(webhooks(10))).items, 0)
+        self.receiver.close()
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_api(self, mock_get):
+
+        api = Api('test-user', 'test-pass', 'test-program')
+        mock_get.side_effect = lambda method, url, params: {'hasNextPage': False, 'data': webhooks(2)}
+
+        result = api.replayWebhookNotifications(self.receiver, '2019-10-01T00:00:00', '2019-10-01T00:10:00').run()
+
+        self.assertEqual(result.items, 2)
+        self.assertEqual(mock_get.call_args[1]['url'], 'webhook-notifications')
+
+        with self.assertRaises(HyperwalletException):
+            api.replayWebhookNotifications(None, '2019-10-01T00:00:00')
+
+        with self.assertRaises(HyperwalletException):
+            api.replayWebhookNotifications(self.receiver)
+
+        with self.assertRaises(HyperwalletException):
+            api.replayWebhookNotifications(self.receiver, '2019-10-01T00:00:00', params={'unknown': 1})
+
+
+class AsyncApiReplayTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+
+        self.api = AsyncApi('test-user', 'test-pass', 'test-program')
+        self.receiver = WebhookReceiver(workers=1)
+        self.received = []
+        self.receiver.on('PAYMENTS', self.received.append)
+
+    def tearDown(self):
+
+        self.receiver.close()
+
+    def test_replay_requires_receiver(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.replayWebhookNotifications(None, '2019-10-01T00:00:00')
+
+        self.assertEqual(exc.exception.message, 'receiver is required')
+
+    @mock.patch('hyperwallet.utils.AsyncApiClient._makeRequest', new_callable=mock.AsyncMock)
+    async def test_replay(self, mock_request):
+
+        mock_request.return_value = {'hasNextPage': False, 'data': webhooks(2)}
+
+        result = await self.api.replayWebhookNotifications(self.receiver, '2019-10-01T00:00:00', '2019-10-01T00:10:00').run()
+        self.receiver.join()
+
+        self.assertEqual(result.items, 2)
+        self.assertEqual([webhook.token for webhook in self.received], ['wbh-0', 'wbh-1'])
+        self.assertEqual(mock_request.call_args[1]['url'], 'webhook-notifications')
+
+
+class AsgiWebhookReceiverTest(unittest.IsolatedAsyncioTestCase):
+
+    async def call(self, receiver, method, chunks):
+
+        messages = [{'type': 'http.request', 'body': chunk, 'more_body': index < len(chunks) - 1} for (index, chunk) in enumerate(chunks)]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        await receiver.asgi({'type': 'http', 'method': method}, receive, send)
+        return sent
+
+    async def test_asgi(self):
+
+        receiver = WebhookReceiver(workers=1, queueSize=1)
+        received = []
+        receiver.on('*', received.append)
+
+        body = notification('wbh-1')
+        sent = await self.call(receiver, 'POST', [body[:10], body[10:]])
+
+        self.assertEqual(sent[0]['status'], 202)
+        self.assertEqual(sent[1], {'type': 'http.response.body', 'body': b''})
+        self.assertEqual((await self.call(receiver, 'GET', [b'']))[0]['status'], 405)
+
+        receiver.close()
+        self.assertEqual(received[0].token, 'wbh-1')
+
+    async def test_asgi_claims_away_from_loop(self):
+
+        receiver = WebhookReceiver(workers=1)
+        loops = []
+
+        def claim(tokens):
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+            return tokens
+
+        receiver.tokenStore.claim = claim
+        sent = await self.call(receiver, 'POST', [notification('wbh-1')])
+        receiver.close()
+
+        self.assertEqual(sent[0]['status'], 202)
+        self.assertEqual(loops, [None])
+
+    async def test_lifespan(self):
+
+        receiver = WebhookReceiver(workers=1)
+        messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        await receiver.asgi({'type': 'lifespan'}, receive, send)
+
+        self.assertEqual([message['type'] for message in sent], ['lifespan.startup.complete', 'lifespan.shutdown.complete'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,57 @@
 #!/usr/bin/env python
 
-from .apiclient import ApiClient
+import importlib
+
+# The modules are imported when one of their names is first used, so that
+# importing the SDK does not load dependencies, such as the HTTP and JOSE
+# libraries, before they are needed.
+_EXPORTS = {
+    'ApiClient': 'apiclient',
+    'PageIterator': 'pagination',
+    'AsyncPageIterator': 'asyncpagination',
+    'AsyncApiClient': 'asyncapiclient',
+    'RetryPolicy': 'retry',
+    'RetryBudget': 'retry',
+    'RateLimiter': 'ratelimit',
+    'TokenBucket': 'ratelimit',
+    'FileTokenBucket': 'ratelimit',
+    'RequestHook': 'instrumentation',
+    'RequestEvent': 'instrumentation',
+    'MetricsCollector': 'instrumentation',
+    'LatencyHistogram': 'instrumentation',
+    'ColumnarBatch': 'columnar',
+    'RECEIPT_COLUMNS': 'columnar',
+    'PAYMENT_COLUMNS': 'columnar',
+    'Exporter': 'export',
+    'ExportResult': 'export',
+    'IncrementalSync': 'sync',
+    'WatermarkStore': 'sync',
+    'FileWatermarkStore': 'sync',
+    'SqliteWatermarkStore': 'sync',
+    'ResponseCache': 'cache',
+    'SingleFlight': 'singleflight',
+    'WebhookReceiver': 'webhooks',
+    'WebhookReplay': 'webhooks',
+    'TokenStore': 'webhooks',
+    'MemoryTokenStore': 'webhooks',
+    'SqliteTokenStore': 'webhooks',
+    'Deadline': 'deadline',
+    'Timeout': 'deadline',
+    'HedgePolicy': 'hedging',
+    'CircuitBreaker': 'breaker',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    value = getattr(importlib.import_module('.' + _EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
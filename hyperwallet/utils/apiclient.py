@@ -1,14 +1,15 @@
 #!/usr/bin/env python
 
-import ssl
-import json
-import requests
+import functools
+import time
 import uuid
 
-from hyperwallet.exceptions import HyperwalletAPIException
-from requests_toolbelt.adapters.ssl import SSLAdapter
+from hyperwallet.exceptions import HyperwalletAPIException, HyperwalletException
 from hyperwallet import __version__
-from hyperwallet.utils.encryption import Encryption
+from hyperwallet.utils.codec import CODECS, defaultCodec
+from hyperwallet.utils.deadline import checkDelay, currentDeadline, deadlineExceeded, requestTimeout
+from hyperwallet.utils.instrumentation import RequestEvent
+from hyperwallet.utils.singleflight import requestKey
 try:
     from urllib.parse import urljoin
 except ImportError:
@@ -27,16 +28,95 @@ class ApiClient(object):
         The base URL of the API. **REQUIRED**
     :param encryptionData:
         Array with params for encrypted requests(Fields: clientPrivateKeySetLocation, hyperwalletKeySetLocation).
+    :param poolConnections:
+        The number of connection pools (one per host) to cache.
+    :param poolMaxSize:
+        The maximum number of connections kept open per host.
+    :param poolBlock:
+        Wait for a free connection instead of opening one that is discarded
+        once the pool is full.
+    :param keepAlive:
+        Reuse connections between requests.
+    :param socketOptions:
+        A list of ``(level, option, value)`` tuples set on every new socket.
+    :param retryPolicy:
+        A RetryPolicy deciding if failed requests are sent again. Requests are
+        not retried by default.
+    :param rateLimiter:
+        A RateLimiter pacing requests before they are sent, retries included.
+        Requests are not limited by default.
+    :param hooks:
+        A list of RequestHook called before each request, after each response
+        and on errors, such as a MetricsCollector.
+    :param responseCache:
+        A ResponseCache keeping the GET responses of resources that rarely
+        change. Responses are not cached by default.
+    :param singleFlight:
+        A SingleFlight sharing one request between identical GETs made at the
+        same time. Requests are not shared by default.
+    :param encryptionProcesses:
+        The number of processes encrypting requests and decrypting responses
+        when encryptionData is set. Encryption runs in the calling thread by
+        default.
+    :param codec:
+        The codec encoding request bodies and decoding response bodies, such
+        as a JsonCodec, or its name: ``json`` or ``orjson``. Defaults to
+        orjson when it is installed, and to the json module otherwise.
+    :param timeout:
+        The seconds to wait for a connection and for the response, as a
+        number or a ``(connect, read)`` tuple. None waits indefinitely. Use
+        ``hyperwallet.utils.Timeout`` to override it for some calls, and
+        ``hyperwallet.utils.Deadline`` to bound a group of calls. Defaults to
+        10 seconds to connect and 60 seconds to read.
+    :param hedgePolicy:
+        A HedgePolicy sending a second copy of GET requests slower than
+        usual and using the first response. Requests are not hedged by
+        default.
+    :param circuitBreaker:
+        A CircuitBreaker failing requests fast, with a CIRCUIT_OPEN error,
+        on endpoints that keep failing. Requests are always sent by default.
+    :param http2:
+        Send requests over HTTP/2 with httpx, which multiplexes concurrent
+        requests over up to ``poolMaxSize`` connections. Requires the
+        ``http2`` extra.
     '''
 
-    def __init__(self, username, password, server, encryptionData=None):
+    def __init__(self,
+                 username,
+                 password,
+                 server,
+                 encryptionData=None,
+                 poolConnections=10,
+                 poolMaxSize=10,
+                 poolBlock=False,
+                 keepAlive=True,
+                 socketOptions=None,
+                 retryPolicy=None,
+                 rateLimiter=None,
+                 hooks=None,
+                 responseCache=None,
+                 singleFlight=None,
+                 encryptionProcesses=None,
+                 codec=None,
+                 timeout=(10, 60),
+                 hedgePolicy=None,
+                 circuitBreaker=None,
+                 http2=False):
         '''
         Create an instance of the API client.
         This client is used to make the calls to the Hyperwallet API.
         '''
 
-        # Setup encryption for request/responses.
-        self.encryption = Encryption(**encryptionData) if encryptionData is not None else None
+        # Setup encryption for request/responses. The JOSE libraries are only
+        # loaded by clients using encryption.
+        if encryptionData is None:
+            self.encryption = None
+        elif encryptionProcesses:
+            from hyperwallet.utils.encryption import EncryptionPool
+            self.encryption = EncryptionPool(processes=encryptionProcesses, **encryptionData)
+        else:
+            from hyperwallet.utils.encryption import Encryption
+            self.encryption = Encryption(**encryptionData)
 
         # Base headers and the custom User-Agent to identify this client as the
         # Hyperwallet SDK.
@@ -49,24 +129,114 @@ class ApiClient(object):
             'Content-Type': 'application/jose+json' if self.encrypted else 'application/json'
         }
 
+        if not keepAlive:
+            self.baseHeaders['Connection'] = 'close'
+
         self.username = username
         self.password = password
         self.server = server
 
+        self.poolConnections = poolConnections
+        self.poolMaxSize = poolMaxSize
+        self.poolBlock = poolBlock
+        self.keepAlive = keepAlive
+        self.socketOptions = socketOptions
+        self.retryPolicy = retryPolicy
+        self.rateLimiter = rateLimiter
+        self.hooks = list(hooks or [])
+        self.responseCache = responseCache
+        self.singleFlight = singleFlight
+        self.timeout = timeout
+        self.hedgePolicy = hedgePolicy
+        self.circuitBreaker = circuitBreaker
+        self.http2 = http2
+
+        if codec is None:
+            self.codec = defaultCodec()
+        elif isinstance(codec, str):
+            if codec not in CODECS:
+                raise HyperwalletException('Unknown codec {}'.format(codec))
+            self.codec = CODECS[codec]()
+        else:
+            self.codec = codec
+
         # The complete base URL of the API.
         self.baseUrl = urljoin(self.server, '/rest/v3/')
 
         # The default connection to persist authentication and SSL settings.
+        self.session = self._createSession()
+
+    @property
+    def encrypted(self):
+        return self.encryption is not None
+
+    def _createSession(self):
+        '''
+        Create the connection used to send requests.
+
+        :returns:
+            A session persisting authentication and SSL settings.
+        '''
+
+        if self.http2:
+            from hyperwallet.utils.http2 import Http2Session
+
+            self.adapter = None
+            return Http2Session(
+                self.server,
+                (self.username, self.password),
+                self.baseHeaders,
+                maxConnections=self.poolMaxSize,
+                keepAlive=self.keepAlive,
+                socketOptions=self.socketOptions
+            )
+
+        import requests
+        from hyperwallet.utils.connectionpool import PooledSSLAdapter
+
+        self.adapter = PooledSSLAdapter(
+            socketOptions=self.socketOptions,
+            pool_connections=self.poolConnections,
+            pool_maxsize=self.poolMaxSize,
+            pool_block=self.poolBlock
+        )
+
         defaultSession = requests.Session()
-        defaultSession.mount(self.server, SSLAdapter())
+        defaultSession.mount(self.server, self.adapter)
         defaultSession.auth = (self.username, self.password)
         defaultSession.headers = self.baseHeaders
 
-        self.session = defaultSession
+        return defaultSession
+
+    def close(self):
+        '''
+        Close every connection of the pool, and stop the processes started
+        for ``encryptionProcesses`` and the event loop of HTTP/2.
+        '''
+
+        self.session.close()
+
+        if hasattr(self.encryption, 'close'):
+            self.encryption.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     @property
-    def encrypted(self):
-        return self.encryption is not None
+    def poolStats(self):
+        '''
+        The statistics of the connection pool, as a dictionary with the number
+        of connections created, reused, discarded, inUse, idle and open. Over
+        HTTP/2, only inUse, idle and open are known.
+        '''
+
+        if self.http2:
+            return self.session.poolStats()
+
+        return self.adapter.poolStats()
 
     def _makeRequest(self,
                      method=None,
@@ -74,7 +244,8 @@ class ApiClient(object):
                      data=None,
                      headers=None,
                      params=None,
-                     files=None):
+                     files=None,
+                     idempotent=None):
         '''
         Process an API response to ensure a JSON object is returned always.
 
@@ -88,6 +259,8 @@ class ApiClient(object):
             A dictionary containing additional request headers.
         :param params:
             A dictionary containing query parameters.
+        :param idempotent:
+            True if the request can be sent more than once without side effects.
         :returns:
             A JSON object containing the response data or an error object.
 
@@ -95,40 +268,261 @@ class ApiClient(object):
             The Hyperwallet API supports **GET**, **POST**, and **PUT**.
         '''
 
+        event = RequestEvent(method, url)
+
         try:
-            response = self.session.request(
-                method=method,
-                url=urljoin(self.baseUrl, url),
-                data=self.__getRequestData(data),
-                headers=headers,
-                params=params,
-                files=files
-            )
+            content = self._sendRequest(event, method, url, data, headers, params, files, idempotent)
         except Exception as e:
-            # The request failed to connect
-            raise HyperwalletAPIException({
-                'errors': [{
-                    'code': 'COMMUNICATION_ERROR',
-                    'message': 'Connection to {} failed: {}'.format(
-                        self.server,
-                        e.args[0]
-                    )
-                }]
-            })
+            event.finish(e)
+            self._recordCircuit(event)
+            self._emit('onError', event)
+            raise
+
+        event.finish()
+        self._recordCircuit(event)
+        self._emit('afterResponse', event)
+
+        return content
+
+    def _sendRequest(self, event, method, url, data, headers, params, files, idempotent):
+        '''
+        Encrypt, send and parse a request, recording its timings in the event.
+
+        :returns:
+            A JSON object containing the response data.
+        '''
+
+        with event.measure('encryptionTime'):
+            data = self._getRequestData(data)
+
+        event.bytesSent = len(data) if data and not files else 0
+        self._emit('beforeRequest', event)
+
+        (cacheKey, cached) = self._cacheLookup(event, method, url, params)
+        if cached is not None:
+            if cached.fresh:
+                return self.responseCache.content(cached)
+            headers = dict(headers or {}, **cached.conditionalHeaders())
+
+        if self.circuitBreaker is not None:
+            self.circuitBreaker.acquire(event)
+
+        if self.retryPolicy is not None:
+            self.retryPolicy.recordRequest()
+
+        attempt = 0
+
+        while True:
+            attempt += 1
+            event.attempts = attempt
+
+            wait = self._throttle(method, url)
+            if wait > 0:
+                checkDelay(wait)
+                time.sleep(wait)
+
+            timeout = requestTimeout(self.timeout)
+
+            try:
+                with event.measure('networkTime'):
+                    response = self._send(event, functools.partial(
+                        self.session.request,
+                        method=method,
+                        url=urljoin(self.baseUrl, url),
+                        data=data,
+                        headers=headers,
+                        params=params,
+                        files=files,
+                        timeout=timeout
+                    ))
+            except Exception as e:
+                delay = self._retryDelay(method, attempt, idempotent, files)
+                if delay is None:
+                    # The request failed to connect
+                    raise self._communicationError(e)
+                checkDelay(delay)
+                time.sleep(delay)
+                continue
+
+            delay = self._retryDelay(method, attempt, idempotent, files, response)
+            if delay is None:
+                break
+            checkDelay(delay)
+            time.sleep(delay)
+
+        event.status = response.status_code
+
+        if self.responseCache is not None and method != 'GET':
+            self.responseCache.invalidate(url)
+
+        if response.status_code == 304 and cached is not None:
+            event.cache = 'revalidated'
+            return self.responseCache.revalidated(cacheKey, cached)
 
         if response.status_code == 204:
             return {}
 
-        self.__checkResponseHeaderContentType(response)
+        content = self._readResponse(response)
+        event.bytesReceived = len(response.content)
+
+        if self.encrypted:
+            with event.measure('encryptionTime'):
+                content = self.encryption.decrypt(content)
+
+        with event.measure('decodeTime'):
+            content = self._parseResponse(content)
+
+        if cacheKey is not None:
+            self.responseCache.store(cacheKey, url, content, response.headers)
+
+        return content
+
+    def _recordCircuit(self, event):
+        '''
+        Record the outcome of a finished request in the circuit breaker.
+
+        :param event:
+            The finished RequestEvent. **REQUIRED**
+        '''
+
+        if self.circuitBreaker is not None:
+            self.circuitBreaker.record(event)
+
+    def _send(self, event, request):
+        '''
+        Send an attempt, hedged when a HedgePolicy is set and the request is a GET.
+
+        :param event:
+            The RequestEvent of the request. **REQUIRED**
+        :param request:
+            Callable sending the attempt and returning its response. **REQUIRED**
+        :returns:
+            The response.
+        '''
+
+        if self.hedgePolicy is None or event.method != 'GET':
+            return request()
 
-        content = response.content
-        if hasattr(content, 'decode'):  # Python 2
-            content = content.decode('utf-8')
+        return self.hedgePolicy.do(event, request)
 
-        content = self.encryption.decrypt(content) if self.encrypted else content
+    def _cacheLookup(self, event, method, url, params):
+        '''
+        Find the cached response of a GET request, recording the outcome in the event.
+
+        :returns:
+            A tuple of the cache key, None if the request is not cached, and
+            the CacheEntry, None if the response is not in the cache.
+        '''
+
+        if self.responseCache is None or method != 'GET':
+            return (None, None)
+
+        key = self.responseCache.key('{}@{}'.format(self.username, self.server), url, params)
+        if key is None:
+            return (None, None)
+
+        cached = self.responseCache.lookup(key)
+
+        if cached is None:
+            event.cache = 'miss'
+        elif cached.fresh:
+            event.cache = 'hit'
+            event.status = 200
+        else:
+            event.cache = 'stale'
+
+        return (key, cached)
+
+    def _retryDelay(self, method, attempt, idempotent, files, response=None):
+        '''
+        Work out the delay before a failed attempt is retried.
+
+        :returns:
+            The delay in seconds, or None if the request must not be retried.
+        '''
+
+        if self.retryPolicy is None or files:
+            return None
+
+        return self.retryPolicy.retryDelay(method, attempt, idempotent, response)
+
+    def _emit(self, name, event):
+        '''
+        Call a method of every hook.
+
+        :param name:
+            The method name: beforeRequest, afterResponse or onError. **REQUIRED**
+        :param event:
+            The RequestEvent. **REQUIRED**
+        '''
+
+        for hook in self.hooks:
+            getattr(hook, name)(event)
+
+    def _throttle(self, method, url):
+        '''
+        Reserve a token of the rate limiter for an attempt.
+
+        :returns:
+            The delay in seconds to wait before sending the attempt.
+        '''
+
+        if self.rateLimiter is None:
+            return 0.0
+
+        return self.rateLimiter.reserve(method, url)
+
+    def _communicationError(self, error):
+        '''
+        Build the exception raised when a request fails to connect.
+
+        :param error:
+            The exception raised by the transport. **REQUIRED**
+        :returns:
+            A HyperwalletAPIException.
+        '''
+
+        deadline = currentDeadline()
+        if deadline is not None and deadline.expired:
+            # The request timed out because the deadline was reached.
+            return deadlineExceeded(deadline)
+
+        return HyperwalletAPIException({
+            'errors': [{
+                'code': 'COMMUNICATION_ERROR',
+                'message': 'Connection to {} failed: {}'.format(
+                    self.server,
+                    error.args[0] if error.args else error
+                )
+            }]
+        })
+
+    def _readResponse(self, response):
+        '''
+        Check the Content-Type of a response and return its body.
+
+        :param response:
+            Response to be read. **REQUIRED**
+        :returns:
+            The response body, as bytes.
+        '''
+
+        self._checkResponseHeaderContentType(response)
+
+        return response.content
+
+    def _parseResponse(self, content):
+        '''
+        Parse a decrypted response body to ensure a JSON object is returned always.
+
+        :param content:
+            The response body. **REQUIRED**
+        :returns:
+            A JSON object containing the response data or an error object.
+        '''
 
         try:
-            json_body = json.loads(content)
+            json_body = self.codec.loads(content)
         except ValueError as e:
             # The response is not JSON
             raise HyperwalletAPIException({
@@ -156,10 +550,16 @@ class ApiClient(object):
             The API response.
         '''
 
-        return self._makeRequest(
-            method='GET',
-            url=partialUrl,
-            params=params
+        if self.singleFlight is None:
+            return self._makeRequest(
+                method='GET',
+                url=partialUrl,
+                params=params
+            )
+
+        return self.singleFlight.do(
+            requestKey('{}@{}'.format(self.username, self.server), partialUrl, params),
+            lambda: self._makeRequest(method='GET', url=partialUrl, params=params)
         )
 
     def doPost(self, partialUrl, data, headers={}):
@@ -179,8 +579,23 @@ class ApiClient(object):
         return self._makeRequest(
             method='POST',
             url=partialUrl,
-            data=json.dumps(data).encode('utf-8'),
-            headers=headers
+            data=self.codec.dumps(data),
+            headers=headers,
+            idempotent=self._hasClientId(data)
+        )
+
+    def _hasClientId(self, data):
+        '''
+        Check if request data carries a client id (such as clientPaymentId),
+        which the API uses to reject duplicates.
+
+        :param data:
+            A dictionary containing data for the request body. **REQUIRED**
+        '''
+
+        return isinstance(data, dict) and any(
+            key.startswith('client') and key.endswith('Id') and value
+            for (key, value) in data.items()
         )
 
     def doPut(self, partialUrl, data):
@@ -198,10 +613,10 @@ class ApiClient(object):
         return self._makeRequest(
             method='PUT',
             url=partialUrl,
-            data=json.dumps(data).encode('utf-8')
+            data=self.codec.dumps(data)
         )
 
-    def __checkResponseHeaderContentType(self, response):
+    def _checkResponseHeaderContentType(self, response):
         '''
         Check response header Content-Type.
 
@@ -215,7 +630,7 @@ class ApiClient(object):
         if (invalidContentType):
             raise HyperwalletAPIException('Invalid Content-Type specified in Response Header')
 
-    def __getRequestData(self, data):
+    def _getRequestData(self, data):
         '''
         If encryption is enabled try to encrypt request data, otherwise no action required.
 
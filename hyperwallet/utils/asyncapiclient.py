@@ -0,0 +1,367 @@
+#!/usr/bin/env python
+
+import asyncio
+import functools
+
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.utils.apiclient import ApiClient
+from hyperwallet.utils.deadline import checkDelay, requestTimeout
+from hyperwallet.utils.instrumentation import RequestEvent
+from hyperwallet.utils.singleflight import requestKey
+try:
+    import httpx
+except ImportError:
+    httpx = None
+try:
+    from urllib.parse import urljoin
+except ImportError:
+    from urlparse import urljoin  # Python 2
+
+
+class AsyncApiClient(ApiClient):
+    '''
+    The asyncio Hyperwallet API Client.
+
+    Requests are sent through a single ``httpx.AsyncClient`` whose connection
+    pool is shared by every concurrent call. Encryption and decryption run in
+    an executor so the event loop is never blocked by RSA work.
+
+    :param username:
+        The username of this API user. **REQUIRED**
+    :param password:
+        The password of this API user. **REQUIRED**
+    :param server:
+        The base URL of the API. **REQUIRED**
+    :param encryptionData:
+        Array with params for encrypted requests(Fields: clientPrivateKeySetLocation, hyperwalletKeySetLocation).
+    :param maxConnections:
+        The maximum number of connections kept open to the API.
+    :param executor:
+        The ``concurrent.futures.Executor`` used for encryption and decryption.
+        Defaults to the event loop default executor.
+    :param retryPolicy:
+        A RetryPolicy deciding if failed requests are sent again. Requests are
+        not retried by default.
+    :param rateLimiter:
+        A RateLimiter pacing requests before they are sent, retries included.
+        Requests are not limited by default.
+    :param hooks:
+        A list of RequestHook called before each request, after each response
+        and on errors, such as a MetricsCollector.
+    :param responseCache:
+        A ResponseCache keeping the GET responses of resources that rarely
+        change. Responses are not cached by default.
+    :param singleFlight:
+        A SingleFlight sharing one request between identical GETs made at the
+        same time. Requests are not shared by default.
+    :param encryptionProcesses:
+        The number of processes encrypting requests and decrypting responses
+        when encryptionData is set. Encryption runs in the calling thread by
+        default.
+    :param codec:
+        The codec encoding request bodies and decoding response bodies, such
+        as a JsonCodec, or its name: ``json`` or ``orjson``. Defaults to
+        orjson when it is installed, and to the json module otherwise.
+    :param timeout:
+        The seconds to wait for a connection and for the response, as a
+        number or a ``(connect, read)`` tuple. None waits indefinitely. Use
+        ``hyperwallet.utils.Timeout`` to override it for some calls, and
+        ``hyperwallet.utils.Deadline`` to bound a group of calls. Defaults to
+        10 seconds to connect and 60 seconds to read.
+    :param hedgePolicy:
+        A HedgePolicy sending a second copy of GET requests slower than
+        usual and using the first response. Requests are not hedged by
+        default.
+    :param circuitBreaker:
+        A CircuitBreaker failing requests fast, with a CIRCUIT_OPEN error,
+        on endpoints that keep failing. Requests are always sent by default.
+    :param http2:
+        Send requests over HTTP/2, which multiplexes concurrent requests
+        over up to ``maxConnections`` connections. Requires the ``http2``
+        extra.
+    '''
+
+    def __init__(self,
+                 username,
+                 password,
+                 server,
+                 encryptionData=None,
+                 maxConnections=100,
+                 executor=None,
+                 retryPolicy=None,
+                 rateLimiter=None,
+                 hooks=None,
+                 responseCache=None,
+                 singleFlight=None,
+                 encryptionProcesses=None,
+                 codec=None,
+                 timeout=(10, 60),
+                 hedgePolicy=None,
+                 circuitBreaker=None,
+                 http2=False):
+        '''
+        Create an instance of the asyncio API client.
+        '''
+
+        if httpx is None:
+            raise HyperwalletException('httpx is required to use the asyncio client')
+
+        self.maxConnections = maxConnections
+        self.executor = executor
+
+        super(AsyncApiClient, self).__init__(
+            username,
+            password,
+            server,
+            encryptionData,
+            retryPolicy=retryPolicy,
+            rateLimiter=rateLimiter,
+            hooks=hooks,
+            responseCache=responseCache,
+            singleFlight=singleFlight,
+            encryptionProcesses=encryptionProcesses,
+            codec=codec,
+            timeout=timeout,
+            hedgePolicy=hedgePolicy,
+            circuitBreaker=circuitBreaker,
+            http2=http2
+        )
+
+    def _createSession(self):
+        '''
+        Create the connection pool used to send requests.
+
+        :returns:
+            An ``httpx.AsyncClient`` persisting authentication settings.
+        '''
+
+        options = {}
+        if self.http2:
+            from hyperwallet.utils.http2 import http2Options
+            options = http2Options(self.server)
+
+        return httpx.AsyncClient(
+            auth=(self.username, self.password),
+            headers=self.baseHeaders,
+            limits=httpx.Limits(
+                max_connections=self.maxConnections,
+                max_keepalive_connections=self.maxConnections
+            ),
+            **options
+        )
+
+    async def _makeRequest(self,
+                           method=None,
+                           url=None,
+                           data=None,
+                           headers=None,
+                           params=None,
+                           files=None,
+                           idempotent=None):
+        '''
+        Process an API response to ensure a JSON object is returned always.
+
+        :param method:
+            The HTTP method to use for the request. **REQUIRED**
+        :param url:
+            A partial URL to specify the API endpoint. **REQUIRED**
+        :param data:
+            A dictionary containing data for the request body.
+        :param headers:
+            A dictionary containing additional request headers.
+        :param params:
+            A dictionary containing query parameters.
+        :param idempotent:
+            True if the request can be sent more than once without side effects.
+        :returns:
+            A JSON object containing the response data or an error object.
+        '''
+
+        event = RequestEvent(method, url)
+
+        try:
+            content = await self._sendRequest(event, method, url, data, headers, params, files, idempotent)
+        except Exception as e:
+            event.finish(e)
+            self._recordCircuit(event)
+            self._emit('onError', event)
+            raise
+
+        event.finish()
+        self._recordCircuit(event)
+        self._emit('afterResponse', event)
+
+        return content
+
+    async def _sendRequest(self, event, method, url, data, headers, params, files, idempotent):
+        '''
+        Encrypt, send and parse a request, recording its timings in the event.
+
+        :returns:
+            A JSON object containing the response data.
+        '''
+
+        if data is not None and self.encrypted:
+            with event.measure('encryptionTime'):
+                data = await self._offload(self.encryption.encrypt, data)
+
+        event.bytesSent = len(data) if data and not files else 0
+        self._emit('beforeRequest', event)
+
+        (cacheKey, cached) = self._cacheLookup(event, method, url, params)
+        if cached is not None:
+            if cached.fresh:
+                return self.responseCache.content(cached)
+            headers = dict(headers or {}, **cached.conditionalHeaders())
+
+        if params:
+            params = dict((key, value) for (key, value) in params.items() if value is not None)
+
+        body = {'data': data, 'files': files} if files else {'content': data}
+
+        if self.circuitBreaker is not None:
+            self.circuitBreaker.acquire(event)
+
+        if self.retryPolicy is not None:
+            self.retryPolicy.recordRequest()
+
+        attempt = 0
+
+        while True:
+            attempt += 1
+            event.attempts = attempt
+
+            wait = self._throttle(method, url)
+            if wait > 0:
+                checkDelay(wait)
+                await asyncio.sleep(wait)
+
+            (connect, read) = requestTimeout(self.timeout)
+
+            try:
+                with event.measure('networkTime'):
+                    response = await self._send(event, functools.partial(
+                        self.session.request,
+                        method=method,
+                        url=urljoin(self.baseUrl, url),
+                        headers=headers or None,
+                        params=params or None,
+                        timeout=httpx.Timeout(read, connect=connect, pool=connect),
+                        **body
+                    ))
+            except Exception as e:
+                delay = self._retryDelay(method, attempt, idempotent, files)
+                if delay is None:
+                    # The request failed to connect
+                    raise self._communicationError(e)
+                checkDelay(delay)
+                await asyncio.sleep(delay)
+                continue
+
+            delay = self._retryDelay(method, attempt, idempotent, files, response)
+            if delay is None:
+                break
+            checkDelay(delay)
+            await asyncio.sleep(delay)
+
+        event.status = response.status_code
+
+        if self.responseCache is not None and method != 'GET':
+            self.responseCache.invalidate(url)
+
+        if response.status_code == 304 and cached is not None:
+            event.cache = 'revalidated'
+            return self.responseCache.revalidated(cacheKey, cached)
+
+        if response.status_code == 204:
+            return {}
+
+        content = self._readResponse(response)
+        event.bytesReceived = len(response.content)
+
+        if self.encrypted:
+            with event.measure('encryptionTime'):
+                content = await self._offload(self.encryption.decrypt, content)
+
+        with event.measure('decodeTime'):
+            content = self._parseResponse(content)
+
+        if cacheKey is not None:
+            self.responseCache.store(cacheKey, url, content, response.headers)
+
+        return content
+
+    async def _send(self, event, request):
+        '''
+        Send an attempt, hedged when a HedgePolicy is set and the request is a GET.
+
+        :param event:
+            The RequestEvent of the request. **REQUIRED**
+        :param request:
+            Callable returning the coroutine sending the attempt. **REQUIRED**
+        :returns:
+            The response.
+        '''
+
+        if self.hedgePolicy is None or event.method != 'GET':
+            return await request()
+
+        return await self.hedgePolicy.doAsync(event, request)
+
+    async def doGet(self, partialUrl, params={}):
+        '''
+        Submit a GET to the API.
+
+        :param partialUrl:
+            A partial URL to specify the API endpoint. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :returns:
+            The API response.
+        '''
+
+        if self.singleFlight is None:
+            return await self._makeRequest(
+                method='GET',
+                url=partialUrl,
+                params=params
+            )
+
+        return await self.singleFlight.doAsync(
+            requestKey('{}@{}'.format(self.username, self.server), partialUrl, params),
+            lambda: self._makeRequest(method='GET', url=partialUrl, params=params)
+        )
+
+    async def _offload(self, function, *args):
+        '''
+        Run a CPU bound function outside of the event loop.
+
+        :param function:
+            The function to run. **REQUIRED**
+        :returns:
+            The result of the function.
+        '''
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    async def close(self):
+        '''
+        Close every connection of the pool, and stop the processes started
+        for ``encryptionProcesses``.
+        '''
+
+        await self.session.aclose()
+
+        if hasattr(self.encryption, 'close'):
+            # Waiting for the processes to exit must not block the event loop.
+            await self._offload(self.encryption.close)
+
+    def __enter__(self):
+        raise TypeError('AsyncApiClient must be used with async with')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
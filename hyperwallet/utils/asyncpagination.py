@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+import asyncio
+
+from hyperwallet.utils.columnar import ColumnarBatch
+from hyperwallet.utils.pagination import PageIterator
+
+
+class AsyncPageIterator(PageIterator):
+    '''
+    An asynchronous iterator over every item of a paginated list endpoint.
+
+    Accepts the same parameters as PageIterator, ``fetchPage`` being a
+    coroutine function. Use it with ``async for``.
+    '''
+
+    def __iter__(self):
+        raise TypeError('AsyncPageIterator must be used with async for')
+
+    async def __aiter__(self):
+        '''
+        Iterate over the models of every page.
+        '''
+
+        async for page in self.pages():
+            for item in page:
+                yield item
+
+    async def pages(self):
+        '''
+        Iterate over the pages of the endpoint.
+
+        :returns:
+            An asynchronous generator of lists of models, one list per page.
+        '''
+
+        async for data in self.rawPages():
+            yield list(self.parse(data))
+
+    async def toColumns(self, columns):
+        '''
+        Read every page into typed columns, without building models.
+
+        :param columns:
+            An iterable of ``(name, columnClass)`` tuples, such as
+            ``columnar.RECEIPT_COLUMNS``. **REQUIRED**
+        :returns:
+            A ColumnarBatch.
+        '''
+
+        batch = ColumnarBatch(columns)
+
+        async for data in self.rawPages():
+            batch.extend(data)
+
+        return batch
+
+    async def rawPages(self):
+        '''
+        Iterate over the ``data`` arrays of the pages of the endpoint,
+        without building models.
+
+        :returns:
+            An asynchronous generator of lists of items, one list per page.
+        '''
+
+        params = dict(self.params)
+        params['limit'] = self.pageSize
+        params['offset'] = int(params.get('offset') or 0)
+
+        pending = None
+
+        try:
+            request = (self.partialUrl, params)
+
+            response = await self.fetchPage(*request)
+
+            while True:
+                data = response.get('data') or []
+                request = self._nextRequest(response, request[1], len(data))
+
+                # Start retrieving the next page before handing this one over.
+                if self.prefetch and request:
+                    pending = asyncio.ensure_future(self.fetchPage(*request))
+
+                yield data
+
+                if request is None:
+                    return
+
+                response = await pending if pending else await self.fetchPage(*request)
+                pending = None
+        finally:
+            if pending is not None:
+                pending.cancel()
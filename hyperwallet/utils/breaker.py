@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+
+import collections
+import threading
+import time
+
+from hyperwallet.exceptions import HyperwalletAPIException
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+def circuitOpen(endpoint, retryIn=None):
+    '''
+    Build the exception raised when a request is rejected by an open circuit.
+
+    :param endpoint:
+        The method and URL template of the request. **REQUIRED**
+    :param retryIn:
+        The seconds before probe requests are allowed, None while probes are in flight.
+    :returns:
+        A HyperwalletAPIException.
+    '''
+
+    if retryIn is None:
+        reason = 'until the probe requests complete'
+    else:
+        reason = 'for {:.1f} seconds'.format(retryIn)
+
+    return HyperwalletAPIException({
+        'errors': [{
+            'code': 'CIRCUIT_OPEN',
+            'message': 'Requests to {} are suspended {} after repeated failures'.format(endpoint, reason)
+        }]
+    })
+
+
+class _Circuit(object):
+
+    def __init__(self, windowSize):
+        self.state = CLOSED
+        self.outcomes = collections.deque(maxlen=windowSize)
+        self.failures = 0
+        self.openedOn = None
+        self.probes = 0
+        self.probeSuccesses = 0
+
+        self.opened = 0
+        self.rejected = 0
+
+    def add(self, failed):
+        if len(self.outcomes) == self.outcomes.maxlen:
+            self.failures -= self.outcomes[0]
+        self.outcomes.append(failed)
+        self.failures += failed
+
+    @property
+    def failureRate(self):
+        return float(self.failures) / len(self.outcomes) if self.outcomes else 0.0
+
+
+class CircuitBreaker(object):
+    '''
+    Stop sending requests to an endpoint that keeps failing, so that callers
+    fail fast instead of piling up on it while other endpoints stay usable.
+
+    Endpoints are keyed by method and URL template, such as
+    ``GET users/{token}/receipts``. A request fails when the API cannot be
+    reached, answers with a 5xx status, or, with ``slowCallDuration``, takes
+    longer than that on the network. Once the failure rate of the last
+    ``windowSize`` requests reaches ``failureRate``, the circuit opens: its
+    requests fail with a CIRCUIT_OPEN error without being sent. After
+    ``openFor`` seconds, up to ``probes`` requests are let through; the
+    circuit closes if they all succeed and opens again otherwise.
+
+    :param failureRate:
+        The fraction of failed requests opening the circuit.
+    :param minRequests:
+        The number of requests recorded before the circuit may open.
+    :param windowSize:
+        The number of recent requests the failure rate is computed on.
+    :param slowCallDuration:
+        The network time in seconds above which a request counts as failed.
+        Slow requests are not failures by default.
+    :param openFor:
+        The seconds an open circuit rejects requests before probing.
+    :param probes:
+        The number of probe requests deciding if the circuit closes.
+    '''
+
+    def __init__(self,
+                 failureRate=0.5,
+                 minRequests=20,
+                 windowSize=100,
+                 slowCallDuration=None,
+                 openFor=30.0,
+                 probes=3):
+        self.failureRate = failureRate
+        self.minRequests = minRequests
+        self.windowSize = windowSize
+        self.slowCallDuration = slowCallDuration
+        self.openFor = openFor
+        self.probes = probes
+
+        self.__circuits = {}
+        self.__lock = threading.Lock()
+
+    def acquire(self, event):
+        '''
+        Allow a request to be sent, recording the state of its circuit in
+        ``event.circuit``.
+
+        :param event:
+            The RequestEvent of the request. **REQUIRED**
+        :raises HyperwalletAPIException:
+            With the CIRCUIT_OPEN code if the circuit is open.
+        '''
+
+        with self.__lock:
+            circuit = self.__circuit(event.endpoint)
+
+            if circuit.state == OPEN:
+                elapsed = time.monotonic() - circuit.openedOn
+                if elapsed < self.openFor:
+                    circuit.rejected += 1
+                    raise circuitOpen(event.endpoint, self.openFor - elapsed)
+
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+                circuit.probeSuccesses = 0
+
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.probes:
+                    circuit.rejected += 1
+                    raise circuitOpen(event.endpoint)
+                circuit.probes += 1
+
+            event.circuit = circuit.state
+
+    def record(self, event):
+        '''
+        Record the outcome of a finished request, updating ``event.circuit``
+        to the state of its circuit.
+
+        :param event:
+            The RequestEvent of a request allowed by ``acquire``. **REQUIRED**
+        '''
+
+        if event.circuit is None:
+            return
+
+        failed = self.failed(event)
+
+        with self.__lock:
+            circuit = self.__circuit(event.endpoint)
+
+            if circuit.state == HALF_OPEN and event.circuit == HALF_OPEN:
+                if failed:
+                    self.__open(circuit)
+                elif failed is None:
+                    # The probe was not sent; let another request probe.
+                    circuit.probes -= 1
+                else:
+                    circuit.probeSuccesses += 1
+                    if circuit.probeSuccesses >= self.probes:
+                        circuit.state = CLOSED
+                        circuit.outcomes.clear()
+                        circuit.failures = 0
+
+            elif circuit.state == CLOSED and failed is not None:
+                circuit.add(failed)
+                if len(circuit.outcomes) >= self.minRequests and circuit.failureRate >= self.failureRate:
+                    self.__open(circuit)
+
+            event.circuit = circuit.state
+
+    def failed(self, event):
+        '''
+        Decide if a finished request counts as a failure of its endpoint.
+
+        :param event:
+            The RequestEvent of the request. **REQUIRED**
+        :returns:
+            True or False, or None if the request was not sent.
+        '''
+
+        # Requests stopped before being sent, such as by their deadline, say
+        # nothing about the endpoint.
+        if not event.networkTime:
+            return None
+
+        if event.status is None:
+            return event.error is not None
+
+        if event.status >= 500:
+            return True
+
+        return self.slowCallDuration is not None and event.networkTime > self.slowCallDuration
+
+    def state(self, endpoint):
+        '''
+        Retrieve the state of the circuit of an endpoint.
+
+        :param endpoint:
+            The method and URL template, such as ``GET users/{token}``. **REQUIRED**
+        :returns:
+            ``closed``, ``open`` or ``half-open``.
+        '''
+
+        with self.__lock:
+            circuit = self.__circuits.get(endpoint)
+
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and time.monotonic() - circuit.openedOn >= self.openFor:
+                return HALF_OPEN
+            return circuit.state
+
+    def stats(self):
+        '''
+        Report the circuits of every endpoint.
+
+        :returns:
+            A dictionary keyed by endpoint of dictionaries with the state, the
+            failure rate, the number of requests in the window, and the number
+            of times the circuit opened and of requests rejected.
+        '''
+
+        with self.__lock:
+            endpoints = list(self.__circuits)
+
+        result = {}
+
+        for endpoint in endpoints:
+            state = self.state(endpoint)
+
+            with self.__lock:
+                circuit = self.__circuits[endpoint]
+                result[endpoint] = {
+                    'state': state,
+                    'failureRate': circuit.failureRate,
+                    'requests': len(circuit.outcomes),
+                    'opened': circuit.opened,
+                    'rejected': circuit.rejected
+                }
+
+        return result
+
+    def reset(self):
+        '''
+        Close every circuit.
+        '''
+
+        with self.__lock:
+            self.__circuits = {}
+
+    def __circuit(self, endpoint):
+        circuit = self.__circuits.get(endpoint)
+        if circuit is None:
+            circuit = self.__circuits[endpoint] = _Circuit(self.windowSize)
+        return circuit
+
+    def __open(self, circuit):
+        circuit.state = OPEN
+        circuit.openedOn = time.monotonic()
+        circuit.opened += 1
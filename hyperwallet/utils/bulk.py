@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+
+import math
+import threading
+import time
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from hyperwallet.exceptions import HyperwalletAPIException
+from hyperwallet.utils.deadline import checkDeadline, checkDelay, submit
+
+
+def errorCode(error):
+    '''
+    Extract the error code of an exception raised by the SDK.
+
+    :param error:
+        The exception. **REQUIRED**
+    :returns:
+        The code of the first API error, or the exception class name.
+    '''
+
+    message = error.args[0] if error.args else None
+
+    if isinstance(message, dict):
+        errors = message.get('errors') or [{}]
+        return errors[0].get('code') or type(error).__name__
+
+    return type(error).__name__
+
+
+def isCommunicationError(error):
+    '''
+    Check if an exception is a failure to reach the API.
+
+    :param error:
+        The exception. **REQUIRED**
+    '''
+
+    return isinstance(error, HyperwalletAPIException) and errorCode(error) == 'COMMUNICATION_ERROR'
+
+
+class BulkResult(object):
+    '''
+    The outcome of one item of a bulk submission.
+
+    :param index:
+        The position of the item in the submitted iterable. **REQUIRED**
+    :param data:
+        The submitted item. **REQUIRED**
+    '''
+
+    def __init__(self, index, data):
+        self.index = index
+        self.data = data
+        self.result = None
+        self.error = None
+        self.attempts = 0
+        self.latency = None
+        self.recovered = False
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+    @property
+    def errorCode(self):
+        return None if self.error is None else errorCode(self.error)
+
+    def __repr__(self):
+        return "BulkResult({index}, {status})".format(
+            index=self.index,
+            status='OK' if self.succeeded else self.errorCode
+        )
+
+
+class BulkSummary(object):
+    '''
+    Aggregated statistics of a bulk submission.
+
+    :param latencies:
+        The latencies, in seconds, of every item. **REQUIRED**
+    :param failuresByCode:
+        A dictionary counting failed items by error code. **REQUIRED**
+    :param elapsed:
+        The wall clock duration of the submission in seconds. **REQUIRED**
+    '''
+
+    def __init__(self, latencies, failuresByCode, elapsed):
+        self.total = len(latencies)
+        self.failed = sum(failuresByCode.values())
+        self.succeeded = self.total - self.failed
+        self.failuresByCode = dict(failuresByCode)
+        self.elapsed = elapsed
+        self.throughput = self.total / elapsed if elapsed > 0 else 0.0
+
+        latencies = sorted(latencies)
+        self.latencyP50 = self.__percentile(latencies, 50)
+        self.latencyP99 = self.__percentile(latencies, 99)
+
+    def __percentile(self, values, percentile):
+        '''
+        Nearest-rank percentile of sorted values.
+        '''
+
+        if not values:
+            return None
+
+        rank = int(math.ceil(percentile / 100.0 * len(values))) - 1
+        return values[max(0, min(rank, len(values) - 1))]
+
+    def asDict(self):
+        '''
+        Return a dictionary representation of the summary.
+        '''
+
+        return {
+            'total': self.total,
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'failuresByCode': self.failuresByCode,
+            'elapsed': self.elapsed,
+            'throughput': self.throughput,
+            'latencyP50': self.latencyP50,
+            'latencyP99': self.latencyP99
+        }
+
+    def __repr__(self):
+        return "BulkSummary({succeeded}/{total}, {throughput:.1f}/s)".format(
+            succeeded=self.succeeded,
+            total=self.total,
+            throughput=self.throughput
+        )
+
+
+class BulkSubmitter(object):
+    '''
+    Submit many items concurrently, yielding a BulkResult per item as soon as
+    it completes. At most twice ``maxWorkers`` items are held in memory, so
+    the iterable can be arbitrarily large.
+
+    When run in a Deadline, the items not sent before it is exceeded fail
+    with a DEADLINE_EXCEEDED error.
+
+    :param submit:
+        Callable sending one item to the API and returning its model. **REQUIRED**
+    :param items:
+        An iterable of items to submit. **REQUIRED**
+    :param maxWorkers:
+        The number of items submitted concurrently.
+    :param rateLimit:
+        The maximum number of requests started per second.
+    :param maxAttempts:
+        The number of times an item is sent when the API cannot be reached.
+    :param recover:
+        Callable called with an item before it is sent again, returning the
+        model created by a previous attempt or None.
+    :param retryable:
+        Callable deciding if an exception allows the item to be sent again.
+        Defaults to communication errors.
+    '''
+
+    def __init__(self,
+                 submit,
+                 items,
+                 maxWorkers=8,
+                 rateLimit=None,
+                 maxAttempts=3,
+                 recover=None,
+                 retryable=isCommunicationError):
+        self.submit = submit
+        self.items = items
+        self.maxWorkers = maxWorkers
+        self.rateLimit = rateLimit
+        self.maxAttempts = max(1, maxAttempts)
+        self.recover = recover
+        self.retryable = retryable
+
+        self.summary = None
+
+        self.__latencies = []
+        self.__failures = Counter()
+        self.__nextStart = 0.0
+        self.__lock = threading.Lock()
+
+    def __iter__(self):
+        '''
+        Run the submission.
+
+        :returns:
+            A generator of BulkResult in completion order. The summary is
+            available once it is exhausted.
+        '''
+
+        started = time.time()
+        executor = ThreadPoolExecutor(max_workers=self.maxWorkers)
+        pending = set()
+
+        try:
+            for (index, item) in enumerate(self.items):
+                pending.add(submit(executor, self.__process, BulkResult(index, item)))
+
+                if len(pending) >= self.maxWorkers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield self.__record(future.result())
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield self.__record(future.result())
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+            self.summary = BulkSummary(self.__latencies, self.__failures, time.time() - started)
+
+    def run(self):
+        '''
+        Run the submission to completion.
+
+        :returns:
+            A list of BulkResult ordered like the submitted items.
+        '''
+
+        return sorted(self, key=lambda result: result.index)
+
+    def __record(self, result):
+        self.__latencies.append(result.latency)
+        if not result.succeeded:
+            self.__failures[result.errorCode] += 1
+
+        return result
+
+    def __process(self, result):
+        '''
+        Send one item, retrying while the API cannot be reached.
+        '''
+
+        started = time.time()
+
+        while True:
+            result.attempts += 1
+
+            try:
+                # Items left once the deadline is exceeded are not sent.
+                checkDeadline()
+
+                if result.attempts > 1 and self.recover is not None:
+                    previous = self.recover(result.data)
+                    if previous is not None:
+                        result.result = previous
+                        result.recovered = True
+                        result.error = None
+                        break
+
+                self.__throttle()
+                result.result = self.submit(result.data)
+                result.error = None
+                break
+            except Exception as e:
+                result.error = e
+                if result.attempts >= self.maxAttempts or not self.retryable(e):
+                    break
+
+        result.latency = time.time() - started
+        return result
+
+    def __throttle(self):
+        '''
+        Delay the calling thread to honour the rate limit.
+        '''
+
+        if not self.rateLimit:
+            return
+
+        with self.__lock:
+            now = time.time()
+            start = max(now, self.__nextStart)
+            self.__nextStart = start + 1.0 / self.rateLimit
+
+        if start > now:
+            checkDelay(start - now)
+            time.sleep(start - now)
@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+
+import collections
+import copy
+import threading
+import time
+
+from hyperwallet.utils.instrumentation import urlTemplate
+from hyperwallet.utils.singleflight import requestKey
+
+# Resources that rarely change, with the number of seconds they are kept.
+DEFAULT_TTLS = {
+    'programs/{token}': 3600,
+    'programs/{token}/accounts/{token}': 300,
+    'transfer-method-configurations': 3600
+}
+
+
+class CacheEntry(object):
+    '''
+    A response kept in a ResponseCache.
+
+    :param url:
+        The partial URL of the request. **REQUIRED**
+    :param content:
+        The parsed response. **REQUIRED**
+    :param ttl:
+        The number of seconds the response is fresh. **REQUIRED**
+    :param etag:
+        The ETag header of the response.
+    :param lastModified:
+        The Last-Modified header of the response.
+    '''
+
+    __slots__ = ('url', 'content', 'ttl', 'expiresOn', 'etag', 'lastModified')
+
+    def __init__(self, url, content, ttl, etag=None, lastModified=None):
+        self.url = url
+        self.content = content
+        self.ttl = ttl
+        self.expiresOn = time.monotonic() + ttl
+        self.etag = etag
+        self.lastModified = lastModified
+
+    @property
+    def fresh(self):
+        return time.monotonic() < self.expiresOn
+
+    def conditionalHeaders(self):
+        '''
+        The headers asking the server to answer 304 if the response is unchanged.
+
+        :returns:
+            A dictionary, empty if the response had no validators.
+        '''
+
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.lastModified:
+            headers['If-Modified-Since'] = self.lastModified
+        return headers
+
+
+class ResponseCache(object):
+    '''
+    An in-memory LRU cache of GET responses, for resources that rarely change.
+
+    Responses are kept for the TTL of their resource, found by URL template.
+    Once expired, a response with an ``ETag`` or ``Last-Modified`` header is
+    revalidated with a conditional request instead of being downloaded again.
+    A POST or PUT to a URL invalidates the responses cached for it and below it.
+
+    :param ttls:
+        A dictionary of TTLs in seconds keyed by URL template, such as
+        ``programs/{token}``. Defaults to DEFAULT_TTLS.
+    :param defaultTtl:
+        The TTL of the resources missing from ``ttls``; 0 to not cache them.
+    :param maxEntries:
+        The number of responses kept, the least recently used being evicted.
+    '''
+
+    def __init__(self, ttls=None, defaultTtl=0, maxEntries=1000):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.defaultTtl = defaultTtl
+        self.maxEntries = maxEntries
+
+        self.__entries = collections.OrderedDict()
+        self.__lock = threading.Lock()
+        self.__counters = collections.Counter()
+
+    def ttl(self, url):
+        '''
+        The TTL of a partial URL, in seconds.
+        '''
+
+        return self.ttls.get(urlTemplate(url), self.defaultTtl)
+
+    def key(self, credential, url, params):
+        '''
+        Build the key of a request.
+
+        :param credential:
+            Identifies the API user, as cached responses must not be shared
+            between users. **REQUIRED**
+        :param url:
+            The partial URL of the request. **REQUIRED**
+        :param params:
+            A dictionary containing query parameters.
+        :returns:
+            A string, or None if the URL is not cached.
+        '''
+
+        if self.ttl(url) <= 0:
+            return None
+
+        return requestKey(credential, url, params)
+
+    def lookup(self, key):
+        '''
+        Retrieve the entry of a request, counting a hit if it is fresh.
+
+        :param key:
+            The key of the request. **REQUIRED**
+        :returns:
+            A CacheEntry, fresh or revalidatable, or None.
+        '''
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is not None and not entry.fresh and not (entry.etag or entry.lastModified):
+                del self.__entries[key]
+                entry = None
+
+            if entry is None:
+                self.__counters['misses'] += 1
+                return None
+
+            self.__entries.move_to_end(key)
+
+            if entry.fresh:
+                self.__counters['hits'] += 1
+            else:
+                self.__counters['stale'] += 1
+
+            return entry
+
+    def content(self, entry):
+        '''
+        A copy of the response of an entry, safe to modify.
+        '''
+
+        return copy.deepcopy(entry.content)
+
+    def revalidated(self, key, entry):
+        '''
+        Keep an entry for another TTL after the server answered 304.
+
+        :returns:
+            A copy of the response of the entry.
+        '''
+
+        with self.__lock:
+            entry.expiresOn = time.monotonic() + entry.ttl
+            self.__counters['revalidated'] += 1
+
+        return self.content(entry)
+
+    def store(self, key, url, content, headers):
+        '''
+        Keep a response.
+
+        :param key:
+            The key of the request. **REQUIRED**
+        :param url:
+            The partial URL of the request. **REQUIRED**
+        :param content:
+            The parsed response. **REQUIRED**
+        :param headers:
+            The headers of the response. **REQUIRED**
+        '''
+
+        if 'no-store' in (headers.get('Cache-Control') or ''):
+            return
+
+        entry = CacheEntry(
+            url.strip('/'),
+            copy.deepcopy(content),
+            self.ttl(url),
+            headers.get('ETag'),
+            headers.get('Last-Modified')
+        )
+
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            self.__counters['stores'] += 1
+
+            while len(self.__entries) > self.maxEntries:
+                self.__entries.popitem(last=False)
+                self.__counters['evictions'] += 1
+
+    def invalidate(self, url=None):
+        '''
+        Drop the responses of a partial URL and of the URLs below it.
+
+        :param url:
+            A partial URL, such as ``programs/prg-123``. Every response is
+            dropped if omitted.
+        :returns:
+            The number of responses dropped.
+        '''
+
+        with self.__lock:
+            if url is None:
+                keys = list(self.__entries)
+            else:
+                url = url.strip('/')
+                keys = [
+                    key for (key, entry) in self.__entries.items()
+                    if entry.url == url or entry.url.startswith(url + '/')
+                ]
+
+            for key in keys:
+                del self.__entries[key]
+
+            self.__counters['invalidations'] += len(keys)
+
+        return len(keys)
+
+    def clear(self):
+        '''
+        Drop every response.
+        '''
+
+        return self.invalidate()
+
+    def stats(self):
+        '''
+        Report the use of the cache.
+
+        :returns:
+            A dictionary with the number of entries, hits, misses, stale
+            lookups, revalidated responses, stores, evictions, invalidations
+            and the hit ratio.
+        '''
+
+        with self.__lock:
+            stats = dict((name, self.__counters[name]) for name in (
+                'hits', 'misses', 'stale', 'revalidated', 'stores', 'evictions', 'invalidations'
+            ))
+            stats['entries'] = len(self.__entries)
+
+        lookups = stats['hits'] + stats['misses'] + stats['stale']
+        stats['hitRatio'] = float(stats['hits'] + stats['revalidated']) / lookups if lookups else 0.0
+
+        return stats
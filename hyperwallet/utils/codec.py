@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+import json
+
+from hyperwallet.exceptions import HyperwalletException
+
+
+class JsonCodec(object):
+    '''
+    Encode request bodies and decode response bodies with the standard
+    library ``json`` module.
+
+    Codecs work on bytes: requests are sent as encoded, and responses are
+    decoded straight from the bytes received, without building an
+    intermediate string.
+    '''
+
+    name = 'json'
+
+    def dumps(self, data):
+        '''
+        Encode data as JSON.
+
+        :param data:
+            The data to encode. **REQUIRED**
+        :returns:
+            The UTF-8 encoded JSON, as bytes.
+        '''
+
+        return json.dumps(data).encode('utf-8')
+
+    def loads(self, content):
+        '''
+        Decode JSON.
+
+        :param content:
+            The JSON, as bytes or string. **REQUIRED**
+        :returns:
+            The decoded data.
+        :raises ValueError:
+            If the content is not valid JSON.
+        '''
+
+        return json.loads(content)
+
+
+class OrjsonCodec(JsonCodec):
+    '''
+    Encode and decode JSON with ``orjson``, which is several times faster
+    than the standard library on API pages.
+    '''
+
+    name = 'orjson'
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError:
+            raise HyperwalletException('orjson is required to use the orjson codec')
+
+        self.orjson = orjson
+
+    def dumps(self, data):
+        # Keys such as integers are turned into strings, as json does.
+        return self.orjson.dumps(data, option=self.orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, content):
+        return self.orjson.loads(content)
+
+
+CODECS = {
+    'json': JsonCodec,
+    'orjson': OrjsonCodec
+}
+
+
+def defaultCodec():
+    '''
+    Select the fastest codec available.
+
+    :returns:
+        An OrjsonCodec when orjson is installed, a JsonCodec otherwise.
+    '''
+
+    try:
+        return OrjsonCodec()
+    except HyperwalletException:
+        return JsonCodec()
@@ -0,0 +1,491 @@
+#!/usr/bin/env python
+
+import calendar
+import re
+
+from array import array
+from decimal import Decimal
+
+from hyperwallet.exceptions import HyperwalletException
+
+# Marks a missing amount or timestamp, like the NaT value of NumPy.
+MISSING = -2 ** 63
+
+# A decimal amount, such as ``12.34``, ``-0.5`` or ``100``.
+DECIMAL = re.compile(r'^[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)$')
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise HyperwalletException('numpy is required to convert columns to arrays')
+    return numpy
+
+
+class Column(object):
+    '''
+    The base class of the columns of a ColumnarBatch.
+
+    :param name:
+        The name of the field stored in the column. **REQUIRED**
+    '''
+
+    def __init__(self, name):
+        self.name = name
+
+    def __len__(self):
+        return len(self.data)
+
+    def mask(self, predicate):
+        '''
+        Evaluate a predicate on every value of the column.
+
+        :param predicate:
+            Callable taking a decoded value. **REQUIRED**
+        :returns:
+            A bytearray holding 1 for the rows matching the predicate.
+        '''
+
+        return bytearray(1 if predicate(value) else 0 for value in self.values())
+
+    def take(self, indices):
+        '''
+        Build a column holding the rows at the given indices.
+
+        :param indices:
+            A list of row indices. **REQUIRED**
+        '''
+
+        column = self._empty()
+        data = self.data
+        column.data.extend(data[index] for index in indices)
+        return column
+
+
+class ScaledDecimalColumn(Column):
+    '''
+    Decimal amounts stored as 64-bit integers scaled by ``10 ** scale``, so
+    that sums are exact integer additions.
+
+    :param name:
+        The name of the field stored in the column. **REQUIRED**
+    :param scale:
+        The number of decimal places kept.
+    '''
+
+    def __init__(self, name, scale=2):
+        super(ScaledDecimalColumn, self).__init__(name)
+
+        self.scale = scale
+        self.factor = 10 ** scale
+        self.data = array('q')
+
+    def extend(self, values):
+        '''
+        Append raw API values, such as ``'12.34'``.
+        '''
+
+        parse = self.parse
+        self.data.extend(parse(value) for value in values)
+
+    def parse(self, value):
+        '''
+        Scale a decimal string to an integer.
+
+        :param value:
+            The amount, as returned by the API. **REQUIRED**
+        :returns:
+            The scaled amount, or MISSING.
+        '''
+
+        if value is None or value == '':
+            return MISSING
+
+        if isinstance(value, int):
+            return value * self.factor
+
+        text = str(value)
+        if not DECIMAL.match(text):
+            raise HyperwalletException('Amount {} is not a decimal'.format(value))
+
+        negative = text.startswith('-')
+        (whole, _, fraction) = text.lstrip('+-').partition('.')
+
+        if len(fraction) > self.scale:
+            if fraction[self.scale:].strip('0'):
+                raise HyperwalletException('Amount {} has more than {} decimal places'.format(value, self.scale))
+            fraction = fraction[:self.scale]
+
+        scaled = int(whole or 0) * self.factor + int(fraction.ljust(self.scale, '0') or 0)
+
+        return -scaled if negative else scaled
+
+    def values(self):
+        '''
+        Iterate over the amounts as Decimals, None when missing.
+        '''
+
+        for value in self.data:
+            yield None if value == MISSING else self.toDecimal(value)
+
+    def toDecimal(self, value):
+        '''
+        Convert a scaled amount back to a Decimal.
+
+        :param value:
+            The scaled amount. **REQUIRED**
+        '''
+
+        return Decimal(value).scaleb(-self.scale).quantize(Decimal(1).scaleb(-self.scale))
+
+    def between(self, low=None, high=None):
+        '''
+        Select the amounts within a range, bounds included.
+
+        :param low:
+            The lowest amount, as a string, number or Decimal.
+        :param high:
+            The highest amount, as a string, number or Decimal.
+        :returns:
+            A bytearray mask.
+        '''
+
+        low = self.parse(str(low)) if low is not None else MISSING + 1
+        high = self.parse(str(high)) if high is not None else -MISSING - 1
+
+        return bytearray(1 if low <= value <= high else 0 for value in self.data)
+
+    def sum(self):
+        '''
+        The sum of the amounts, missing values excluded, as a Decimal.
+        '''
+
+        return self.toDecimal(sum(value for value in self.data if value != MISSING))
+
+    def toNumpy(self):
+        '''
+        A NumPy int64 array sharing the memory of the column.
+        '''
+
+        return _numpy().frombuffer(self.data, dtype='int64')
+
+    def _empty(self):
+        return ScaledDecimalColumn(self.name, self.scale)
+
+
+class TimestampColumn(Column):
+    '''
+    Timestamps stored as 64-bit integers counting seconds since the epoch.
+    API timestamps, such as ``2019-10-01T22:10:48``, are in UTC.
+
+    :param name:
+        The name of the field stored in the column. **REQUIRED**
+    '''
+
+    def __init__(self, name):
+        super(TimestampColumn, self).__init__(name)
+
+        self.data = array('q')
+        self.__days = {}
+
+    def extend(self, values):
+        '''
+        Append raw API values.
+        '''
+
+        parse = self.parse
+        self.data.extend(parse(value) for value in values)
+
+    def parse(self, value):
+        '''
+        Convert a timestamp to seconds since the epoch.
+
+        :param value:
+            The timestamp, as returned by the API. **REQUIRED**
+        :returns:
+            The number of seconds, or MISSING.
+        '''
+
+        if not value:
+            return MISSING
+
+        if isinstance(value, int):
+            return value
+
+        date = value[:10]
+
+        try:
+            day = self.__days.get(date)
+
+            if day is None:
+                day = self.__days[date] = calendar.timegm((int(date[0:4]), int(date[5:7]), int(date[8:10]), 0, 0, 0))
+
+            if len(value) < 19:
+                return day
+
+            return day + int(value[11:13]) * 3600 + int(value[14:16]) * 60 + int(value[17:19])
+        except ValueError:
+            raise HyperwalletException('Invalid timestamp {}'.format(value))
+
+    def values(self):
+        '''
+        Iterate over the timestamps as seconds since the epoch, None when missing.
+        '''
+
+        for value in self.data:
+            yield None if value == MISSING else value
+
+    def between(self, start=None, end=None):
+        '''
+        Select the timestamps within a range, bounds included.
+
+        :param start:
+            The earliest timestamp, as a string or seconds since the epoch.
+        :param end:
+            The latest timestamp, as a string or seconds since the epoch.
+        :returns:
+            A bytearray mask.
+        '''
+
+        start = self.parse(start) if start is not None else MISSING + 1
+        end = self.parse(end) if end is not None else -MISSING - 1
+
+        return bytearray(1 if start <= value <= end else 0 for value in self.data)
+
+    def toNumpy(self):
+        '''
+        A NumPy datetime64[s] array sharing the memory of the column.
+        '''
+
+        return _numpy().frombuffer(self.data, dtype='datetime64[s]')
+
+    def _empty(self):
+        return TimestampColumn(self.name)
+
+
+class CategoricalColumn(Column):
+    '''
+    Values from a small set, such as currencies or receipt types, stored as
+    32-bit codes indexing ``categories``. Missing values have the code -1.
+
+    :param name:
+        The name of the field stored in the column. **REQUIRED**
+    '''
+
+    def __init__(self, name):
+        super(CategoricalColumn, self).__init__(name)
+
+        self.data = array('i')
+        self.categories = []
+        self.codes = {}
+
+    def extend(self, values):
+        '''
+        Append raw API values.
+        '''
+
+        codes = self.codes
+        categories = self.categories
+        data = self.data
+
+        for value in values:
+            if value is None:
+                data.append(-1)
+                continue
+
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(categories)
+                categories.append(value)
+            data.append(code)
+
+    def values(self):
+        '''
+        Iterate over the values, None when missing.
+        '''
+
+        categories = self.categories
+        for code in self.data:
+            yield None if code < 0 else categories[code]
+
+    def isin(self, values):
+        '''
+        Select the rows holding one of the given values.
+
+        :param values:
+            A value or an iterable of values. **REQUIRED**
+        :returns:
+            A bytearray mask.
+        '''
+
+        if isinstance(values, str):
+            values = [values]
+
+        wanted = set(self.codes[value] for value in values if value in self.codes)
+
+        return bytearray(1 if code in wanted else 0 for code in self.data)
+
+    def take(self, indices):
+        column = super(CategoricalColumn, self).take(indices)
+        column.categories = list(self.categories)
+        column.codes = dict(self.codes)
+        return column
+
+    def toNumpy(self):
+        '''
+        A NumPy int32 array of the codes, sharing the memory of the column.
+        '''
+
+        return _numpy().frombuffer(self.data, dtype='int32')
+
+    def _empty(self):
+        return CategoricalColumn(self.name)
+
+
+class TextColumn(Column):
+    '''
+    Free text values, such as tokens, stored as a list.
+
+    :param name:
+        The name of the field stored in the column. **REQUIRED**
+    '''
+
+    def __init__(self, name):
+        super(TextColumn, self).__init__(name)
+
+        self.data = []
+
+    def extend(self, values):
+        '''
+        Append raw API values.
+        '''
+
+        self.data.extend(values)
+
+    def values(self):
+        '''
+        Iterate over the values.
+        '''
+
+        return iter(self.data)
+
+    def _empty(self):
+        return TextColumn(self.name)
+
+
+RECEIPT_COLUMNS = (
+    ('journalId', TextColumn),
+    ('type', CategoricalColumn),
+    ('entry', CategoricalColumn),
+    ('createdOn', TimestampColumn),
+    ('amount', ScaledDecimalColumn),
+    ('fee', ScaledDecimalColumn),
+    ('currency', CategoricalColumn),
+    ('sourceToken', TextColumn),
+    ('destinationToken', TextColumn)
+)
+
+PAYMENT_COLUMNS = (
+    ('token', TextColumn),
+    ('status', CategoricalColumn),
+    ('createdOn', TimestampColumn),
+    ('amount', ScaledDecimalColumn),
+    ('currency', CategoricalColumn),
+    ('clientPaymentId', TextColumn),
+    ('purpose', CategoricalColumn),
+    ('destinationToken', TextColumn),
+    ('programToken', CategoricalColumn)
+)
+
+
+class ColumnarBatch(object):
+    '''
+    List results decoded into one typed column per field, without building a
+    Model per row.
+
+    :param columns:
+        An iterable of ``(name, columnClass)`` tuples, such as RECEIPT_COLUMNS. **REQUIRED**
+    '''
+
+    def __init__(self, columns):
+        self.columns = dict((name, column(name)) for (name, column) in columns)
+        self.names = [name for (name, column) in columns]
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def extend(self, items):
+        '''
+        Append the items of a page.
+
+        :param items:
+            A list of dictionaries, the ``data`` array of a page. **REQUIRED**
+        '''
+
+        for name in self.names:
+            self.columns[name].extend([item.get(name) for item in items])
+
+        self.length += len(items)
+
+    def filter(self, *masks):
+        '''
+        Select the rows matching every mask.
+
+        :param masks:
+            Masks returned by the columns, such as
+            ``batch['currency'].isin(['USD'])``.
+        :returns:
+            A new ColumnarBatch.
+        '''
+
+        if masks:
+            indices = [index for (index, selected) in enumerate(zip(*masks)) if all(selected)]
+        else:
+            indices = range(self.length)
+
+        batch = ColumnarBatch(())
+        batch.names = list(self.names)
+        batch.columns = dict((name, self.columns[name].take(indices)) for name in self.names)
+        batch.length = len(indices)
+
+        return batch
+
+    def sumBy(self, value, key):
+        '''
+        Sum an amount column per value of another column.
+
+        :param value:
+            The name of a ScaledDecimalColumn, such as ``amount``. **REQUIRED**
+        :param key:
+            The name of a CategoricalColumn, such as ``currency``. **REQUIRED**
+        :returns:
+            A dictionary of Decimal sums keyed by the values of the key column.
+        '''
+
+        amounts = self.columns[value]
+        groups = self.columns[key]
+
+        totals = {}
+        for (code, amount) in zip(groups.data, amounts.data):
+            if code >= 0 and amount != MISSING:
+                totals[code] = totals.get(code, 0) + amount
+
+        return dict(
+            (groups.categories[code], amounts.toDecimal(total))
+            for (code, total) in totals.items()
+        )
+
+    def asDict(self):
+        '''
+        Return the decoded values of every column.
+
+        :returns:
+            A dictionary of lists keyed by column name.
+        '''
+
+        return dict((name, list(self.columns[name].values())) for name in self.names)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+import threading
+
+from requests_toolbelt.adapters.ssl import SSLAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.poolmanager import PoolManager
+
+
+class ConnectionPoolStats(object):
+    '''
+    Thread-safe counters of the connections used by an adapter.
+    '''
+
+    def __init__(self):
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.inUse = 0
+
+        self.__lock = threading.Lock()
+
+    def increment(self, name, value=1):
+        with self.__lock:
+            setattr(self, name, getattr(self, name) + value)
+
+
+class _CountingPoolMixin(object):
+    '''
+    Count the connections created, reused and discarded by a connection pool.
+    '''
+
+    stats = None
+
+    def _new_conn(self):
+        if self.stats is not None:
+            self.stats.increment('created')
+        return super(_CountingPoolMixin, self)._new_conn()
+
+    def _get_conn(self, timeout=None):
+        idle = self.pool is not None and self.pool.qsize() > 0 and self.pool.queue[-1] is not None
+        conn = super(_CountingPoolMixin, self)._get_conn(timeout=timeout)
+
+        if self.stats is not None:
+            self.stats.increment('inUse')
+            if idle:
+                self.stats.increment('reused')
+
+        return conn
+
+    def _put_conn(self, conn):
+        if self.stats is not None:
+            self.stats.increment('inUse', -1)
+            if self.pool is None or self.pool.full():
+                self.stats.increment('discarded')
+
+        return super(_CountingPoolMixin, self)._put_conn(conn)
+
+    def idleConnections(self):
+        '''
+        The number of open connections waiting in the pool.
+        '''
+
+        if self.pool is None:
+            return 0
+        return sum(1 for conn in list(self.pool.queue) if conn is not None)
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _CountingPoolManager(PoolManager):
+    '''
+    A PoolManager creating connection pools that report to ConnectionPoolStats.
+    '''
+
+    def __init__(self, stats, **kwargs):
+        super(_CountingPoolManager, self).__init__(**kwargs)
+
+        self.stats = stats
+        self.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super(_CountingPoolManager, self)._new_pool(scheme, host, port, request_context=request_context)
+        pool.stats = self.stats
+        return pool
+
+
+class PooledSSLAdapter(SSLAdapter):
+    '''
+    An SSLAdapter with configurable connection pools and socket options that
+    keeps statistics about its connections.
+
+    :param ssl_version:
+        The SSL/TLS version to negotiate.
+    :param socketOptions:
+        A list of ``(level, option, value)`` tuples set on every new socket,
+        in addition to the urllib3 defaults.
+    :param kwargs:
+        Keyword arguments of ``requests.adapters.HTTPAdapter`` such as
+        pool_connections, pool_maxsize and pool_block.
+    '''
+
+    __attrs__ = SSLAdapter.__attrs__ + ['socketOptions']
+
+    def __init__(self, ssl_version=None, socketOptions=None, **kwargs):
+        self.socketOptions = list(socketOptions or [])
+        self.stats = ConnectionPoolStats()
+
+        super(PooledSSLAdapter, self).__init__(ssl_version=ssl_version, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+
+        if self.socketOptions:
+            kwargs['socket_options'] = HTTPConnection.default_socket_options + self.socketOptions
+
+        self.poolmanager = _CountingPoolManager(
+            getattr(self, 'stats', None),
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            ssl_version=self.ssl_version,
+            **kwargs
+        )
+
+    def __setstate__(self, state):
+        self.stats = ConnectionPoolStats()
+        super(PooledSSLAdapter, self).__setstate__(state)
+
+    def poolStats(self):
+        '''
+        Retrieve the statistics of the connections of this adapter.
+
+        :returns:
+            A dictionary with the number of connections created, reused,
+            discarded because the pool was full, in use, idle and open.
+        '''
+
+        pools = self.poolmanager.pools
+        idle = 0
+
+        for key in pools.keys():
+            pool = pools.get(key)
+            if hasattr(pool, 'idleConnections'):
+                idle += pool.idleConnections()
+
+        return {
+            'created': self.stats.created,
+            'reused': self.stats.reused,
+            'discarded': self.stats.discarded,
+            'inUse': self.stats.inUse,
+            'idle': idle,
+            'open': idle + self.stats.inUse
+        }
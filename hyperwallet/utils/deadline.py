@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+
+import contextvars
+import time
+
+from hyperwallet.exceptions import HyperwalletAPIException
+
+_deadline = contextvars.ContextVar('hyperwallet.deadline', default=None)
+_timeout = contextvars.ContextVar('hyperwallet.timeout', default=None)
+
+
+class Deadline(object):
+    '''
+    A time budget shared by the requests made in a with block, including
+    their retries and the pages and bulk submissions started in it.
+
+    Each request waits at most the remaining time, and fails with a
+    DEADLINE_EXCEEDED error once the budget is spent; remaining bulk items
+    are then not sent. A nested deadline cannot extend the one enclosing it.
+
+    :param seconds:
+        The budget in seconds. **REQUIRED**
+    '''
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.expiresOn = None
+        self.__tokens = []
+
+    def __enter__(self):
+        self.expiresOn = time.monotonic() + self.seconds
+
+        parent = _deadline.get()
+        if parent is not None:
+            self.expiresOn = min(self.expiresOn, parent.expiresOn)
+
+        self.__tokens.append(_deadline.set(self))
+        return self
+
+    def __exit__(self, *args):
+        _deadline.reset(self.__tokens.pop())
+
+    def remaining(self):
+        '''
+        The seconds left before the deadline.
+        '''
+
+        return max(0.0, self.expiresOn - time.monotonic())
+
+    @property
+    def expired(self):
+        return self.remaining() <= 0
+
+    def check(self):
+        '''
+        Fail if the deadline is exceeded.
+
+        :returns:
+            The seconds left before the deadline.
+        '''
+
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise deadlineExceeded(self)
+
+        return remaining
+
+
+class Timeout(object):
+    '''
+    Override the timeouts of the requests made in a with block, such as for
+    a single slow call.
+
+    :param timeout:
+        The seconds to wait for a connection and for the response, as a
+        number or a ``(connect, read)`` tuple. None waits indefinitely. **REQUIRED**
+    '''
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.__tokens = []
+
+    def __enter__(self):
+        self.__tokens.append(_timeout.set(self))
+        return self
+
+    def __exit__(self, *args):
+        _timeout.reset(self.__tokens.pop())
+
+
+def deadlineExceeded(deadline):
+    '''
+    Build the exception raised when a deadline is exceeded.
+
+    :param deadline:
+        The exceeded Deadline. **REQUIRED**
+    :returns:
+        A HyperwalletAPIException.
+    '''
+
+    return HyperwalletAPIException({
+        'errors': [{
+            'code': 'DEADLINE_EXCEEDED',
+            'message': 'The deadline of {} seconds was exceeded'.format(deadline.seconds)
+        }]
+    })
+
+
+def currentDeadline():
+    '''
+    The Deadline of the calling context, or None.
+    '''
+
+    return _deadline.get()
+
+
+def checkDeadline():
+    '''
+    Fail if the deadline of the calling context is exceeded.
+    '''
+
+    deadline = _deadline.get()
+    if deadline is not None:
+        deadline.check()
+
+
+def checkDelay(seconds):
+    '''
+    Fail if waiting would exceed the deadline of the calling context, so
+    that no time is spent sleeping before an attempt that cannot be made.
+
+    :param seconds:
+        The delay before the next attempt. **REQUIRED**
+    '''
+
+    deadline = _deadline.get()
+    if deadline is not None and deadline.check() <= seconds:
+        raise deadlineExceeded(deadline)
+
+
+def requestTimeout(timeout):
+    '''
+    Work out the timeouts of a request, honouring the Timeout and the
+    Deadline of the calling context.
+
+    :param timeout:
+        The timeout of the client, as a number or a ``(connect, read)`` tuple. **REQUIRED**
+    :returns:
+        A ``(connect, read)`` tuple, where None waits indefinitely.
+    '''
+
+    override = _timeout.get()
+    if override is not None:
+        timeout = override.timeout
+
+    (connect, read) = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+
+    deadline = _deadline.get()
+    if deadline is not None:
+        remaining = deadline.check()
+        connect = remaining if connect is None else min(connect, remaining)
+        read = remaining if read is None else min(read, remaining)
+
+    return (connect, read)
+
+
+def submit(executor, function, *args):
+    '''
+    Submit a function to an executor, running it with the Deadline and
+    Timeout of the calling context.
+
+    :returns:
+        A Future.
+    '''
+
+    return executor.submit(contextvars.copy_context().run, function, *args)
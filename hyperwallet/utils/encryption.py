@@ -1,18 +1,216 @@
 #!/usr/bin/env python
 
 import os
+import inspect
 import json
+import multiprocessing
 import requests
 import time
 import sys
+import threading
 
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from jwcrypto import jwk, jws as cryptoJWS, jwe
+from jwcrypto.jwa import JWA
 from jwcrypto.common import json_encode, json_decode
 from jwcrypto.common import base64url_decode, base64url_encode
-from jose import jws
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse  # Python 2
 
 from hyperwallet.exceptions import HyperwalletException
-from six.moves.urllib.parse import urlparse
+
+
+# A JWK key parsed from a key set: ``data`` holds the JSON representation of
+# the key and ``key`` the ready-built ``jwk.JWK`` object.
+JwkKey = namedtuple('JwkKey', ['kid', 'algorithm', 'data', 'key'])
+
+
+class JwkKeySet(object):
+    '''
+    A parsed JWK key set, indexed by algorithm and key id.
+
+    :param keySet:
+        JSON representation of JWK key set. **REQUIRED**
+    '''
+
+    def __init__(self, keySet):
+        '''
+        Parse every key of the key set once.
+        '''
+
+        try:
+            data = json.loads(keySet)
+        except ValueError:
+            raise HyperwalletException('Wrong JWK key set ' + keySet)
+
+        self.loadedOn = time.time()
+        self.byAlgorithm = {}
+        self.byKid = {}
+
+        for keyData in data['keys']:
+            key = JwkKey(
+                kid=keyData.get('kid'),
+                algorithm=keyData.get('alg'),
+                data=keyData,
+                key=jwk.JWK(**keyData)
+            )
+
+            # The first key wins, like a linear scan of the key set would.
+            self.byAlgorithm.setdefault(key.algorithm, key)
+            if key.kid is not None:
+                self.byKid.setdefault(key.kid, key)
+
+
+class JwkKeySetCache(object):
+    '''
+    A thread-safe cache of parsed JWK key sets keyed by location.
+
+    :param loader:
+        Callable returning the JSON representation of the key set found at a
+        location. **REQUIRED**
+    :param ttl:
+        Time in seconds a key set is used before being loaded again. A value of
+        ``None`` keeps key sets until they are refreshed explicitly.
+    :param kidMissRefreshInterval:
+        Minimum age in seconds of a key set before a lookup for an unknown key
+        id triggers a refresh.
+    '''
+
+    def __init__(self, loader, ttl=3600, kidMissRefreshInterval=30):
+        '''
+        Create an empty key set cache.
+        '''
+
+        self.loader = loader
+        self.ttl = ttl
+        self.kidMissRefreshInterval = kidMissRefreshInterval
+
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+        self.__keySets = {}
+        self.__lock = threading.RLock()
+
+    @property
+    def stats(self):
+        '''
+        The cache counters, as a dictionary with keys hits, misses and refreshes.
+        '''
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'refreshes': self.refreshes
+        }
+
+    def get(self, location):
+        '''
+        Retrieve the parsed key set found at a location, loading it if needed.
+
+        :param location:
+            Location(can be a URL or path to file) of JWK key data. **REQUIRED**
+        :returns:
+            A JwkKeySet.
+        '''
+
+        with self.__lock:
+            keySet = self.__keySets.get(location)
+
+            if keySet is None:
+                self.misses += 1
+                return self.__load(location)
+
+            if self.ttl is not None and time.time() - keySet.loadedOn >= self.ttl:
+                self.refreshes += 1
+                return self.__load(location)
+
+            self.hits += 1
+            return keySet
+
+    def refresh(self, location):
+        '''
+        Load the key set found at a location again, replacing the cached one.
+
+        :param location:
+            Location(can be a URL or path to file) of JWK key data. **REQUIRED**
+        :returns:
+            A JwkKeySet.
+        '''
+
+        with self.__lock:
+            self.refreshes += 1
+            return self.__load(location)
+
+    def clear(self):
+        '''
+        Drop every cached key set.
+        '''
+
+        with self.__lock:
+            self.__keySets.clear()
+
+    def findByAlgorithm(self, location, algorithm):
+        '''
+        Finds JWK key by given algorithm.
+
+        :param location:
+            Location(can be a URL or path to file) of JWK key data. **REQUIRED**
+        :param algorithm:
+            Algorithm of the JWK key to be found in key set. **REQUIRED**
+        :returns:
+            A JwkKey with given algorithm.
+        '''
+
+        key = self.get(location).byAlgorithm.get(algorithm)
+
+        if key is None:
+            raise HyperwalletException('JWK set doesn\'t contain key with algorithm = ' + algorithm)
+
+        return key
+
+    def findByKid(self, location, kid, algorithm):
+        '''
+        Finds JWK key by given key id, refreshing the key set once if the key id
+        is unknown. Falls back to a key with given algorithm.
+
+        :param location:
+            Location(can be a URL or path to file) of JWK key data. **REQUIRED**
+        :param kid:
+            Key id of the JWK key to be found in key set.
+        :param algorithm:
+            Algorithm of the JWK key used as fallback. **REQUIRED**
+        :returns:
+            A JwkKey.
+        '''
+
+        keySet = self.get(location)
+
+        if kid is None:
+            return self.findByAlgorithm(location, algorithm)
+
+        key = keySet.byKid.get(kid)
+        if key is None and time.time() - keySet.loadedOn >= self.kidMissRefreshInterval:
+            keySet = self.refresh(location)
+            key = keySet.byKid.get(kid)
+
+        if key is None:
+            return self.findByAlgorithm(location, algorithm)
+
+        return key
+
+    def __load(self, location):
+        '''
+        Load, parse and store the key set found at a location.
+        '''
+
+        keySet = JwkKeySet(self.loader(location))
+        self.__keySets[location] = keySet
+        return keySet
 
 
 class Encryption(object):
@@ -31,6 +229,8 @@ class Encryption(object):
         JWE body encryption method.
     :param jwsExpirationMinutes:
         Time in minutes when JWS signature is valid after creation.
+    :param keySetCacheTtlSeconds:
+        Time in seconds JWK key sets are cached before being loaded again.
     '''
 
     def __init__(self,
@@ -39,7 +239,8 @@ class Encryption(object):
                  encryptionAlgorithm='RSA-OAEP-256',
                  signAlgorithm='RS256',
                  encryptionMethod='A256CBC-HS512',
-                 jwsExpirationMinutes=5):
+                 jwsExpirationMinutes=5,
+                 keySetCacheTtlSeconds=3600):
         '''
         Encryption service for hyperwallet client
         '''
@@ -51,63 +252,114 @@ class Encryption(object):
         self.encryptionMethod = encryptionMethod
         self.jwsExpirationMinutes = jwsExpirationMinutes
         self.integer_types = (int, long,) if sys.version_info < (3,) else (int,)
+        self.keySetCache = JwkKeySetCache(self.__getJwkKeySet, ttl=keySetCacheTtlSeconds)
 
     def encrypt(self, body):
         '''
         :param body:
-            Body message to be 1) signed and 2) encrypted. **REQUIRED**
+            Body message to be 1) signed and 2) encrypted, as bytes or string. **REQUIRED**
         :returns:
             String as a result of signature and encryption of input message body
         '''
 
-        jwsKeySet = self.__getJwkKeySet(location=self.clientPrivateKeySetLocation)
-        jwkSignKey = self.__findJwkKeyByAlgorithm(jwkKeySet=jwsKeySet, algorithm=self.signAlgorithm)
-        privateKeyToSign = jwk.JWK(**jwkSignKey)
-        jwsToken = cryptoJWS.JWS(body.encode('utf-8'))
-        jwsToken.add_signature(privateKeyToSign, None, json_encode({
+        if not isinstance(body, bytes):
+            body = body.encode('utf-8')
+
+        signKey = self.keySetCache.findByAlgorithm(self.clientPrivateKeySetLocation, self.signAlgorithm)
+        jwsToken = cryptoJWS.JWS(body)
+        jwsToken.add_signature(signKey.key, None, json_encode({
             "alg": self.signAlgorithm,
-            "kid": jwkSignKey['kid'],
+            "kid": signKey.kid,
             "exp": self.__getJwsExpirationTime()
         }))
         signedBody = jwsToken.serialize(True)
 
-        jweKeySet = self.__getJwkKeySet(location=self.hyperwalletKeySetLocation)
-        jwkEncryptKey = self.__findJwkKeyByAlgorithm(jwkKeySet=jweKeySet, algorithm=self.encryptionAlgorithm)
-        publicKeyToEncrypt = jwk.JWK(**jwkEncryptKey)
+        encryptKey = self.keySetCache.findByAlgorithm(self.hyperwalletKeySetLocation, self.encryptionAlgorithm)
         protected_header = {
             "alg": self.encryptionAlgorithm,
             "enc": self.encryptionMethod,
             "typ": "JWE",
-            "kid": jwkEncryptKey['kid'],
+            "kid": encryptKey.kid,
         }
-        jweToken = jwe.JWE(signedBody.encode('utf-8'), recipient=publicKeyToEncrypt, protected=protected_header)
+        jweToken = jwe.JWE(signedBody.encode('utf-8'), recipient=encryptKey.key, protected=protected_header)
         return jweToken.serialize(True)
 
     def decrypt(self, body):
         '''
         :param body:
-            Body message to be 1) decrypted and 2) check for correct signature. **REQUIRED**
+            Body message to be 1) decrypted and 2) check for correct signature, as bytes or string. **REQUIRED**
         :returns:
-            Decrypted body message
+            Decrypted body message, as bytes
         '''
 
-        jweKeySet = self.__getJwkKeySet(location=self.clientPrivateKeySetLocation)
-        jwkDecryptKey = self.__findJwkKeyByAlgorithm(jwkKeySet=jweKeySet, algorithm=self.encryptionAlgorithm)
-        privateKeyToDecrypt = jwk.JWK(**jwkDecryptKey)
         jweToken = jwe.JWE()
         try:
-            jweToken.deserialize(body, key=privateKeyToDecrypt)
+            if isinstance(body, bytes):
+                body = body.decode('ascii')
+            jweToken.deserialize(body)
+            decryptKey = self.keySetCache.findByKid(
+                self.clientPrivateKeySetLocation,
+                jweToken.jose_header.get('kid'),
+                self.encryptionAlgorithm
+            )
+            jweToken.decrypt(decryptKey.key)
+        except HyperwalletException:
+            raise
         except Exception as e:
             raise HyperwalletException(str(e))
-        payload = jweToken.payload
 
-        self.checkJwsExpiration(payload)
-        jwsKeySet = self.__getJwkKeySet(location=self.hyperwalletKeySetLocation)
-        jwkCheckSignKey = self.__findJwkKeyByAlgorithm(jwkKeySet=jwsKeySet, algorithm=self.signAlgorithm)
+        return self.verify(jweToken.payload)
+
+    def verify(self, payload):
+        '''
+        :param payload:
+            Signed JWS message to be checked for expiration and correct signature. **REQUIRED**
+        :returns:
+            The message, as bytes
+        '''
+
+        # The message is split and its header decoded once; the signature is
+        # then checked on the original segments with the key built when the
+        # key set was loaded.
+        (protected, encodedPayload, signature) = self.__splitJws(payload)
+        header = self.__checkExpiration(self.__decodeHeader(protected))
+        checkSignKey = self.keySetCache.findByKid(
+            self.hyperwalletKeySetLocation,
+            header.get('kid'),
+            self.signAlgorithm
+        )
         try:
-            return jws.verify(payload, json.dumps(jwkCheckSignKey), algorithms=self.signAlgorithm)
-        except Exception as e:
-            raise HyperwalletException(str(e))
+            if header.get('alg') != self.signAlgorithm:
+                raise ValueError('Unexpected algorithm')
+            JWA.signing_alg(self.signAlgorithm).verify(
+                checkSignKey.key,
+                protected + b'.' + encodedPayload,
+                base64url_decode(signature.decode('ascii'))
+            )
+        except Exception:
+            raise HyperwalletException('Signature verification failed.')
+
+        return base64url_decode(encodedPayload.decode('ascii'))
+
+    def encryptMany(self, bodies):
+        '''
+        :param bodies:
+            A list of body messages to be signed and encrypted. **REQUIRED**
+        :returns:
+            The list of encrypted messages, in the same order
+        '''
+
+        return [self.encrypt(body) for body in bodies]
+
+    def decryptMany(self, bodies):
+        '''
+        :param bodies:
+            A list of body messages to be decrypted and verified. **REQUIRED**
+        :returns:
+            The list of decrypted messages, in the same order
+        '''
+
+        return [self.decrypt(body) for body in bodies]
 
     def __getJwkKeySet(self, location):
         '''
@@ -130,46 +382,77 @@ class Encryption(object):
             else:
                 raise HyperwalletException('Wrong JWK key set location path = ' + location)
 
-    def __findJwkKeyByAlgorithm(self, jwkKeySet, algorithm):
+    def __getJwsExpirationTime(self):
         '''
-        Finds JWK key by given algorithm.
+        Calculates the expiration time (in seconds) of JWS signature.
 
-        :param jwkKeySet:
-            JSON representation of JWK key set. **REQUIRED**
-        :param algorithm:
-            Algorithm of the JWK key to be found in key set. **REQUIRED**
         :returns:
-            JWK key with given algorithm.
+            JWS expiration time in seconds since the UNIX epoch (January 1, 1970 00:00:00 UTC).
         '''
 
-        try:
-            keySet = json.loads(jwkKeySet)
-        except ValueError:
-            raise HyperwalletException('Wrong JWK key set ' + jwkKeySet)
+        secondsInMinute = 60
+        return int(time.time() + self.jwsExpirationMinutes * secondsInMinute)
+
+    def checkJwsExpiration(self, payload):
+        '''
+        Check if JWS signature has not expired.
 
-        for key in keySet['keys']:
-            if key['alg'] == algorithm:
-                return key
+        :param payload:
+            Signed JWS message. **REQUIRED**
+        :returns:
+            The unverified JWS header.
+        '''
 
-        raise HyperwalletException('JWK set doesn\'t contain key with algorithm = ' + algorithm)
+        return self.__checkExpiration(self.__decodeHeader(self.__splitJws(payload)[0]))
 
-    def __getJwsExpirationTime(self):
+    def __splitJws(self, payload):
         '''
-        Calculates the expiration time (in seconds) of JWS signature.
+        Split a compact JWS message in its encoded header, payload and signature.
 
+        :param payload:
+            Signed JWS message, as text or bytes. **REQUIRED**
         :returns:
-            JWS expiration time in seconds since the UNIX epoch (January 1, 1970 00:00:00 UTC).
+            A tuple of three bytes.
         '''
 
-        secondsInMinute = 60
-        return int(time.time() + self.jwsExpirationMinutes * secondsInMinute)
+        if not isinstance(payload, bytes):
+            payload = payload.encode('utf-8')
 
-    def checkJwsExpiration(self, payload):
+        segments = payload.split(b'.')
+        if len(segments) != 3:
+            raise HyperwalletException('Invalid JWS signature, expected 3 segments')
+
+        return tuple(segments)
+
+    def __decodeHeader(self, protected):
         '''
-        Check if JWS signature has not expired.
+        Decode the encoded header of a JWS message.
+
+        :param protected:
+            The first segment of the message. **REQUIRED**
+        :returns:
+            The header, as a dictionary.
+        '''
+
+        try:
+            header = json.loads(base64url_decode(protected.decode('ascii')))
+        except Exception:
+            raise HyperwalletException('Invalid JWS header')
+
+        if not isinstance(header, dict):
+            raise HyperwalletException('Invalid JWS header')
+
+        return header
+
+    def __checkExpiration(self, header):
         '''
+        Check the [exp] parameter of a JWS header.
 
-        header = jws.get_unverified_header(payload)
+        :param header:
+            The JWS header. **REQUIRED**
+        :returns:
+            The header.
+        '''
 
         if 'exp' not in header:
             raise HyperwalletException('While trying to verify JWS signature no [exp] header is found')
@@ -181,3 +464,113 @@ class Encryption(object):
 
         if exp < time.time():
             raise HyperwalletException('JWS signature has expired, checked by [exp] JWS header')
+
+        return header
+
+
+# The Encryption of a worker process of an EncryptionPool.
+_worker = None
+
+
+def _initializeWorker(settings):
+    '''
+    Create the Encryption of a worker process and load its key sets once.
+    '''
+
+    global _worker
+    _worker = Encryption(**settings)
+
+    for location in (_worker.clientPrivateKeySetLocation, _worker.hyperwalletKeySetLocation):
+        try:
+            _worker.keySetCache.get(location)
+        except HyperwalletException:
+            # Reported by the first encryption or decryption instead.
+            pass
+
+
+def _encryptBatch(bodies):
+    return _worker.encryptMany(bodies)
+
+
+def _decryptBatch(bodies):
+    return _worker.decryptMany(bodies)
+
+
+class EncryptionPool(Encryption):
+    '''
+    An Encryption running the RSA work on a pool of processes, so that
+    encrypted requests made by many threads use every core. Each worker
+    process loads the key sets once.
+
+    :param clientPrivateKeySetLocation:
+        The location(url or path to file) of client's private JWK key set. **REQUIRED**
+    :param hyperwalletKeySetLocation:
+        The location(url or path to file) of hyperwallet public JWK key set. **REQUIRED**
+    :param processes:
+        The number of worker processes. Defaults to the number of CPUs.
+    :param batchSize:
+        The number of messages sent to a worker at once by encryptMany and
+        decryptMany.
+    :param settings:
+        The other parameters of Encryption, such as signAlgorithm.
+    '''
+
+    def __init__(self,
+                 clientPrivateKeySetLocation,
+                 hyperwalletKeySetLocation,
+                 processes=None,
+                 batchSize=16,
+                 **settings):
+        '''
+        Start the worker processes.
+        '''
+
+        settings['clientPrivateKeySetLocation'] = clientPrivateKeySetLocation
+        settings['hyperwalletKeySetLocation'] = hyperwalletKeySetLocation
+
+        # Report invalid settings here rather than in every worker.
+        inspect.signature(Encryption).bind(**settings)
+
+        # Only the workers load the key sets.
+        self.clientPrivateKeySetLocation = clientPrivateKeySetLocation
+        self.hyperwalletKeySetLocation = hyperwalletKeySetLocation
+        self.keySetCache = None
+
+        self.batchSize = batchSize
+        self.executor = ProcessPoolExecutor(
+            max_workers=processes,
+            # Forking a process running threads can deadlock on the locks
+            # they hold, so the workers start from a fresh interpreter.
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_initializeWorker,
+            initargs=(settings,)
+        )
+
+    def encrypt(self, body):
+        return self.executor.submit(_encryptBatch, [body]).result()[0]
+
+    def decrypt(self, body):
+        return self.executor.submit(_decryptBatch, [body]).result()[0]
+
+    def encryptMany(self, bodies):
+        return self.__map(_encryptBatch, bodies)
+
+    def decryptMany(self, bodies):
+        return self.__map(_decryptBatch, bodies)
+
+    def close(self):
+        '''
+        Stop the worker processes.
+        '''
+
+        self.executor.shutdown()
+
+    def __map(self, function, bodies):
+        '''
+        Split messages in batches processed concurrently by the workers.
+        '''
+
+        bodies = list(bodies)
+        batches = [bodies[index:index + self.batchSize] for index in range(0, len(bodies), self.batchSize)]
+
+        return [body for batch in self.executor.map(function, batches) for body in batch]
@@ -0,0 +1,478 @@
+#!/usr/bin/env python
+
+import csv
+import hashlib
+import json
+import os
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.utils.deadline import submit
+from hyperwallet.utils.pagination import PageIterator
+
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+
+def parseTimestamp(value):
+    '''
+    Normalize a datetime or API timestamp string to ``YYYY-MM-DDTHH:MM:SS``.
+
+    :param value:
+        A datetime, or a timestamp or date string. **REQUIRED**
+    :returns:
+        The timestamp string.
+    '''
+
+    if isinstance(value, datetime):
+        return value.strftime(TIMESTAMP_FORMAT)
+
+    try:
+        return datetime.strptime(value[:19], TIMESTAMP_FORMAT).strftime(TIMESTAMP_FORMAT)
+    except (TypeError, ValueError):
+        try:
+            return datetime.strptime(value[:10], '%Y-%m-%d').strftime(TIMESTAMP_FORMAT)
+        except (TypeError, ValueError):
+            raise HyperwalletException('Invalid timestamp {}'.format(value))
+
+
+def nowTimestamp():
+    '''
+    The current UTC time, as a normalized timestamp string.
+    '''
+
+    return datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
+
+
+def shiftTimestamp(timestamp, seconds):
+    '''
+    Move a normalized timestamp string by a number of seconds.
+    '''
+
+    return (datetime.strptime(timestamp, TIMESTAMP_FORMAT) + timedelta(seconds=seconds)).strftime(TIMESTAMP_FORMAT)
+
+
+def dateWindows(start, end, windowSize):
+    '''
+    Split a period in date windows.
+
+    :param start:
+        The beginning of the period, as a normalized timestamp string. **REQUIRED**
+    :param end:
+        The end of the period, as a normalized timestamp string. **REQUIRED**
+    :param windowSize:
+        The duration of each window, as a timedelta. **REQUIRED**
+    :returns:
+        A list of ``(start, end)`` timestamp tuples.
+    '''
+
+    windows = []
+    windowStart = datetime.strptime(start, TIMESTAMP_FORMAT)
+    end = datetime.strptime(end, TIMESTAMP_FORMAT)
+
+    while windowStart < end:
+        windowEnd = min(end, windowStart + windowSize)
+        windows.append((windowStart.strftime(TIMESTAMP_FORMAT), windowEnd.strftime(TIMESTAMP_FORMAT)))
+        windowStart = windowEnd
+
+    return windows
+
+
+def contentKey(item):
+    '''
+    Identify an item by a hash of its content.
+    '''
+
+    return hashlib.sha1(json.dumps(item, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _text(value):
+    '''
+    Convert a raw API value to the text stored in an export file.
+    '''
+
+    if value is None:
+        return None
+
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True)
+
+    return value if isinstance(value, str) else str(value)
+
+
+class CsvFileWriter(object):
+    '''
+    Write items to a CSV file with a header row.
+
+    :param path:
+        The path of the file. **REQUIRED**
+    :param fields:
+        The names of the columns. **REQUIRED**
+    '''
+
+    extension = '.csv'
+
+    def __init__(self, path, fields):
+        self.fields = fields
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(fields)
+
+    def write(self, items):
+        fields = self.fields
+        self.writer.writerows(
+            ['' if value is None else value for value in (_text(item.get(field)) for field in fields)]
+            for item in items
+        )
+
+    def close(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+
+class ParquetFileWriter(object):
+    '''
+    Write items to a Parquet file of string columns, one row group per page.
+    Requires pyarrow.
+
+    :param path:
+        The path of the file. **REQUIRED**
+    :param fields:
+        The names of the columns. **REQUIRED**
+    '''
+
+    extension = '.parquet'
+
+    def __init__(self, path, fields):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise HyperwalletException('pyarrow is required to export Parquet files')
+
+        self.pyarrow = pyarrow
+        self.fields = fields
+        self.schema = pyarrow.schema([(field, pyarrow.string()) for field in fields])
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    def write(self, items):
+        columns = dict((field, [_text(item.get(field)) for item in items]) for field in self.fields)
+        self.writer.write_table(self.pyarrow.Table.from_pydict(columns, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+FORMATS = {
+    'csv': CsvFileWriter,
+    'parquet': ParquetFileWriter
+}
+
+
+class ExportResult(object):
+    '''
+    The outcome of an export.
+
+    :param files:
+        The paths of the exported files, in window order. **REQUIRED**
+    :param rows:
+        The number of rows written by this run. **REQUIRED**
+    :param windows:
+        The number of date windows of the export. **REQUIRED**
+    :param resumed:
+        The number of windows continued from a previous run. **REQUIRED**
+    :param elapsed:
+        The duration of the run in seconds. **REQUIRED**
+    '''
+
+    def __init__(self, files, rows, windows, resumed, elapsed):
+        self.files = files
+        self.rows = rows
+        self.windows = windows
+        self.resumed = resumed
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return 'ExportResult({rows} rows, {files} files)'.format(rows=self.rows, files=len(self.files))
+
+
+class Exporter(object):
+    '''
+    Export every item of a list endpoint created within a period to files,
+    streaming page by page so memory stays bounded.
+
+    The period is split in date windows fetched in parallel, each written to
+    its own files. Progress is saved in a state file whenever a file is
+    completed, with the ``createdOn`` watermark of the last item written, so
+    an interrupted export resumes from the watermark when run again.
+
+    :param fetchPage:
+        Callable taking a partial URL and a dictionary of query parameters and
+        returning the API response. **REQUIRED**
+    :param partialUrl:
+        A partial URL to specify the API endpoint. **REQUIRED**
+    :param fields:
+        The names of the exported fields, such as ``Receipt.defaults``. **REQUIRED**
+    :param directory:
+        The directory the files and the state file are written to. **REQUIRED**
+    :param name:
+        The prefix of the file names. **REQUIRED**
+    :param start:
+        The beginning of the period, included, as a datetime or timestamp string. **REQUIRED**
+    :param end:
+        The end of the period, excluded, as a datetime or timestamp string. **REQUIRED**
+    :param params:
+        A dictionary containing additional query parameters.
+    :param format:
+        The file format, ``csv`` or ``parquet``.
+    :param windowSize:
+        The duration of each date window, as a timedelta.
+    :param maxWorkers:
+        The number of windows fetched concurrently.
+    :param rowsPerFile:
+        The number of rows after which a new file is started.
+    :param pageSize:
+        The number of items requested per page.
+    :param sortable:
+        True if the endpoint accepts ``sortBy=createdOn``. Windows of endpoints
+        returning unsorted items restart from their beginning on resume.
+    '''
+
+    def __init__(self,
+                 fetchPage,
+                 partialUrl,
+                 fields,
+                 directory,
+                 name,
+                 start,
+                 end,
+                 params=None,
+                 format='csv',
+                 windowSize=timedelta(days=1),
+                 maxWorkers=4,
+                 rowsPerFile=50000,
+                 pageSize=100,
+                 sortable=True):
+        if format not in FORMATS:
+            raise HyperwalletException('Unsupported export format ' + str(format))
+
+        self.fetchPage = fetchPage
+        self.partialUrl = partialUrl
+        self.fields = list(fields)
+        self.directory = directory
+        self.name = name
+        self.start = parseTimestamp(start)
+        self.end = parseTimestamp(end)
+        self.params = dict(params or {})
+        self.format = format
+        self.windowSize = windowSize
+        self.maxWorkers = maxWorkers
+        self.rowsPerFile = rowsPerFile
+        self.pageSize = pageSize
+        self.sortable = sortable
+
+        if self.start >= self.end:
+            raise HyperwalletException('start must be before end')
+
+        self.statePath = os.path.join(directory, name + '.state.json')
+
+        self.__lock = threading.Lock()
+        self.__state = None
+
+    def windows(self):
+        '''
+        Split the period in date windows.
+
+        :returns:
+            A list of ``(start, end)`` timestamp tuples.
+        '''
+
+        return dateWindows(self.start, self.end, self.windowSize)
+
+    def run(self):
+        '''
+        Export the period, resuming from the state file if present.
+
+        :returns:
+            An ExportResult.
+        '''
+
+        started = time.time()
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        self.__state = self.__loadState()
+
+        windows = self.windows()
+        pending = [window for window in windows if not self.__windowState(window[0]).get('done')]
+        resumed = sum(1 for window in pending if self.__windowState(window[0]).get('files'))
+
+        with ThreadPoolExecutor(max_workers=self.maxWorkers) as executor:
+            rows = sum(future.result() for future in [submit(executor, self.__exportWindow, *window) for window in pending])
+
+        files = []
+        for (windowStart, windowEnd) in windows:
+            files.extend(os.path.join(self.directory, path) for path in self.__windowState(windowStart)['files'])
+
+        return ExportResult(files, rows, len(windows), resumed, time.time() - started)
+
+    def __exportWindow(self, windowStart, windowEnd):
+        state = self.__windowState(windowStart)
+        self.__removeUncommittedFiles(windowStart, state)
+
+        watermark = state.get('watermark') if state.get('ordered', True) else None
+        skip = set(state.get('watermarkKeys') or []) if watermark else set()
+
+        if state.get('files') and watermark is None:
+            # Without a usable watermark the window is exported again.
+            self.__removeFiles(state['files'])
+            state = self.__resetWindow(windowStart)
+
+        params = dict(self.params)
+        # Bounds are widened by a second and items filtered exactly below, so
+        # the result does not depend on the API treating bounds as inclusive.
+        params['createdAfter'] = shiftTimestamp(watermark or windowStart, -1)
+        params['createdBefore'] = shiftTimestamp(windowEnd, 1)
+        if self.sortable:
+            params['sortBy'] = 'createdOn'
+
+        iterator = PageIterator(self.fetchPage, self.partialUrl, None, params, self.pageSize)
+
+        writer = None
+        fileRows = 0
+        rows = 0
+        ordered = True
+        lowest = watermark or windowStart
+
+        try:
+            for page in iterator.rawPages():
+                items = []
+
+                for item in page:
+                    createdOn = (item.get('createdOn') or '')[:19]
+                    if not (lowest <= createdOn < windowEnd):
+                        continue
+
+                    key = contentKey(item)
+                    if createdOn == watermark and key in skip:
+                        continue
+
+                    if watermark is None or createdOn > watermark:
+                        watermark = createdOn
+                        skip = set([key])
+                    elif createdOn == watermark:
+                        skip.add(key)
+                    else:
+                        ordered = False
+
+                    items.append(item)
+
+                if not items:
+                    continue
+
+                if writer is None:
+                    (writer, path) = self.__openFile(windowStart)
+
+                writer.write(items)
+                fileRows += len(items)
+                rows += len(items)
+
+                if fileRows >= self.rowsPerFile:
+                    writer.close()
+                    writer = None
+                    fileRows = 0
+                    self.__commit(windowStart, path, watermark, skip, ordered)
+
+            if writer is not None:
+                writer.close()
+                writer = None
+                self.__commit(windowStart, path, watermark, skip, ordered)
+
+            self.__commit(windowStart, None, watermark, skip, ordered, done=True)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return rows
+
+    def __openFile(self, windowStart):
+        path = '{name}-{window}-{index:05d}{extension}'.format(
+            name=self.name,
+            window=windowStart.replace('-', '').replace(':', ''),
+            index=len(self.__windowState(windowStart).get('files') or []),
+            extension=FORMATS[self.format].extension
+        )
+
+        return (FORMATS[self.format](os.path.join(self.directory, path), self.fields), path)
+
+    def __windowState(self, windowStart):
+        with self.__lock:
+            return dict(self.__state['windows'].get(windowStart) or {})
+
+    def __resetWindow(self, windowStart):
+        with self.__lock:
+            self.__state['windows'].pop(windowStart, None)
+            self.__saveState()
+        return {}
+
+    def __commit(self, windowStart, path, watermark, keys, ordered, done=False):
+        with self.__lock:
+            state = self.__state['windows'].setdefault(windowStart, {'files': []})
+            if path is not None:
+                state['files'].append(path)
+            state['watermark'] = watermark
+            state['watermarkKeys'] = sorted(keys)
+            state['ordered'] = ordered
+            state['done'] = done
+            self.__saveState()
+
+    def __removeUncommittedFiles(self, windowStart, state):
+        prefix = '{}-{}-'.format(self.name, windowStart.replace('-', '').replace(':', ''))
+        committed = set(state.get('files') or [])
+
+        self.__removeFiles(
+            path for path in os.listdir(self.directory)
+            if path.startswith(prefix) and path not in committed
+        )
+
+    def __removeFiles(self, paths):
+        for path in list(paths):
+            try:
+                os.remove(os.path.join(self.directory, path))
+            except OSError:
+                pass
+
+    def __loadState(self):
+        settings = {
+            'start': self.start,
+            'end': self.end,
+            'format': self.format,
+            'fields': self.fields,
+            'windowSize': self.windowSize.total_seconds()
+        }
+
+        if not os.path.isfile(self.statePath):
+            return {'settings': settings, 'windows': {}}
+
+        with open(self.statePath) as stateFile:
+            state = json.load(stateFile)
+
+        if state.get('settings') != settings:
+            raise HyperwalletException('The export state {} belongs to a different export'.format(self.statePath))
+
+        return state
+
+    def __saveState(self):
+        temporaryPath = self.statePath + '.tmp'
+
+        with open(temporaryPath, 'w') as stateFile:
+            json.dump(self.__state, stateFile, sort_keys=True)
+            stateFile.flush()
+            os.fsync(stateFile.fileno())
+
+        os.replace(temporaryPath, self.statePath)
@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+
+import threading
+import time
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from hyperwallet.utils.deadline import submit
+from hyperwallet.utils.instrumentation import LatencyHistogram
+from hyperwallet.utils.retry import RetryBudget
+
+
+def _firstResult(done, pending, error):
+    '''
+    Pick the finished attempt to return, preferring responses to errors.
+
+    :returns:
+        The finished attempt, or None to keep waiting for the pending one.
+    '''
+
+    for attempt in sorted(done, key=lambda attempt: error(attempt) is not None):
+        if error(attempt) is None or not pending:
+            return attempt
+
+    return None
+
+
+class _RecentLatencies(object):
+    '''
+    The latencies of an endpoint over the current and the previous window,
+    so that the hedging delay follows changes in the latency of the API.
+    '''
+
+    def __init__(self, window):
+        self.window = window
+
+        self.__current = LatencyHistogram()
+        self.__previous = None
+        self.__started = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def record(self, latency):
+        self.__rotate()
+        self.__current.record(latency)
+
+    def histogram(self, minSamples):
+        '''
+        Find the most recent histogram holding enough latencies.
+
+        :returns:
+            The histogram of the current window, or of the previous one while
+            the current one holds fewer than minSamples latencies, or None.
+        '''
+
+        self.__rotate()
+
+        for histogram in (self.__current, self.__previous):
+            if histogram is not None and histogram.count >= minSamples:
+                return histogram
+
+        return None
+
+    def __rotate(self):
+        now = time.monotonic()
+        if now - self.__started < self.window:
+            return
+
+        with self.__lock:
+            elapsed = now - self.__started
+            if elapsed < self.window:
+                return
+
+            # Windows without requests leave nothing recent to keep.
+            self.__previous = self.__current if elapsed < 2 * self.window else None
+            self.__current = LatencyHistogram()
+            self.__started = now
+
+
+class HedgePolicy(object):
+    '''
+    Cut the tail latency of GET requests by sending a second copy of a
+    request that is slower than usual, and using whichever response arrives
+    first.
+
+    The delay before the copy is sent is a percentile of the latencies
+    observed on the same endpoint over the last ``window`` seconds, so only
+    the slowest requests are hedged. The copy is sent on another connection
+    of the pool, which needs a ``poolMaxSize`` above the number of threads
+    sending requests.
+
+    Every request deposits ``budget.ratio`` tokens in the budget and every
+    copy withdraws one, which bounds the extra load on the API. Copies are
+    not paced by the rate limiter of the client.
+
+    :param percentile:
+        The latency percentile after which a request is hedged.
+    :param minDelay:
+        The minimum delay in seconds before a request is hedged.
+    :param maxDelay:
+        The maximum delay in seconds before a request is hedged.
+    :param minSamples:
+        The number of latencies observed on an endpoint within a window
+        before its requests are hedged.
+    :param window:
+        The seconds of latencies the hedging delay is worked out from.
+    :param budget:
+        A RetryBudget shared by every request. Defaults to a budget allowing
+        copies of 5% of the requests.
+    :param maxWorkers:
+        The number of threads sending the requests of synchronous clients,
+        and of threads sending their copies. Requests beyond it are sent by
+        the calling thread, without a copy.
+    '''
+
+    def __init__(self,
+                 percentile=95,
+                 minDelay=0.01,
+                 maxDelay=2.0,
+                 minSamples=20,
+                 budget=None,
+                 maxWorkers=32,
+                 window=60.0):
+        self.percentile = percentile
+        self.minDelay = minDelay
+        self.maxDelay = maxDelay
+        self.minSamples = minSamples
+        self.window = window
+        self.budget = RetryBudget(ratio=0.05, minRetriesPerSecond=0.1, maxBalance=10.0) if budget is None else budget
+        self.maxWorkers = maxWorkers
+
+        self.__latencies = {}
+        self.__requests = 0
+        self.__fired = 0
+        self.__won = 0
+        self.__denied = 0
+        self.__executor = None
+        self.__primaries = None
+        self.__slots = threading.BoundedSemaphore(maxWorkers)
+        self.__lock = threading.Lock()
+
+    def delay(self, endpoint):
+        '''
+        Work out the delay before a request to an endpoint is hedged.
+
+        :param endpoint:
+            The method and URL template, such as ``GET users/{token}``. **REQUIRED**
+        :returns:
+            The delay in seconds, or None while too few latencies are known.
+        '''
+
+        latencies = self.__latencies.get(endpoint)
+        histogram = None if latencies is None else latencies.histogram(self.minSamples)
+        if histogram is None:
+            return None
+
+        return min(self.maxDelay, max(self.minDelay, histogram.percentile(self.percentile)))
+
+    def do(self, event, function):
+        '''
+        Run a request, and a copy of it once the hedging delay has passed.
+
+        :param event:
+            The RequestEvent of the request, counting the copies sent and won. **REQUIRED**
+        :param function:
+            Callable sending the request and returning its response. **REQUIRED**
+        :returns:
+            The first response received.
+        '''
+
+        delay = self.__start(event)
+
+        # The request is sent by an idle thread of the pool, so that the
+        # caller can return whichever response comes first. When every thread
+        # is busy, it is sent at once by the caller rather than queued.
+        if delay is None or not self.__slots.acquire(blocking=False):
+            return self.__timed(event.endpoint, function)
+
+        started = threading.Event()
+
+        def send():
+            started.set()
+            return self.__timed(event.endpoint, function)
+
+        try:
+            primary = submit(self.__getPrimaries(), send)
+        except BaseException:
+            self.__slots.release()
+            raise
+
+        primary.add_done_callback(lambda future: self.__slots.release())
+
+        # The delay runs from the moment the request is sent.
+        started.wait()
+        if wait([primary], timeout=delay)[0] or not self.__allow():
+            return primary.result()
+
+        hedge = submit(self.__getExecutor(), self.__timed, event.endpoint, function)
+        self.__recordHedge(event)
+
+        pending = set([primary, hedge])
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            first = _firstResult(done, pending, lambda future: future.exception())
+            if first is not None:
+                # The slower request is not interrupted; its connection is
+                # returned to the pool once it completes.
+                self.__recordWinner(event, first is hedge)
+                return first.result()
+
+    async def doAsync(self, event, function):
+        '''
+        Await a request, and a copy of it once the hedging delay has passed.
+        The slower request is cancelled.
+
+        :param event:
+            The RequestEvent of the request, counting the copies sent and won. **REQUIRED**
+        :param function:
+            Callable returning the coroutine sending the request. **REQUIRED**
+        :returns:
+            The first response received.
+        '''
+
+        # Loaded here so that synchronous clients do not import asyncio.
+        import asyncio
+
+        delay = self.__start(event)
+        if delay is None:
+            return await self.__timedAsync(event.endpoint, function)
+
+        tasks = [asyncio.ensure_future(self.__timedAsync(event.endpoint, function))]
+
+        try:
+            if (await asyncio.wait(tasks, timeout=delay))[0] or not self.__allow():
+                return await tasks[0]
+
+            tasks.append(asyncio.ensure_future(self.__timedAsync(event.endpoint, function)))
+            self.__recordHedge(event)
+
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                first = _firstResult(done, pending, lambda task: task.exception())
+                if first is not None:
+                    self.__recordWinner(event, first is tasks[1])
+                    return first.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self):
+        '''
+        Report the use of hedging.
+
+        :returns:
+            A dictionary with the number of requests made, of copies fired, of
+            copies answering first, and of copies denied by the budget.
+        '''
+
+        with self.__lock:
+            return {
+                'requests': self.__requests,
+                'fired': self.__fired,
+                'won': self.__won,
+                'denied': self.__denied
+            }
+
+    def close(self):
+        '''
+        Stop the threads sending requests.
+        '''
+
+        with self.__lock:
+            executors = (self.__executor, self.__primaries)
+            (self.__executor, self.__primaries) = (None, None)
+
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def __start(self, event):
+        self.budget.deposit()
+
+        with self.__lock:
+            self.__requests += 1
+
+        return self.delay(event.endpoint)
+
+    def __allow(self):
+        if self.budget.withdraw():
+            return True
+
+        with self.__lock:
+            self.__denied += 1
+
+        return False
+
+    def __recordHedge(self, event):
+        event.hedges += 1
+
+        with self.__lock:
+            self.__fired += 1
+
+    def __recordWinner(self, event, hedgeWon):
+        if hedgeWon:
+            event.hedgesWon += 1
+            with self.__lock:
+                self.__won += 1
+
+    def __timed(self, endpoint, function):
+        start = time.perf_counter()
+        result = function()
+        self.__record(endpoint, time.perf_counter() - start)
+        return result
+
+    async def __timedAsync(self, endpoint, function):
+        start = time.perf_counter()
+        result = await function()
+        self.__record(endpoint, time.perf_counter() - start)
+        return result
+
+    def __record(self, endpoint, latency):
+        latencies = self.__latencies.get(endpoint)
+        if latencies is None:
+            with self.__lock:
+                latencies = self.__latencies.setdefault(endpoint, _RecentLatencies(self.window))
+
+        latencies.record(latency)
+
+    def __getExecutor(self):
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=self.maxWorkers)
+            return self.__executor
+
+    def __getPrimaries(self):
+        with self.__lock:
+            if self.__primaries is None:
+                self.__primaries = ThreadPoolExecutor(max_workers=self.maxWorkers)
+            return self.__primaries
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+
+import threading
+import weakref
+
+from hyperwallet.exceptions import HyperwalletException
+
+
+def http2Options(server):
+    '''
+    The HTTP versions an httpx client offers to a server.
+
+    HTTPS servers negotiate HTTP/2 and fall back to HTTP/1.1 if they do not
+    support it. Plain HTTP servers, such as local stand-ins, cannot
+    negotiate, so HTTP/2 is spoken to them directly.
+
+    :param server:
+        The base URL of the API. **REQUIRED**
+    :returns:
+        A dictionary of the http1 and http2 keyword arguments of httpx.
+    '''
+
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        raise HyperwalletException('h2 is required to use HTTP/2')
+
+    return {'http1': not server.startswith('http:'), 'http2': True}
+
+
+class Http2Session(object):
+    '''
+    Send requests with httpx over HTTP/2, which multiplexes the concurrent
+    requests of every thread over a few connections instead of holding one
+    connection, and one TLS handshake, per request in flight.
+
+    It offers the part of the ``requests.Session`` interface used by
+    ApiClient, and returns httpx responses, which have the same
+    ``status_code``, ``content`` and ``headers``.
+
+    The connections are driven by an event loop running in a background
+    thread: the synchronous HTTP/2 implementation of httpx can send the
+    streams of concurrent threads out of order, which servers reject.
+
+    :param server:
+        The base URL of the API. **REQUIRED**
+    :param auth:
+        The username and password of the API user, as a tuple. **REQUIRED**
+    :param headers:
+        The headers sent with every request.
+    :param maxConnections:
+        The maximum number of connections opened to the server.
+    :param keepAlive:
+        Reuse connections between requests.
+    :param socketOptions:
+        A list of ``(level, option, value)`` tuples set on every new socket.
+    '''
+
+    def __init__(self, server, auth, headers=None, maxConnections=10, keepAlive=True, socketOptions=None):
+        try:
+            import httpx
+        except ImportError:
+            raise HyperwalletException('httpx is required to use HTTP/2')
+
+        import asyncio
+
+        self.httpx = httpx
+        self.asyncio = asyncio
+
+        self.transport = httpx.AsyncHTTPTransport(
+            # HTTP/2 has no Connection header; without keep-alive, the pool
+            # closes connections once their requests are completed.
+            limits=httpx.Limits(
+                max_connections=maxConnections,
+                max_keepalive_connections=maxConnections if keepAlive else 0
+            ),
+            socket_options=socketOptions,
+            **http2Options(server)
+        )
+
+        self.client = httpx.AsyncClient(auth=auth, headers=headers, transport=self.transport)
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name='hyperwallet-http2')
+        self.thread.daemon = True
+        self.thread.start()
+
+        # Stop the loop if the session is dropped without being closed.
+        self.__finalizer = weakref.finalize(self, self.loop.call_soon_threadsafe, self.loop.stop)
+
+    @property
+    def headers(self):
+        return self.client.headers
+
+    def request(self, method, url, data=None, headers=None, params=None, files=None, timeout=None):
+        '''
+        Send a request, waiting for its response.
+
+        :param method:
+            The HTTP method. **REQUIRED**
+        :param url:
+            The complete URL. **REQUIRED**
+        :param data:
+            The request body, or the form fields sent with files.
+        :param headers:
+            A dictionary of additional request headers.
+        :param params:
+            A dictionary of query parameters, where None values are left out.
+        :param files:
+            The files to upload, as accepted by requests.
+        :param timeout:
+            The seconds to wait for a connection and for the response, as a
+            ``(connect, read)`` tuple.
+        :returns:
+            An ``httpx.Response``.
+        '''
+
+        if params:
+            params = dict((key, value) for (key, value) in params.items() if value is not None)
+
+        (connect, read) = timeout or (None, None)
+        body = {'data': data, 'files': files} if files else {'content': data}
+
+        return self.__run(self.client.request(
+            method,
+            url,
+            headers=headers or None,
+            params=params or None,
+            timeout=self.httpx.Timeout(read, connect=connect, pool=connect),
+            **body
+        ))
+
+    def poolStats(self):
+        '''
+        Retrieve the statistics of the connections of the session.
+
+        :returns:
+            A dictionary with the number of connections in use, idle and open,
+            which are None if the installed httpx does not expose its pool.
+        '''
+
+        # The httpcore pool of the transport lists its open connections. It
+        # is not part of the httpx API, so the http2 extra pins the versions
+        # known to expose it.
+        connections = getattr(getattr(self.transport, '_pool', None), 'connections', None)
+        if connections is None:
+            return {'inUse': None, 'idle': None, 'open': None}
+
+        connections = list(connections)
+        idle = sum(1 for connection in connections if connection.is_idle())
+
+        return {
+            'inUse': len(connections) - idle,
+            'idle': idle,
+            'open': len(connections)
+        }
+
+    def close(self):
+        '''
+        Close every connection and stop the event loop.
+        '''
+
+        if self.__finalizer.alive:
+            self.__run(self.client.aclose())
+            self.__finalizer()
+            self.thread.join()
+
+    def __run(self, coroutine):
+        return self.asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
@@ -0,0 +1,425 @@
+#!/usr/bin/env python
+
+import math
+import threading
+import time
+
+from contextlib import contextmanager
+
+try:
+    from urllib.parse import urlsplit
+except ImportError:
+    from urlparse import urlsplit  # Python 2
+
+from hyperwallet.utils.bulk import errorCode
+
+# The path of the API below the server URL.
+API_PATH = '/rest/v3/'
+
+
+def urlTemplate(url):
+    '''
+    Replace the tokens of a partial URL with placeholders, so that requests
+    to the same endpoint can be grouped.
+
+    Hyperwallet URLs alternate collections and tokens, for example
+    ``users/usr-123/bank-accounts`` becomes ``users/{token}/bank-accounts``.
+    Complete URLs, such as the ``next`` links of list endpoints, are reduced
+    to their path below ``/rest/v3/``, and query strings are left out.
+
+    :param url:
+        A partial or complete URL. **REQUIRED**
+    '''
+
+    path = urlsplit(url or '').path
+
+    if API_PATH in path:
+        path = path.split(API_PATH, 1)[1]
+
+    paths = path.strip('/').split('/')
+
+    return '/'.join('{token}' if index % 2 else path for (index, path) in enumerate(paths))
+
+
+class RequestEvent(object):
+    '''
+    The description of a request given to the hooks of an ApiClient.
+
+    Times are in seconds. The encryption time covers both the encryption of
+    the request and the decryption of the response, the network time covers
+    every attempt but not the delays between them. With a ResponseCache, the
+    cache outcome of GET requests is hit, stale, revalidated or miss. With a
+    HedgePolicy, hedges counts the copies of the request sent and hedgesWon
+    the copies answering first. With a CircuitBreaker, circuit is the state
+    of the circuit of the endpoint once the request is finished, and None if
+    the request was rejected.
+
+    :param method:
+        The HTTP method of the request. **REQUIRED**
+    :param url:
+        The partial URL of the request. **REQUIRED**
+    '''
+
+    def __init__(self, method, url):
+        self.method = method
+        self.url = url
+        self.urlTemplate = urlTemplate(url)
+
+        self.attempts = 0
+        self.status = None
+        self.bytesSent = 0
+        self.bytesReceived = 0
+        self.encryptionTime = 0.0
+        self.networkTime = 0.0
+        self.decodeTime = 0.0
+        self.error = None
+        self.cache = None
+        self.hedges = 0
+        self.hedgesWon = 0
+        self.circuit = None
+
+        self.startedOn = time.time()
+        self.__start = time.perf_counter()
+        self.__end = None
+
+    @property
+    def endpoint(self):
+        '''
+        The method and URL template of the request, such as ``GET users/{token}``.
+        '''
+
+        return '{} {}'.format(self.method, self.urlTemplate)
+
+    @property
+    def totalTime(self):
+        '''
+        The time spent in the client, retries and rate limiting included.
+        '''
+
+        return (self.__end or time.perf_counter()) - self.__start
+
+    @property
+    def errorCode(self):
+        '''
+        The code of the error, None if the request succeeded.
+        '''
+
+        return errorCode(self.error) if self.error is not None else None
+
+    @contextmanager
+    def measure(self, name):
+        '''
+        Add the time spent in a block to one of the times of the event.
+
+        :param name:
+            The attribute name, such as networkTime. **REQUIRED**
+        '''
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            setattr(self, name, getattr(self, name) + time.perf_counter() - start)
+
+    def finish(self, error=None):
+        '''
+        Record the end of the request.
+
+        :param error:
+            The exception raised by the request.
+        '''
+
+        self.__end = time.perf_counter()
+        self.error = error
+
+
+class RequestHook(object):
+    '''
+    Base class of the hooks of an ApiClient. Every method does nothing, so
+    subclasses only override the ones they need.
+
+    Hooks are called on the thread (or event loop) sending the request, and
+    exceptions they raise are not caught.
+    '''
+
+    def beforeRequest(self, event):
+        '''
+        Called once the request body is ready, before the first attempt.
+
+        :param event:
+            The RequestEvent. **REQUIRED**
+        '''
+
+    def afterResponse(self, event):
+        '''
+        Called once the response is parsed.
+
+        :param event:
+            The RequestEvent. **REQUIRED**
+        '''
+
+    def onError(self, event):
+        '''
+        Called when the request raises an exception, available as event.error.
+
+        :param event:
+            The RequestEvent. **REQUIRED**
+        '''
+
+
+class LatencyHistogram(object):
+    '''
+    A thread-safe HDR-style histogram of durations.
+
+    Values are counted in log-linear buckets: each power of two is split in
+    ``2 ** (precisionBits - 1)`` buckets, so percentiles are accurate within
+    ``1 / 2 ** (precisionBits - 1)`` whatever the range of the values.
+
+    :param precisionBits:
+        The number of significant bits kept for each value.
+    :param unit:
+        The resolution of the histogram in seconds.
+    '''
+
+    def __init__(self, precisionBits=7, unit=1e-6):
+        self.precisionBits = precisionBits
+        self.unit = unit
+
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+        self.__half = 1 << (precisionBits - 1)
+        self.__counts = {}
+        self.__lock = threading.Lock()
+
+    def record(self, value):
+        '''
+        Record a duration.
+
+        :param value:
+            The duration in seconds. **REQUIRED**
+        '''
+
+        index = self.__index(max(0, int(value / self.unit)))
+
+        with self.__lock:
+            self.__counts[index] = self.__counts.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percentile):
+        '''
+        Retrieve a percentile of the recorded durations.
+
+        :param percentile:
+            The percentile, between 0 and 100. **REQUIRED**
+        :returns:
+            The highest duration of the bucket holding the percentile, in
+            seconds, or None if nothing was recorded.
+        '''
+
+        with self.__lock:
+            if not self.count:
+                return None
+
+            rank = max(1, int(math.ceil(percentile / 100.0 * self.count)))
+            seen = 0
+
+            for index in sorted(self.__counts):
+                seen += self.__counts[index]
+                if seen >= rank:
+                    return min(self.max, self.__highestValue(index) * self.unit)
+
+    def asDict(self):
+        '''
+        Summarize the histogram.
+
+        :returns:
+            A dictionary with the count, min, mean, p50, p90, p99 and max.
+        '''
+
+        return {
+            'count': self.count,
+            'min': self.min,
+            'mean': self.mean,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.max
+        }
+
+    def __index(self, value):
+        if value < 2 * self.__half:
+            return value
+
+        exponent = value.bit_length() - self.precisionBits
+        return exponent * self.__half + (value >> exponent)
+
+    def __highestValue(self, index):
+        if index < 2 * self.__half:
+            return index
+
+        exponent = index // self.__half - 1
+        return ((index - exponent * self.__half + 1) << exponent) - 1
+
+
+class EndpointMetrics(object):
+    '''
+    The metrics of the requests sent to one endpoint.
+    '''
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.network = LatencyHistogram()
+        self.encryption = LatencyHistogram()
+        self.decode = LatencyHistogram()
+
+        self.requests = 0
+        self.errors = {}
+        self.statuses = {}
+        self.bytesSent = 0
+        self.bytesReceived = 0
+        self.hedges = 0
+        self.hedgesWon = 0
+        self.circuit = None
+
+        self.__lock = threading.Lock()
+
+    def record(self, event):
+        '''
+        Record a finished request.
+
+        :param event:
+            The RequestEvent. **REQUIRED**
+        '''
+
+        self.latency.record(event.totalTime)
+        self.network.record(event.networkTime)
+        self.encryption.record(event.encryptionTime)
+        self.decode.record(event.decodeTime)
+
+        with self.__lock:
+            self.requests += 1
+            self.bytesSent += event.bytesSent
+            self.bytesReceived += event.bytesReceived
+            self.hedges += event.hedges
+            self.hedgesWon += event.hedgesWon
+
+            if event.circuit is not None:
+                self.circuit = event.circuit
+
+            if event.status is not None:
+                self.statuses[event.status] = self.statuses.get(event.status, 0) + 1
+
+            if event.error is not None:
+                code = event.errorCode
+                self.errors[code] = self.errors.get(code, 0) + 1
+
+    def asDict(self):
+        '''
+        Summarize the metrics of the endpoint.
+
+        :returns:
+            A dictionary of counters and histogram summaries.
+        '''
+
+        return {
+            'requests': self.requests,
+            'errors': dict(self.errors),
+            'statuses': dict(self.statuses),
+            'bytesSent': self.bytesSent,
+            'bytesReceived': self.bytesReceived,
+            'hedges': self.hedges,
+            'hedgesWon': self.hedgesWon,
+            'circuit': self.circuit,
+            'latency': self.latency.asDict(),
+            'network': self.network.asDict(),
+            'encryption': self.encryption.asDict(),
+            'decode': self.decode.asDict()
+        }
+
+
+class MetricsCollector(RequestHook):
+    '''
+    An in-memory RequestHook keeping latency histograms per endpoint, to find
+    slow endpoints and the time spent in the SDK rather than the network.
+
+    Endpoints are keyed by method and URL template, such as
+    ``GET users/{token}/bank-accounts``.
+    '''
+
+    def __init__(self):
+        self.endpoints = {}
+
+        self.__lock = threading.Lock()
+
+    def afterResponse(self, event):
+        self.endpoint(event.endpoint).record(event)
+
+    def onError(self, event):
+        self.endpoint(event.endpoint).record(event)
+
+    def endpoint(self, name):
+        '''
+        Retrieve the metrics of an endpoint, created if missing.
+
+        :param name:
+            The method and URL template, such as ``GET users/{token}``. **REQUIRED**
+        :returns:
+            The EndpointMetrics.
+        '''
+
+        with self.__lock:
+            metrics = self.endpoints.get(name)
+            if metrics is None:
+                metrics = self.endpoints[name] = EndpointMetrics()
+            return metrics
+
+    def slowest(self, percentile=99, limit=10):
+        '''
+        Rank the endpoints by latency.
+
+        :param percentile:
+            The latency percentile to compare.
+        :param limit:
+            The maximum number of endpoints returned.
+        :returns:
+            A list of ``(endpoint, latency)`` tuples, slowest first.
+        '''
+
+        with self.__lock:
+            endpoints = list(self.endpoints.items())
+
+        ranking = [(name, metrics.latency.percentile(percentile)) for (name, metrics) in endpoints]
+        ranking.sort(key=lambda item: item[1] or 0, reverse=True)
+
+        return ranking[:limit]
+
+    def asDict(self):
+        '''
+        Summarize the metrics of every endpoint.
+
+        :returns:
+            A dictionary of endpoint summaries keyed by endpoint.
+        '''
+
+        with self.__lock:
+            endpoints = list(self.endpoints.items())
+
+        return dict((name, metrics.asDict()) for (name, metrics) in endpoints)
+
+    def reset(self):
+        '''
+        Forget every recorded request.
+        '''
+
+        with self.__lock:
+            self.endpoints = {}
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+
+from concurrent.futures import ThreadPoolExecutor
+
+from hyperwallet.utils.columnar import ColumnarBatch
+from hyperwallet.utils.deadline import submit
+
+
+class PageIterator(object):
+    '''
+    A lazy iterator over every item of a paginated list endpoint.
+
+    Pages are requested one at a time with ``limit``/``offset`` query
+    parameters, or by following the ``next`` link returned by the API, so only
+    the current page (and the prefetched one) is held in memory.
+
+    :param fetchPage:
+        Callable taking a partial URL and a dictionary of query parameters and
+        returning the API response. **REQUIRED**
+    :param partialUrl:
+        A partial URL to specify the API endpoint. **REQUIRED**
+    :param parse:
+        Callable turning the ``data`` array of a page into an iterable of
+        models. **REQUIRED**
+    :param params:
+        A dictionary containing query parameters.
+    :param pageSize:
+        The number of items requested per page. Defaults to the ``limit``
+        query parameter if provided.
+    :param prefetch:
+        Request the next page in the background while the current one is
+        being processed.
+    '''
+
+    defaultPageSize = 100
+
+    def __init__(self,
+                 fetchPage,
+                 partialUrl,
+                 parse,
+                 params=None,
+                 pageSize=None,
+                 prefetch=True):
+        '''
+        Create a new iterator. No request is made until iteration starts.
+        '''
+
+        self.fetchPage = fetchPage
+        self.partialUrl = partialUrl
+        self.parse = parse
+        self.params = dict(params or {})
+        self.pageSize = int(pageSize or self.params.get('limit') or self.defaultPageSize)
+        self.prefetch = prefetch
+
+    def __iter__(self):
+        '''
+        Iterate over the models of every page.
+        '''
+
+        for page in self.pages():
+            for item in page:
+                yield item
+
+    def pages(self):
+        '''
+        Iterate over the pages of the endpoint.
+
+        :returns:
+            A generator of lists of models, one list per page.
+        '''
+
+        for data in self.rawPages():
+            yield list(self.parse(data))
+
+    def toColumns(self, columns):
+        '''
+        Read every page into typed columns, without building models.
+
+        :param columns:
+            An iterable of ``(name, columnClass)`` tuples, such as
+            ``columnar.RECEIPT_COLUMNS``. **REQUIRED**
+        :returns:
+            A ColumnarBatch.
+        '''
+
+        batch = ColumnarBatch(columns)
+
+        for data in self.rawPages():
+            batch.extend(data)
+
+        return batch
+
+    def rawPages(self):
+        '''
+        Iterate over the ``data`` arrays of the pages of the endpoint,
+        without building models.
+
+        :returns:
+            A generator of lists of items, one list per page.
+        '''
+
+        params = dict(self.params)
+        params['limit'] = self.pageSize
+        params['offset'] = int(params.get('offset') or 0)
+
+        executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+
+        try:
+            request = (self.partialUrl, params)
+
+            response = self.fetchPage(*request)
+
+            while True:
+                data = response.get('data') or []
+                request = self._nextRequest(response, request[1], len(data))
+
+                # Start retrieving the next page before handing this one over.
+                pending = submit(executor, self.fetchPage, *request) if executor and request else None
+
+                yield data
+
+                if request is None:
+                    return
+
+                response = pending.result() if pending else self.fetchPage(*request)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    def _nextRequest(self, response, params, count):
+        '''
+        Work out the request for the page following a response.
+
+        :param response:
+            The API response of the current page. **REQUIRED**
+        :param params:
+            The query parameters used for the current page. **REQUIRED**
+        :param count:
+            The number of items in the current page. **REQUIRED**
+        :returns:
+            A tuple of partial URL and query parameters, or None on the last page.
+        '''
+
+        if count == 0:
+            return None
+
+        for link in response.get('links') or []:
+            if (link.get('params') or {}).get('rel') == 'next' and link.get('href'):
+                return (link['href'], None)
+
+        if params is None:
+            # Pages reached through a link only continue through links.
+            return None
+
+        hasNextPage = response.get('hasNextPage')
+
+        if hasNextPage is None:
+            # Older responses carry no paging metadata, a short page is the last one.
+            hasNextPage = count >= int(params.get('limit') or self.pageSize)
+
+        if not hasNextPage:
+            return None
+
+        nextParams = dict(params)
+        nextParams['offset'] = int(params.get('offset') or 0) + count
+
+        return (self.partialUrl, nextParams)
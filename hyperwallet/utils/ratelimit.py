@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+
+import json
+import os
+import threading
+import time
+
+from hyperwallet.exceptions import HyperwalletException
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows
+
+
+class TokenBucket(object):
+    '''
+    A thread-safe token bucket.
+
+    Callers reserve a token and wait for the returned delay, so tokens are
+    handed out in order and the bucket works for threads and asyncio alike.
+
+    :param rate:
+        The number of tokens added per second. **REQUIRED**
+    :param capacity:
+        The maximum number of tokens, that is the size of a burst. Defaults to
+        ``rate``.
+    '''
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise HyperwalletException('rate must be positive')
+
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+
+        self.reservations = 0
+        self.throttled = 0
+        self.totalWait = 0.0
+        self.lastWait = 0.0
+
+        self._tokens = self.capacity
+        self._updatedOn = time.time()
+        self._lock = threading.Lock()
+
+    @property
+    def level(self):
+        '''
+        The number of tokens currently available, negative when callers are
+        waiting for tokens.
+        '''
+
+        with self._lock:
+            return self._refill(self._tokens, self._updatedOn, time.time())
+
+    def reserve(self, tokens=1):
+        '''
+        Take tokens from the bucket.
+
+        :param tokens:
+            The number of tokens to take.
+        :returns:
+            The delay in seconds to wait before using the tokens.
+        '''
+
+        with self._lock:
+            now = time.time()
+            self._tokens = self._refill(self._tokens, self._updatedOn, now) - tokens
+            self._updatedOn = now
+            wait = max(0.0, -self._tokens / self.rate)
+
+        self._record(wait)
+        return wait
+
+    def acquire(self, tokens=1):
+        '''
+        Take tokens from the bucket, sleeping until they are available.
+
+        :param tokens:
+            The number of tokens to take.
+        :returns:
+            The time in seconds spent waiting.
+        '''
+
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def stats(self):
+        '''
+        Retrieve the statistics of the bucket.
+
+        :returns:
+            A dictionary with the current level, the number of reservations,
+            of throttled reservations and the total and last wait times.
+        '''
+
+        return {
+            'level': self.level,
+            'capacity': self.capacity,
+            'reservations': self.reservations,
+            'throttled': self.throttled,
+            'totalWait': self.totalWait,
+            'lastWait': self.lastWait
+        }
+
+    def _refill(self, tokens, updatedOn, now):
+        return min(self.capacity, tokens + max(0.0, now - updatedOn) * self.rate)
+
+    def _record(self, wait):
+        with self._lock:
+            self.reservations += 1
+            self.lastWait = wait
+            if wait > 0:
+                self.throttled += 1
+                self.totalWait += wait
+
+
+class FileTokenBucket(TokenBucket):
+    '''
+    A token bucket shared by every process of a host through a state file
+    protected by an exclusive file lock.
+
+    :param path:
+        The path of the state file, created if missing. **REQUIRED**
+    :param rate:
+        The number of tokens added per second. **REQUIRED**
+    :param capacity:
+        The maximum number of tokens, that is the size of a burst. Defaults to
+        ``rate``.
+    '''
+
+    def __init__(self, path, rate, capacity=None):
+        if fcntl is None:
+            raise HyperwalletException('FileTokenBucket requires fcntl file locks')
+
+        super(FileTokenBucket, self).__init__(rate, capacity)
+
+        self.path = path
+
+    @property
+    def level(self):
+        with self.__state() as state:
+            return self._refill(state['tokens'], state['updatedOn'], time.time())
+
+    def reserve(self, tokens=1):
+        with self.__state() as state:
+            now = time.time()
+            state['tokens'] = self._refill(state['tokens'], state['updatedOn'], now) - tokens
+            state['updatedOn'] = now
+            wait = max(0.0, -state['tokens'] / self.rate)
+
+        self._record(wait)
+        return wait
+
+    def __state(self):
+        return _LockedState(self.path, {'tokens': self.capacity, 'updatedOn': time.time()})
+
+
+class _LockedState(object):
+    '''
+    Read a JSON state file under an exclusive lock and write it back on exit.
+    '''
+
+    def __init__(self, path, default):
+        self.path = path
+        self.default = default
+
+    def __enter__(self):
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+
+        content = os.read(self.fd, 4096)
+        try:
+            self.state = json.loads(content.decode('utf-8')) if content else dict(self.default)
+        except ValueError:
+            self.state = dict(self.default)
+
+        return self.state
+
+    def __exit__(self, *exc_info):
+        try:
+            content = json.dumps(self.state).encode('utf-8')
+            os.lseek(self.fd, 0, os.SEEK_SET)
+            os.ftruncate(self.fd, 0)
+            os.write(self.fd, content)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+
+
+def classifyByMethod(method, url):
+    '''
+    Classify requests as reads (GET) or writes (everything else).
+
+    :param method:
+        The HTTP method of the request. **REQUIRED**
+    :param url:
+        The partial URL of the request. **REQUIRED**
+    '''
+
+    return 'read' if (method or '').upper() == 'GET' else 'write'
+
+
+class RateLimiter(object):
+    '''
+    Limits the rate of requests with one token bucket per endpoint class.
+
+    :param buckets:
+        A dictionary of token buckets keyed by endpoint class, such as
+        ``{'read': TokenBucket(50), 'write': TokenBucket(10)}``. Requests of a
+        class without a bucket are not limited. **REQUIRED**
+    :param classify:
+        Callable taking the HTTP method and partial URL of a request and
+        returning its endpoint class. Defaults to ``read`` for GET requests and
+        ``write`` for the others.
+    '''
+
+    def __init__(self, buckets, classify=classifyByMethod):
+        self.buckets = dict(buckets)
+        self.classify = classify
+
+    def reserve(self, method, url):
+        '''
+        Reserve a token for a request.
+
+        :param method:
+            The HTTP method of the request. **REQUIRED**
+        :param url:
+            The partial URL of the request. **REQUIRED**
+        :returns:
+            The delay in seconds to wait before sending the request.
+        '''
+
+        bucket = self.buckets.get(self.classify(method, url))
+        return bucket.reserve() if bucket is not None else 0.0
+
+    def acquire(self, method, url):
+        '''
+        Reserve a token for a request, sleeping until it is available.
+
+        :returns:
+            The time in seconds spent waiting.
+        '''
+
+        wait = self.reserve(method, url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def stats(self):
+        '''
+        Retrieve the statistics of every bucket.
+
+        :returns:
+            A dictionary of bucket statistics keyed by endpoint class.
+        '''
+
+        return dict((name, bucket.stats()) for (name, bucket) in self.buckets.items())
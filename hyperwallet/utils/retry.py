@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+
+import random
+import threading
+import time
+
+from email.utils import parsedate_tz, mktime_tz
+
+
+class RetryBudget(object):
+    '''
+    Limits retries to a fraction of the requests sent, so that retries cannot
+    multiply the load on the API while it is struggling.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one. A
+    reserve of ``minRetriesPerSecond`` tokens per second lets low traffic
+    retry too.
+
+    :param ratio:
+        The number of retries allowed per request.
+    :param minRetriesPerSecond:
+        The number of retries allowed per second regardless of traffic.
+    :param maxBalance:
+        The maximum number of tokens saved up.
+    '''
+
+    def __init__(self, ratio=0.1, minRetriesPerSecond=1.0, maxBalance=100.0):
+        self.ratio = ratio
+        self.minRetriesPerSecond = minRetriesPerSecond
+        self.maxBalance = maxBalance
+
+        self.balance = maxBalance
+        self.exhausted = 0
+
+        self.__updatedOn = time.time()
+        self.__lock = threading.Lock()
+
+    def deposit(self):
+        '''
+        Record a request.
+        '''
+
+        with self.__lock:
+            self.__refill(self.ratio)
+
+    def withdraw(self):
+        '''
+        Try to spend a token for a retry.
+
+        :returns:
+            True if the retry is allowed.
+        '''
+
+        with self.__lock:
+            self.__refill(0)
+
+            if self.balance < 1:
+                self.exhausted += 1
+                return False
+
+            self.balance -= 1
+            return True
+
+    def __refill(self, amount):
+        now = time.time()
+        amount += (now - self.__updatedOn) * self.minRetriesPerSecond
+        self.__updatedOn = now
+        self.balance = min(self.maxBalance, self.balance + amount)
+
+
+class RetryPolicy(object):
+    '''
+    Decides if and when a failed request is sent again.
+
+    Requests are retried when the API cannot be reached or answers with one of
+    ``retryStatuses``, but only for idempotent methods and for POSTs carrying a
+    client id (such as clientPaymentId) that the API uses to reject duplicates.
+
+    :param maxAttempts:
+        The maximum number of times a request is sent.
+    :param backoffFactor:
+        The delay in seconds before the first retry, doubled for each retry.
+    :param maxBackoff:
+        The maximum delay in seconds between two attempts.
+    :param jitter:
+        Randomize delays between zero and the backoff to spread retries.
+    :param retryStatuses:
+        The HTTP status codes that are retried.
+    :param retryMethods:
+        The HTTP methods that are always safe to retry.
+    :param respectRetryAfter:
+        Wait for the delay of the Retry-After response header when present.
+    :param maxRetryAfter:
+        Give up instead of waiting when Retry-After asks for a longer delay.
+    :param budget:
+        A RetryBudget shared by every request. Defaults to a new RetryBudget,
+        False disables the budget.
+    '''
+
+    def __init__(self,
+                 maxAttempts=3,
+                 backoffFactor=0.5,
+                 maxBackoff=30.0,
+                 jitter=True,
+                 retryStatuses=(429, 500, 502, 503, 504),
+                 retryMethods=('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'),
+                 respectRetryAfter=True,
+                 maxRetryAfter=60.0,
+                 budget=None):
+        self.maxAttempts = maxAttempts
+        self.backoffFactor = backoffFactor
+        self.maxBackoff = maxBackoff
+        self.jitter = jitter
+        self.retryStatuses = frozenset(retryStatuses)
+        self.retryMethods = frozenset(retryMethods)
+        self.respectRetryAfter = respectRetryAfter
+        self.maxRetryAfter = maxRetryAfter
+        self.budget = RetryBudget() if budget is None else (budget or None)
+
+        self.retries = 0
+
+        self.__lock = threading.Lock()
+
+    def recordRequest(self):
+        '''
+        Record a new request in the retry budget.
+        '''
+
+        if self.budget:
+            self.budget.deposit()
+
+    def isRetryable(self, method, idempotent=None):
+        '''
+        Check if a request may be sent more than once.
+
+        :param method:
+            The HTTP method of the request. **REQUIRED**
+        :param idempotent:
+            True if the request carries a client id, None to decide from the method.
+        '''
+
+        return bool(idempotent) or (method or '').upper() in self.retryMethods
+
+    def retryDelay(self, method, attempt, idempotent=None, response=None):
+        '''
+        Work out the delay before a failed attempt is retried.
+
+        :param method:
+            The HTTP method of the request. **REQUIRED**
+        :param attempt:
+            The number of the attempt that failed, starting at 1. **REQUIRED**
+        :param idempotent:
+            True if the request carries a client id.
+        :param response:
+            The response of the attempt, None if the API could not be reached.
+        :returns:
+            The delay in seconds, or None if the request must not be retried.
+        '''
+
+        if attempt >= self.maxAttempts or not self.isRetryable(method, idempotent):
+            return None
+
+        if response is not None and response.status_code not in self.retryStatuses:
+            return None
+
+        delay = self.backoff(attempt)
+
+        retryAfter = self.retryAfter(response) if response is not None and self.respectRetryAfter else None
+        if retryAfter is not None:
+            if retryAfter > self.maxRetryAfter:
+                return None
+            delay = retryAfter
+
+        if self.budget and not self.budget.withdraw():
+            return None
+
+        with self.__lock:
+            self.retries += 1
+
+        return delay
+
+    def backoff(self, attempt):
+        '''
+        The exponential backoff delay after a failed attempt.
+
+        :param attempt:
+            The number of the attempt that failed, starting at 1. **REQUIRED**
+        '''
+
+        delay = min(self.maxBackoff, self.backoffFactor * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def retryAfter(self, response):
+        '''
+        Parse the Retry-After header of a response.
+
+        :param response:
+            The response. **REQUIRED**
+        :returns:
+            The delay in seconds, or None if the header is missing or invalid.
+        '''
+
+        value = (response.headers or {}).get('Retry-After')
+
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+
+        date = parsedate_tz(value)
+        if date is None:
+            return None
+
+        return max(0.0, mktime_tz(date) - time.time())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+
+import copy
+import json
+import threading
+
+
+def requestKey(credential, url, params):
+    '''
+    Identify a GET request by its API user, partial URL and query parameters.
+
+    :param credential:
+        Identifies the API user and server, as responses must not be shared
+        between users. **REQUIRED**
+    :param url:
+        The partial URL of the request. **REQUIRED**
+    :param params:
+        A dictionary containing query parameters.
+    :returns:
+        A string.
+    '''
+
+    # Dates are sent as strings, as the requests do.
+    return json.dumps([credential, (url or '').strip('/'), params or {}], sort_keys=True, default=str)
+
+
+class _Call(object):
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+
+class _AsyncCall(object):
+
+    def __init__(self):
+        self.task = None
+        self.followers = 0
+        self.waiting = 0
+
+
+class SingleFlight(object):
+    '''
+    Share one request between callers asking for the same resource at the
+    same time.
+
+    The first caller of a key runs the request while the others wait for it;
+    every caller then receives its own copy of the response, or the same
+    exception. A new request is made once the shared one is completed, so
+    responses are never reused afterwards. A request made by a single caller
+    is returned without being copied.
+    '''
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__calls = {}
+        self.__futures = {}
+        self.__requests = 0
+        self.__coalesced = 0
+
+    def do(self, key, function):
+        '''
+        Run a function, unless a call with the same key is in flight.
+
+        :param key:
+            Identifies the request, such as the result of ``requestKey``. **REQUIRED**
+        :param function:
+            Callable making the request. **REQUIRED**
+        :returns:
+            The result of the function.
+        '''
+
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = self.__calls[key] = _Call()
+                self.__requests += 1
+            else:
+                call.followers += 1
+                self.__coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+
+        return self.__own(call)
+
+    async def doAsync(self, key, function):
+        '''
+        Await a coroutine function, unless a call with the same key is in flight.
+
+        :param key:
+            Identifies the request, such as the result of ``requestKey``. **REQUIRED**
+        :param function:
+            Callable returning the coroutine making the request. **REQUIRED**
+        :returns:
+            The result of the coroutine.
+        '''
+
+        # Loaded here so that synchronous clients do not import asyncio.
+        import asyncio
+
+        call = self.__futures.get(key)
+
+        if call is None:
+            call = self.__futures[key] = _AsyncCall()
+            call.task = asyncio.ensure_future(self.__runAsync(key, call, function))
+            with self.__lock:
+                self.__requests += 1
+        else:
+            call.followers += 1
+            with self.__lock:
+                self.__coalesced += 1
+
+        # The request runs in a task of its own, so a caller being cancelled,
+        # the first one included, leaves it to the others. It is only
+        # cancelled once no caller is waiting for it.
+        call.waiting += 1
+        try:
+            result = await asyncio.shield(call.task)
+        finally:
+            call.waiting -= 1
+            if not call.waiting and not call.task.done():
+                call.task.cancel()
+
+        return copy.deepcopy(result) if call.followers else result
+
+    async def __runAsync(self, key, call, function):
+        try:
+            return await function()
+        finally:
+            # Removed before the task completes, so that every caller sharing
+            # the response is known when it is handed over.
+            if self.__futures.get(key) is call:
+                del self.__futures[key]
+
+    def __own(self, call):
+        '''
+        Hand the response over to the caller that made the request, copied if
+        other callers share it, since they copy it concurrently. Callers only
+        join a call in flight, so they are all known once it is completed.
+        '''
+
+        return copy.deepcopy(call.result) if call.followers else call.result
+
+    def stats(self):
+        '''
+        Report the use of the coalescing.
+
+        :returns:
+            A dictionary with the number of requests made, of calls served by
+            another caller's request, and of requests in flight.
+        '''
+
+        with self.__lock:
+            return {
+                'requests': self.__requests,
+                'coalesced': self.__coalesced,
+                'inFlight': len(self.__calls) + len(self.__futures)
+            }
@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+
+import collections
+import functools
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.utils.deadline import submit
+from hyperwallet.utils.export import contentKey, dateWindows, nowTimestamp, parseTimestamp, shiftTimestamp
+from hyperwallet.utils.pagination import PageIterator
+
+
+def itemKey(item):
+    '''
+    Identify an item by its token, or by a hash of its content for items
+    without one, such as Receipts.
+    '''
+
+    return item.get('token') or contentKey(item)
+
+
+class WatermarkStore(object):
+    '''
+    The base class of the stores persisting the position of each stream.
+    The state of a stream is a dictionary holding its ``watermark`` and the
+    ``keys`` of the items seen shortly before it.
+    '''
+
+    def load(self, stream):
+        '''
+        Retrieve the state of a stream.
+
+        :param stream:
+            The name of the stream. **REQUIRED**
+        :returns:
+            A dictionary, or None if the stream was never synchronized.
+        '''
+
+        raise NotImplementedError()
+
+    def save(self, stream, state):
+        '''
+        Replace the state of a stream.
+
+        :param stream:
+            The name of the stream. **REQUIRED**
+        :param state:
+            A dictionary. **REQUIRED**
+        '''
+
+        raise NotImplementedError()
+
+
+class FileWatermarkStore(WatermarkStore):
+    '''
+    Keep the states of every stream in a JSON file, replaced atomically.
+
+    :param path:
+        The path of the file. **REQUIRED**
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        self.__lock = threading.Lock()
+
+    def load(self, stream):
+        with self.__lock:
+            return self.__read().get(stream)
+
+    def save(self, stream, state):
+        with self.__lock:
+            states = self.__read()
+            states[stream] = state
+
+            temporaryPath = self.path + '.tmp'
+            with open(temporaryPath, 'w') as stateFile:
+                json.dump(states, stateFile, sort_keys=True)
+                stateFile.flush()
+                os.fsync(stateFile.fileno())
+
+            os.replace(temporaryPath, self.path)
+
+    def __read(self):
+        if not os.path.isfile(self.path):
+            return {}
+
+        with open(self.path) as stateFile:
+            return json.load(stateFile)
+
+
+class SqliteWatermarkStore(WatermarkStore):
+    '''
+    Keep the states of every stream in a SQLite database.
+
+    :param path:
+        The path of the database. **REQUIRED**
+    '''
+
+    def __init__(self, path):
+        self.path = path
+
+        with self.__connect() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS watermarks (stream TEXT PRIMARY KEY, state TEXT NOT NULL)'
+            )
+
+    def load(self, stream):
+        with self.__connect() as connection:
+            row = connection.execute('SELECT state FROM watermarks WHERE stream = ?', (stream,)).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def save(self, stream, state):
+        with self.__connect() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO watermarks (stream, state) VALUES (?, ?)',
+                (stream, json.dumps(state, sort_keys=True))
+            )
+
+    def __connect(self):
+        # A connection per call, as connections cannot be shared by threads.
+        return sqlite3.connect(self.path, timeout=30)
+
+
+class SyncResult(object):
+    '''
+    The outcome of a synchronization.
+
+    :param stream:
+        The name of the stream. **REQUIRED**
+    :param items:
+        The number of new items handled. **REQUIRED**
+    :param windows:
+        The number of date windows requested. **REQUIRED**
+    :param watermark:
+        The watermark saved at the end of the run. **REQUIRED**
+    :param elapsed:
+        The duration of the run in seconds. **REQUIRED**
+    '''
+
+    def __init__(self, stream, items, windows, watermark, elapsed):
+        self.stream = stream
+        self.items = items
+        self.windows = windows
+        self.watermark = watermark
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return 'SyncResult({stream}: {items} items until {watermark})'.format(
+            stream=self.stream,
+            items=self.items,
+            watermark=self.watermark
+        )
+
+
+class IncrementalSync(object):
+    '''
+    Hand over the items of a list endpoint created since the previous run.
+
+    The period between the saved watermark and now is split in date windows
+    requested concurrently, and handled in chronological order. The watermark
+    is saved after each window, so an interrupted run continues from the last
+    handled window. Each run looks back a little before the watermark to pick
+    up items that became visible late, and skips the items already handled
+    using their token.
+
+    :param fetchPage:
+        Callable taking a partial URL and a dictionary of query parameters and
+        returning the API response. **REQUIRED**
+    :param partialUrl:
+        A partial URL to specify the API endpoint. **REQUIRED**
+    :param store:
+        The WatermarkStore keeping the position of the stream. **REQUIRED**
+    :param stream:
+        The name of the stream in the store. **REQUIRED**
+    :param handler:
+        Callable taking the list of new models of a window. **REQUIRED**
+    :param parse:
+        Callable turning a list of items into a list of models. **REQUIRED**
+    :param start:
+        Where the first run starts, as a datetime or timestamp string.
+        Required until the stream has a watermark.
+    :param end:
+        Where the run ends, as a datetime or timestamp string. Defaults to now.
+    :param params:
+        A dictionary containing additional query parameters.
+    :param windowSize:
+        The duration of each date window, as a timedelta.
+    :param maxWorkers:
+        The number of date windows requested concurrently.
+    :param pageSize:
+        The number of items requested per page.
+    :param lookback:
+        How far before the watermark each run starts, as a timedelta.
+    '''
+
+    def __init__(self,
+                 fetchPage,
+                 partialUrl,
+                 store,
+                 stream,
+                 handler,
+                 parse,
+                 start=None,
+                 end=None,
+                 params=None,
+                 windowSize=timedelta(days=1),
+                 maxWorkers=4,
+                 pageSize=100,
+                 lookback=timedelta(minutes=5)):
+        self.fetchPage = fetchPage
+        self.partialUrl = partialUrl
+        self.store = store
+        self.stream = stream
+        self.handler = handler
+        self.parse = parse
+        self.start = parseTimestamp(start) if start else None
+        self.end = parseTimestamp(end) if end else None
+        self.params = dict(params or {})
+        self.windowSize = windowSize
+        self.maxWorkers = maxWorkers
+        self.pageSize = pageSize
+        self.lookback = lookback
+
+    def run(self):
+        '''
+        Hand over the new items and move the watermark forward.
+
+        :returns:
+            A SyncResult.
+        '''
+
+        started = time.time()
+
+        state = self.store.load(self.stream)
+
+        if state is None:
+            if not self.start:
+                raise HyperwalletException('start is required for the first synchronization of ' + self.stream)
+            state = {'watermark': self.start, 'keys': {}}
+            start = self.start
+        else:
+            start = shiftTimestamp(state['watermark'], -int(self.lookback.total_seconds()))
+
+        end = self.end or nowTimestamp()
+        windows = dateWindows(start, end, self.windowSize)
+
+        watermark = state['watermark']
+        keys = dict(state['keys'])
+        count = 0
+
+        fetch = functools.partial(fetchWindow, self.fetchPage, self.partialUrl, self.params, self.pageSize)
+
+        for ((windowStart, windowEnd), items) in fetchInOrder(fetch, windows, self.maxWorkers):
+            new = []
+            for item in items:
+                key = itemKey(item)
+                if key not in keys:
+                    keys[key] = item['createdOn'][:19]
+                    new.append(item)
+
+            if new:
+                self.handler(self.parse(new))
+                count += len(new)
+
+            watermark = max(watermark, windowEnd)
+            horizon = shiftTimestamp(watermark, -int(self.lookback.total_seconds()))
+            keys = dict((key, createdOn) for (key, createdOn) in keys.items() if createdOn >= horizon)
+
+            self.store.save(self.stream, {'watermark': watermark, 'keys': keys})
+
+        return SyncResult(self.stream, count, len(windows), watermark, time.time() - started)
+
+
+def fetchWindow(fetchPage, partialUrl, params, pageSize, windowStart, windowEnd):
+    '''
+    Retrieve the items of a list endpoint created in a date window.
+
+    :param fetchPage:
+        Callable taking a partial URL and a dictionary of query parameters and
+        returning the API response. **REQUIRED**
+    :param partialUrl:
+        A partial URL to specify the API endpoint. **REQUIRED**
+    :param params:
+        A dictionary containing additional query parameters. **REQUIRED**
+    :param pageSize:
+        The number of items requested per page. **REQUIRED**
+    :param windowStart:
+        The beginning of the window, included. **REQUIRED**
+    :param windowEnd:
+        The end of the window, excluded. **REQUIRED**
+    :returns:
+        A list of items, sorted by creation date.
+    '''
+
+    params = dict(params)
+    # Bounds are widened by a second and items filtered exactly below, so
+    # the result does not depend on the API treating bounds as inclusive.
+    params['createdAfter'] = shiftTimestamp(windowStart, -1)
+    params['createdBefore'] = shiftTimestamp(windowEnd, 1)
+    params['sortBy'] = 'createdOn'
+
+    iterator = PageIterator(fetchPage, partialUrl, None, params, pageSize, prefetch=False)
+
+    items = []
+    for page in iterator.rawPages():
+        items.extend(item for item in page if windowStart <= (item.get('createdOn') or '')[:19] < windowEnd)
+
+    items.sort(key=lambda item: item['createdOn'][:19])
+
+    return items
+
+
+def fetchInOrder(fetch, windows, maxWorkers):
+    '''
+    Retrieve date windows concurrently, keeping a bounded number in flight.
+
+    :param fetch:
+        Callable taking the start and end of a window and returning its
+        items, such as a partial of fetchWindow. **REQUIRED**
+    :param windows:
+        A list of ``(start, end)`` timestamp tuples. **REQUIRED**
+    :param maxWorkers:
+        The number of windows requested concurrently. **REQUIRED**
+    :returns:
+        A generator of ``(window, items)`` tuples, in the order of the windows.
+    '''
+
+    with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+        pending = collections.deque()
+        remaining = iter(windows)
+
+        for window in remaining:
+            pending.append((window, submit(executor, fetch, *window)))
+            if len(pending) >= maxWorkers:
+                break
+
+        while pending:
+            (window, future) = pending.popleft()
+            items = future.result()
+
+            for nextWindow in remaining:
+                pending.append((nextWindow, submit(executor, fetch, *nextWindow)))
+                break
+
+            yield (window, items)
@@ -0,0 +1,637 @@
+#!/usr/bin/env python
+
+import collections
+import functools
+import queue
+import sqlite3
+import threading
+import time
+
+from datetime import timedelta
+
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.models import Webhook
+from hyperwallet.utils.codec import defaultCodec
+from hyperwallet.utils.export import dateWindows, nowTimestamp, parseTimestamp
+from hyperwallet.utils.sync import fetchInOrder, fetchWindow
+
+STATUS_LINES = {
+    200: '200 OK',
+    202: '202 Accepted',
+    400: '400 Bad Request',
+    405: '405 Method Not Allowed',
+    503: '503 Service Unavailable'
+}
+
+# The number of Webhook types whose handlers are remembered.
+CACHED_TYPES = 1024
+
+# Placed in the queue to stop a worker.
+_STOP = object()
+
+
+class TokenStore(object):
+    '''
+    The base class of the stores recording the tokens of the Webhook
+    Notifications already handed over, shared by the receiver and replays.
+    '''
+
+    def claim(self, tokens):
+        '''
+        Record tokens, unless they were already recorded.
+
+        :param tokens:
+            A list of Webhook Notification tokens. **REQUIRED**
+        :returns:
+            The list of the tokens that were not recorded before.
+        '''
+
+        raise NotImplementedError()
+
+    def release(self, tokens):
+        '''
+        Forget tokens, so that their notifications are accepted again.
+
+        :param tokens:
+            A list of Webhook Notification tokens. **REQUIRED**
+        '''
+
+        raise NotImplementedError()
+
+
+class MemoryTokenStore(TokenStore):
+    '''
+    Keep the most recent tokens in memory.
+
+    :param maxTokens:
+        The number of tokens remembered.
+    '''
+
+    def __init__(self, maxTokens=100000):
+        self.maxTokens = maxTokens
+        self.__lock = threading.Lock()
+        self.__tokens = collections.OrderedDict()
+
+    def claim(self, tokens):
+        claimed = []
+
+        with self.__lock:
+            for token in tokens:
+                if token not in self.__tokens:
+                    self.__tokens[token] = True
+                    claimed.append(token)
+
+            while len(self.__tokens) > self.maxTokens:
+                self.__tokens.popitem(last=False)
+
+        return claimed
+
+    def release(self, tokens):
+        with self.__lock:
+            for token in tokens:
+                self.__tokens.pop(token, None)
+
+
+class SqliteTokenStore(TokenStore):
+    '''
+    Keep the tokens in a SQLite database, so that they survive restarts and
+    are shared by the processes receiving and replaying notifications.
+
+    :param path:
+        The path of the database. **REQUIRED**
+    '''
+
+    def __init__(self, path):
+        self.path = path
+
+        with self.__connect() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS webhook_tokens (token TEXT PRIMARY KEY, claimedOn REAL NOT NULL)'
+            )
+
+    def claim(self, tokens):
+        claimed = []
+        now = time.time()
+
+        # One transaction per call, so a window of a replay is a single write.
+        with self.__connect() as connection:
+            for token in tokens:
+                cursor = connection.execute(
+                    'INSERT OR IGNORE INTO webhook_tokens (token, claimedOn) VALUES (?, ?)',
+                    (token, now)
+                )
+                if cursor.rowcount:
+                    claimed.append(token)
+
+        return claimed
+
+    def release(self, tokens):
+        with self.__connect() as connection:
+            connection.executemany('DELETE FROM webhook_tokens WHERE token = ?', [(token,) for token in tokens])
+
+    def prune(self, age):
+        '''
+        Forget the tokens recorded long ago.
+
+        :param age:
+            How long tokens are kept, as a timedelta. **REQUIRED**
+        :returns:
+            The number of tokens forgotten.
+        '''
+
+        with self.__connect() as connection:
+            cursor = connection.execute(
+                'DELETE FROM webhook_tokens WHERE claimedOn < ?',
+                (time.time() - age.total_seconds(),)
+            )
+
+        return cursor.rowcount
+
+    def __connect(self):
+        # A connection per call, as connections cannot be shared by threads.
+        return sqlite3.connect(self.path, timeout=30)
+
+
+class WebhookReceiver(object):
+    '''
+    Receive Webhook Notifications over HTTP and hand them over to handlers.
+
+    The receiver is mounted as a WSGI application (``receiver.wsgi``) or an
+    ASGI application (``receiver.asgi``) at the URL the notifications of the
+    program are sent to. Each notification is decrypted and verified when
+    encryption is used, parsed into a Webhook and queued, unless its token was
+    already received. Worker threads then call the handlers registered for its
+    type, in no particular order between notifications.
+
+    When the queue is full the notification is refused with a 503 status, so
+    that it is delivered again later instead of holding the request open.
+
+    :param encryptionData:
+        Dictionary with params for encrypted notifications (Fields: clientPrivateKeySetLocation, hyperwalletKeySetLocation).
+    :param workers:
+        The number of threads calling the handlers.
+    :param queueSize:
+        The number of notifications waiting for a worker before new ones
+        are refused.
+    :param seenTokens:
+        The number of notification tokens remembered to drop redeliveries,
+        when no tokenStore is given.
+    :param enqueueTimeout:
+        The seconds a WSGI request waits for room in the queue. ASGI requests
+        never wait, so as not to block the event loop.
+    :param retryAfter:
+        The seconds sent in the ``Retry-After`` header of refused notifications.
+    :param onError:
+        Callable taking the Webhook and the exception raised by a handler.
+    :param tokenStore:
+        The TokenStore recording the notifications handed over, such as a
+        SqliteTokenStore shared with replays. Tokens are kept in memory by
+        default.
+    :param codec:
+        The codec decoding the notifications. Defaults to orjson when it is
+        installed, and to the json module otherwise.
+    '''
+
+    def __init__(self,
+                 encryptionData=None,
+                 workers=4,
+                 queueSize=1000,
+                 seenTokens=100000,
+                 enqueueTimeout=1,
+                 retryAfter=5,
+                 onError=None,
+                 tokenStore=None,
+                 codec=None):
+
+        if encryptionData is None:
+            self.encryption = None
+        else:
+            from hyperwallet.utils.encryption import Encryption
+            self.encryption = Encryption(**encryptionData)
+
+        self.workers = workers
+        self.tokenStore = tokenStore or MemoryTokenStore(seenTokens)
+        self.codec = codec or defaultCodec()
+        self.enqueueTimeout = enqueueTimeout
+        self.retryAfter = retryAfter
+        self.onError = onError
+
+        self.__queue = queue.Queue(maxsize=queueSize)
+        self.__lock = threading.Lock()
+        self.__threads = []
+        self.__handlers = []
+        self.__routes = {}
+        self.__counts = collections.Counter()
+
+    def on(self, webhookType, handler=None):
+        '''
+        Register a handler for a type of Webhook Notification.
+
+        Can be used as a decorator when the handler is omitted.
+
+        :param webhookType:
+            A type, such as ``PAYMENTS.CREATED``, the first segments of a type,
+            such as ``USERS.BANK_ACCOUNTS``, or ``*`` for every type. **REQUIRED**
+        :param handler:
+            Callable taking the Webhook.
+        :returns:
+            The handler.
+        '''
+
+        if not webhookType:
+            raise HyperwalletException('webhookType is required')
+
+        if handler is None:
+            return lambda function: self.on(webhookType, function)
+
+        with self.__lock:
+            self.__handlers.append((webhookType, handler))
+            self.__routes = {}
+
+        return handler
+
+    def handlers(self, webhookType):
+        '''
+        Find the handlers of a type of Webhook Notification.
+
+        :param webhookType:
+            The type of the Webhook. **REQUIRED**
+        :returns:
+            A tuple of the handlers, in the order they were registered.
+        '''
+
+        routes = self.__routes
+        if webhookType in routes:
+            return routes[webhookType]
+
+        with self.__lock:
+            matching = tuple(
+                handler
+                for (registered, handler) in self.__handlers
+                if registered in ('*', webhookType) or webhookType.startswith(registered + '.')
+            )
+            # The types come from the notifications, so only so many are kept.
+            if len(self.__routes) < CACHED_TYPES:
+                self.__routes[webhookType] = matching
+
+        return matching
+
+    def parse(self, body):
+        '''
+        Decrypt and parse the body of a notification.
+
+        :param body:
+            The body of the request, as bytes. **REQUIRED**
+        :returns:
+            A Webhook.
+        '''
+
+        try:
+            if self.encryption is not None:
+                body = self.encryption.decrypt(body)
+            data = self.codec.loads(body)
+        except (HyperwalletException, ValueError) as e:
+            raise HyperwalletException('Invalid webhook notification: {}'.format(e))
+
+        if not isinstance(data, dict) or not data.get('type'):
+            raise HyperwalletException('Invalid webhook notification: type is missing')
+
+        return Webhook(data)
+
+    def receive(self, body, timeout=None):
+        '''
+        Queue a notification for the handlers.
+
+        :param body:
+            The body of the request, as bytes. **REQUIRED**
+        :param timeout:
+            The seconds to wait for room in the queue, None to use
+            enqueueTimeout and 0 not to wait.
+        :returns:
+            The HTTP status of the response: 202 when queued, 200 when already
+            received and 503 when the queue is full.
+        '''
+
+        with self.__lock:
+            self.__counts['received'] += 1
+
+        try:
+            webhook = self.parse(body)
+        except HyperwalletException:
+            with self.__lock:
+                self.__counts['invalid'] += 1
+            raise
+
+        token = webhook.token
+
+        # Claimed before queueing so a concurrent redelivery is dropped.
+        if token is not None and not self.tokenStore.claim([token]):
+            with self.__lock:
+                self.__counts['duplicates'] += 1
+            return 200
+
+        self.start()
+
+        try:
+            timeout = self.enqueueTimeout if timeout is None else timeout
+            self.__queue.put(webhook, block=timeout > 0, timeout=timeout or None)
+        except queue.Full:
+            if token is not None:
+                self.tokenStore.release([token])
+            with self.__lock:
+                self.__counts['rejected'] += 1
+            return 503
+
+        with self.__lock:
+            self.__counts['accepted'] += 1
+
+        return 202
+
+    def wsgi(self, environ, start_response):
+        '''
+        The WSGI application receiving the notifications.
+        '''
+
+        if environ.get('REQUEST_METHOD') != 'POST':
+            start_response(STATUS_LINES[405], [('Allow', 'POST'), ('Content-Length', '0')])
+            return [b'']
+
+        try:
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            length = 0
+
+        (status, headers) = self.__respond(environ['wsgi.input'].read(length), None)
+
+        start_response(STATUS_LINES[status], headers)
+        return [b'']
+
+    async def asgi(self, scope, receive, send):
+        '''
+        The ASGI application receiving the notifications.
+        '''
+
+        import asyncio
+
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    self.start()
+                    await send({'type': 'lifespan.startup.complete'})
+                elif message['type'] == 'lifespan.shutdown':
+                    await asyncio.get_running_loop().run_in_executor(None, self.close)
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+
+        if scope['type'] != 'http':
+            raise HyperwalletException('Unsupported ASGI scope {}'.format(scope['type']))
+
+        if scope.get('method') != 'POST':
+            (status, headers) = (405, [('Allow', 'POST'), ('Content-Length', '0')])
+        else:
+            chunks = []
+            while True:
+                message = await receive()
+                chunks.append(message.get('body', b''))
+                if not message.get('more_body'):
+                    break
+
+            body = b''.join(chunks)
+
+            # Decrypting and claiming the token, which may query a database,
+            # both block, away from the event loop.
+            (status, headers) = await asyncio.get_running_loop().run_in_executor(None, self.__respond, body, 0)
+
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for (name, value) in headers]
+        })
+        await send({'type': 'http.response.body', 'body': b''})
+
+    def __respond(self, body, timeout):
+        try:
+            status = self.receive(body, timeout)
+        except HyperwalletException:
+            status = 400
+
+        headers = [('Content-Length', '0')]
+        if status == 503:
+            headers.append(('Retry-After', str(self.retryAfter)))
+
+        return (status, headers)
+
+    def start(self):
+        '''
+        Start the workers, if they are not running yet.
+        '''
+
+        if self.__threads:
+            return
+
+        with self.__lock:
+            if self.__threads:
+                return
+
+            for index in range(self.workers):
+                thread = threading.Thread(target=self.__work, name='hyperwallet-webhooks-{}'.format(index))
+                thread.daemon = True
+                thread.start()
+                self.__threads.append(thread)
+
+    def join(self):
+        '''
+        Wait for the handlers to process the queued notifications.
+        '''
+
+        self.__queue.join()
+
+    def close(self):
+        '''
+        Process the queued notifications, then stop the workers.
+        '''
+
+        with self.__lock:
+            (threads, self.__threads) = (self.__threads, [])
+
+        for _ in threads:
+            self.__queue.put(_STOP)
+
+        for thread in threads:
+            thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __work(self):
+        while True:
+            webhook = self.__queue.get()
+            try:
+                if webhook is _STOP:
+                    return
+                self.dispatch(webhook)
+            finally:
+                self.__queue.task_done()
+
+    def dispatch(self, webhook):
+        '''
+        Call the handlers registered for the type of a Webhook, in the calling
+        thread. Errors of the handlers are passed to onError.
+
+        :param webhook:
+            The Webhook. **REQUIRED**
+        '''
+
+        handlers = self.handlers(webhook.type or '')
+
+        if not handlers:
+            with self.__lock:
+                self.__counts['unhandled'] += 1
+            return
+
+        failed = False
+
+        for handler in handlers:
+            try:
+                handler(webhook)
+            except Exception as e:
+                failed = True
+                if self.onError is not None:
+                    self.onError(webhook, e)
+
+        with self.__lock:
+            self.__counts['failed' if failed else 'handled'] += 1
+
+    def stats(self):
+        '''
+        Report the notifications received.
+
+        :returns:
+            A dictionary with the number of notifications received, accepted,
+            dropped as duplicates, rejected because the queue was full, invalid,
+            handled, failed in a handler, without handler, and queued.
+        '''
+
+        with self.__lock:
+            stats = dict(
+                (name, self.__counts[name])
+                for name in ('received', 'accepted', 'duplicates', 'rejected', 'invalid', 'handled', 'failed', 'unhandled')
+            )
+
+        stats['queued'] = self.__queue.qsize()
+        return stats
+
+
+class ReplayResult(object):
+    '''
+    The outcome of a replay.
+
+    :param items:
+        The number of notifications handed over. **REQUIRED**
+    :param duplicates:
+        The number of notifications skipped as already handed over. **REQUIRED**
+    :param windows:
+        The number of date windows requested. **REQUIRED**
+    :param elapsed:
+        The duration of the replay in seconds. **REQUIRED**
+    '''
+
+    def __init__(self, items, duplicates, windows, elapsed):
+        self.items = items
+        self.duplicates = duplicates
+        self.windows = windows
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return 'ReplayResult({items} items, {duplicates} duplicates)'.format(
+            items=self.items,
+            duplicates=self.duplicates
+        )
+
+
+class WebhookReplay(object):
+    '''
+    Hand over the Webhook Notifications of a period again, such as after an
+    outage of the receiver.
+
+    The period is split in date windows requested concurrently, and the
+    notifications are handed over in the order they were created. Those whose
+    token is in the token store of the receiver, because they were received
+    live or by a previous replay, are skipped. The others are recorded and
+    passed to the handlers of the receiver in the calling thread.
+
+    :param fetchPage:
+        Callable taking a partial URL and a dictionary of query parameters and
+        returning the API response. **REQUIRED**
+    :param receiver:
+        The WebhookReceiver whose handlers and token store are used. **REQUIRED**
+    :param start:
+        The start of the period, as a datetime or timestamp string. **REQUIRED**
+    :param end:
+        The end of the period, as a datetime or timestamp string. Defaults to now.
+    :param params:
+        A dictionary containing additional query parameters.
+    :param windowSize:
+        The duration of each date window, as a timedelta.
+    :param maxWorkers:
+        The number of date windows requested concurrently.
+    :param pageSize:
+        The number of items requested per page.
+    '''
+
+    def __init__(self,
+                 fetchPage,
+                 receiver,
+                 start,
+                 end=None,
+                 params=None,
+                 windowSize=timedelta(hours=1),
+                 maxWorkers=4,
+                 pageSize=100):
+        self.fetchPage = fetchPage
+        self.receiver = receiver
+        self.start = parseTimestamp(start)
+        self.end = parseTimestamp(end) if end else None
+        self.params = dict(params or {})
+        self.windowSize = windowSize
+        self.maxWorkers = maxWorkers
+        self.pageSize = pageSize
+
+    def run(self):
+        '''
+        Hand over the notifications of the period not handed over yet.
+
+        :returns:
+            A ReplayResult.
+        '''
+
+        started = time.time()
+
+        end = self.end or nowTimestamp()
+        windows = dateWindows(self.start, end, self.windowSize)
+
+        fetch = functools.partial(fetchWindow, self.fetchPage, 'webhook-notifications', self.params, self.pageSize)
+        count = 0
+        duplicates = 0
+
+        for (window, items) in fetchInOrder(fetch, windows, self.maxWorkers):
+            webhooks = [Webhook(item) for item in items]
+            claimed = set(self.receiver.tokenStore.claim([webhook.token for webhook in webhooks if webhook.token]))
+
+            for webhook in webhooks:
+                if webhook.token:
+                    if webhook.token not in claimed:
+                        duplicates += 1
+                        continue
+                    # An item repeated by the paging is handed over once.
+                    claimed.discard(webhook.token)
+
+                self.receiver.dispatch(webhook)
+                count += 1
+
+        return ReplayResult(count, duplicates, len(windows), time.time() - started)
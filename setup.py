@@ -34,8 +34,10 @@ setup(
     long_description_content_type = 'text/x-rst',
     maintainer = extract_metaitem('author'),
     maintainer_email = extract_metaitem('email'),
-    packages = find_packages(exclude = ('tests', 'doc')),
-    install_requires = ['requests', 'requests-toolbelt', 'jwcrypto', 'python-jose'],
+    packages = find_packages(exclude = ('tests', 'doc', 'benchmarks')),
+    python_requires = '>=3.8',
+    install_requires = ['requests', 'requests-toolbelt', 'jwcrypto'],
+    extras_require = {'async': ['httpx'], 'parquet': ['pyarrow'], 'orjson': ['orjson'], 'http2': ['httpx>=0.23,<0.29', 'httpcore>=0.16,<2', 'h2']},
     test_suite = 'nose.collector',
     tests_require = [ 'mock', 'nose'],
     keywords='hyperwallet api',
@@ -45,8 +47,13 @@ setup(
         'Intended Audience :: Developers',
         'Natural Language :: English',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
         'Topic :: Internet',
         'Topic :: Software Development :: Libraries :: Python Modules'
     ]